@@ -1,25 +1,42 @@
 from __future__ import annotations
 
+import importlib
 import sys
 from pathlib import Path
 from json import JSONDecodeError
+from types import ModuleType
 
-from PySide6.QtCore import QObject, QUrl, Slot
+if __package__:
+    from .ui_qt.startup import DeferredLoader, StartupProfile, run_staged
+else:  # pragma: no cover - executed when running as a script
+    from ui_qt.startup import DeferredLoader, StartupProfile, run_staged
+
+# Created before PySide6 is imported so ``--startup-profile`` can time it.
+STARTUP_PROFILE = StartupProfile.from_argv() if __name__ == "__main__" else StartupProfile()
+
+from PySide6.QtCore import QObject, QUrl, Signal, Slot  # noqa: E402  (profiled import)
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtQml import QQmlApplicationEngine
 
-from model.param_catalog import ParamCatalog
-from model.param_store import ParamStore
-from model.exporters import (
-    export_params_csv,
-    export_params_dat,
-    export_params_json,
-    read_params_dat,
-    read_params_json,
-)
-from model.units_adapter import convert_to_si
-from model.runner import extract_series, run as run_sim
-from model.exporters import export_timeseries_csv, export_timeseries_mdf4
+if __package__:
+    from .model.param_catalog import ParamCatalog
+    from .model.param_store import ParamStore
+    from .model.units_adapter import convert_to_si
+    from .ui_qt.simulation_jobs import JobContext, SimulationJobQueue
+else:  # pragma: no cover - executed when running as a script
+    from model.param_catalog import ParamCatalog
+    from model.param_store import ParamStore
+    from model.units_adapter import convert_to_si
+    from ui_qt.simulation_jobs import JobContext, SimulationJobQueue
+
+# Imported on first use (or by the deferred start-up loader): the exporters
+# pull in asammdf and the runner PyBaMM, neither is needed for the first frame.
+_DEFERRED_MODEL_MODULES = ("exporters", "runner")
+
+
+def _model_module(name: str) -> ModuleType:
+    package = f"{__package__}.model" if __package__ else "model"
+    return importlib.import_module(f"{package}.{name}")
 
 
 def resource_path(relative: str) -> str:
@@ -28,10 +45,25 @@ def resource_path(relative: str) -> str:
 
 
 class Bridge(QObject):
-    def __init__(self, store: ParamStore, catalog: ParamCatalog) -> None:
+    progressUpdated = Signal(str, float)
+    simulationFinished = Signal(str)
+    simulationFailed = Signal(str)
+
+    def __init__(
+        self,
+        store: ParamStore,
+        catalog: ParamCatalog,
+        job_queue: SimulationJobQueue | None = None,
+    ) -> None:
         super().__init__()
         self._store = store
         self._catalog = catalog
+        self._jobs = job_queue if job_queue is not None else SimulationJobQueue(self)
+        self._job_ids: set[str] = set()
+        self._jobs.jobProgress.connect(self._on_job_progress)
+        self._jobs.jobFinished.connect(self._on_job_finished)
+        self._jobs.jobFailed.connect(self._on_job_failed)
+        self._jobs.jobCancelled.connect(self._on_job_cancelled)
 
     @staticmethod
     def _normalize_path(path: str) -> str:
@@ -45,10 +77,11 @@ class Bridge(QObject):
         normalized = self._normalize_path(path)
         try:
             lower = normalized.lower()
+            exporters = _model_module("exporters")
             if lower.endswith(".json"):
-                values = read_params_json(normalized)
+                values = exporters.read_params_json(normalized)
             elif lower.endswith(".dat"):
-                values = read_params_dat(normalized)
+                values = exporters.read_params_dat(normalized)
             else:
                 return
             self._store.setValues(values)
@@ -61,16 +94,17 @@ class Bridge(QObject):
         target = Path(normalized)
         if target.parent:
             target.parent.mkdir(parents=True, exist_ok=True)
-        values = self._store.values
+        values = self._store.view()
         schema = self._catalog.categories_schema()
         values_si = convert_to_si(values, schema)
+        exporters = _model_module("exporters")
         try:
             if fmt == "csv":
-                export_params_csv(target, values_si)
+                exporters.export_params_csv(target, values_si)
             elif fmt == "dat":
-                export_params_dat(target, values_si)
+                exporters.export_params_dat(target, values_si)
             else:
-                export_params_json(target, values_si)
+                exporters.export_params_json(target, values_si)
         except (FileNotFoundError, PermissionError) as exc:
             print(f"Export failed: {exc}")
         except OSError as exc:
@@ -82,27 +116,60 @@ class Bridge(QObject):
         target = Path(normalized)
         if target.parent:
             target.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            solution, _context = run_sim(self._store.values, self._catalog.categories_schema())
-            series = extract_series(solution)
-            if fmt.lower() == "mdf4":
-                export_timeseries_mdf4(target, series)
+        # Snapshot the inputs on the GUI thread; the job runs on the pool.
+        values = dict(self._store.view())
+        schema = self._catalog.categories_schema()
+        use_mdf4 = fmt.lower() == "mdf4"
+
+        def job(context: JobContext) -> str:
+            runner = _model_module("runner")
+            exporters = _model_module("exporters")
+            context.report("Running simulation", 0.05)
+            solution, _context = runner.run(values, schema)
+            context.report("Writing results", 0.8)
+            series = runner.extract_series(solution)
+            if use_mdf4:
+                exporters.export_timeseries_mdf4(target, series)
             else:
-                export_timeseries_csv(target, series)
-        except RuntimeError as exc:
-            print(f"Simulation failed: {exc}")
-        except (FileNotFoundError, PermissionError) as exc:
-            print(f"Simulation failed: {exc}")
-        except OSError as exc:
-            print(f"Simulation failed: {exc}")
+                exporters.export_timeseries_csv(target, series)
+            context.report("Simulation complete", 1.0)
+            return str(target)
 
+        self._job_ids.add(self._jobs.submit(job, name=target.name))
 
-def main() -> int:
-    app = QGuiApplication(sys.argv)
+    @Slot()
+    def cancelSimulation(self) -> None:  # noqa: N802
+        for job_id in self._job_ids:
+            self._jobs.cancel(job_id)
+
+    def _on_job_progress(self, job_id: str, stage: str, fraction: float) -> None:
+        if job_id in self._job_ids:
+            self.progressUpdated.emit(stage, fraction)
+
+    def _on_job_finished(self, job_id: str, result: object) -> None:
+        if job_id in self._job_ids:
+            self._job_ids.discard(job_id)
+            self.simulationFinished.emit(str(result))
 
-    schema_path = resource_path("params/params_schema.json")
-    catalog = ParamCatalog.from_json(schema_path)
-    store = ParamStore(catalog)
+    def _on_job_failed(self, job_id: str, error: str) -> None:
+        if job_id in self._job_ids:
+            self._job_ids.discard(job_id)
+            print(f"Simulation failed: {error}")
+            self.simulationFailed.emit(error)
+
+    def _on_job_cancelled(self, job_id: str) -> None:
+        self._job_ids.discard(job_id)
+
+
+def main() -> int:
+    profile = STARTUP_PROFILE
+    profile.mark("main")
+    app = QGuiApplication(profile.qt_argv)
+
+    with profile.phase("load_catalog"):
+        schema_path = resource_path("params/params_schema.json")
+        catalog = ParamCatalog.from_json(schema_path)
+        store = ParamStore(catalog)
     bridge = Bridge(store, catalog)
 
     engine = QQmlApplicationEngine()
@@ -111,7 +178,8 @@ def main() -> int:
     engine.rootContext().setContextProperty("Bridge", bridge)
 
     qml_path = resource_path("ui_qt/qml/Main.qml")
-    engine.load(QUrl.fromLocalFile(qml_path))
+    with profile.phase("load_qml"):
+        engine.load(QUrl.fromLocalFile(qml_path))
 
     root_objects = engine.rootObjects()
     if not root_objects:
@@ -122,7 +190,17 @@ def main() -> int:
     root.exportRequested.connect(bridge.exportParams)
     root.importRequested.connect(bridge.importParams)
 
-    return app.exec()
+    loader = DeferredLoader(
+        profile,
+        on_failed=lambda name, exc: print(f"Deferred start-up step '{name}' failed: {exc}", file=sys.stderr),
+    )
+    for name in _DEFERRED_MODEL_MODULES:
+        loader.add(f"model.{name}", lambda name=name: _model_module(name))
+    run_staged(app, engine, profile, loader)
+    exit_code = app.exec()
+    # Tear the QML scene down while the context objects it binds to still exist.
+    del engine
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,335 @@
+"""Columnar reader for tab-separated ``.dat`` result files.
+
+Both ``.dat`` flavours in the tree are supported: the WLTP single-cell
+export (``#`` metadata lines, then a ``time_s`` header and a tab-separated
+body with dotted channel names such as ``LFP.voltage_v``) and the PyBaMM
+export written by :func:`app.ui_qt.pybamm_runner.write_dat_text` (header
+line and body only).
+
+:class:`DatFile` memory-maps the file and parses only what is asked for:
+the requested columns (by name or by ``<prefix>.`` group) of the requested
+rows. The body is converted block by block with NumPy's C text parser, so
+memory stays at one block of text plus the projected output arrays instead
+of a whole-file table. Row ranges use a newline index that is built on
+first use and kept for later reads.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import pathlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Bytes of body text converted per block.
+DAT_BLOCK_BYTES = 16 * 1024 * 1024
+
+_CELL_LINE = re.compile(
+    r"^(?P<cell_id>\S+) \((?P<chemistry>[^,]*), model: (?P<model>[^,]*), capacity: (?P<capacity>[^ ]+) Ah\)$"
+)
+
+RowRange = Union[slice, Tuple[Optional[int], Optional[int]], None]
+
+
+@dataclass(frozen=True)
+class DatCell:
+    cell_id: str
+    chemistry: str
+    model_kind: str
+    capacity_ah: float
+
+
+@dataclass
+class DatHeader:
+    """Metadata parsed from the ``#`` lines and the column header."""
+
+    columns: Tuple[str, ...]
+    title: str = ""
+    metadata: Dict[str, str] = field(default_factory=dict)
+    lists: Dict[str, List[str]] = field(default_factory=dict)
+    comments: List[str] = field(default_factory=list)
+    body_offset: int = 0
+
+    @property
+    def cells(self) -> List[DatCell]:
+        """Cell descriptions of a WLTP single-cell export (empty otherwise)."""
+
+        cells = []
+        for item in self.lists.get("Cells", []):
+            match = _CELL_LINE.match(item)
+            if match:
+                cells.append(
+                    DatCell(
+                        cell_id=match["cell_id"],
+                        chemistry=match["chemistry"],
+                        model_kind=match["model"],
+                        capacity_ah=float(match["capacity"]),
+                    )
+                )
+        return cells
+
+    @property
+    def prefixes(self) -> List[str]:
+        """Channel prefixes (``drive``, cell ids, ...) in column order."""
+
+        return list(dict.fromkeys(name.split(".", 1)[0] for name in self.columns[1:] if "." in name))
+
+
+def _parse_header_lines(lines: Iterable[str], columns: Sequence[str], body_offset: int) -> DatHeader:
+    header = DatHeader(columns=tuple(columns), body_offset=body_offset)
+    current_list: Optional[str] = None
+    for raw in lines:
+        text = raw[1:].rstrip("\r\n")
+        header.comments.append(text)
+        stripped = text.strip()
+        if stripped.startswith("- ") and current_list is not None:
+            header.lists[current_list].append(stripped[2:].strip())
+            continue
+        current_list = None
+        if stripped.endswith(":"):
+            current_list = stripped[:-1].strip()
+            header.lists[current_list] = []
+        elif ": " in stripped:
+            key, value = stripped.split(": ", 1)
+            header.metadata[key.strip()] = value.strip()
+        elif stripped and not header.title:
+            header.title = stripped
+    return header
+
+
+@dataclass
+class DatTable:
+    """Projected columns of a ``.dat`` file.
+
+    ``columns`` keeps file order and always starts with the time column.
+    ``row_offset`` is the index of the first returned row in the file.
+    """
+
+    header: DatHeader
+    columns: Dict[str, np.ndarray]
+    row_offset: int = 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return int(self.time.shape[0])
+
+    @property
+    def time_channel(self) -> str:
+        return self.header.columns[0]
+
+    @property
+    def time(self) -> np.ndarray:
+        return self.columns[self.time_channel]
+
+    def by_prefix(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Group channels by the part of their name before the first dot.
+
+        ``{"LFP": {"voltage_v": ..., ...}, "drive": {...}}``; channels
+        without a dot (other than the time column) are grouped under ``""``.
+        """
+
+        groups: Dict[str, Dict[str, np.ndarray]] = {}
+        for name, values in self.columns.items():
+            if name == self.time_channel:
+                continue
+            prefix, _, signal = name.partition(".") if "." in name else ("", "", name)
+            groups.setdefault(prefix, {})[signal] = values
+        return groups
+
+
+class DatFile:
+    """Memory-mapped ``.dat`` results file; use as a context manager."""
+
+    def __init__(self, path: str | pathlib.Path) -> None:
+        self.path = pathlib.Path(path)
+        self._handle = open(self.path, "rb")
+        try:
+            size = self.path.stat().st_size
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            self.header = self._read_header()
+        except BaseException:
+            self.close()
+            raise
+        self._line_starts: Optional[np.ndarray] = None
+
+    def __enter__(self) -> "DatFile":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._handle.close()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return self.header.columns
+
+    def _read_header(self) -> DatHeader:
+        if self._map is None:
+            raise ValueError(f"DAT file is empty: {self.path}")
+        comments: List[str] = []
+        position = 0
+        while True:
+            end = self._map.find(b"\n", position)
+            line_end = len(self._map) if end < 0 else end
+            line = self._map[position:line_end].decode("utf-8")
+            next_position = line_end + 1
+            if line.startswith("#") or not line.strip():
+                if line.startswith("#"):
+                    comments.append(line)
+                if end < 0:
+                    raise ValueError(f"DAT file has no column header: {self.path}")
+                position = next_position
+                continue
+            columns = line.rstrip("\r").split("\t")
+            return _parse_header_lines(comments, columns, min(next_position, len(self._map)))
+
+    def _body_end(self) -> int:
+        return len(self._map) if self._map is not None else 0
+
+    def _line_index(self) -> np.ndarray:
+        """Return the byte offset of every body row plus the end of the body."""
+
+        if self._line_starts is None:
+            body = self.header.body_offset
+            end = self._body_end()
+            starts = [np.array([body], dtype=np.int64)]
+            position = body
+            while position < end:
+                count = min(DAT_BLOCK_BYTES, end - position)
+                window = np.frombuffer(self._map, dtype=np.uint8, count=count, offset=position)
+                starts.append(np.flatnonzero(window == 0x0A).astype(np.int64) + position + 1)
+                position += count
+            offsets = np.concatenate(starts)
+            if offsets[-1] != end:
+                offsets = np.append(offsets, end)  # last row without a trailing newline
+            while offsets.shape[0] > 1 and not self._map[int(offsets[-2]) : int(offsets[-1])].strip():
+                offsets = offsets[:-1]  # trailing blank lines
+            self._line_starts = offsets
+        return self._line_starts
+
+    @property
+    def row_count(self) -> int:
+        return int(self._line_index().shape[0] - 1)
+
+    def select_columns(self, columns: Iterable[str] | None = None, prefixes: Iterable[str] | None = None) -> List[str]:
+        """Resolve a projection to column names in file order, time first."""
+
+        if columns is None and prefixes is None:
+            return list(self.columns)
+        wanted = set(columns or ())
+        missing = wanted - set(self.columns)
+        if missing:
+            raise KeyError(f"Unknown DAT column(s): {', '.join(sorted(missing))}")
+        prefix_tuple = tuple(f"{prefix}." for prefix in (prefixes or ()))
+        unknown = [prefix for prefix in prefix_tuple if not any(name.startswith(prefix) for name in self.columns)]
+        if unknown:
+            raise KeyError(f"Unknown DAT channel prefix(es): {', '.join(prefix[:-1] for prefix in unknown)}")
+        time_channel = self.columns[0]
+        return [
+            name
+            for name in self.columns
+            if name == time_channel or name in wanted or (prefix_tuple and name.startswith(prefix_tuple))
+        ]
+
+    def _row_range(self, rows: RowRange) -> Tuple[int, int]:
+        count = self.row_count
+        if rows is None:
+            return 0, count
+        if isinstance(rows, tuple):
+            rows = slice(*rows)
+        if rows.step not in (None, 1):
+            raise ValueError("row ranges must be contiguous")
+        start, stop, _ = rows.indices(count)
+        return start, max(start, stop)
+
+    def read(
+        self,
+        columns: Iterable[str] | None = None,
+        *,
+        prefixes: Iterable[str] | None = None,
+        rows: RowRange = None,
+    ) -> DatTable:
+        """Return the selected columns of the selected rows as float arrays.
+
+        *columns* names channels explicitly and *prefixes* adds every
+        ``<prefix>.*`` channel; the time column is always included. *rows* is
+        a ``slice`` or ``(start, stop)`` pair of body row indices.
+        """
+
+        names = self.select_columns(columns, prefixes)
+        positions = {name: position for position, name in enumerate(self.columns)}
+        usecols = [positions[name] for name in names]
+        first, last = self._row_range(rows)
+        index = self._line_index()
+        # Channel-major output: every returned column is a contiguous row.
+        out = np.empty((len(names), last - first))
+        row = first
+        while row < last:
+            # Rows whose text fits in one block (at least one row).
+            stop = int(np.searchsorted(index, index[row] + DAT_BLOCK_BYTES, side="right")) - 1
+            stop = min(max(stop, row + 1), last)
+            block = self._map[int(index[row]) : int(index[stop])]
+            parsed = np.loadtxt(
+                io.BytesIO(block), delimiter="\t", usecols=usecols, dtype=np.float64, ndmin=2, comments=None
+            )
+            if parsed.shape[0] != stop - row:
+                raise ValueError(f"Malformed DAT body between rows {row} and {stop}: {self.path}")
+            out[:, row - first : stop - first] = parsed.T
+            row = stop
+        return DatTable(
+            header=self.header,
+            columns={name: out[position] for position, name in enumerate(names)},
+            row_offset=first,
+        )
+
+
+def read_dat_header(path: str | pathlib.Path) -> DatHeader:
+    with DatFile(path) as dat:
+        return dat.header
+
+
+def read_dat(
+    path: str | pathlib.Path,
+    columns: Iterable[str] | None = None,
+    *,
+    prefixes: Iterable[str] | None = None,
+    rows: RowRange = None,
+) -> DatTable:
+    """Read a ``.dat`` results file; see :meth:`DatFile.read`."""
+
+    with DatFile(path) as dat:
+        return dat.read(columns, prefixes=prefixes, rows=rows)
+
+
+def read_dat_groups(
+    path: str | pathlib.Path,
+    prefixes: Iterable[str] | None = None,
+    *,
+    rows: RowRange = None,
+) -> Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+    """Return ``(time, {prefix: {signal: values}})``, optionally for some prefixes only."""
+
+    table = read_dat(path, prefixes=prefixes, rows=rows)
+    return table.time, table.by_prefix()
+
+
+__all__ = [
+    "DatCell",
+    "DatFile",
+    "DatHeader",
+    "DatTable",
+    "read_dat",
+    "read_dat_groups",
+    "read_dat_header",
+]
@@ -0,0 +1,366 @@
+"""Drive-cycle traces for the Python single-cell engines.
+
+:func:`load_wltp_csv` mirrors ``evsim::io::load_wltp_csv`` from the C++ core:
+the file needs ``time_s`` and ``speed_kph`` columns, ``distance_m`` and
+``phase`` are optional, and the sample interval is the spacing of the last
+two timestamps (``1.0`` if that is not positive). Phase names are stored as
+the integer codes that the result files carry in ``drive.phase_id``.
+
+:func:`load_cycle` is the entry point for tooling that reads the same cycle
+repeatedly. It compiles the CSV once into a binary file under
+``<project>/.cache/drive_cycles``, keyed by the SHA-256 of the CSV bytes,
+and returns arrays memory-mapped from that file so parallel workers share
+one page-cache copy instead of each parsing text.
+
+Cache layout (little endian), version :data:`CACHE_FORMAT_VERSION`::
+
+    8s   magic  b"EVSIMDC\\0"
+    u4   format version
+    u4   metadata length in bytes
+    u8   sample count
+    ...  UTF-8 JSON metadata, padded to a 64-byte boundary
+    f8[] time_s, speed_kph, distance_m   (each padded to 64 bytes)
+    u1[] phase codes
+
+The JSON metadata records the source hash, cycle id and description, the
+sample interval and the byte offset of every column.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import pathlib
+import struct
+import tempfile
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+PHASE_CODES: Dict[str, int] = {"low": 1, "medium": 2, "high": 3, "extra_high": 4}
+
+WLTP_CYCLE_ID = "WLTP_Class3"
+WLTP_CYCLE_DESCRIPTION = "WLTP Class 3 representative cycle"
+
+CACHE_MAGIC = b"EVSIMDC\0"
+CACHE_FORMAT_VERSION = 1
+CACHE_SUFFIX = ".evdc"
+CACHE_ENV_VAR = "EVSIM_CYCLE_CACHE"
+DRIVE_CYCLE_CACHE_DIR = pathlib.Path(".cache") / "drive_cycles"
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+_PREAMBLE = struct.Struct("<8sIIQ")
+_ALIGNMENT = 64
+_FLOAT_COLUMNS: Tuple[str, ...] = ("time_s", "speed_kph", "distance_m")
+
+
+@dataclass(frozen=True)
+class DriveCycle:
+    time_s: np.ndarray
+    speed_kph: np.ndarray
+    distance_m: np.ndarray
+    phase_code: np.ndarray
+    sample_interval: float
+    source: str = ""
+    id: str = WLTP_CYCLE_ID
+    description: str = WLTP_CYCLE_DESCRIPTION
+    cache_path: Optional[str] = None
+
+    def __len__(self) -> int:
+        return int(self.time_s.shape[0])
+
+    @property
+    def phase_id(self) -> np.ndarray:
+        """Phase codes as the floating-point ``drive.phase_id`` channel."""
+
+        return self.phase_code.astype(np.float64)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Cached cycles travel to worker processes as a path; each worker
+        # maps the same file instead of receiving a pickled copy.
+        if self.cache_path is not None:
+            return (open_cycle, (self.cache_path, self.source))
+        return (type(self), tuple(getattr(self, item.name) for item in fields(self)))
+
+
+def _parse_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise ValueError(f"Failed to parse numeric value '{value}'") from exc
+
+
+def load_wltp_csv(path: str | pathlib.Path) -> DriveCycle:
+    """Read a ``time_s,phase,speed_kph,distance_m`` drive-cycle CSV."""
+
+    source = str(path)
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        headers = next(reader, None)
+        if headers is None:
+            raise ValueError(f"WLTP CSV is empty: {source}")
+        if len(headers) < 3:
+            raise ValueError("WLTP CSV header must contain at least three columns")
+        index = {name: position for position, name in enumerate(headers)}
+        if "time_s" not in index or "speed_kph" not in index:
+            raise ValueError("WLTP CSV must contain time_s and speed_kph columns")
+
+        time_s: List[float] = []
+        speed_kph: List[float] = []
+        distance_m: List[float] = []
+        phase_code: List[int] = []
+        for row in reader:
+            if not row:
+                continue
+            row = row + [""] * (len(headers) - len(row))
+            time_s.append(_parse_float(row[index["time_s"]]))
+            speed_kph.append(_parse_float(row[index["speed_kph"]]))
+            distance_m.append(_parse_float(row[index["distance_m"]]) if "distance_m" in index else 0.0)
+            phase_code.append(PHASE_CODES.get(row[index["phase"]], 0) if "phase" in index else 0)
+
+    if not time_s:
+        raise ValueError("WLTP CSV did not contain samples")
+    interval = time_s[-1] - time_s[-2] if len(time_s) > 1 else 0.0
+    return DriveCycle(
+        time_s=np.asarray(time_s, dtype=np.float64),
+        speed_kph=np.asarray(speed_kph, dtype=np.float64),
+        distance_m=np.asarray(distance_m, dtype=np.float64),
+        phase_code=np.asarray(phase_code, dtype=np.uint8),
+        sample_interval=interval if interval > 0.0 else 1.0,
+        source=source,
+    )
+
+
+def default_cache_dir() -> pathlib.Path:
+    """Return ``$EVSIM_CYCLE_CACHE`` or ``<project>/.cache/drive_cycles``."""
+
+    configured = os.environ.get(CACHE_ENV_VAR)
+    if configured:
+        return pathlib.Path(configured)
+    return PROJECT_ROOT / DRIVE_CYCLE_CACHE_DIR
+
+
+def source_digest(path: str | pathlib.Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path_for(
+    path: str | pathlib.Path,
+    cache_dir: str | pathlib.Path | None = None,
+    *,
+    digest: str | None = None,
+) -> pathlib.Path:
+    """Return the cache file that holds the compiled form of the CSV at *path*."""
+
+    digest = digest or source_digest(path)
+    directory = pathlib.Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    return directory / f"{pathlib.Path(path).stem}-{digest[:24]}.v{CACHE_FORMAT_VERSION}{CACHE_SUFFIX}"
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class CycleCacheWriter:
+    """Write a cache file from chunks whose total length is known up front.
+
+    The file is written next to *target* and renamed into place on a clean
+    exit, so readers never see a partial cache and concurrent writers simply
+    race to install identical content. Use it as a context manager and call
+    :meth:`append` once per chunk.
+    """
+
+    def __init__(
+        self,
+        target: str | pathlib.Path,
+        sample_count: int,
+        *,
+        sample_interval: float,
+        source: str = "",
+        id: str = WLTP_CYCLE_ID,
+        description: str = WLTP_CYCLE_DESCRIPTION,
+        digest: str = "",
+    ) -> None:
+        self.target = pathlib.Path(target)
+        self.sample_count = int(sample_count)
+        self.written = 0
+        self._stream: Optional[Any] = None
+        self._temp_name = ""
+        dtypes = [(name, np.dtype("<f8")) for name in _FLOAT_COLUMNS] + [("phase_code", np.dtype(np.uint8))]
+
+        metadata: Dict[str, Any] = {
+            "source_sha256": digest,
+            "source": source,
+            "id": id,
+            "description": description,
+            "sample_interval": sample_interval,
+            "phase_codes": PHASE_CODES,
+            "columns": {},
+        }
+        # Column offsets depend on the metadata length; reserve room for them
+        # first and lay the columns out after the padded header.
+        placeholder = json.dumps(metadata).encode("utf-8")
+        offset = _aligned(_PREAMBLE.size + len(placeholder) + 64 * len(dtypes))
+        self._columns: List[Tuple[str, np.dtype, int]] = []
+        for name, dtype in dtypes:
+            metadata["columns"][name] = {"offset": offset, "dtype": dtype.str}
+            self._columns.append((name, dtype, offset))
+            offset = _aligned(offset + self.sample_count * dtype.itemsize)
+        self._size = offset
+        self._header = json.dumps(metadata).encode("utf-8")
+        if _PREAMBLE.size + len(self._header) > self._columns[0][2]:
+            raise ValueError("drive-cycle metadata does not fit the reserved header")
+
+    def __enter__(self) -> "CycleCacheWriter":
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        handle, self._temp_name = tempfile.mkstemp(prefix=self.target.name, suffix=".tmp", dir=self.target.parent)
+        self._stream = os.fdopen(handle, "wb")
+        self._stream.write(_PREAMBLE.pack(CACHE_MAGIC, CACHE_FORMAT_VERSION, len(self._header), self.sample_count))
+        self._stream.write(self._header)
+        self._stream.truncate(self._size)
+        return self
+
+    def append(self, time_s: np.ndarray, speed_kph: np.ndarray, distance_m: np.ndarray, phase_code: np.ndarray) -> None:
+        if self._stream is None:
+            raise RuntimeError("CycleCacheWriter.append() called outside its context")
+        count = len(time_s)
+        if self.written + count > self.sample_count:
+            raise ValueError("more samples appended than declared")
+        for (name, dtype, offset), values in zip(self._columns, (time_s, speed_kph, distance_m, phase_code)):
+            values = np.ascontiguousarray(values, dtype=dtype)
+            if values.shape != (count,):
+                raise ValueError(f"column {name} has {values.shape[0]} samples, expected {count}")
+            self._stream.seek(offset + self.written * dtype.itemsize)
+            self._stream.write(values.tobytes())
+        self.written += count
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        stream, self._stream = self._stream, None
+        try:
+            if stream is not None:
+                stream.close()
+            if exc_type is None and self.written != self.sample_count:
+                raise ValueError(f"wrote {self.written} samples, declared {self.sample_count}")
+            if exc_type is None:
+                os.chmod(self._temp_name, 0o644)  # mkstemp creates the file private
+                os.replace(self._temp_name, self.target)
+        finally:
+            if os.path.exists(self._temp_name):
+                os.unlink(self._temp_name)
+
+
+def write_cycle_cache(cycle: DriveCycle, target: str | pathlib.Path, *, digest: str = "") -> pathlib.Path:
+    """Serialise *cycle* into the binary cache format at *target*."""
+
+    writer = CycleCacheWriter(
+        target,
+        len(cycle),
+        sample_interval=cycle.sample_interval,
+        source=cycle.source,
+        id=cycle.id,
+        description=cycle.description,
+        digest=digest,
+    )
+    with writer:
+        writer.append(cycle.time_s, cycle.speed_kph, cycle.distance_m, cycle.phase_code)
+    return writer.target
+
+
+def read_cache_metadata(path: str | pathlib.Path) -> Dict[str, Any]:
+    """Return the JSON metadata of a cache file after checking its preamble."""
+
+    with open(path, "rb") as handle:
+        preamble = handle.read(_PREAMBLE.size)
+        if len(preamble) != _PREAMBLE.size:
+            raise ValueError(f"Drive-cycle cache is truncated: {path}")
+        magic, version, length, count = _PREAMBLE.unpack(preamble)
+        if magic != CACHE_MAGIC:
+            raise ValueError(f"Not a drive-cycle cache file: {path}")
+        if version != CACHE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported drive-cycle cache version {version} (expected {CACHE_FORMAT_VERSION})")
+        metadata = json.loads(handle.read(length).decode("utf-8"))
+    metadata["sample_count"] = count
+    return metadata
+
+
+def open_cycle(path: str | pathlib.Path, source: Optional[str] = None) -> DriveCycle:
+    """Map a cache file written by :func:`write_cycle_cache` as a :class:`DriveCycle`.
+
+    The returned arrays are read-only views of the mapped file.
+    """
+
+    metadata = read_cache_metadata(path)
+    count = metadata["sample_count"]
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays: Dict[str, np.ndarray] = {}
+    for name, column in metadata["columns"].items():
+        dtype = np.dtype(column["dtype"])
+        start = column["offset"]
+        end = start + count * dtype.itemsize
+        if end > mapped.shape[0]:
+            raise ValueError(f"Drive-cycle cache is truncated: {path}")
+        arrays[name] = mapped[start:end].view(dtype)
+    return DriveCycle(
+        time_s=arrays["time_s"],
+        speed_kph=arrays["speed_kph"],
+        distance_m=arrays["distance_m"],
+        phase_code=arrays["phase_code"],
+        sample_interval=float(metadata["sample_interval"]),
+        source=metadata["source"] if source is None else source,
+        id=metadata["id"],
+        description=metadata["description"],
+        cache_path=str(path),
+    )
+
+
+def compile_cycle(path: str | pathlib.Path, cache_dir: str | pathlib.Path | None = None) -> pathlib.Path:
+    """Ensure a current cache file exists for the CSV at *path* and return it."""
+
+    digest = source_digest(path)
+    target = cache_path_for(path, cache_dir, digest=digest)
+    if target.exists():
+        try:
+            if read_cache_metadata(target).get("source_sha256") == digest:
+                return target
+        except (ValueError, json.JSONDecodeError):
+            pass  # unreadable or stale: rebuild below
+    return write_cycle_cache(load_wltp_csv(path), target, digest=digest)
+
+
+def load_cycle(
+    path: str | pathlib.Path,
+    *,
+    cache_dir: str | pathlib.Path | None = None,
+    use_cache: bool = True,
+) -> DriveCycle:
+    """Return the drive cycle in *path*, memory-mapped from its binary cache.
+
+    With ``use_cache=False`` the CSV is parsed directly, as
+    :func:`load_wltp_csv` does. ``source`` always reports *path* as given.
+    """
+
+    if not use_cache:
+        return load_wltp_csv(path)
+    cycle = open_cycle(compile_cycle(path, cache_dir))
+    return replace(cycle, source=str(path))
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "CycleCacheWriter",
+    "DriveCycle",
+    "PHASE_CODES",
+    "compile_cycle",
+    "default_cache_dir",
+    "load_cycle",
+    "load_wltp_csv",
+    "open_cycle",
+    "write_cycle_cache",
+]
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import csv
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
 try:  # pragma: no cover - optional dependency
     from asammdf import MDF, Signal  # type: ignore
@@ -12,6 +13,11 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # noqa: BLE001
     HAS_ASAMMDF = False
 
+# Defaults for :func:`iter_timeseries_mdf4`. A block never holds more than
+# ``MDF_CHUNK_ROWS`` records nor (approximately) ``MDF_MEMORY_LIMIT`` bytes.
+MDF_CHUNK_ROWS = 1_000_000
+MDF_MEMORY_LIMIT = 256 * 1024 * 1024
+
 
 def export_params_json(path: str | Path, params: Dict[str, Any]) -> None:
     destination = Path(path)
@@ -36,7 +42,7 @@ def export_params_dat(path: str | Path, params: Dict[str, Any]) -> None:
             handle.write(f"{key}={value}\n")
 
 
-def export_timeseries_csv(path: str | Path, series: Dict[str, list | tuple]) -> None:
+def export_timeseries_csv(path: str | Path, series: Mapping[str, Sequence[float]]) -> None:
     destination = Path(path)
     keys = list(series.keys())
     rows = zip(*[series[k] for k in keys]) if keys else []
@@ -47,7 +53,7 @@ def export_timeseries_csv(path: str | Path, series: Dict[str, list | tuple]) ->
             writer.writerow(row)
 
 
-def export_timeseries_mdf4(path: str | Path, series: Dict[str, list | tuple], rate_hz: float | None = None) -> None:
+def export_timeseries_mdf4(path: str | Path, series: Mapping[str, Sequence[float]], rate_hz: float | None = None) -> None:
     if not HAS_ASAMMDF:
         raise RuntimeError("asammdf not installed. Install `asammdf` to enable MDF4 export.")
     import numpy as np
@@ -103,3 +109,88 @@ def read_timeseries_mdf4(path: str | Path) -> Dict[str, list]:
         signal = mdf.get(channel)
         data[channel] = signal.samples.tolist()
     return data
+
+
+@dataclass
+class TimeseriesBlock:
+    """A contiguous slice of records from one MDF channel group."""
+
+    group: int
+    offset: int
+    timestamps: Any
+    channels: Dict[str, Any]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+def iter_timeseries_mdf4(
+    path: str | Path,
+    channels: Iterable[str] | None = None,
+    *,
+    chunk_size: int = MDF_CHUNK_ROWS,
+    max_memory: int = MDF_MEMORY_LIMIT,
+) -> Iterator[TimeseriesBlock]:
+    """Stream selected channels of an MDF4 file as NumPy blocks.
+
+    Only the requested channels are decoded, and only ``chunk_size`` records
+    at a time, so arbitrarily large measurement files can be processed with
+    bounded memory. The record count per block is further reduced so that the
+    block (timestamps plus every selected channel, estimated at eight bytes
+    per value) stays below ``max_memory`` bytes. Channels stored in different
+    channel groups are yielded in separate blocks because they do not share a
+    time base.
+    """
+
+    if not HAS_ASAMMDF:
+        raise RuntimeError("asammdf not installed. Install `asammdf` to enable MDF4 read.")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    source = Path(path)
+    mdf = MDF(source)
+    try:
+        selection = _select_mdf_channels(mdf, channels)
+        for group_index in sorted(selection):
+            entries = selection[group_index]
+            cycles = int(mdf.groups[group_index].channel_group.cycles_nr)
+            bytes_per_record = 8 * (len(entries) + 1)
+            rows = max(1, min(int(chunk_size), int(max_memory) // bytes_per_record))
+            for offset in range(0, cycles, rows):
+                signals = mdf.select(
+                    [(name, group_index, channel_index) for name, channel_index in entries],
+                    record_offset=offset,
+                    record_count=rows,
+                )
+                yield TimeseriesBlock(
+                    group=group_index,
+                    offset=offset,
+                    timestamps=signals[0].timestamps,
+                    channels={name: signal.samples for (name, _), signal in zip(entries, signals)},
+                )
+    finally:
+        mdf.close()
+
+
+def _select_mdf_channels(mdf: Any, channels: Iterable[str] | None) -> Dict[int, List[Tuple[str, int]]]:
+    masters: Dict[int, int] = dict(mdf.masters_db)  # type: ignore[attr-defined]
+    selection: Dict[int, List[Tuple[str, int]]] = {}
+    if channels is None:
+        for group_index, group in enumerate(mdf.groups):
+            for channel_index, channel in enumerate(group.channels):
+                if masters.get(group_index) == channel_index:
+                    continue
+                selection.setdefault(group_index, []).append((channel.name, channel_index))
+        return selection
+
+    channels_db = mdf.channels_db  # type: ignore[attr-defined]
+    for name in channels:
+        occurrences = channels_db.get(name)
+        if not occurrences:
+            raise KeyError(f"Channel '{name}' not found in MDF file")
+        for group_index, channel_index in occurrences:
+            if masters.get(group_index) == channel_index:
+                continue
+            entries = selection.setdefault(group_index, [])
+            if (name, channel_index) not in entries:
+                entries.append((name, channel_index))
+    return selection
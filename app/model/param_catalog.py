@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import json
-import copy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, Sequence
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Sequence
 
-from PySide6.QtCore import QObject, Property, Slot
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Property, Qt, Slot
 
 
 @dataclass(frozen=True)
@@ -20,13 +20,231 @@ class Field:
     step: float | None = None
     default: Any | None = None
     options: Sequence[str] | None = None
+    advanced: bool = False
 
     has_default: bool = False
 
 
+def _freeze(value: Any) -> Any:
+    """Return an immutable copy of a JSON-like value."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a plain ``dict``/``list`` copy of a frozen value for callers."""
+
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _field_matches(field: Mapping[str, Any], query: str, show_advanced: bool) -> bool:
+    if not show_advanced and field.get("advanced"):
+        return False
+    if not query:
+        return True
+    label = str(field.get("label") or "").lower()
+    key = str(field.get("key") or "").lower()
+    return query in label or query in key
+
+
+class FieldListModel(QAbstractListModel):
+    """Fields of one schema section."""
+
+    KeyRole = Qt.UserRole + 1
+    LabelRole = Qt.UserRole + 2
+    TypeRole = Qt.UserRole + 3
+    UnitRole = Qt.UserRole + 4
+    AdvancedRole = Qt.UserRole + 5
+    FieldRole = Qt.UserRole + 6
+
+    _ROLE_KEYS = {KeyRole: "key", LabelRole: "label", TypeRole: "type", UnitRole: "unit"}
+
+    def __init__(self, fields: Sequence[Mapping[str, Any]], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._fields = tuple(fields)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(self._fields)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._fields)):
+            return None
+        field = self._fields[index.row()]
+        if role in (Qt.DisplayRole, self.LabelRole):
+            return field.get("label")
+        if role in self._ROLE_KEYS:
+            return field.get(self._ROLE_KEYS[role])
+        if role == self.AdvancedRole:
+            return bool(field.get("advanced", False))
+        if role == self.FieldRole:
+            # ParamField reads the whole definition; convert only this field.
+            return _thaw(field)
+        return None
+
+    def roleNames(self) -> dict[int, bytes]:  # noqa: N802 - Qt API
+        return {
+            self.KeyRole: b"key",
+            self.LabelRole: b"label",
+            self.TypeRole: b"type",
+            self.UnitRole: b"unit",
+            self.AdvancedRole: b"advanced",
+            self.FieldRole: b"field",
+        }
+
+    @Property(int, constant=True)
+    def count(self) -> int:
+        return len(self._fields)
+
+    @Slot(str, bool, result=int)
+    def countMatching(self, query: str, show_advanced: bool) -> int:  # noqa: N802 - Qt slot naming
+        """Return how many fields match the sidebar search and advanced toggle."""
+
+        needle = (query or "").lower()
+        return sum(1 for field in self._fields if _field_matches(field, needle, show_advanced))
+
+
+class SectionListModel(QAbstractListModel):
+    """Sections of one schema category; field models are created on demand."""
+
+    LabelRole = Qt.UserRole + 1
+    FieldCountRole = Qt.UserRole + 2
+    FieldsRole = Qt.UserRole + 3
+
+    def __init__(self, sections: Sequence[Mapping[str, Any]], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._sections = tuple(sections)
+        self._field_models: dict[int, FieldListModel] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(self._sections)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._sections)):
+            return None
+        section = self._sections[index.row()]
+        if role in (Qt.DisplayRole, self.LabelRole):
+            return section.get("label")
+        if role == self.FieldCountRole:
+            return len(section.get("fields", ()))
+        if role == self.FieldsRole:
+            return self.fieldsModel(index.row())
+        return None
+
+    def roleNames(self) -> dict[int, bytes]:  # noqa: N802 - Qt API
+        return {self.LabelRole: b"label", self.FieldCountRole: b"fieldCount", self.FieldsRole: b"fields"}
+
+    @Property(int, constant=True)
+    def count(self) -> int:
+        return len(self._sections)
+
+    def label(self, row: int) -> str | None:
+        if 0 <= row < len(self._sections):
+            return self._sections[row].get("label")
+        return None
+
+    @Slot(int, result=QObject)
+    def fieldsModel(self, row: int) -> FieldListModel | None:  # noqa: N802 - Qt slot naming
+        if not 0 <= row < len(self._sections):
+            return None
+        model = self._field_models.get(row)
+        if model is None:
+            model = FieldListModel(self._sections[row].get("fields", ()), parent=self)
+            self._field_models[row] = model
+        return model
+
+    @Slot(str, bool, result=int)
+    def countMatching(self, query: str, show_advanced: bool) -> int:  # noqa: N802 - Qt slot naming
+        """Return how many fields across all sections match the filter."""
+
+        needle = (query or "").lower()
+        return sum(
+            1
+            for section in self._sections
+            for field in section.get("fields", ())
+            if _field_matches(field, needle, show_advanced)
+        )
+
+
+class CategoryListModel(QAbstractListModel):
+    """Top level of the schema tree; section models are created on demand."""
+
+    IdRole = Qt.UserRole + 1
+    LabelRole = Qt.UserRole + 2
+    SectionCountRole = Qt.UserRole + 3
+    SectionsRole = Qt.UserRole + 4
+
+    def __init__(self, categories: Sequence[Mapping[str, Any]], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._categories = tuple(categories)
+        self._section_models: dict[int, SectionListModel] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(self._categories)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._categories)):
+            return None
+        category = self._categories[index.row()]
+        if role in (Qt.DisplayRole, self.LabelRole):
+            return category.get("label")
+        if role == self.IdRole:
+            return category.get("id")
+        if role == self.SectionCountRole:
+            return len(category.get("sections", ()))
+        if role == self.SectionsRole:
+            return self.sectionsModel(index.row())
+        return None
+
+    def roleNames(self) -> dict[int, bytes]:  # noqa: N802 - Qt API
+        return {
+            self.IdRole: b"categoryId",
+            self.LabelRole: b"label",
+            self.SectionCountRole: b"sectionCount",
+            self.SectionsRole: b"sections",
+        }
+
+    @Property(int, constant=True)
+    def count(self) -> int:
+        return len(self._categories)
+
+    def label(self, row: int) -> str | None:
+        if 0 <= row < len(self._categories):
+            return self._categories[row].get("label")
+        return None
+
+    @Slot(int, result=QObject)
+    def sectionsModel(self, row: int) -> SectionListModel | None:  # noqa: N802 - Qt slot naming
+        if not 0 <= row < len(self._categories):
+            return None
+        model = self._section_models.get(row)
+        if model is None:
+            model = SectionListModel(self._categories[row].get("sections", ()), parent=self)
+            self._section_models[row] = model
+        return model
+
 
 class ParamCatalog(QObject):
-    """Lightweight wrapper around the parameter schema for QML."""
+    """Lightweight wrapper around the parameter schema for QML.
+
+    The schema is frozen once into an immutable snapshot. QML browses it
+    through :attr:`categoryModel`, a tree of list models whose section and
+    field levels are only built when a view asks for them, so property
+    bindings never copy or marshal the whole schema.
+    """
 
     def __init__(
         self,
@@ -34,12 +252,13 @@ class ParamCatalog(QObject):
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
-        self._categories = list(categories)
+        self._categories: tuple[Mapping[str, Any], ...] = _freeze(list(categories))
+        self._category_model: CategoryListModel | None = None
 
-        self._fields_by_key: dict[str, dict[str, Any]] = {}
+        self._fields_by_key: dict[str, Mapping[str, Any]] = {}
         for category in self._categories:
-            for section in category.get("sections", []):
-                for field in section.get("fields", []):
+            for section in category.get("sections", ()):
+                for field in section.get("fields", ()):
                     key = field.get("key")
                     if key:
                         self._fields_by_key[key] = field
@@ -54,22 +273,51 @@ class ParamCatalog(QObject):
         return cls(categories, parent=parent)
 
     def categories_schema(self) -> list[dict[str, Any]]:
-        """Return a deep copy of the raw category schema for Python callers."""
+        """Return a mutable copy of the raw category schema for Python callers."""
 
-        return copy.deepcopy(self._categories)
+        return _thaw(self._categories)
 
     @Property("QVariant", constant=True)
     def categories(self) -> list[dict[str, Any]]:
+        # Kept for scripts that still want the plain nested structure; views
+        # should bind ``categoryModel`` instead.
         return self.categories_schema()
 
+    @Property(QObject, constant=True)
+    def categoryModel(self) -> CategoryListModel:  # noqa: N802 - Qt property naming
+        if self._category_model is None:
+            self._category_model = CategoryListModel(self._categories, parent=self)
+        return self._category_model
+
+    @Slot(int, int, result=QObject)
+    def fieldsModel(self, category: int, section: int) -> FieldListModel | None:  # noqa: N802 - Qt slot naming
+        """Return the field model of one section, or ``None`` if out of range."""
+
+        sections = self.categoryModel.sectionsModel(category)
+        if sections is None:
+            return None
+        return sections.fieldsModel(section)
+
+    @Slot(int, int, result=str)
+    def sectionTitle(self, category: int, section: int) -> str:  # noqa: N802 - Qt slot naming
+        """Return ``"Category · Section"`` or an empty string if out of range."""
+
+        sections = self.categoryModel.sectionsModel(category)
+        if sections is None:
+            return ""
+        section_label = sections.label(section)
+        if section_label is None:
+            return ""
+        return f"{self.categoryModel.label(category)} · {section_label}"
+
     def iter_fields(self) -> Iterator[Field]:
         for category in self._categories:
-            for section in category.get("sections", []):
-                for field in section.get("fields", []):
+            for section in category.get("sections", ()):
+                for field in section.get("fields", ()):
 
                     yield Field(**field, has_default="default" in field)
 
-    def _field_by_key(self, key: str) -> dict[str, Any] | None:
+    def _field_by_key(self, key: str) -> Mapping[str, Any] | None:
         return self._fields_by_key.get(key)
 
     @Slot(str, result="QVariant")
@@ -91,4 +339,4 @@ class ParamCatalog(QObject):
         field = self._field_by_key(key)
         if not field:
             return None
-        return field.get("default")
+        return _thaw(field.get("default"))
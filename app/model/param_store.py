@@ -1,49 +1,176 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterator, Tuple
-
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Tuple
 
 from PySide6.QtCore import QObject, Property, Signal, Slot
 
+_MISSING = object()
+
 
 class ParamStore(QObject):
-    """Mutable storage of parameter values exposed to QML."""
+    """Mutable storage of parameter values exposed to QML.
 
-    changed = Signal(str, "QVariant")
+    ``changed`` is emitted for individual :meth:`setValue` calls made outside
+    a transaction. ``valuesChanged`` is emitted once per committed change set
+    -- a single edit or a whole transaction -- with a dict of the keys whose
+    value actually changed to their new value (``None`` when removed).
 
+    Every committed change set also bumps :attr:`revision`. QML delegates
+    compare it with :meth:`keyRevision` for their own key instead of
+    receiving the diff, so an import costs O(keys + delegates) rather than
+    one marshalled map per delegate. Python callers read through
+    :meth:`view` instead of copying the values.
+    """
+
+    changed = Signal(str, "QVariant")
+    valuesChanged = Signal(dict)
+    revisionChanged = Signal()
 
     def __init__(self, catalog, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._catalog = catalog
 
         self._values: Dict[str, Any] = dict(self._iter_default_items())
+        self._view: Mapping[str, Any] = MappingProxyType(self._values)
+        self._revision = 0
+        self._key_revision: Dict[str, int] = {}
+        self._depth = 0
+        # Value of every key touched by the open transaction before it started.
+        self._original: Dict[str, Any] = {}
+        # Set when a nested transaction rolled back; the outer one cannot commit.
+        self._rollback_only = False
 
     def _iter_default_items(self) -> Iterator[Tuple[str, Any]]:
         for field in self._catalog.iter_fields():
             if getattr(field, "has_default", False):
                 yield field.key, field.default
 
+    def _assign(self, key: str, value: Any) -> None:
+        if self._depth and key not in self._original:
+            self._original[key] = self._values.get(key, _MISSING)
+        if value is None:
+            self._values.pop(key, None)
+        else:
+            self._values[key] = value
 
     @Slot(str, "QVariant")
     def setValue(self, key: str, value: Any) -> None:  # noqa: N802 - Qt slot naming
-        if value is None and key in self._values:
-            del self._values[key]
-        else:
-            self._values[key] = value
+        if self._depth:
+            self._assign(key, value)
+            return
+        previous = self._values.get(key, _MISSING)
+        self._assign(key, value)
         self.changed.emit(key, value)
+        if self._values.get(key, _MISSING) != previous:
+            self._publish({key: self._values.get(key)})
 
     @Slot(str, result="QVariant")
     def getValue(self, key: str) -> Any:  # noqa: N802 - Qt slot naming
         return self._values.get(key)
 
     @Slot("QVariantMap")
-    def setValues(self, values: Dict[str, Any]) -> None:
-        for key, value in values.items():
-            self.setValue(key, value)
-
-    @Property("QVariant", constant=True)
+    def setValues(self, values: Dict[str, Any]) -> None:  # noqa: N802 - Qt slot naming
+        """Apply *values* atomically and notify listeners once."""
+
+        with self.transaction():
+            for key, value in values.items():
+                self._assign(key, value)
+
+    @Slot()
+    def beginTransaction(self) -> None:  # noqa: N802 - Qt slot naming
+        self._depth += 1
+
+    @Slot()
+    def commitTransaction(self) -> Dict[str, Any]:  # noqa: N802 - Qt slot naming
+        """Close the innermost transaction and return the emitted diff.
+
+        Nested transactions are folded into the outermost one; only closing
+        that emits ``valuesChanged``. An empty diff is not emitted. If a
+        nested transaction was rolled back, closing the outermost one rolls
+        it back as well and raises :class:`RuntimeError`.
+        """
+
+        if not self._depth:
+            raise RuntimeError("commitTransaction() called without an open transaction")
+        self._depth -= 1
+        if self._depth:
+            return {}
+        if self._rollback_only:
+            self._rollback_only = False
+            self._restore()
+            raise RuntimeError("Transaction rolled back because a nested transaction failed")
+        original, self._original = self._original, {}
+        diff = {
+            key: self._values.get(key)
+            for key, before in original.items()
+            if self._values.get(key, _MISSING) != before
+        }
+        if diff:
+            self._publish(diff)
+        return diff
+
+    def _publish(self, diff: Dict[str, Any]) -> None:
+        self._revision += 1
+        for key in diff:
+            self._key_revision[key] = self._revision
+        self.valuesChanged.emit(diff)
+        self.revisionChanged.emit()
+
+    @Slot()
+    def rollbackTransaction(self) -> None:  # noqa: N802 - Qt slot naming
+        """Discard every change since the outermost ``beginTransaction`` and close one level.
+
+        Rolling back a nested transaction leaves the outer ones open but marks
+        them rollback-only: later edits still join them, and closing the
+        outermost one rolls back instead of committing.
+        """
+
+        if not self._depth:
+            raise RuntimeError("rollbackTransaction() called without an open transaction")
+        self._depth -= 1
+        self._restore()
+        self._rollback_only = bool(self._depth)
+
+    def _restore(self) -> None:
+        for key, before in self._original.items():
+            if before is _MISSING:
+                self._values.pop(key, None)
+            else:
+                self._values[key] = before
+        self._original = {}
+
+    @contextmanager
+    def transaction(self) -> Iterator["ParamStore"]:
+        """Group updates; commit on exit or roll back if the block raises."""
+
+        self.beginTransaction()
+        try:
+            yield self
+        except BaseException:
+            self.rollbackTransaction()
+            raise
+        self.commitTransaction()
+
+    def view(self) -> Mapping[str, Any]:
+        """Return a live read-only view of the current values."""
+
+        return self._view
+
+    @Property(int, notify=revisionChanged)
+    def revision(self) -> int:
+        return self._revision
+
+    @Slot(str, result=int)
+    def keyRevision(self, key: str) -> int:  # noqa: N802 - Qt slot naming
+        """Return the revision of the last change set that touched *key*."""
+
+        return self._key_revision.get(key, 0)
+
+    @Property("QVariantMap", notify=revisionChanged)
     def values(self) -> Dict[str, Any]:  # noqa: D401
-
+        # QML needs a marshalled map anyway; Python callers should use view().
         return dict(self._values)
 
     @Slot(result="QVariant")
@@ -63,11 +63,12 @@ def run(ui_values: Dict[str, Any], categories_schema: list[dict]):
 
 def extract_series(solution):
     _lazy_import_pybamm()  # ensure dependency present
-    series: Dict[str, list] = {"time [s]": solution.t.tolist()}
+    # Channels stay as NumPy arrays; the exporters consume them directly.
+    series: Dict[str, Any] = {"time [s]": solution.t}
 
-    def try_get(name: str) -> list | None:
+    def try_get(name: str) -> Any | None:
         try:
-            return solution[name](solution.t).full().flatten().tolist()
+            return solution[name](solution.t).full().ravel()
         except Exception:  # noqa: BLE001 - PyBaMM raises many custom exceptions
             return None
 
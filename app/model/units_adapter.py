@@ -1,8 +1,28 @@
+"""Unit conversion of UI parameter values into the units PyBaMM expects.
+
+Conversions are compiled once per category schema into a
+:class:`ConversionPlan`: one ``scale``/``offset`` pair per field, so a single
+parameter set or a whole ``(points, keys)`` matrix of sweep points is
+converted with one vectorised multiply-add. Units are resolved by a small
+:class:`UnitRegistry` that understands SI prefixes, compound units in UI and
+PyBaMM notation (``W/(m^2·K)``, ``W.m-2.K-1``, ``mAh``) and offset
+temperature scales (°C/°F ↔ K). Values are converted to the unit named in the
+target PyBaMM key (``Nominal cell capacity [A.h]``), or to coherent SI for
+keys without one, and dimension mismatches are reported on the plan.
+"""
+
 from __future__ import annotations
 
-from typing import Any, Dict
+import math
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
-# Simple unit multipliers to SI (scalars only)
+# Simple unit multipliers to SI (scalars only). Kept for callers that use the
+# table directly; the registry reproduces every entry.
 UNIT_TO_SI: dict[str, float] = {
     "μm": 1e-6,
     "um": 1e-6,
@@ -61,34 +81,416 @@ PYBAMM_KEY_MAP: dict[str, str] = {
 CELSIUS_KEYS = {"initial.temperature", "thermal.ambient_temp"}
 
 
-def _build_unit_index(categories: list[dict]) -> dict[str, dict]:
-    idx: dict[str, dict] = {}
-    for cat in categories:
-        for sec in cat.get("sections", []):
-            for field in sec.get("fields", []):
-                idx[field["key"]] = {
-                    "unit": field.get("unit"),
-                    "advanced": field.get("advanced", False),
-                }
-    return idx
+_PYBAMM_UNIT = re.compile(r"\[(.*?)\]$")
 
+# Exponents of (m, kg, s, A, K, mol, cd).
+Dimensions = Tuple[float, ...]
+_DIMENSIONLESS: Dimensions = (0.0,) * 7
 
-def convert_to_si(values: Dict[str, Any], categories_schema: list[dict]) -> Dict[str, Any]:
-    unit_idx = _build_unit_index(categories_schema)
-    out: Dict[str, Any] = {}
-    for key, value in values.items():
-        meta = unit_idx.get(key, {})
-        unit = meta.get("unit")
+
+class UnitError(ValueError):
+    """Raised for unknown units or conversions between incompatible dimensions."""
+
+
+@dataclass(frozen=True)
+class UnitDefinition:
+    """``si = value * scale + offset`` with the given base-unit exponents."""
+
+    scale: float
+    dimensions: Dimensions = _DIMENSIONLESS
+    offset: float = 0.0
+
+    def __mul__(self, other: "UnitDefinition") -> "UnitDefinition":
+        # Offset scales only apply to standalone temperatures; inside a
+        # compound unit (W/(m·°C)) they act as temperature differences.
+        return UnitDefinition(
+            self.scale * other.scale,
+            tuple(a + b for a, b in zip(self.dimensions, other.dimensions)),
+        )
+
+    def __truediv__(self, other: "UnitDefinition") -> "UnitDefinition":
+        return self * other ** -1
+
+    def __pow__(self, exponent: float) -> "UnitDefinition":
+        if exponent == 1:
+            return self
+        return UnitDefinition(self.scale**exponent, tuple(value * exponent for value in self.dimensions))
+
+    def compatible(self, other: "UnitDefinition") -> bool:
+        return all(math.isclose(a, b) for a, b in zip(self.dimensions, other.dimensions))
+
+
+def _base(index: int) -> Dimensions:
+    return tuple(1.0 if position == index else 0.0 for position in range(7))
+
+
+_METRE = UnitDefinition(1.0, _base(0))
+_KILOGRAM = UnitDefinition(1.0, _base(1))
+_SECOND = UnitDefinition(1.0, _base(2))
+_AMPERE = UnitDefinition(1.0, _base(3))
+_KELVIN = UnitDefinition(1.0, _base(4))
+_MOLE = UnitDefinition(1.0, _base(5))
+_CANDELA = UnitDefinition(1.0, _base(6))
+_HOUR = UnitDefinition(3600.0, _SECOND.dimensions)
+_NEWTON = _KILOGRAM * _METRE / _SECOND**2
+_JOULE = _NEWTON * _METRE
+_WATT = _JOULE / _SECOND
+_COULOMB = _AMPERE * _SECOND
+_VOLT = _WATT / _AMPERE
+_OHM = _VOLT / _AMPERE
+
+_UNITS: Dict[str, UnitDefinition] = {
+    "m": _METRE,
+    "g": UnitDefinition(1e-3, _KILOGRAM.dimensions),
+    "s": _SECOND,
+    "A": _AMPERE,
+    "K": _KELVIN,
+    "mol": _MOLE,
+    "cd": _CANDELA,
+    "min": UnitDefinition(60.0, _SECOND.dimensions),
+    "h": _HOUR,
+    "hr": _HOUR,
+    "Hz": _SECOND**-1,
+    "N": _NEWTON,
+    "Pa": _NEWTON / _METRE**2,
+    "bar": UnitDefinition(1e5, (_NEWTON / _METRE**2).dimensions),
+    "J": _JOULE,
+    "W": _WATT,
+    "C": _COULOMB,
+    "V": _VOLT,
+    "Ohm": _OHM,
+    "ohm": _OHM,
+    "Ω": _OHM,
+    "S": _OHM**-1,
+    "F": _COULOMB / _VOLT,
+    "L": UnitDefinition(1e-3, (_METRE**3).dimensions),
+    "l": UnitDefinition(1e-3, (_METRE**3).dimensions),
+    "Ah": _AMPERE * _HOUR,
+    "Wh": _WATT * _HOUR,
+    "%": UnitDefinition(1e-2),
+    "ppm": UnitDefinition(1e-6),
+    "°C": UnitDefinition(1.0, _KELVIN.dimensions, 273.15),
+    "degC": UnitDefinition(1.0, _KELVIN.dimensions, 273.15),
+    "℃": UnitDefinition(1.0, _KELVIN.dimensions, 273.15),
+    "°F": UnitDefinition(5.0 / 9.0, _KELVIN.dimensions, 273.15 - 32.0 * 5.0 / 9.0),
+    "degF": UnitDefinition(5.0 / 9.0, _KELVIN.dimensions, 273.15 - 32.0 * 5.0 / 9.0),
+}
+
+_PREFIXES: Dict[str, float] = {
+    "G": 1e9,
+    "M": 1e6,
+    "k": 1e3,
+    "d": 1e-1,
+    "c": 1e-2,
+    "m": 1e-3,
+    "μ": 1e-6,
+    "µ": 1e-6,
+    "u": 1e-6,
+    "n": 1e-9,
+    "p": 1e-12,
+}
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<open>\()|(?P<close>\))|(?P<div>/)|(?P<mul>[*·⋅.])"
+    r"|(?P<number>\^?-?\d+(?:\.\d+)?)|(?P<symbol>[^\s()/*·⋅.^\d-]+))"
+)
+
+
+class UnitRegistry:
+    """Parses unit strings into :class:`UnitDefinition` objects.
+
+    Supports SI prefixes, products (``·``, ``*``, ``.`` or a space), quotients,
+    parentheses and exponents written ``m^2``, ``m2`` or ``K-1``.
+    """
+
+    def __init__(self, units: Optional[Mapping[str, UnitDefinition]] = None) -> None:
+        self._units: Dict[str, UnitDefinition] = dict(_UNITS if units is None else units)
+        self._cache: Dict[str, UnitDefinition] = {}
+
+    def define(self, name: str, definition: UnitDefinition) -> None:
+        self._units[name] = definition
+        self._cache.clear()
+
+    def parse(self, text: Optional[str]) -> UnitDefinition:
+        key = (text or "").strip()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        if key in {"", "1", "-"}:
+            unit = UnitDefinition(1.0)
+        else:
+            unit = _UnitParser(self, key).parse()
+        self._cache[key] = unit
+        return unit
+
+    def symbol(self, name: str) -> UnitDefinition:
+        unit = self._units.get(name)
+        if unit is not None:
+            return unit
+        for prefix in sorted(_PREFIXES, key=len, reverse=True):
+            if name.startswith(prefix) and name[len(prefix) :] in self._units:
+                base = self._units[name[len(prefix) :]]
+                if base.offset:
+                    break
+                return UnitDefinition(base.scale * _PREFIXES[prefix], base.dimensions)
+        raise UnitError(f"Unknown unit '{name}'")
+
+    def conversion(self, source: Optional[str], target: Optional[str]) -> Tuple[float, float]:
+        """Return ``(scale, offset)`` so that ``target_value = value * scale + offset``."""
+
+        source_unit = self.parse(source)
+        target_unit = self.parse(target)
+        if not source_unit.compatible(target_unit):
+            raise UnitError(f"Cannot convert '{source}' to '{target}': incompatible dimensions")
+        scale = source_unit.scale / target_unit.scale
+        offset = (source_unit.offset - target_unit.offset) / target_unit.scale
+        return scale, offset
+
+    def convert(self, value: Any, source: Optional[str], target: Optional[str]) -> Any:
+        scale, offset = self.conversion(source, target)
         if isinstance(value, (int, float)):
-            if key in CELSIUS_KEYS:
-                out[key] = float(value) + 273.15 if unit in ("°C", "C") else float(value)
-            elif unit in UNIT_TO_SI:
-                out[key] = float(value) * UNIT_TO_SI[unit]
+            return float(value) * scale + offset
+        return np.asarray(value, dtype=np.float64) * scale + offset
+
+
+class _UnitParser:
+    def __init__(self, registry: UnitRegistry, text: str) -> None:
+        self._registry = registry
+        self._text = text
+        self._tokens: List[Tuple[str, str]] = []
+        position = 0
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                if text[position:].strip():
+                    raise UnitError(f"Cannot parse unit '{text}'")
+                break
+            self._tokens.append((match.lastgroup or "", match.group(match.lastgroup or 0)))
+            position = match.end()
+        self._index = 0
+
+    def _peek(self) -> str:
+        return self._tokens[self._index][0] if self._index < len(self._tokens) else ""
+
+    def _take(self) -> Tuple[str, str]:
+        token = self._tokens[self._index]
+        self._index += 1
+        return token
+
+    def parse(self) -> UnitDefinition:
+        unit = self._expression()
+        if self._index != len(self._tokens):
+            raise UnitError(f"Cannot parse unit '{self._text}'")
+        return unit
+
+    def _expression(self) -> UnitDefinition:
+        unit = self._factor()
+        while True:
+            kind = self._peek()
+            if kind == "mul":
+                self._take()
+                unit = unit * self._factor()
+            elif kind == "div":
+                self._take()
+                unit = unit / self._factor()
+            elif kind in {"symbol", "open"}:
+                unit = unit * self._factor()
             else:
-                out[key] = float(value)
+                return unit
+
+    def _factor(self) -> UnitDefinition:
+        kind = self._peek()
+        if kind == "open":
+            self._take()
+            unit = self._expression()
+            if self._peek() != "close":
+                raise UnitError(f"Unbalanced parentheses in unit '{self._text}'")
+            self._take()
+        elif kind == "symbol":
+            unit = self._registry.symbol(self._take()[1])
+        elif kind == "number":
+            unit = UnitDefinition(float(self._take()[1].lstrip("^")))
         else:
-            out[key] = value
-    return out
+            raise UnitError(f"Cannot parse unit '{self._text}'")
+        if self._peek() == "number":
+            unit = unit ** float(self._take()[1].lstrip("^"))
+        return unit
+
+
+DEFAULT_REGISTRY = UnitRegistry()
+
+# Quantities PyBaMM expresses in a non-coherent unit; used as the target for
+# UI keys without a PyBaMM mapping.
+_PREFERRED_UNITS: Tuple[str, ...] = ("A.h",)
+
+
+def pybamm_unit(name: str) -> Optional[str]:
+    """Return the unit in a PyBaMM parameter name, ``None`` when it has none."""
+
+    match = _PYBAMM_UNIT.search(name)
+    return match.group(1) if match else None
+
+
+@dataclass(frozen=True)
+class ConversionPlan:
+    """Per-field ``scale``/``offset`` arrays compiled from a category schema."""
+
+    keys: Tuple[str, ...]
+    units: Tuple[Optional[str], ...]
+    target_units: Tuple[Optional[str], ...]
+    pybamm_keys: Tuple[str, ...]
+    scale: np.ndarray
+    offset: np.ndarray
+    mismatches: Tuple[str, ...] = ()
+    index: Mapping[str, int] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def compile(
+        cls,
+        categories_schema: Sequence[Mapping[str, Any]],
+        *,
+        registry: Optional[UnitRegistry] = None,
+    ) -> "ConversionPlan":
+        fields = _schema_units(categories_schema)
+        if registry is None:
+            return _compile_cached(fields)
+        return _compile(fields, registry)
+
+    def columns(self, keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the ``scale`` and ``offset`` vectors for *keys* (in that order)."""
+
+        scale = np.ones(len(keys), dtype=np.float64)
+        offset = np.zeros(len(keys), dtype=np.float64)
+        for column, key in enumerate(keys):
+            position = self.index.get(key)
+            if position is not None:
+                scale[column] = self.scale[position]
+                offset[column] = self.offset[position]
+        return scale, offset
+
+    def to_si(self, matrix: Any, keys: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Convert a ``(points, len(keys))`` matrix (or one vector) in one pass."""
+
+        values = np.asarray(matrix, dtype=np.float64)
+        if keys is None:
+            scale, offset = self.scale, self.offset
+        else:
+            scale, offset = self.columns(keys)
+        if values.shape[-1] != scale.shape[0]:
+            raise ValueError(f"Expected {scale.shape[0]} columns, got {values.shape[-1]}")
+        return values * scale + offset
+
+    def pybamm_names(self, keys: Optional[Sequence[str]] = None) -> List[str]:
+        if keys is None:
+            return list(self.pybamm_keys)
+        return [PYBAMM_KEY_MAP.get(key, key) for key in keys]
+
+    def to_pybamm(self, matrix: Any, keys: Optional[Sequence[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """Return PyBaMM parameter names and the converted matrix."""
+
+        return self.pybamm_names(keys), self.to_si(matrix, keys)
+
+    def pybamm_points(self, matrix: Any, keys: Optional[Sequence[str]] = None) -> List[Dict[str, float]]:
+        """Convert sweep points to override dictionaries keyed by PyBaMM names."""
+
+        names, converted = self.to_pybamm(np.atleast_2d(np.asarray(matrix, dtype=np.float64)), keys)
+        return [dict(zip(names, row)) for row in converted.tolist()]
+
+    def convert_values(self, values: Mapping[str, Any]) -> Dict[str, Any]:
+        """Convert one parameter dictionary; non-numeric values pass through."""
+
+        out: Dict[str, Any] = {}
+        index = self.index
+        for key, value in values.items():
+            if isinstance(value, (int, float)):
+                position = index.get(key)
+                if position is None:
+                    out[key] = float(value)
+                else:
+                    out[key] = float(value) * float(self.scale[position]) + float(self.offset[position])
+            else:
+                out[key] = value
+        return out
+
+
+def _schema_units(categories: Sequence[Mapping[str, Any]]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    return tuple(
+        (field["key"], field.get("unit"))
+        for cat in categories
+        for sec in cat.get("sections", [])
+        for field in sec.get("fields", [])
+    )
+
+
+def _target_unit(key: str, unit: Optional[str], registry: UnitRegistry) -> Optional[str]:
+    pybamm_name = PYBAMM_KEY_MAP.get(key)
+    if pybamm_name is not None:
+        return pybamm_unit(pybamm_name) or ""
+    source = registry.parse(unit)
+    for preferred in _PREFERRED_UNITS:
+        if source.compatible(registry.parse(preferred)):
+            return preferred
+    return None
+
+
+def _compile(fields: Tuple[Tuple[str, Optional[str]], ...], registry: UnitRegistry) -> ConversionPlan:
+    keys: List[str] = []
+    units: List[Optional[str]] = []
+    targets: List[Optional[str]] = []
+    scale: List[float] = []
+    offset: List[float] = []
+    mismatches: List[str] = []
+    for key, unit in fields:
+        if key in CELSIUS_KEYS and unit == "C":
+            unit = "°C"  # historical spelling of degrees Celsius for these keys
+        factor, shift, target = 1.0, 0.0, None
+        if unit:
+            try:
+                target = _target_unit(key, unit, registry)
+                if target is None:
+                    source = registry.parse(unit)
+                    factor, shift = source.scale, source.offset
+                else:
+                    factor, shift = registry.conversion(unit, target)
+            except UnitError as exc:
+                # Left unconverted, as before, but reported.
+                mismatches.append(f"{key}: {exc}")
+                factor, shift, target = 1.0, 0.0, unit
+        keys.append(key)
+        units.append(unit)
+        targets.append(target)
+        scale.append(factor)
+        offset.append(shift)
+    scale_array = np.asarray(scale, dtype=np.float64)
+    offset_array = np.asarray(offset, dtype=np.float64)
+    scale_array.flags.writeable = False
+    offset_array.flags.writeable = False
+    return ConversionPlan(
+        keys=tuple(keys),
+        units=tuple(units),
+        target_units=tuple(targets),
+        pybamm_keys=tuple(PYBAMM_KEY_MAP.get(key, key) for key in keys),
+        scale=scale_array,
+        offset=offset_array,
+        mismatches=tuple(mismatches),
+        # Later duplicates win, matching the dictionary the schema describes.
+        index={key: position for position, key in enumerate(keys)},
+    )
+
+
+@lru_cache(maxsize=16)
+def _compile_cached(fields: Tuple[Tuple[str, Optional[str]], ...]) -> ConversionPlan:
+    return _compile(fields, DEFAULT_REGISTRY)
+
+
+def compile_plan(categories_schema: Sequence[Mapping[str, Any]]) -> ConversionPlan:
+    """Return the (cached) conversion plan for *categories_schema*."""
+
+    return ConversionPlan.compile(categories_schema)
+
+
+def convert_to_si(values: Dict[str, Any], categories_schema: list[dict]) -> Dict[str, Any]:
+    return compile_plan(categories_schema).convert_values(values)
 
 
 def values_to_pybamm_keys(values_si: Dict[str, Any]) -> Dict[str, Any]:
@@ -96,3 +498,19 @@ def values_to_pybamm_keys(values_si: Dict[str, Any]) -> Dict[str, Any]:
     for key, value in values_si.items():
         out[PYBAMM_KEY_MAP.get(key, key)] = value
     return out
+
+
+__all__ = [
+    "CELSIUS_KEYS",
+    "ConversionPlan",
+    "DEFAULT_REGISTRY",
+    "PYBAMM_KEY_MAP",
+    "UNIT_TO_SI",
+    "UnitDefinition",
+    "UnitError",
+    "UnitRegistry",
+    "compile_plan",
+    "convert_to_si",
+    "pybamm_unit",
+    "values_to_pybamm_keys",
+]
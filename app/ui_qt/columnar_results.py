@@ -0,0 +1,321 @@
+"""Compressed columnar storage (Parquet / Arrow IPC) for simulation results.
+
+Every result channel becomes one ``float64`` column, time first. Units are
+stored as per-field metadata (``unit``) and the run metadata (``run_id``,
+scenario, preset, overrides, ...) as JSON in the schema metadata under
+``evsim``, so both survive without a side-car file and can be inspected from
+the file footer alone.
+
+Parquet files are compressed per column (``zstd`` by default, with the
+byte-stream-split encoding for the floating point channels) and are the
+format of choice for archiving sweeps. Arrow IPC files are faster to read,
+can be memory-mapped when uncompressed and use one codec for the whole file.
+Both readers decode only the projected channels, which lets analysis code
+pull a couple of signals out of thousands of runs::
+
+    for path, results in scan_columnar_results("data/simulations/sweep", ["Voltage [V]"]):
+        ...
+
+``pyarrow`` is an optional dependency; :data:`HAS_PYARROW` tells whether it
+is available.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa  # type: ignore
+    import pyarrow.ipc  # type: ignore  # noqa: F401  (registers pa.ipc)
+    import pyarrow.parquet as pq  # type: ignore
+
+    HAS_PYARROW = True
+except Exception:  # noqa: BLE001
+    HAS_PYARROW = False
+
+if __package__:
+    from .simulation_results import SimulationResults
+else:  # pragma: no cover - executed when running as a script
+    from simulation_results import SimulationResults
+
+
+PARQUET_SUFFIX = ".parquet"
+ARROW_SUFFIX = ".arrow"
+COLUMNAR_FORMATS = {"parquet": PARQUET_SUFFIX, "arrow": ARROW_SUFFIX}
+
+# Rows per Parquet row group / Arrow record batch. Readers decompress whole
+# row groups, so this bounds the temporary memory of a projected read.
+COLUMNAR_ROW_GROUP_ROWS = 262144
+
+# Schema metadata key holding the JSON run description and its layout version.
+SCHEMA_METADATA_KEY = b"evsim"
+COLUMNAR_FORMAT_VERSION = 1
+
+Compression = Union[str, Mapping[str, str], None]
+
+
+@dataclass
+class ColumnarHeader:
+    """Channel layout and run metadata of a columnar results file."""
+
+    path: pathlib.Path
+    format: str
+    time_channel: str
+    channels: List[str]
+    units: Dict[str, str] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    samples: int = 0
+
+    @property
+    def run_id(self) -> Optional[str]:
+        value = self.metadata.get("run_id")
+        return None if value is None else str(value)
+
+
+def _require_pyarrow(action: str) -> None:
+    if not HAS_PYARROW:
+        raise RuntimeError(f"pyarrow not installed. Install `pyarrow` to enable columnar {action}.")
+
+
+def columnar_format_for(path: str | pathlib.Path, format: Optional[str] = None) -> str:
+    """Return ``"parquet"`` or ``"arrow"`` for *path* (by suffix unless *format* is given)."""
+
+    if format is None:
+        suffix = pathlib.Path(path).suffix.lower()
+        format = {PARQUET_SUFFIX: "parquet", ARROW_SUFFIX: "arrow", ".feather": "arrow"}.get(suffix)
+        if format is None:
+            raise ValueError(f"Cannot infer the columnar format of '{path}'")
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format '{format}'")
+    return format
+
+
+def _schema(data: SimulationResults, names: Sequence[str]) -> "pa.Schema":
+    fields = [
+        pa.field(name, pa.float64(), nullable=False, metadata={b"unit": data.unit(name).encode("utf-8")})
+        for name in names
+    ]
+    description = {
+        "version": COLUMNAR_FORMAT_VERSION,
+        "time_channel": data.time_channel,
+        "samples": data.sample_count,
+        "metadata": data.metadata,
+    }
+    return pa.schema(fields, metadata={SCHEMA_METADATA_KEY: json.dumps(description, default=str).encode("utf-8")})
+
+
+def write_columnar_results(
+    path: str | pathlib.Path,
+    results: Mapping[str, Sequence[float]],
+    *,
+    format: Optional[str] = None,
+    compression: Compression = "zstd",
+    compression_level: Optional[int] = None,
+    row_group_rows: int = COLUMNAR_ROW_GROUP_ROWS,
+) -> pathlib.Path:
+    """Write *results* as a Parquet or Arrow IPC file and return its path.
+
+    ``compression`` names the codec (``"zstd"``, ``"lz4"``, ``"snappy"``,
+    ``"gzip"`` or ``None``). For Parquet it may also map channel names to
+    codecs; channels missing from the mapping are stored uncompressed. Arrow
+    IPC only supports ``"zstd"``, ``"lz4"`` or ``None`` for the whole file.
+    """
+
+    _require_pyarrow("export")
+    path = pathlib.Path(path)
+    format = columnar_format_for(path, format)
+    data = SimulationResults.from_mapping(results)
+    names = [data.time_channel] + data.channel_names
+    schema = _schema(data, names)
+    # Zero-copy: contiguous float64 NumPy columns become Arrow buffers as-is.
+    table = pa.Table.from_arrays([pa.array(data[name]) for name in names], schema=schema)
+    rows = max(1, int(row_group_rows))
+
+    if format == "parquet":
+        if isinstance(compression, Mapping):
+            codecs: Any = {name: compression.get(name, "none") or "none" for name in names}
+        else:
+            codecs = compression or "none"
+        pq.write_table(
+            table,
+            path,
+            row_group_size=rows,
+            compression=codecs,
+            compression_level=compression_level,
+            use_byte_stream_split=True,
+            use_dictionary=False,
+            write_statistics=[data.time_channel],
+        )
+        return path
+
+    if isinstance(compression, Mapping):
+        raise ValueError("Arrow IPC files use a single codec; per-channel compression needs Parquet")
+    codec = None
+    if compression is not None:
+        codec = pa.Codec(compression, compression_level=compression_level)
+    options = pa.ipc.IpcWriteOptions(compression=codec)
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, schema, options=options) as writer:
+        writer.write_table(table, max_chunksize=rows)
+    return path
+
+
+def _description(schema: "pa.Schema") -> Dict[str, Any]:
+    raw = (schema.metadata or {}).get(SCHEMA_METADATA_KEY)
+    if raw is None:
+        return {}
+    description = json.loads(raw.decode("utf-8"))
+    version = description.get("version", COLUMNAR_FORMAT_VERSION)
+    if version != COLUMNAR_FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar results version {version}")
+    return description
+
+
+def _header_from_schema(path: pathlib.Path, format: str, schema: "pa.Schema", samples: int) -> ColumnarHeader:
+    description = _description(schema)
+    names = list(schema.names)
+    if not names:
+        raise ValueError(f"{path} holds no result channels")
+    time_channel = description.get("time_channel", names[0])
+    units = {}
+    for item in schema:
+        unit = (item.metadata or {}).get(b"unit")
+        units[item.name] = unit.decode("utf-8") if unit is not None else ""
+    return ColumnarHeader(
+        path=path,
+        format=format,
+        time_channel=time_channel,
+        channels=[name for name in names if name != time_channel],
+        units=units,
+        metadata=description.get("metadata", {}),
+        samples=samples,
+    )
+
+
+def _ipc_header(path: pathlib.Path, source: "pa.NativeFile") -> Tuple[ColumnarHeader, "pa.Schema"]:
+    schema = pa.ipc.open_file(source).schema
+    samples = _description(schema).get("samples")
+    if samples is None:
+        # Files without a recorded row count: decode only the first column,
+        # since every batch of a compressed file is decompressed when read.
+        options = pa.ipc.IpcReadOptions(included_fields=[0])
+        reader = pa.ipc.open_file(source, options=options)
+        samples = sum(reader.get_batch(index).num_rows for index in range(reader.num_record_batches))
+    return _header_from_schema(path, "arrow", schema, int(samples)), schema
+
+
+def read_columnar_header(path: str | pathlib.Path, *, format: Optional[str] = None) -> ColumnarHeader:
+    """Read channel names, units, run metadata and row count without decoding any samples."""
+
+    _require_pyarrow("read")
+    path = pathlib.Path(path)
+    format = columnar_format_for(path, format)
+    if format == "parquet":
+        parquet = pq.ParquetFile(path)
+        try:
+            return _header_from_schema(path, format, parquet.schema_arrow, parquet.metadata.num_rows)
+        finally:
+            parquet.close()
+    with pa.memory_map(str(path), "r") as source:
+        return _ipc_header(path, source)[0]
+
+
+def _projection(header: ColumnarHeader, channels: Optional[Iterable[str]]) -> List[str]:
+    wanted = header.channels if channels is None else list(dict.fromkeys(channels))
+    missing = set(wanted).difference(header.channels)
+    if missing:
+        raise KeyError(f"Channels not present in {header.path}: {sorted(missing)}")
+    selected = set(wanted)
+    return [header.time_channel] + [name for name in header.channels if name in selected]
+
+
+def _column(table: "pa.Table", name: str) -> np.ndarray:
+    column = table.column(name)
+    if column.num_chunks == 1:
+        # Zero-copy view for uncompressed memory-mapped Arrow files.
+        return column.chunk(0).to_numpy()
+    return column.to_numpy()
+
+
+def read_columnar_results(
+    path: str | pathlib.Path,
+    channels: Optional[Iterable[str]] = None,
+    *,
+    format: Optional[str] = None,
+) -> SimulationResults:
+    """Read a columnar results file, decoding only *channels* (plus time)."""
+
+    _require_pyarrow("read")
+    path = pathlib.Path(path)
+    format = columnar_format_for(path, format)
+    if format == "parquet":
+        parquet = pq.ParquetFile(path)
+        try:
+            header = _header_from_schema(path, format, parquet.schema_arrow, parquet.metadata.num_rows)
+            names = _projection(header, channels)
+            table = parquet.read(columns=names, use_threads=True)
+        finally:
+            parquet.close()
+    else:
+        # The map stays open for as long as zero-copy columns reference it.
+        source = pa.memory_map(str(path), "r")
+        header, schema = _ipc_header(path, source)
+        names = _projection(header, channels)
+        positions = {name: index for index, name in enumerate(schema.names)}
+        options = pa.ipc.IpcReadOptions(included_fields=sorted(positions[name] for name in names))
+        table = pa.ipc.open_file(source, options=options).read_all()
+
+    return SimulationResults(
+        {name: _column(table, name) for name in names},
+        units={name: header.units.get(name, "") for name in names},
+        metadata=header.metadata,
+        time_channel=header.time_channel,
+    )
+
+
+def scan_columnar_results(
+    paths: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]],
+    channels: Optional[Iterable[str]] = None,
+    *,
+    where: Optional[Callable[[ColumnarHeader], bool]] = None,
+) -> Iterator[Tuple[pathlib.Path, SimulationResults]]:
+    """Yield ``(path, results)`` for many runs, one at a time.
+
+    *paths* is a directory (every ``.parquet`` and ``.arrow`` file in it, in
+    name order) or an iterable of files. ``where`` receives each run's
+    :class:`ColumnarHeader` and can skip runs by their metadata before any
+    samples are read. Only *channels* (plus time) are decoded.
+    """
+
+    if isinstance(paths, (str, pathlib.Path)) and pathlib.Path(paths).is_dir():
+        directory = pathlib.Path(paths)
+        files = sorted(item for item in directory.iterdir() if item.suffix in (PARQUET_SUFFIX, ARROW_SUFFIX))
+    elif isinstance(paths, (str, pathlib.Path)):
+        files = [pathlib.Path(paths)]
+    else:
+        files = [pathlib.Path(item) for item in paths]
+    projection = None if channels is None else list(channels)
+    for path in files:
+        if where is not None and not where(read_columnar_header(path)):
+            continue
+        yield path, read_columnar_results(path, projection)
+
+
+__all__ = [
+    "ARROW_SUFFIX",
+    "COLUMNAR_FORMATS",
+    "COLUMNAR_FORMAT_VERSION",
+    "COLUMNAR_ROW_GROUP_ROWS",
+    "ColumnarHeader",
+    "HAS_PYARROW",
+    "PARQUET_SUFFIX",
+    "columnar_format_for",
+    "read_columnar_header",
+    "read_columnar_results",
+    "scan_columnar_results",
+    "write_columnar_results",
+]
@@ -2,53 +2,126 @@ from __future__ import annotations
 
 import pathlib
 import sys
-from typing import Optional
+from typing import Any, List, Optional
+
+from startup import DeferredLoader, StartupProfile, run_staged
+
+# Created before PySide6 is imported so ``--startup-profile`` can time it.
+STARTUP_PROFILE = StartupProfile.from_argv() if __name__ == "__main__" else StartupProfile()
 
 try:
     from PySide6 import QtCore, QtGui, QtQml
 except ImportError as exc:  # pragma: no cover - optional dependency
     raise SystemExit("PySide6 is required to launch the Qt UI") from exc
 
-from orchestrator_client import OrchestratorClient
-from parameter_bridge import ParameterBridge, find_project_root
+from orchestrator_client import OrchestratorPool
+from simulation_jobs import JobContext, SimulationJobQueue
 
 
 class SimulationController(QtCore.QObject):
     runCompleted = QtCore.Signal(str)
     runFailed = QtCore.Signal(str)
+    runCancelled = QtCore.Signal()
+    progressUpdated = QtCore.Signal(str, float)
 
-    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        *,
+        job_queue: Optional[SimulationJobQueue] = None,
+        pool: Optional[OrchestratorPool] = None,
+    ) -> None:
         super().__init__(parent)
-        self._client: Optional[OrchestratorClient] = None
+        # Each queued run checks out its own orchestrator handle, so runs
+        # proceed in parallel up to the size of the pool.
+        self._pool = pool if pool is not None else OrchestratorPool()
+        self._jobs = job_queue if job_queue is not None else SimulationJobQueue(self)
+        self._job_ids: List[str] = []
+        self._jobs.jobProgress.connect(self._on_progress)
+        self._jobs.jobFinished.connect(self._on_finished)
+        self._jobs.jobFailed.connect(self._on_failed)
+        self._jobs.jobCancelled.connect(self._on_cancelled)
 
     @QtCore.Slot()
     def run_scenario(self) -> None:
-        try:
-            if self._client is None:
-                self._client = OrchestratorClient()
-            self._client.run_default_scenario(1.0, 120)
-            self.runCompleted.emit("Simulation finished")
-        except Exception as exc:  # pragma: no cover - UI path
-            self.runFailed.emit(str(exc))
+        def job(context: JobContext) -> str:
+            context.report("Running scenario", 0.1)
+            with self._pool.client() as client:
+                context.check_cancelled()
+                client.run_default_scenario(1.0, 120)
+            context.report("Scenario complete", 1.0)
+            return "Simulation finished"
+
+        self._job_ids.append(self._jobs.submit(job, name="default_scenario"))
+
+    @QtCore.Slot()
+    def cancel(self) -> None:
+        for job_id in self._job_ids:
+            self._jobs.cancel(job_id)
+
+    @QtCore.Slot()
+    def shutdown(self) -> None:
+        self._pool.close(wait=False, cancel_pending=True)
+
+    def _on_progress(self, job_id: str, stage: str, fraction: float) -> None:
+        if job_id in self._job_ids:
+            self.progressUpdated.emit(stage, fraction)
+
+    def _on_finished(self, job_id: str, message: object) -> None:
+        if job_id in self._job_ids:
+            self._job_ids.remove(job_id)
+            self.runCompleted.emit(str(message))
+
+    def _on_failed(self, job_id: str, error: str) -> None:
+        if job_id in self._job_ids:
+            self._job_ids.remove(job_id)
+            self.runFailed.emit(error)
+
+    def _on_cancelled(self, job_id: str) -> None:
+        if job_id in self._job_ids:
+            self._job_ids.remove(job_id)
+            self.runCancelled.emit()
 
 
 def main() -> int:
-    app = QtGui.QGuiApplication(sys.argv)
+    profile = STARTUP_PROFILE
+    profile.mark("main")
+    app = QtGui.QGuiApplication(profile.qt_argv)
     engine = QtQml.QQmlApplicationEngine()
 
-    controller = SimulationController()
-    engine.rootContext().setContextProperty("simulationController", controller)
+    job_queue = SimulationJobQueue()
+    app.aboutToQuit.connect(job_queue.cancel_all)
+    engine.rootContext().setContextProperty("simulationJobs", job_queue)
 
-    project_root = find_project_root(pathlib.Path(__file__))
-    scenario_path = project_root / "configs" / "scenarios" / "default.yaml"
-    parameter_bridge = ParameterBridge(scenario_path)
-    engine.rootContext().setContextProperty("parameterBridge", parameter_bridge)
+    controller = SimulationController(job_queue=job_queue)
+    app.aboutToQuit.connect(controller.shutdown)
+    engine.rootContext().setContextProperty("simulationController", controller)
 
     qml_path = pathlib.Path(__file__).parent / "qml" / "Main.qml"
-    engine.load(QtCore.QUrl.fromLocalFile(str(qml_path)))
+    with profile.phase("load_qml"):
+        engine.load(QtCore.QUrl.fromLocalFile(str(qml_path)))
 
     if not engine.rootObjects():
         return -1
+
+    def load_parameter_bridge() -> Any:
+        # Pulls in YAML, NumPy and the PyBaMM schema; deferred until the
+        # window has been presented.
+        from parameter_bridge import ParameterBridge, find_project_root
+
+        project_root = find_project_root(pathlib.Path(__file__))
+        scenario_path = project_root / "configs" / "scenarios" / "default.yaml"
+        parameter_bridge = ParameterBridge(scenario_path, parent=app, job_queue=job_queue)
+        app.aboutToQuit.connect(parameter_bridge.flushScenario)
+        engine.rootContext().setContextProperty("parameterBridge", parameter_bridge)
+        return parameter_bridge
+
+    loader = DeferredLoader(
+        profile,
+        on_failed=lambda name, exc: print(f"Deferred start-up step '{name}' failed: {exc}", file=sys.stderr),
+    )
+    loader.add("parameter_bridge", load_parameter_bridge)
+    run_staged(app, engine, profile, loader)
     return app.exec()
 
 
@@ -2,8 +2,82 @@ from __future__ import annotations
 
 import ctypes
 import ctypes.util
+import os
 import pathlib
-from typing import Optional
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+class _ResultBuffer:
+    """Owns an ``evsim_result_handle``; freed once no array view remains."""
+
+    def __init__(self, lib: ctypes.CDLL, handle: int) -> None:
+        self.handle = ctypes.c_void_p(handle)
+        self._finalizer = weakref.finalize(self, lib.evsim_destroy_result, self.handle)
+
+    def view(self, address: Optional[int], count: int) -> Any:
+        import numpy as np
+
+        if not count:
+            return np.empty(0, dtype=np.float64)
+        block = (ctypes.c_double * count).from_address(address)
+        # NumPy keeps ``block`` alive as the array base; ``block`` keeps us.
+        block._owner = self
+        array = np.frombuffer(block, dtype=np.float64)
+        array.flags.writeable = False
+        return array
+
+
+class RunResult:
+    """Columnar samples of a finished core run, viewed without copying.
+
+    ``timestamps`` and the per-channel arrays are read-only NumPy views into
+    the buffers exported by evsim_core. The native result is released when
+    the last of them (and this object) has been garbage collected, so views
+    may safely outlive the :class:`OrchestratorClient`.
+    """
+
+    TIME_CHANNEL = "time [s]"
+
+    def __init__(self, lib: ctypes.CDLL, handle: int) -> None:
+        buffer = _ResultBuffer(lib, handle)
+        self.run_id: str = lib.evsim_result_run_id(buffer.handle).decode("utf-8")
+        sample_count = lib.evsim_result_sample_count(buffer.handle)
+        channel_count = lib.evsim_result_channel_count(buffer.handle)
+        self.channel_names: List[str] = [
+            lib.evsim_result_channel_name(buffer.handle, index).decode("utf-8") for index in range(channel_count)
+        ]
+        self.timestamps = buffer.view(lib.evsim_result_timestamps(buffer.handle), sample_count)
+        # One (channels, samples) block; each channel is a row view of it.
+        self.values = buffer.view(
+            lib.evsim_result_values(buffer.handle), channel_count * sample_count
+        ).reshape(channel_count, sample_count)
+        self._index = {name: index for index, name in enumerate(self.channel_names)}
+
+    def __len__(self) -> int:
+        return int(self.timestamps.shape[0])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.channel_names)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[self._index[name]]
+
+    def series(self) -> Dict[str, Any]:
+        """Return the run in the ``{channel: array}`` layout used by the exporters."""
+
+        series: Dict[str, Any] = {self.TIME_CHANNEL: self.timestamps}
+        for name in self.channel_names:
+            series[name] = self[name]
+        return series
 
 
 class OrchestratorClient:
@@ -16,18 +90,42 @@ class OrchestratorClient:
         self._lib.evsim_destroy_orchestrator.argtypes = [ctypes.c_void_p]
         self._lib.evsim_run_default_scenario.argtypes = [ctypes.c_void_p, ctypes.c_double, ctypes.c_uint32]
         self._lib.evsim_run_default_scenario.restype = ctypes.c_int
+        self._lib.evsim_discard_run.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        self._lib.evsim_discard_run.restype = ctypes.c_int
+        self._declare_result_api()
         handle = self._lib.evsim_create_orchestrator()
         if not handle:
             raise RuntimeError("Failed to create orchestrator instance")
         self._handle = ctypes.c_void_p(handle)
 
+    def _declare_result_api(self) -> None:
+        lib = self._lib
+        lib.evsim_export_last_run.argtypes = [ctypes.c_void_p]
+        lib.evsim_export_last_run.restype = ctypes.c_void_p
+        lib.evsim_destroy_result.argtypes = [ctypes.c_void_p]
+        lib.evsim_destroy_result.restype = None
+        lib.evsim_result_run_id.argtypes = [ctypes.c_void_p]
+        lib.evsim_result_run_id.restype = ctypes.c_char_p
+        for name in ("evsim_result_sample_count", "evsim_result_channel_count"):
+            getattr(lib, name).argtypes = [ctypes.c_void_p]
+            getattr(lib, name).restype = ctypes.c_size_t
+        lib.evsim_result_channel_name.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        lib.evsim_result_channel_name.restype = ctypes.c_char_p
+        # Buffers are returned as plain addresses and wrapped by _ResultBuffer.
+        for name in ("evsim_result_timestamps", "evsim_result_values"):
+            getattr(lib, name).argtypes = [ctypes.c_void_p]
+            getattr(lib, name).restype = ctypes.c_void_p
+        lib.evsim_result_channel_data.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        lib.evsim_result_channel_data.restype = ctypes.c_void_p
+
     def _load_library(self, library_path: Optional[pathlib.Path]) -> ctypes.CDLL:
         candidates = []
         if library_path is not None:
             candidates.append(pathlib.Path(library_path))
-        module_path = pathlib.Path(__file__).resolve().parent.parent
-        candidates.append(module_path / ".." / ".." / "build" / "libevsim_core.so")
-        candidates.append(module_path / ".." / ".." / "build" / "Debug" / "evsim_core.dll")
+        build_dir = pathlib.Path(__file__).resolve().parents[2] / "build"
+        candidates.append(build_dir / "libevsim_core.so")
+        candidates.append(build_dir / "src" / "sim_core" / "libevsim_core.so")
+        candidates.append(build_dir / "Debug" / "evsim_core.dll")
         system_name = ctypes.util.find_library("evsim_core")
         if system_name:
             candidates.append(pathlib.Path(system_name))
@@ -44,6 +142,28 @@ class OrchestratorClient:
         if result != 0:
             raise RuntimeError(f"Simulation run failed with code {result}")
 
+    def export_last_run(self) -> RunResult:
+        """Return the samples of the most recent run as NumPy column views."""
+
+        if not self._handle:
+            raise RuntimeError("Orchestrator not initialised")
+        handle = self._lib.evsim_export_last_run(self._handle)
+        if not handle:
+            raise RuntimeError("No completed run to export")
+        return RunResult(self._lib, handle)
+
+    def discard_run(self, run_id: Optional[str] = None) -> None:
+        """Free the samples the core keeps for *run_id* (default: the last run).
+
+        The core holds every run of a handle in memory until it is discarded,
+        so long-lived handles discard each run once it has been exported.
+        Exported :class:`RunResult` objects own their buffers and stay valid.
+        """
+
+        if not self._handle:
+            raise RuntimeError("Orchestrator not initialised")
+        self._lib.evsim_discard_run(self._handle, None if run_id is None else run_id.encode("utf-8"))
+
     def close(self) -> None:
         if self._handle:
             self._lib.evsim_destroy_orchestrator(self._handle)
@@ -56,4 +176,131 @@ class OrchestratorClient:
         self.close()
 
 
-__all__ = ["OrchestratorClient"]
+@dataclass(frozen=True)
+class ScenarioRequest:
+    """One core run submitted to an :class:`OrchestratorPool`.
+
+    Only the default scenario is exposed by the C API today; further scenario
+    fields are added here as the API grows.
+    """
+
+    time_step: float = 1.0
+    steps: int = 60
+    collect_results: bool = True
+    name: str = ""
+
+
+@dataclass
+class ScenarioOutcome:
+    request: ScenarioRequest
+    result: Optional[RunResult]
+    duration_s: float
+
+
+class OrchestratorPool:
+    """Runs independent scenarios concurrently on a pool of orchestrator handles.
+
+    Every worker thread checks a private :class:`OrchestratorClient` out of the
+    pool for the duration of a run, so no handle is ever shared between
+    threads. ctypes releases the GIL for the native call, which lets the runs
+    execute in parallel. Handles are created on demand, at most ``size`` of
+    them, and are reused until :meth:`close`. The last run of a handle is
+    discarded when it returns to the pool, so export results inside
+    :meth:`client` (as :meth:`run` does).
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        *,
+        library_path: Optional[pathlib.Path] = None,
+        client_factory: Optional[Callable[[], OrchestratorClient]] = None,
+    ) -> None:
+        self.size = max(1, int(size if size is not None else (os.cpu_count() or 1)))
+        self._factory = client_factory or (lambda: OrchestratorClient(library_path))
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle: List[OrchestratorClient] = []
+        self._created = 0
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="evsim-orchestrator")
+
+    @property
+    def handle_count(self) -> int:
+        return self._created
+
+    @contextmanager
+    def client(self) -> Iterator[OrchestratorClient]:
+        """Check out a client for exclusive use by the calling thread."""
+
+        client = self._acquire()
+        try:
+            yield client
+        finally:
+            self._release(client)
+
+    def _acquire(self) -> OrchestratorClient:
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Orchestrator pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._available.wait()
+        try:
+            return self._factory()
+        except BaseException:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+    def _release(self, client: OrchestratorClient) -> None:
+        client.discard_run()
+        with self._available:
+            if not self._closed:
+                self._idle.append(client)
+                self._available.notify()
+                return
+        client.close()
+
+    def run(self, request: ScenarioRequest) -> ScenarioOutcome:
+        """Execute *request* on the calling thread using a pooled handle."""
+
+        started = time.perf_counter()
+        with self.client() as client:
+            client.run_default_scenario(request.time_step, request.steps)
+            result = client.export_last_run() if request.collect_results else None
+        return ScenarioOutcome(request=request, result=result, duration_s=time.perf_counter() - started)
+
+    def submit(self, request: ScenarioRequest) -> Future[ScenarioOutcome]:
+        return self._executor.submit(self.run, request)
+
+    def submit_many(self, requests: Iterable[ScenarioRequest]) -> List[Future[ScenarioOutcome]]:
+        return [self.submit(request) for request in requests]
+
+    def map(self, requests: Iterable[ScenarioRequest]) -> List[ScenarioOutcome]:
+        """Run all *requests* and return their outcomes in submission order."""
+
+        return [future.result() for future in self.submit_many(requests)]
+
+    def close(self, *, wait: bool = True, cancel_pending: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_pending)
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for client in idle:
+            client.close()
+
+    def __enter__(self) -> "OrchestratorPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+__all__ = ["OrchestratorClient", "OrchestratorPool", "RunResult", "ScenarioOutcome", "ScenarioRequest"]
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import atexit
 import json
 import numbers
+import os
 import pathlib
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+import threading
+import weakref
+from collections import OrderedDict
+from typing import IO, Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 if __package__:
-    from .pybamm_runner import export_simulation_results, run_pybamm_simulation
+    from .pybamm_runner import StreamProgress, stream_pybamm_simulation
+    from .result_cache import ResultCache
+    from .run_catalog import CATALOG_FILENAME
+    from .schema_cache import SchemaCache, SchemaCacheKey
+    from .simulation_jobs import JobContext, SimulationJobQueue
 else:  # pragma: no cover - executed when running as a script
-    from pybamm_runner import export_simulation_results, run_pybamm_simulation
+    from pybamm_runner import StreamProgress, stream_pybamm_simulation
+    from result_cache import ResultCache
+    from run_catalog import CATALOG_FILENAME
+    from schema_cache import SchemaCache, SchemaCacheKey
+    from simulation_jobs import JobContext, SimulationJobQueue
 
 
 def _serialise_value(value: Any) -> Any:
@@ -76,6 +89,114 @@ class ParameterDefinition:
     override: Optional[Any] = None
 
 
+class ParameterSearchIndex:
+    """Normalised trigram index over parameter labels and identifiers.
+
+    Queries match case-insensitive substrings of ``"<label> <identifier>"``
+    (the same haystack the filter models have always used). Candidate rows
+    come from intersecting trigram postings, or from the previous result when
+    the new query extends it, and are confirmed with a substring check.
+    Results are cached per query so several filter models over the same
+    source share the work.
+    """
+
+    CACHE_SIZE = 32
+
+    def __init__(self, items: Iterable[ParameterDefinition] = ()) -> None:
+        self._labels: List[str] = []
+        self._haystacks: List[str] = []
+        self._trigrams: Dict[str, FrozenSet[int]] = {}
+        self._all_rows: FrozenSet[int] = frozenset()
+        self._cache: "OrderedDict[str, FrozenSet[int]]" = OrderedDict()
+        self.rebuild(items)
+
+    @staticmethod
+    def normalise(text: str) -> str:
+        return text.casefold()
+
+    def rebuild(self, items: Iterable[ParameterDefinition]) -> None:
+        self._labels = []
+        self._haystacks = []
+        postings: Dict[str, set] = {}
+        for row, item in enumerate(items):
+            label = self.normalise(item.label)
+            haystack = f"{label} {self.normalise(item.identifier)}"
+            self._labels.append(label)
+            self._haystacks.append(haystack)
+            for offset in range(len(haystack) - 2):
+                postings.setdefault(haystack[offset : offset + 3], set()).add(row)
+        self._trigrams = {gram: frozenset(rows) for gram, rows in postings.items()}
+        self._all_rows = frozenset(range(len(self._haystacks)))
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._haystacks)
+
+    def search(self, query: str) -> FrozenSet[int]:
+        """Return the rows whose haystack contains *query*."""
+
+        needle = self.normalise(query)
+        if not needle:
+            return self._all_rows
+        cached = self._cache.get(needle)
+        if cached is not None:
+            self._cache.move_to_end(needle)
+            return cached
+        candidates = self._narrowest_cached(needle)
+        if candidates is self._all_rows and len(needle) >= 3:
+            for gram in sorted({needle[i : i + 3] for i in range(len(needle) - 2)}, key=self._posting_size):
+                candidates = candidates & self._trigrams.get(gram, frozenset())
+                if not candidates:
+                    break
+        haystacks = self._haystacks
+        matches = frozenset(row for row in candidates if needle in haystacks[row])
+        self._cache[needle] = matches
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return matches
+
+    def ranked(self, query: str) -> List[int]:
+        """Return matching rows, best first.
+
+        Exact label matches rank first, then label prefixes, word starts in
+        the label, other label substrings and finally identifier-only hits;
+        ties are broken by match position and row.
+        """
+
+        needle = self.normalise(query)
+        return sorted(self.search(query), key=lambda row: self._score(row, needle))
+
+    def rank_map(self, query: str) -> Dict[int, int]:
+        return {row: position for position, row in enumerate(self.ranked(query))}
+
+    def _score(self, row: int, needle: str) -> Tuple[int, int, int]:
+        label = self._labels[row]
+        if not needle:
+            return (0, 0, row)
+        if label == needle:
+            return (0, 0, row)
+        position = label.find(needle)
+        if position == 0:
+            return (1, 0, row)
+        if position > 0:
+            tier = 2 if not label[position - 1].isalnum() else 3
+            return (tier, position, row)
+        return (4, self._haystacks[row].find(needle), row)
+
+    def _posting_size(self, gram: str) -> int:
+        return len(self._trigrams.get(gram, ()))
+
+    def _narrowest_cached(self, needle: str) -> FrozenSet[int]:
+        # Results for any cached substring of the query are a superset of the
+        # answer, so start from the smallest one (typically the previous
+        # keystroke's query).
+        best = self._all_rows
+        for cached_query, rows in self._cache.items():
+            if len(rows) < len(best) and cached_query in needle:
+                best = rows
+        return best
+
+
 class ParameterListModel(QtCore.QAbstractListModel):
     IdRole = QtCore.Qt.UserRole + 1
     LabelRole = IdRole + 1
@@ -95,6 +216,9 @@ class ParameterListModel(QtCore.QAbstractListModel):
     def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         super().__init__(parent)
         self._items: List[ParameterDefinition] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._overridden: set = set()
+        self._search_index = ParameterSearchIndex()
         self._change_callback: Optional[Callable[[str, ParameterDefinition], None]] = None
 
     def set_change_callback(self, callback: Callable[[str, ParameterDefinition], None]) -> None:
@@ -175,8 +299,10 @@ class ParameterListModel(QtCore.QAbstractListModel):
         item.value = clean_value
         if clean_value == item.default:
             item.override = None
+            self._overridden.discard(item.identifier)
         else:
             item.override = clean_value
+            self._overridden.add(item.identifier)
         self.dataChanged.emit(index, index, [self.ValueRole, self.DirtyRole])
         if self._change_callback is not None:
             self._change_callback(item.identifier, item)
@@ -208,44 +334,98 @@ class ParameterListModel(QtCore.QAbstractListModel):
     def set_items(self, items: List[ParameterDefinition]) -> None:
         self.beginResetModel()
         self._items = items
+        self._row_by_id = {item.identifier: row for row, item in enumerate(items)}
+        self._overridden = {item.identifier for item in items if item.override is not None}
+        self._search_index.rebuild(items)
         self.endResetModel()
 
+    @property
+    def search_index(self) -> ParameterSearchIndex:
+        return self._search_index
+
+    def item_at(self, row: int) -> ParameterDefinition:
+        return self._items[row]
+
+    def row_for(self, identifier: str) -> int:
+        """Return the row of *identifier*, or ``-1`` when it is unknown."""
+
+        return self._row_by_id.get(identifier, -1)
+
+    def item(self, identifier: str) -> Optional[ParameterDefinition]:
+        row = self._row_by_id.get(identifier)
+        return None if row is None else self._items[row]
+
+    #: Above this many disjoint runs a single spanning ``dataChanged`` is
+    #: cheaper for views than one signal per run.
+    MAX_CHANGE_RANGES = 32
+
+    def _emit_row_ranges(self, rows: Iterable[int], roles: List[int]) -> int:
+        """Emit one ``dataChanged`` per contiguous run of *rows*; returns the count."""
+
+        ordered = sorted(set(rows))
+        if not ordered:
+            return 0
+        ranges: List[Tuple[int, int]] = []
+        start = ordered[0]
+        for previous, row in zip(ordered, ordered[1:]):
+            if row != previous + 1:
+                ranges.append((start, previous))
+                start = row
+        ranges.append((start, ordered[-1]))
+        if len(ranges) > self.MAX_CHANGE_RANGES:
+            ranges = [(ordered[0], ordered[-1])]
+        for first, last in ranges:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 0), roles)
+        return len(ranges)
+
     def update_defaults(self, defaults: Dict[str, Any]) -> None:
-        changed_indexes: List[QtCore.QModelIndex] = []
-        for row, item in enumerate(self._items):
-            if item.identifier in defaults:
-                item.default = defaults[item.identifier]
-                if item.override is None:
-                    if item.value != item.default:
-                        item.value = item.default
-                        changed_indexes.append(self.index(row, 0))
-                elif item.override == item.default:
-                    item.override = None
-                    if item.value != item.default:
-                        item.value = item.default
-                    changed_indexes.append(self.index(row, 0))
-        if changed_indexes:
-            for index in changed_indexes:
-                self.dataChanged.emit(index, index, [self.DefaultRole, self.ValueRole, self.DirtyRole])
+        changed_rows: List[int] = []
+        for identifier, default in defaults.items():
+            row = self._row_by_id.get(identifier)
+            if row is None:
+                continue
+            item = self._items[row]
+            changed = item.default != default
+            item.default = default
+            if item.override is None:
+                if item.value != default:
+                    item.value = default
+                    changed = True
+            elif item.override == default:
+                item.override = None
+                self._overridden.discard(identifier)
+                item.value = default
+                changed = True
+            if changed:
+                changed_rows.append(row)
+        if changed_rows:
+            self._emit_row_ranges(changed_rows, [self.DefaultRole, self.ValueRole, self.DirtyRole])
 
     def set_overrides(self, overrides: Dict[str, Any]) -> None:
-        changed: List[QtCore.QModelIndex] = []
-        for row, item in enumerate(self._items):
-            if item.identifier in overrides:
-                new_value = overrides[item.identifier]
-                if item.value != new_value:
-                    item.value = new_value
-                    item.override = new_value if new_value != item.default else None
-                    changed.append(self.index(row, 0))
-            else:
-                if item.override is not None:
-                    item.override = None
-                    if item.value != item.default:
-                        item.value = item.default
-                        changed.append(self.index(row, 0))
-        if changed:
-            for index in changed:
-                self.dataChanged.emit(index, index, [self.ValueRole, self.DirtyRole])
+        changed_rows: List[int] = []
+        for identifier in self._overridden - overrides.keys():
+            row = self._row_by_id[identifier]
+            item = self._items[row]
+            item.override = None
+            if item.value != item.default:
+                item.value = item.default
+                changed_rows.append(row)
+        self._overridden &= overrides.keys()
+        for identifier, new_value in overrides.items():
+            row = self._row_by_id.get(identifier)
+            if row is None:
+                continue
+            item = self._items[row]
+            if item.value != new_value:
+                item.value = new_value
+                item.override = new_value if new_value != item.default else None
+                if item.override is None:
+                    self._overridden.discard(identifier)
+                else:
+                    self._overridden.add(identifier)
+                changed_rows.append(row)
+        if changed_rows:
+            self._emit_row_ranges(changed_rows, [self.ValueRole, self.DirtyRole])
 
     def items(self) -> List[ParameterDefinition]:
         return list(self._items)
@@ -258,25 +438,52 @@ class ParameterFilterModel(QtCore.QSortFilterProxyModel):
         self._category: str = ""
         self._show_advanced: bool = True
         self._diff_only = diff_only
+        self._ranked = False
+        # Rows passing the search, category and advanced filters, resolved in
+        # bulk against a ParameterListModel source; ``None`` accepts all rows.
+        self._static_rows: Optional[FrozenSet[int]] = None
+        self._accepted_rows: Optional[FrozenSet[int]] = None
+        self._rank: Dict[int, int] = {}
         self.setDynamicSortFilter(True)
 
+    def setSourceModel(self, model: QtCore.QAbstractItemModel) -> None:  # type: ignore[override]
+        previous = self.sourceModel()
+        if isinstance(previous, ParameterListModel):
+            previous.modelReset.disconnect(self._on_source_reset)
+        super().setSourceModel(model)
+        if isinstance(model, ParameterListModel):
+            # Connected after the proxy's own reset handling; re-filter with
+            # rows resolved against the rebuilt search index.
+            model.modelReset.connect(self._on_source_reset)
+        self._on_source_reset()
+
     def set_search(self, text: str) -> None:
         if text == self._search:
             return
         self._search = text
-        self.invalidateFilter()
+        self._refresh_matches()
+
+    def set_ranked(self, ranked: bool) -> None:
+        """Order rows by search relevance while a query is active."""
+
+        if ranked == self._ranked:
+            return
+        self._ranked = ranked
+        self._refresh_matches()
 
     def set_category(self, category: str) -> None:
         if category == self._category:
             return
         self._category = category
-        self.invalidateFilter()
+        self._refresh_static_rows()
+        self._refresh_matches()
 
     def set_show_advanced(self, show: bool) -> None:
         if show == self._show_advanced:
             return
         self._show_advanced = show
-        self.invalidateFilter()
+        self._refresh_static_rows()
+        self._refresh_matches()
 
     def set_diff_only(self, diff_only: bool) -> None:
         if diff_only == self._diff_only:
@@ -284,15 +491,54 @@ class ParameterFilterModel(QtCore.QSortFilterProxyModel):
         self._diff_only = diff_only
         self.invalidateFilter()
 
+    def _on_source_reset(self) -> None:
+        self._refresh_static_rows()
+        self._refresh_matches()
+
+    def _refresh_static_rows(self) -> None:
+        source = self.sourceModel()
+        if not isinstance(source, ParameterListModel) or (not self._category and self._show_advanced):
+            self._static_rows = None
+            return
+        self._static_rows = frozenset(
+            row
+            for row, item in enumerate(source.items())
+            if (not self._category or item.category == self._category) and (self._show_advanced or not item.advanced)
+        )
+
+    def _refresh_matches(self) -> None:
+        source = self.sourceModel()
+        accepted = self._static_rows
+        self._rank = {}
+        if self._search and isinstance(source, ParameterListModel):
+            index = source.search_index
+            matched = index.search(self._search)
+            accepted = matched if accepted is None else accepted & matched
+            if self._ranked:
+                self._rank = index.rank_map(self._search)
+        self._accepted_rows = accepted
+        self.invalidateFilter()
+        self.sort(0 if self._rank else -1)
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool:  # type: ignore[override]
+        if self._rank:
+            return self._rank.get(left.row(), len(self._rank)) < self._rank.get(right.row(), len(self._rank))
+        return left.row() < right.row()
+
     def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # type: ignore[override]
-        index = self.sourceModel().index(source_row, 0, source_parent)
+        source = self.sourceModel()
+        if isinstance(source, ParameterListModel):
+            if self._accepted_rows is not None and source_row not in self._accepted_rows:
+                return False
+            return not self._diff_only or source.item_at(source_row).override is not None
+        index = source.index(source_row, 0, source_parent)
         if not index.isValid():
             return False
-        label = self.sourceModel().data(index, ParameterListModel.LabelRole)
-        name = self.sourceModel().data(index, ParameterListModel.IdRole)
-        category = self.sourceModel().data(index, ParameterListModel.CategoryRole)
-        advanced = self.sourceModel().data(index, ParameterListModel.AdvancedRole)
-        dirty = self.sourceModel().data(index, ParameterListModel.DirtyRole)
+        label = source.data(index, ParameterListModel.LabelRole)
+        name = source.data(index, ParameterListModel.IdRole)
+        category = source.data(index, ParameterListModel.CategoryRole)
+        advanced = source.data(index, ParameterListModel.AdvancedRole)
+        dirty = source.data(index, ParameterListModel.DirtyRole)
         if self._diff_only and not dirty:
             return False
         if not self._show_advanced and advanced:
@@ -307,26 +553,80 @@ class ParameterFilterModel(QtCore.QSortFilterProxyModel):
 
 
 class ScenarioStore:
-    def __init__(self, path: pathlib.Path) -> None:
+    """Scenario YAML with write-behind, crash-safe persistence of edits.
+
+    Mutations are applied in memory and appended to ``<scenario>.journal`` as
+    JSON lines, which is cheap regardless of the number of overrides. A timer
+    flushes the accumulated changes ``flush_delay_s`` after the first dirty
+    edit by writing the full YAML to a temporary file and renaming it over
+    the scenario; the journal is truncated afterwards. Journal entries left
+    behind by a crash are replayed on :meth:`load`.
+    """
+
+    JOURNAL_SUFFIX = ".journal"
+
+    def __init__(self, path: pathlib.Path, *, flush_delay_s: float = 1.0) -> None:
         self.path = path
+        self.journal_path = path.with_name(path.name + self.JOURNAL_SUFFIX)
+        self.flush_delay_s = max(0.0, float(flush_delay_s))
         self._data: Dict[str, Any] = {}
         self._project_root = find_project_root(path)
+        self._lock = threading.RLock()
+        self._journal: Optional[IO[str]] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._dirty = False
         self.load()
+        atexit.register(_flush_scenario_at_exit, weakref.ref(self))
 
     def load(self) -> None:
         if yaml is None:
             raise RuntimeError("PyYAML is required to load scenario files")
         if not self.path.exists():
             raise FileNotFoundError(f"Scenario file not found: {self.path}")
-        with self.path.open("r", encoding="utf-8") as handle:
-            self._data = yaml.safe_load(handle) or {}
+        with self._lock:
+            with self.path.open("r", encoding="utf-8") as handle:
+                self._data = yaml.safe_load(handle) or {}
+            if self._replay_journal():
+                self.save()
 
     def save(self) -> None:
+        """Write the scenario immediately (atomically) and reset the journal."""
+
         if yaml is None:
             raise RuntimeError("PyYAML is required to save scenario files")
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as handle:
-            yaml.safe_dump(self._data, handle, sort_keys=False)
+        with self._lock:
+            self._cancel_flush_timer()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            payload = yaml.safe_dump(self._data, sort_keys=False)
+            temp_path = self.path.with_name(f".{self.path.name}.tmp")
+            with temp_path.open("w", encoding="utf-8") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, self.path)
+            self._truncate_journal()
+            self._dirty = False
+
+    def flush(self) -> None:
+        """Persist pending edits now; a no-op when nothing changed."""
+
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def close(self) -> None:
+        """Flush pending edits and release the journal handle."""
+
+        with self._lock:
+            self.flush()
+            self._cancel_flush_timer()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
 
     @property
     def pybamm_config(self) -> Dict[str, Any]:
@@ -337,16 +637,79 @@ class ScenarioStore:
         return self.pybamm_config.setdefault("overrides", {})
 
     def set_override(self, identifier: str, value: Optional[Any]) -> None:
-        overrides = self.overrides
-        if value is None or value == "":
-            overrides.pop(identifier, None)
-        else:
-            overrides[identifier] = value
-        self.save()
+        if value == "":
+            value = None
+        with self._lock:
+            self._apply({"op": "set_override", "id": identifier, "value": value})
+            self._record({"op": "set_override", "id": identifier, "value": value})
 
     def set_overrides(self, overrides: Dict[str, Any]) -> None:
-        self.pybamm_config["overrides"] = overrides
-        self.save()
+        with self._lock:
+            entry = {"op": "replace_overrides", "overrides": dict(overrides)}
+            self._apply(entry)
+            self._record(entry)
+
+    def _apply(self, entry: Mapping[str, Any]) -> None:
+        op = entry.get("op")
+        if op == "set_override":
+            overrides = self.overrides
+            if entry.get("value") is None:
+                overrides.pop(entry["id"], None)
+            else:
+                overrides[entry["id"]] = entry["value"]
+        elif op == "replace_overrides":
+            self.pybamm_config["overrides"] = dict(entry.get("overrides") or {})
+        elif op == "set_preset":
+            self.pybamm_config["default_preset"] = entry.get("preset", "")
+        else:
+            raise ValueError(f"Unknown scenario journal operation: {op!r}")
+
+    def _record(self, entry: Mapping[str, Any]) -> None:
+        if self._journal is None:
+            self._journal = self.journal_path.open("a", encoding="utf-8")
+        self._journal.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_delay_s, self._flush_from_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            self.flush()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _truncate_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    def _replay_journal(self) -> bool:
+        if not self.journal_path.exists():
+            return False
+        replayed = False
+        with self.journal_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self._apply(entry)
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from an interrupted append; everything
+                    # before it has already been applied.
+                    break
+                replayed = True
+        return replayed
 
     @property
     def schema_spec(self) -> str:
@@ -389,16 +752,188 @@ class ScenarioStore:
         return self.pybamm_config.get("default_preset", "")
 
     def set_current_preset(self, preset_id: str) -> None:
-        self.pybamm_config["default_preset"] = preset_id
-        self.save()
+        with self._lock:
+            entry = {"op": "set_preset", "preset": preset_id}
+            self._apply(entry)
+            self._record(entry)
+
+
+def _flush_scenario_at_exit(reference: "weakref.ReferenceType[ScenarioStore]") -> None:
+    store = reference()
+    if store is not None:
+        try:
+            store.close()
+        except Exception:  # pragma: no cover - best effort during interpreter shutdown
+            pass
+
+
+_MISSING = object()
+
+
+@dataclass
+class _PreviewState:
+    model: Any
+    parameter_values: Any
+    base_values: Dict[str, Any] = field(default_factory=dict)
+    applied: Dict[str, Any] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class PreviewEngine:
+    """Keeps processed PyBaMM models and parameter values per preset.
+
+    Building a model, loading a parameter set and running ``process_model``
+    happens once per ``(chemistry, model, parameter set)``. Subsequent preview
+    requests only push the overrides that changed since the previous request
+    into the cached :class:`pybamm.ParameterValues` and restore the preset
+    value of overrides that were removed.
+    """
+
+    PREVIEW_KEYS: Tuple[str, ...] = ("Nominal cell capacity [A.h]", "Negative electrode thickness [m]")
+
+    def __init__(self) -> None:
+        self._states: Dict[Tuple[str, str, str], _PreviewState] = {}
+        self._build_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, chemistry: str, model: str, parameter_set: str) -> _PreviewState:
+        key = (chemistry, model, parameter_set)
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                return state
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        # Concurrent callers for the same preset wait for a single build.
+        with build_lock:
+            with self._lock:
+                state = self._states.get(key)
+            if state is not None:
+                return state
+            try:
+                import pybamm  # type: ignore
+            except ImportError as exc:  # pragma: no cover - optional dependency
+                raise RuntimeError("PyBaMM is not available in the runtime environment") from exc
+            chemistry_module = getattr(pybamm, chemistry)
+            model_factory = getattr(chemistry_module, model)
+            parameter_source = getattr(pybamm.parameter_sets, parameter_set)
+            pybamm.logger.verbose = False  # silence detailed logs
+            model_instance = model_factory()
+            parameter_values = pybamm.ParameterValues(chemistry=parameter_source)
+            parameter_values.process_model(model_instance)
+            created = _PreviewState(model=model_instance, parameter_values=parameter_values)
+            with self._lock:
+                self._states[key] = created
+                self._build_locks.pop(key, None)
+            return created
+
+    def preview(
+        self,
+        *,
+        chemistry: str,
+        model: str,
+        parameter_set: str,
+        overrides: Mapping[str, Any],
+    ) -> Dict[str, Any]:
+        """Apply *overrides* (by PyBaMM name) incrementally and read the preview keys."""
+
+        state = self._state(chemistry, model, parameter_set)
+        with state.lock:
+            parameter_values = state.parameter_values
+            changes: Dict[str, Any] = {}
+            for name, value in overrides.items():
+                if state.applied.get(name, _MISSING) != value:
+                    if name not in state.base_values and name in parameter_values:
+                        state.base_values[name] = parameter_values[name]
+                    changes[name] = value
+            for name in state.applied:
+                if name not in overrides and name in state.base_values:
+                    changes[name] = state.base_values[name]
+            if changes:
+                parameter_values.update(changes)
+            state.applied = dict(overrides)
+            preview: Dict[str, Any] = {
+                "preset": parameter_set,
+                "override_count": len(overrides),
+            }
+            for key in self.PREVIEW_KEYS:
+                if key not in parameter_values:
+                    continue
+                try:
+                    preview[key] = _serialise_value(parameter_values[key])
+                except Exception:  # pragma: no cover - parameter evaluation error
+                    continue
+        return preview
+
+    def defaults(
+        self,
+        *,
+        chemistry: str,
+        model: str,
+        parameter_set: str,
+        id_to_name: Mapping[str, str],
+    ) -> Dict[str, Any]:
+        """Return the preset values (ignoring applied overrides) by identifier."""
+
+        state = self._state(chemistry, model, parameter_set)
+        defaults: Dict[str, Any] = {}
+        with state.lock:
+            for identifier, name in id_to_name.items():
+                try:
+                    raw = state.base_values[name] if name in state.base_values else state.parameter_values[name]
+                    defaults[identifier] = _serialise_value(raw)
+                except KeyError:
+                    continue
+        return defaults
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+
+@dataclass
+class _PreviewRequest:
+    chemistry: str
+    model: str
+    parameter_set: str
+    overrides: Dict[str, Any]
+
+
+class _PreviewRunnable(QtCore.QRunnable):
+    def __init__(self, processor: "PyBammProcessor") -> None:
+        super().__init__()
+        self._processor = processor
+        self.setAutoDelete(True)
+
+    def run(self) -> None:  # type: ignore[override]
+        self._processor._drain_requests()
+
+
+class _DefaultsRunnable(QtCore.QRunnable):
+    def __init__(self, processor: "PyBammProcessor", request: _PreviewRequest, id_to_name: Dict[str, str]) -> None:
+        super().__init__()
+        self._processor = processor
+        self._request = request
+        self._id_to_name = id_to_name
+        self.setAutoDelete(True)
+
+    def run(self) -> None:  # type: ignore[override]
+        self._processor._emit_defaults(self._request, self._id_to_name)
 
 
 class PyBammProcessor(QtCore.QObject):
+    """Debounced parameter previews computed on a background thread.
+
+    Bursts of edits are coalesced: only the most recent request is kept while
+    a preview is being computed, and the worker picks it up as soon as it is
+    done with the current one.
+    """
+
     previewReady = QtCore.Signal(dict)
+    defaultsReady = QtCore.Signal(str, dict)
     progressUpdated = QtCore.Signal(str, float)
     errorOccurred = QtCore.Signal(str)
 
-    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+    def __init__(self, parent: Optional[QtCore.QObject] = None, *, engine: Optional[PreviewEngine] = None) -> None:
         super().__init__(parent)
         self._debounce_timer = QtCore.QTimer(self)
         self._debounce_timer.setSingleShot(True)
@@ -408,6 +943,12 @@ class PyBammProcessor(QtCore.QObject):
         self._chemistry = "lithium_ion"
         self._model = "DFN"
         self._parameter_set = "Chen2020"
+        self._engine = engine if engine is not None else PreviewEngine()
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._request_lock = threading.Lock()
+        self._latest_request: Optional[_PreviewRequest] = None
+        self._worker_active = False
 
     def configure(self, *, id_to_name: Dict[str, str], chemistry: str, model: str, preset: str) -> None:
         self._id_to_name = dict(id_to_name)
@@ -423,69 +964,81 @@ class PyBammProcessor(QtCore.QObject):
         self._pending_overrides = dict(overrides)
         self._debounce_timer.start(debounce_ms)
 
+    def wait_for_idle(self, timeout_ms: int = -1) -> bool:
+        """Block until the background worker has processed every request."""
+
+        return self._pool.waitForDone(timeout_ms)
+
     def _process(self) -> None:
-        try:
-            import pybamm  # type: ignore
-        except ImportError:  # pragma: no cover - optional dependency
-            self.errorOccurred.emit("PyBaMM is not available in the runtime environment")
-            return
-        try:
-            chemistry_module = getattr(pybamm, self._chemistry)
-            model_factory = getattr(chemistry_module, self._model)
-            parameter_set = getattr(pybamm.parameter_sets, self._parameter_set)
-        except AttributeError as exc:  # pragma: no cover - invalid configuration
-            self.errorOccurred.emit(str(exc))
-            return
-        model = model_factory()
-        parameter_values = pybamm.ParameterValues(chemistry=parameter_set)
-        pybamm.logger.verbose = False  # silence detailed logs
-        self.progressUpdated.emit("processing", 0.05)
-        parameter_values.process_model(model)
         override_payload: Dict[str, Any] = {}
         for identifier, value in self._pending_overrides.items():
             name = self._id_to_name.get(identifier)
             if not name:
                 continue
             override_payload[name] = value
-        if override_payload:
-            parameter_values.update(override_payload)
-        self.progressUpdated.emit("processing", 0.6)
-        preview: Dict[str, Any] = {
-            "preset": self._parameter_set,
-            "override_count": len(override_payload),
-        }
-        sample_keys = [name for name in ["Nominal cell capacity [A.h]", "Negative electrode thickness [m]"] if name in parameter_values]
-        for key in sample_keys:
+        request = _PreviewRequest(
+            chemistry=self._chemistry,
+            model=self._model,
+            parameter_set=self._parameter_set,
+            overrides=override_payload,
+        )
+        with self._request_lock:
+            self._latest_request = request
+            if self._worker_active:
+                return
+            self._worker_active = True
+        self._pool.start(_PreviewRunnable(self))
+
+    def _drain_requests(self) -> None:
+        while True:
+            with self._request_lock:
+                request = self._latest_request
+                self._latest_request = None
+                if request is None:
+                    self._worker_active = False
+                    return
+            self.progressUpdated.emit("processing", 0.05)
             try:
-                preview[key] = _serialise_value(parameter_values[key])
-            except Exception:  # pragma: no cover - parameter evaluation error
+                preview = self._engine.preview(
+                    chemistry=request.chemistry,
+                    model=request.model,
+                    parameter_set=request.parameter_set,
+                    overrides=request.overrides,
+                )
+            except Exception as exc:  # noqa: BLE001 - reported to the UI
+                self.errorOccurred.emit(str(exc))
+                continue
+            with self._request_lock:
+                superseded = self._latest_request is not None
+            if superseded:
+                # A newer edit arrived while computing; skip the stale result.
                 continue
-        self.progressUpdated.emit("processing", 0.95)
-        self.previewReady.emit(preview)
-        self.progressUpdated.emit("done", 1.0)
+            self.progressUpdated.emit("processing", 0.95)
+            self.previewReady.emit(preview)
+            self.progressUpdated.emit("done", 1.0)
 
-    def collect_defaults(self, preset: str) -> Dict[str, Any]:
-        try:
-            import pybamm  # type: ignore
-        except ImportError:  # pragma: no cover - optional dependency
-            return {}
+    def request_defaults(self, preset: str) -> None:
+        """Compute the defaults of *preset* on the worker and emit ``defaultsReady``.
+
+        The first request for a preset builds and processes its model, which
+        must not happen on the GUI thread.
+        """
+
+        request = _PreviewRequest(chemistry=self._chemistry, model=self._model, parameter_set=preset, overrides={})
+        self._pool.start(_DefaultsRunnable(self, request, dict(self._id_to_name)))
+
+    def _emit_defaults(self, request: _PreviewRequest, id_to_name: Dict[str, str]) -> None:
         try:
-            chemistry_module = getattr(pybamm, self._chemistry)
-            model_factory = getattr(chemistry_module, self._model)
-            parameter_set = getattr(pybamm.parameter_sets, preset)
-        except AttributeError:
-            return {}
-        model = model_factory()
-        parameter_values = pybamm.ParameterValues(chemistry=parameter_set)
-        parameter_values.process_model(model)
-        defaults: Dict[str, Any] = {}
-        for identifier, name in self._id_to_name.items():
-            try:
-                value = _serialise_value(parameter_values[name])
-            except KeyError:
-                continue
-            defaults[identifier] = value
-        return defaults
+            defaults = self._engine.defaults(
+                chemistry=request.chemistry,
+                model=request.model,
+                parameter_set=request.parameter_set,
+                id_to_name=id_to_name,
+            )
+        except (AttributeError, RuntimeError):
+            return
+        if defaults:
+            self.defaultsReady.emit(request.parameter_set, defaults)
 
 
 class ParameterBridge(QtCore.QObject):
@@ -508,10 +1061,26 @@ class ParameterBridge(QtCore.QObject):
     progressUpdated = QtCore.Signal(str, float)
     errorOccurred = QtCore.Signal(str)
     simulationCompleted = QtCore.Signal(str)
-
-    def __init__(self, scenario_path: pathlib.Path, parent: Optional[QtCore.QObject] = None) -> None:
+    simulationCancelled = QtCore.Signal()
+    runningChanged = QtCore.Signal()
+    _schemaRebuilt = QtCore.Signal(object, object)
+    _schemaRebuildFailed = QtCore.Signal(object, str)
+
+    def __init__(
+        self,
+        scenario_path: pathlib.Path,
+        parent: Optional[QtCore.QObject] = None,
+        *,
+        job_queue: Optional[SimulationJobQueue] = None,
+    ) -> None:
         super().__init__(parent)
         self._scenario = ScenarioStore(scenario_path)
+        self._jobs = job_queue if job_queue is not None else SimulationJobQueue(self)
+        self._simulation_jobs: List[str] = []
+        self._jobs.jobProgress.connect(self._on_job_progress)
+        self._jobs.jobFinished.connect(self._on_job_finished)
+        self._jobs.jobFailed.connect(self._on_job_failed)
+        self._jobs.jobCancelled.connect(self._on_job_cancelled)
         self._model = ParameterListModel(self)
         self._model.set_change_callback(self._on_value_changed)
         self._filtered_model = ParameterFilterModel(parent=self)
@@ -526,8 +1095,13 @@ class ParameterBridge(QtCore.QObject):
             self._current_preset = self._presets[0]["id"]
         self._current_parameter_set = self._resolve_parameter_set(self._current_preset)
         self._id_to_name: Dict[str, str] = {}
+        self._schema_cache = SchemaCache.for_project(self._scenario.project_root)
+        self._schema_rebuild: Optional[threading.Thread] = None
+        self._schemaRebuilt.connect(self._on_schema_rebuilt)
+        self._schemaRebuildFailed.connect(self._on_schema_rebuild_failed)
         self._processor = PyBammProcessor(self)
         self._processor.previewReady.connect(self.previewReady)
+        self._processor.defaultsReady.connect(self._on_defaults_ready)
         self._processor.progressUpdated.connect(self.progressUpdated)
         self._processor.errorOccurred.connect(self.errorOccurred)
         self._load_schema()
@@ -572,12 +1146,21 @@ class ParameterBridge(QtCore.QObject):
         self._current_parameter_set = self._resolve_parameter_set(preset_id)
         self._scenario.set_current_preset(preset_id)
         self._processor.set_preset(self._current_parameter_set)
-        defaults = self._processor.collect_defaults(self._current_parameter_set)
-        if defaults:
-            self._model.update_defaults(defaults)
+        self._processor.request_defaults(self._current_parameter_set)
         self._processor.schedule(self._scenario.overrides)
         self.presetsChanged.emit()
 
+    def _on_defaults_ready(self, parameter_set: str, defaults: Dict[str, Any]) -> None:
+        if parameter_set != self._current_parameter_set:
+            return  # the user has moved on to another preset
+        self._model.update_defaults(defaults)
+
+    @QtCore.Slot()
+    def flushScenario(self) -> None:
+        """Persist pending scenario edits (connected to ``aboutToQuit``)."""
+
+        self._scenario.close()
+
     @QtCore.Slot(str)
     def exportOverrides(self, name: str) -> None:
         if yaml is None:
@@ -614,7 +1197,7 @@ class ParameterBridge(QtCore.QObject):
         used_fallback = False
         if schema_path is None:
             try:
-                items, categories, id_to_name = self._build_schema_from_pybamm(overrides)
+                items, categories, id_to_name = self._load_cached_pybamm_schema(overrides)
             except Exception as exc:
                 fallback = self._scenario.fallback_schema_path
                 if fallback is None:
@@ -624,7 +1207,17 @@ class ParameterBridge(QtCore.QObject):
                 self.errorOccurred.emit(f"PyBaMM schema unavailable ({exc}). Using fallback definition.")
         else:
             items, categories, id_to_name = self._load_schema_from_file(schema_path, overrides)
-
+        self._apply_schema(items, categories, id_to_name, used_fallback=used_fallback)
+
+    def _apply_schema(
+        self,
+        items: List[ParameterDefinition],
+        categories: Iterable[str],
+        id_to_name: Dict[str, str],
+        *,
+        used_fallback: bool = False,
+    ) -> None:
+        overrides = self._scenario.overrides
         self._id_to_name = id_to_name
         self._model.set_items(items)
         self._filtered_model.invalidateFilter()
@@ -642,6 +1235,73 @@ class ParameterBridge(QtCore.QObject):
         )
         self._processor.schedule(overrides)
 
+    def _schema_cache_key(self) -> SchemaCacheKey:
+        return SchemaCacheKey.current(
+            chemistry=self._scenario.chemistry,
+            model=self._scenario.model,
+            parameter_set=self._current_parameter_set or "",
+        )
+
+    def _load_cached_pybamm_schema(
+        self, overrides: Dict[str, Any]
+    ) -> Tuple[List[ParameterDefinition], Iterable[str], Dict[str, str]]:
+        """Return the auto schema from the on-disk cache, generating it on a miss.
+
+        A cache entry written by another PyBaMM version is still used so the
+        editor opens immediately; it is regenerated on a background thread
+        and swapped in once ready.
+        """
+
+        key = self._schema_cache_key()
+        cached = self._schema_cache.load(key) if key.parameter_set else None
+        if cached is not None:
+            if cached.stale:
+                self._rebuild_schema_in_background(key)
+            return self._items_from_entries(cached.entries, overrides)
+        entries = self._generate_pybamm_schema_entries(key.parameter_set)
+        self._store_schema_entries(key, entries)
+        return self._items_from_entries(entries, overrides)
+
+    def _store_schema_entries(self, key: SchemaCacheKey, entries: List[Dict[str, Any]]) -> None:
+        try:
+            self._schema_cache.store(key, entries)
+        except OSError as exc:
+            self.errorOccurred.emit(f"Could not write schema cache: {exc}")
+
+    def _rebuild_schema_in_background(self, key: SchemaCacheKey) -> None:
+        def rebuild() -> None:
+            try:
+                entries = self._generate_pybamm_schema_entries(key.parameter_set)
+            except Exception as exc:  # noqa: BLE001 - reported on the GUI thread
+                self._schemaRebuildFailed.emit(key, str(exc))
+                return
+            self._schemaRebuilt.emit(key, entries)
+
+        thread = threading.Thread(target=rebuild, name="pybamm-schema-rebuild", daemon=True)
+        self._schema_rebuild = thread
+        thread.start()
+
+    def wait_for_schema_rebuild(self, timeout: Optional[float] = None) -> bool:
+        """Join a pending background rebuild; its result arrives with the next event loop pass."""
+
+        thread = self._schema_rebuild
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _on_schema_rebuilt(self, key: SchemaCacheKey, entries: List[Dict[str, Any]]) -> None:
+        self._schema_rebuild = None
+        self._store_schema_entries(key, entries)
+        if key != self._schema_cache_key():
+            return
+        items, categories, id_to_name = self._items_from_entries(entries, self._scenario.overrides)
+        self._apply_schema(items, categories, id_to_name)
+
+    def _on_schema_rebuild_failed(self, key: SchemaCacheKey, error: str) -> None:
+        self._schema_rebuild = None
+        self.errorOccurred.emit(f"Could not refresh the PyBaMM schema ({error}). Using cached definition.")
+
     def _on_value_changed(self, identifier: str, item: ParameterDefinition) -> None:
         override_value = item.override
         self._scenario.set_override(identifier, override_value)
@@ -651,38 +1311,86 @@ class ParameterBridge(QtCore.QObject):
 
     @QtCore.Slot()
     def runDefaultSimulation(self) -> None:
-        overrides = self._scenario.overrides
-        self.progressUpdated.emit("Preparing PyBaMM simulation", 0.05)
-        try:
-            override_payload = self._map_overrides_to_parameter_names(overrides)
-            results = run_pybamm_simulation(
-                chemistry=self._scenario.chemistry,
-                model=self._scenario.model,
-                parameter_set=self._current_parameter_set or "",
-                overrides=override_payload,
-            )
-        except Exception as exc:  # pragma: no cover - runtime path
-            self.errorOccurred.emit(str(exc))
-            return
+        """Queue a PyBaMM run with the current overrides on the worker pool."""
 
+        # Snapshot everything the worker needs; it must not touch GUI state.
+        override_payload = self._map_overrides_to_parameter_names(self._scenario.overrides)
+        chemistry = self._scenario.chemistry
+        model = self._scenario.model
+        parameter_set = self._current_parameter_set or ""
         export_dir = self._scenario.project_root / "data" / "simulations"
-        export_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         prefix = f"{timestamp}_{self._current_preset or 'simulation'}"
-        self.progressUpdated.emit("Writing exports", 0.5)
-        try:
-            export_result = export_simulation_results(export_dir, prefix, results)
-        except Exception as exc:  # pragma: no cover - runtime path
-            self.errorOccurred.emit(f"Export failed: {exc}")
-            return
+        run_metadata = {"scenario": self._scenario.path.stem, "preset": self._current_preset or None}
+        # Switching back to a preset that was run before replays its cached results.
+        result_cache = ResultCache.for_project(self._scenario.project_root)
+
+        def job(context: JobContext) -> str:
+            context.report("Preparing PyBaMM simulation", 0.05)
+
+            def on_window(progress: StreamProgress) -> None:
+                # Raises on cancellation; the windows written so far stay on disk.
+                context.report(
+                    f"Simulated {progress.t_end:.0f} of {progress.t_final:.0f} s",
+                    0.05 + 0.95 * progress.fraction,
+                )
+
+            try:
+                export_result = stream_pybamm_simulation(
+                    export_dir,
+                    prefix,
+                    chemistry=chemistry,
+                    model=model,
+                    parameter_set=parameter_set,
+                    overrides=override_payload,
+                    on_window=on_window,
+                    metadata=run_metadata,
+                    catalog=export_dir / CATALOG_FILENAME,
+                    result_cache=result_cache,
+                )
+            except OSError as exc:
+                raise RuntimeError(f"Export failed: {exc}") from exc
+            context.report("Simulation complete", 1.0)
+            message = f"Simulation exported to {export_result.dat_path.name}"
+            if export_result.mdf_path is not None:
+                message += f" and {export_result.mdf_path.name}"
+            if export_result.warnings:
+                message += f" (warnings: {'; '.join(export_result.warnings)})"
+            return message
+
+        job_id = self._jobs.submit(job, name=prefix)
+        self._simulation_jobs.append(job_id)
+        self.runningChanged.emit()
 
-        self.progressUpdated.emit("Simulation complete", 1.0)
-        message = f"Simulation exported to {export_result.dat_path.name}"
-        if export_result.mdf_path is not None:
-            message += f" and {export_result.mdf_path.name}"
-        if export_result.warnings:
-            message += f" (warnings: {'; '.join(export_result.warnings)})"
-        self.simulationCompleted.emit(message)
+    @QtCore.Slot()
+    def cancelSimulation(self) -> None:
+        """Request cancellation of every queued or running simulation."""
+
+        for job_id in self._simulation_jobs:
+            self._jobs.cancel(job_id)
+
+    def _take_simulation_job(self, job_id: str) -> bool:
+        if job_id not in self._simulation_jobs:
+            return False
+        self._simulation_jobs.remove(job_id)
+        self.runningChanged.emit()
+        return True
+
+    def _on_job_progress(self, job_id: str, stage: str, fraction: float) -> None:
+        if job_id in self._simulation_jobs:
+            self.progressUpdated.emit(stage, fraction)
+
+    def _on_job_finished(self, job_id: str, message: object) -> None:
+        if self._take_simulation_job(job_id):
+            self.simulationCompleted.emit(str(message))
+
+    def _on_job_failed(self, job_id: str, error: str) -> None:
+        if self._take_simulation_job(job_id):
+            self.errorOccurred.emit(error)
+
+    def _on_job_cancelled(self, job_id: str) -> None:
+        if self._take_simulation_job(job_id):
+            self.simulationCancelled.emit()
 
     def _map_overrides_to_parameter_names(
         self, overrides: Mapping[str, Any]
@@ -701,6 +1409,11 @@ class ParameterBridge(QtCore.QObject):
             raise FileNotFoundError(f"Parameter schema not found: {schema_path}")
         with schema_path.open("r", encoding="utf-8") as handle:
             schema_data = json.load(handle)
+        return self._items_from_entries(schema_data, overrides)
+
+    def _items_from_entries(
+        self, schema_data: Iterable[Mapping[str, Any]], overrides: Dict[str, Any]
+    ) -> Tuple[List[ParameterDefinition], Iterable[str], Dict[str, str]]:
         items: List[ParameterDefinition] = []
         categories = set()
         id_to_name: Dict[str, str] = {}
@@ -730,20 +1443,25 @@ class ParameterBridge(QtCore.QObject):
                 item.category = "Uncategorised"
             if item.override is not None:
                 item.value = item.override
+            if item.type == "string" and item.value is not None and not isinstance(item.value, str):
+                item.value = str(item.value)
             categories.add(item.category)
             id_to_name[item.identifier] = item.name
             items.append(item)
         return items, categories, id_to_name
 
-    def _build_schema_from_pybamm(
-        self, overrides: Dict[str, Any]
-    ) -> Tuple[List[ParameterDefinition], Iterable[str], Dict[str, str]]:
+    def _generate_pybamm_schema_entries(self, parameter_set_name: str) -> List[Dict[str, Any]]:
+        """Introspect a PyBaMM parameter set into schema-file entries.
+
+        Runs on a worker thread for background rebuilds, so it must not touch
+        any GUI state.
+        """
+
         try:
             import pybamm  # type: ignore
         except ImportError as exc:  # pragma: no cover - optional dependency
             raise RuntimeError("PyBaMM is not available in the runtime environment") from exc
 
-        parameter_set_name = self._current_parameter_set or ""
         if not parameter_set_name:
             raise ValueError("No PyBaMM parameter set selected")
         try:
@@ -752,45 +1470,28 @@ class ParameterBridge(QtCore.QObject):
             raise RuntimeError(f"Unknown PyBaMM parameter set '{parameter_set_name}'") from exc
 
         parameter_values = pybamm.ParameterValues(chemistry=parameter_set)
-        id_to_name: Dict[str, str] = {}
-        items: List[ParameterDefinition] = []
-        categories = set()
-
+        entries: List[Dict[str, Any]] = []
         for name, raw_value in parameter_values.items():
-            identifier = self._slugify(name)
             default_value = _serialise_value(raw_value)
-            override_value = overrides.get(identifier)
             label, unit = self._split_label_unit(name)
             param_type, advanced = self._infer_type(raw_value)
             if param_type == "string" and not isinstance(default_value, str):
                 default_value = str(default_value)
-            value = override_value if override_value is not None else default_value
-            if param_type == "string" and not isinstance(value, str):
-                value = str(value)
-            item = ParameterDefinition(
-                identifier=identifier,
-                name=name,
-                label=label,
-                type=param_type,
-                default=default_value,
-                value=value,
-                unit=unit,
-                category=self._guess_category(label),
-                advanced=advanced,
-                description="",
-                minimum=None,
-                maximum=None,
-                step=None,
-                choices=[],
-                source=parameter_set_name,
-                override=override_value if override_value is not None and override_value != default_value else None,
+            entries.append(
+                {
+                    "id": self._slugify(name),
+                    "name": name,
+                    "label": label,
+                    "type": param_type,
+                    "default": default_value,
+                    "unit": unit,
+                    "category": self._guess_category(label),
+                    "advanced": advanced,
+                    "source": parameter_set_name,
+                }
             )
-            categories.add(item.category)
-            id_to_name[item.identifier] = name
-            items.append(item)
-
-        items.sort(key=lambda entry: entry.label.lower())
-        return items, categories, id_to_name
+        entries.sort(key=lambda entry: entry["label"].lower())
+        return entries
 
     def _slugify(self, text: str) -> str:
         cleaned = re.sub(r"[^0-9a-zA-Z]+", "_", text).strip("_")
@@ -855,6 +1556,14 @@ class ParameterBridge(QtCore.QObject):
     def currentPreset(self) -> str:
         return self._current_preset
 
+    @QtCore.Property(bool, notify=runningChanged)
+    def running(self) -> bool:
+        return bool(self._simulation_jobs)
+
+    @QtCore.Property(QtCore.QObject, constant=True)
+    def jobs(self) -> QtCore.QObject:
+        return self._jobs
+
     @QtCore.Property(int, notify=overridesChanged)
     def dirtyCount(self) -> int:
         return sum(1 for item in self._model.items() if item.override is not None)
@@ -865,6 +1574,8 @@ __all__ = [
     "ParameterDefinition",
     "ParameterFilterModel",
     "ParameterListModel",
+    "ParameterSearchIndex",
+    "PreviewEngine",
     "PyBammProcessor",
     "ScenarioStore",
 ]
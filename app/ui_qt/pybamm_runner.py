@@ -8,9 +8,47 @@ avoid importing PySide to keep their dependency surface minimal.
 
 from __future__ import annotations
 
+import contextlib
+import itertools
+import json
+import numbers
+import os
 import pathlib
+import shutil
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+if __package__:
+    from .result_cache import ResultCache, result_cache_key
+    from .run_catalog import RunCatalog, merge_kpis, record_export, result_kpis
+    from .simulation_results import TIME_CHANNEL, SimulationResults
+else:  # pragma: no cover - executed when running as a script
+    from result_cache import ResultCache, result_cache_key
+    from run_catalog import RunCatalog, merge_kpis, record_export, result_kpis
+    from simulation_results import TIME_CHANNEL, SimulationResults
 
 
 # A curated set of variables that provide a representative snapshot of the
@@ -26,6 +64,109 @@ DEFAULT_EXPORT_VARIABLES: Sequence[str] = (
 )
 
 
+# Upper bound on the number of built simulations kept alive by the in-process
+# model cache. Each entry holds a discretised model plus its solver set-up, so
+# the cache is deliberately small.
+MODEL_CACHE_SIZE = 8
+
+
+# Number of rows formatted per batch by the text ``.dat`` writer. Bounds the
+# temporary memory used while exporting long runs.
+DAT_CHUNK_ROWS = 65536
+
+# Simulated seconds solved per window by :func:`stream_pybamm_simulation`.
+# Only one window of solver output is held in memory at a time.
+STREAM_WINDOW_S = 600.0
+
+# Binary DAT layout (all integers little-endian):
+#
+#   offset 0   8 bytes   magic ``b"EVSIMDAT"``
+#   offset 8   uint32    format version (``BINARY_DAT_VERSION``)
+#   offset 12  uint32    length ``H`` of the JSON header in bytes
+#   offset 16  H bytes   UTF-8 JSON header with ``channels`` (time first),
+#                        ``units``, ``samples`` and ``metadata``
+#   padding    zero bytes up to the next multiple of 8
+#   data       ``samples * len(channels)`` little-endian float64 values,
+#              channel-major (every channel is one contiguous block)
+#
+# The channel-major block allows readers to memory-map the file and expose
+# each channel as a zero-copy array.
+BINARY_DAT_MAGIC = b"EVSIMDAT"
+BINARY_DAT_VERSION = 1
+BINARY_DAT_SUFFIX = ".bdat"
+_BINARY_DAT_PREAMBLE = struct.Struct("<8sII")
+
+# Result file flavours accepted by :func:`export_simulation_results`.
+DAT_FORMATS = ("text", "binary", "parquet", "arrow")
+
+
+@dataclass
+class _CachedSimulation:
+    simulation: Any
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ModelCache:
+    """In-process cache of built PyBaMM simulations.
+
+    Entries are keyed by the structural configuration of a run (chemistry,
+    model, parameter set, mesh settings and the *names* of the numeric
+    overrides). Numeric overrides are turned into ``[input]`` parameters so a
+    cached simulation can be re-solved with new values without rebuilding or
+    re-discretising the model.
+    """
+
+    def __init__(self, max_entries: int = MODEL_CACHE_SIZE) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, _CachedSimulation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, key: Hashable, factory: Any) -> _CachedSimulation:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        # Build outside of the cache lock so unrelated configurations can be
+        # prepared concurrently.
+        created = _CachedSimulation(simulation=factory())
+        with self._lock:
+            entry = self._entries.setdefault(key, created)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_MODEL_CACHE = ModelCache()
+
+
+def get_model_cache() -> ModelCache:
+    """Return the process-wide cache used by :func:`run_pybamm_simulation`."""
+
+    return _MODEL_CACHE
+
+
+def clear_model_cache() -> None:
+    """Drop every cached simulation (e.g. after swapping the PyBaMM install)."""
+
+    _MODEL_CACHE.clear()
+
+
 @dataclass
 class ExportResult:
     """Metadata about the artefacts written by :func:`export_simulation_results`."""
@@ -43,9 +184,16 @@ def run_pybamm_simulation(
     overrides: Mapping[str, object],
     t_eval: Optional[Iterable[float]] = None,
     extra_variables: Optional[Iterable[str]] = None,
-) -> Dict[str, List[float]]:
+    var_pts: Optional[Mapping[str, int]] = None,
+    use_cache: bool = True,
+    result_cache: Optional[ResultCache] = None,
+) -> SimulationResults:
     """Execute a PyBaMM simulation and return the requested result channels.
 
+    The channels are returned as a columnar :class:`SimulationResults` that
+    wraps the solver's ``float64`` arrays without converting them to Python
+    lists.
+
     Parameters
     ----------
     chemistry:
@@ -62,8 +210,722 @@ def run_pybamm_simulation(
         solve. When omitted a one hour discharge sampled every second is used.
     extra_variables:
         Additional solution variables to extract from the simulation.
+    var_pts:
+        Optional mesh settings forwarded to :class:`pybamm.Simulation`.
+    use_cache:
+        Reuse a previously built simulation from the in-process model cache.
+        Numeric overrides are passed to the solver as inputs, so only the
+        solve is paid for when a configuration has been seen before.
+    result_cache:
+        On-disk :class:`ResultCache` consulted before building or solving
+        anything. A configuration that was solved before (same overrides,
+        times, variables, mesh and PyBaMM version) is returned from the cache
+        with read-only channels and ``metadata["cache_hit"]`` set; otherwise
+        the fresh results are stored in it.
+    """
+
+    variables = _export_variables(extra_variables)
+    key: Optional[str] = None
+    if result_cache is not None:
+        started = time.perf_counter()
+        if t_eval is not None:
+            t_eval = [float(value) for value in t_eval]
+        key = result_cache_key(
+            chemistry=chemistry,
+            model=model,
+            parameter_set=parameter_set,
+            overrides=overrides,
+            t_eval=t_eval,
+            variables=variables,
+            var_pts=var_pts,
+        )
+        cached = result_cache.load(key)
+        if cached is not None:
+            cached.metadata.update(cache_hit=True, solve_s=time.perf_counter() - started)
+            return cached
+
+    entry, input_overrides, t_eval = _prepare_simulation(
+        chemistry, model, parameter_set, overrides, t_eval, var_pts, use_cache
+    )
+
+    # A built simulation keeps per-solve state, so concurrent callers sharing
+    # a cache entry are serialised on it.
+    with entry.lock:
+        started = time.perf_counter()
+        if input_overrides:
+            solution = entry.simulation.solve(t_eval=t_eval, inputs=input_overrides)
+        else:
+            solution = entry.simulation.solve(t_eval=t_eval)
+        solve_s = time.perf_counter() - started
+
+    metadata = _run_metadata(chemistry, model, parameter_set, overrides)
+    metadata["solve_s"] = solve_s
+    results = SimulationResults(_solution_channels(solution, variables), metadata=metadata)
+    if key is not None:
+        try:
+            result_cache.store(key, results)
+        except OSError:  # pragma: no cover - a full or read-only cache must not fail the run
+            pass
+    return results
+
+
+def export_simulation_results(
+    export_dir: pathlib.Path,
+    prefix: str,
+    results: Mapping[str, Sequence[float]],
+    *,
+    include_mdf: bool = True,
+    dat_format: str = "text",
+    metadata: Optional[Mapping[str, object]] = None,
+    catalog: Optional[Union[pathlib.Path, RunCatalog]] = None,
+) -> ExportResult:
+    """Persist simulation results as ``.dat`` (and optionally ``.mdf``) files.
+
+    ``results`` may be a :class:`SimulationResults` or any mapping of channel
+    name to samples; the latter is wrapped (and validated) once up front.
+    ``dat_format="binary"`` writes the binary DAT flavour (``.bdat``, see
+    :func:`write_binary_dat`) instead of the tab-separated text file, and
+    ``"parquet"`` / ``"arrow"`` write a compressed columnar file (see
+    :mod:`columnar_results`, requires ``pyarrow``).
+
+    ``metadata`` (scenario, preset, ...) is merged into the run metadata
+    stored by the binary and columnar formats; ``run_id`` defaults to
+    *prefix*. With ``catalog`` (a :class:`~run_catalog.RunCatalog` or the
+    path of one) the run, its files with checksums, KPIs and timings are
+    recorded once every file has been written. A catalog that cannot be
+    written (e.g. still locked after the busy timeout) is reported in
+    ``warnings`` and does not fail the export.
+    """
+
+    if dat_format not in DAT_FORMATS:
+        raise ValueError(f"Unsupported DAT format '{dat_format}'")
+
+    started = time.perf_counter()
+    export_dir.mkdir(parents=True, exist_ok=True)
+
+    data = SimulationResults.from_mapping(results)
+    if metadata or "run_id" not in data.metadata:
+        merged = {"run_id": prefix, **data.metadata, **dict(metadata or {})}
+        data = SimulationResults.from_mapping(data, metadata=merged)
+    columns = data.channel_names
+
+    if dat_format == "binary":
+        dat_path = write_binary_dat(export_dir / f"{prefix}{BINARY_DAT_SUFFIX}", data)
+    elif dat_format in ("parquet", "arrow"):
+        if __package__:
+            from .columnar_results import COLUMNAR_FORMATS, write_columnar_results
+        else:  # pragma: no cover - executed when running as a script
+            from columnar_results import COLUMNAR_FORMATS, write_columnar_results
+
+        dat_path = write_columnar_results(
+            export_dir / f"{prefix}{COLUMNAR_FORMATS[dat_format]}", data, format=dat_format
+        )
+    else:
+        dat_path = export_dir / f"{prefix}.dat"
+        with dat_path.open("w", encoding="utf-8", newline="") as handle:
+            write_dat_text(handle, data)
+
+    mdf_path: Optional[pathlib.Path] = None
+    warnings: List[str] = []
+
+    if include_mdf:
+        try:
+            from asammdf import MDF, Signal  # type: ignore
+        except ImportError:  # pragma: no cover - optional dependency
+            warnings.append("asammdf is not installed; MDF export skipped")
+        else:
+            signals = [
+                Signal(samples=data[column], timestamps=data.time, name=column, unit=data.unit(column))
+                for column in columns
+            ]
+
+            mdf = MDF()
+            mdf.append(signals)
+            # asammdf may adjust the suffix (``.mf4`` for MDF 4.x), so keep the
+            # path it actually wrote.
+            mdf_path = pathlib.Path(mdf.save(export_dir / f"{prefix}.mdf", overwrite=True))
+
+    if catalog is not None:
+        _record_run(
+            catalog,
+            str(data.metadata["run_id"]),
+            data.metadata,
+            {"dat": dat_path, "mdf": mdf_path},
+            warnings,
+            samples=data.sample_count,
+            kpis=result_kpis(data),
+            export_s=time.perf_counter() - started,
+        )
+
+    return ExportResult(dat_path=dat_path, mdf_path=mdf_path, warnings=warnings)
+
+
+@dataclass
+class StreamProgress:
+    """Progress of :func:`stream_pybamm_simulation` after a window was written."""
+
+    window: int
+    window_count: int
+    t_end: float
+    t_final: float
+    rows: int
+
+    @property
+    def fraction(self) -> float:
+        return (self.window + 1) / self.window_count
+
+
+def stream_pybamm_simulation(
+    export_dir: pathlib.Path,
+    prefix: str,
+    *,
+    chemistry: str,
+    model: str,
+    parameter_set: str,
+    overrides: Mapping[str, object],
+    t_eval: Optional[Iterable[float]] = None,
+    extra_variables: Optional[Iterable[str]] = None,
+    var_pts: Optional[Mapping[str, int]] = None,
+    use_cache: bool = True,
+    include_mdf: bool = True,
+    window_s: float = STREAM_WINDOW_S,
+    on_window: Optional[Callable[[StreamProgress], None]] = None,
+    metadata: Optional[Mapping[str, object]] = None,
+    catalog: Optional[Union[pathlib.Path, RunCatalog]] = None,
+    result_cache: Optional[ResultCache] = None,
+) -> ExportResult:
+    """Solve a PyBaMM simulation in time windows and export each window as it finishes.
+
+    Takes the same run arguments as :func:`run_pybamm_simulation` and writes
+    the same ``<prefix>.dat`` text file (and ``.mdf``) as
+    :func:`export_simulation_results`, but never holds more than one window
+    of ``window_s`` simulated seconds in memory. The first window is solved
+    from the initial conditions; every later one is a
+    ``Simulation.step(save=False)`` continuing from the previous window's
+    state. The ``.dat`` file is flushed after every window, so a long run
+    can be inspected while it is still going and keeps its completed windows
+    if it fails. MDF samples are spooled to asammdf's temporary file and the
+    ``.mdf`` is written when the run ends. A solver event such as the voltage
+    cut-off ends the run early, as it does for a single solve.
+
+    ``on_window`` is called with a :class:`StreamProgress` after each window
+    has been written; exceptions it raises (e.g. a cancellation) stop the
+    run. ``metadata`` and ``catalog`` work as in
+    :func:`export_simulation_results`; a run that stops early is catalogued
+    with status ``"incomplete"``.
+
+    With a ``result_cache`` a configuration that was streamed before (with
+    the same ``window_s``) is exported from the cache without solving, still
+    window by window. Otherwise every window is also spooled to temporary
+    files in the cache directory, and a completed run becomes a cache entry
+    without holding more than one window in memory. Runs larger than the
+    cache's ``max_entry_bytes`` are not cached.
+    """
+
+    if window_s <= 0:
+        raise ValueError("window_s must be positive")
+    variables = _export_variables(extra_variables)
+    key: Optional[str] = None
+    cached: Optional[SimulationResults] = None
+    if result_cache is not None:
+        if t_eval is not None:
+            t_eval = [float(value) for value in t_eval]
+        key = result_cache_key(
+            chemistry=chemistry,
+            model=model,
+            parameter_set=parameter_set,
+            overrides=overrides,
+            t_eval=t_eval,
+            variables=variables,
+            var_pts=var_pts,
+            window_s=window_s,
+        )
+        cached = result_cache.load(key)
+
+    lock: Any
+    if cached is not None:
+        windows = _time_windows(np.asarray(cached.time), float(window_s))
+        source = _cached_windows(cached, windows)
+        lock = contextlib.nullcontext()
+    else:
+        entry, input_overrides, t_eval = _prepare_simulation(
+            chemistry, model, parameter_set, overrides, t_eval, var_pts, use_cache
+        )
+        windows = _time_windows(np.asarray(t_eval, dtype=np.float64), float(window_s))
+        source = _solved_windows(entry.simulation, windows, variables, input_overrides)
+        lock = entry.lock
+    run_metadata = {"run_id": prefix, **_run_metadata(chemistry, model, parameter_set, overrides)}
+    run_metadata.update(metadata or {})
+    if cached is not None:
+        run_metadata["cache_hit"] = True
+
+    export_dir = pathlib.Path(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    dat_path = export_dir / f"{prefix}.dat"
+    warnings: List[str] = []
+    mdf_stream: Optional[_MdfStream] = None
+    if include_mdf:
+        try:
+            mdf_stream = _MdfStream(export_dir / f"{prefix}.mdf")
+        except ImportError:  # pragma: no cover - optional dependency
+            warnings.append("asammdf is not installed; MDF export skipped")
+
+    rows = 0
+    t_final = float(windows[-1][-1])
+    kpis: Dict[str, float] = {}
+    solve_s = export_s = 0.0
+    status = "incomplete"
+    spool = _BinaryDatSpool(result_cache) if result_cache is not None and cached is None else None
+    try:
+        with lock, dat_path.open("w", encoding="utf-8", newline="") as handle:
+            started = time.perf_counter()
+            for index, (channels, last) in enumerate(source):
+                data = SimulationResults(channels, metadata=run_metadata)
+                solve_s += time.perf_counter() - started
+                started = time.perf_counter()
+                write_dat_text(handle, data, include_header=index == 0)
+                handle.flush()
+                if mdf_stream is not None:
+                    mdf_stream.append(data)
+                export_s += time.perf_counter() - started
+                merge_kpis(kpis, result_kpis(data))
+                rows += data.sample_count
+                if spool is not None:
+                    spool.append(data)
+                if on_window is not None:
+                    on_window(
+                        StreamProgress(
+                            window=index,
+                            window_count=len(windows),
+                            t_end=float(data.time[-1]),
+                            t_final=t_final,
+                            rows=rows,
+                        )
+                    )
+                if last:
+                    break
+                started = time.perf_counter()
+        status = "completed"
+        if spool is not None:
+            spool.commit(key, {**_run_metadata(chemistry, model, parameter_set, overrides), "solve_s": solve_s})
+            if spool.error is not None:
+                warnings.append(f"Could not write result cache: {spool.error}")
+    finally:
+        if spool is not None:
+            spool.close()
+        mdf_path = mdf_stream.close() if mdf_stream is not None else None
+        if catalog is not None and rows:
+            # Never masks the run's own outcome: a failure here only adds a warning.
+            _record_run(
+                catalog,
+                str(run_metadata["run_id"]),
+                {**run_metadata, "solve_s": solve_s},
+                {"dat": dat_path, "mdf": mdf_path},
+                warnings,
+                status=status,
+                samples=rows,
+                kpis=kpis,
+                export_s=export_s,
+            )
+
+    return ExportResult(dat_path=dat_path, mdf_path=mdf_path, warnings=warnings)
+
+
+def write_dat_text(
+    handle: IO[str],
+    results: Mapping[str, Sequence[float]],
+    *,
+    include_header: bool = True,
+    chunk_rows: int = DAT_CHUNK_ROWS,
+) -> int:
+    """Write *results* as tab-separated text and return the number of rows.
+
+    The time channel comes first followed by the remaining channels in
+    mapping order. Values are formatted exactly like the historical
+    row-by-row writer (``0`` for zero, ``%.6e`` for magnitudes >= 1e4 or
+    <= 1e-3, ``%.12g`` otherwise) but a whole chunk of rows is rendered with
+    a single ``%`` operation.
+    """
+
+    data = SimulationResults.from_mapping(results)
+    names = [data.time_channel] + data.channel_names
+    if include_header:
+        handle.write("\t".join(names) + "\n")
+    columns = [data[name] for name in names]
+    total = data.sample_count
+    step = max(1, int(chunk_rows))
+    for start in range(0, total, step):
+        block = np.column_stack([column[start : start + step] for column in columns])
+        handle.write(_format_dat_block(block))
+    return total
+
+
+# Format tokens indexed by ``kind + 3 * is_last_column`` where kind is 0 for
+# zero, 1 for scientific and 2 for general notation.
+_DAT_TOKENS = ("0\t", "%.6e\t", "%.12g\t", "0\n", "%.6e\n", "%.12g\n")
+
+
+def _format_dat_block(block: np.ndarray) -> str:
+    if block.size == 0:
+        return ""
+    magnitude = np.abs(block)
+    zero = block == 0
+    kind = np.where(zero, 0, np.where((magnitude >= 1e4) | (magnitude <= 1e-3), 1, 2))
+    kind[:, -1] += 3
+    tokens = _DAT_TOKENS
+    template = "".join([tokens[code] for code in kind.ravel().tolist()])
+    # Zeros are rendered as a literal, so only the remaining values are
+    # substituted into the template.
+    return template % tuple(block[~zero].tolist())
+
+
+def write_binary_dat(path: pathlib.Path, results: Mapping[str, Sequence[float]]) -> pathlib.Path:
+    """Write *results* in the binary DAT layout described at module level."""
+
+    data = SimulationResults.from_mapping(results)
+    names = [data.time_channel] + data.channel_names
+    path = pathlib.Path(path)
+    with path.open("wb") as handle:
+        handle.write(_binary_dat_prefix(names, data.units, data.sample_count, data.metadata))
+        for name in names:
+            np.asarray(data[name], dtype="<f8").tofile(handle)
+    return path
+
+
+def _binary_dat_prefix(
+    names: Sequence[str], units: Mapping[str, str], samples: int, metadata: Mapping[str, Any]
+) -> bytes:
+    """Return the preamble, JSON header and padding that precede the channel data."""
+
+    header = json.dumps(
+        {
+            "channels": list(names),
+            "units": {name: units.get(name, "") for name in names},
+            "samples": samples,
+            "metadata": dict(metadata),
+        },
+        default=str,
+    ).encode("utf-8")
+    preamble = _BINARY_DAT_PREAMBLE.pack(BINARY_DAT_MAGIC, BINARY_DAT_VERSION, len(header))
+    return preamble + header + b"\0" * (-(len(preamble) + len(header)) % 8)
+
+
+def read_binary_dat(
+    path: pathlib.Path,
+    *,
+    channels: Optional[Iterable[str]] = None,
+    mmap: bool = True,
+) -> SimulationResults:
+    """Read a binary DAT file written by :func:`write_binary_dat`.
+
+    With ``mmap=True`` the channels are read-only views onto a memory map of
+    the file, so only the pages that are actually touched are loaded.
+    ``channels`` restricts the returned data channels (time is always
+    included).
+    """
+
+    path = pathlib.Path(path)
+    with path.open("rb") as handle:
+        preamble = handle.read(_BINARY_DAT_PREAMBLE.size)
+        if len(preamble) != _BINARY_DAT_PREAMBLE.size:
+            raise ValueError(f"{path} is not a binary DAT file")
+        magic, version, header_length = _BINARY_DAT_PREAMBLE.unpack(preamble)
+        if magic != BINARY_DAT_MAGIC:
+            raise ValueError(f"{path} is not a binary DAT file")
+        if version != BINARY_DAT_VERSION:
+            raise ValueError(f"Unsupported binary DAT version {version} in {path}")
+        header = json.loads(handle.read(header_length).decode("utf-8"))
+
+    names: List[str] = list(header["channels"])
+    samples = int(header["samples"])
+    offset = _BINARY_DAT_PREAMBLE.size + header_length
+    offset += -offset % 8
+    if mmap and samples and names:
+        block = np.memmap(path, dtype="<f8", mode="r", offset=offset, shape=(len(names), samples))
+    else:
+        block = np.fromfile(path, dtype="<f8", count=len(names) * samples, offset=offset)
+        block = block.reshape(len(names), samples)
+
+    selected = set(names if channels is None else channels)
+    missing = selected.difference(names)
+    if missing:
+        raise KeyError(f"Channels not present in {path}: {sorted(missing)}")
+    time_channel = names[0]
+    columns = {
+        name: block[position]
+        for position, name in enumerate(names)
+        if position == 0 or name in selected
+    }
+    return SimulationResults(
+        columns,
+        units=header.get("units", {}),
+        metadata=header.get("metadata", {}),
+        time_channel=time_channel,
+    )
+
+
+@dataclass
+class SweepPoint:
+    """Outcome of a single point of :func:`run_sweep`."""
+
+    index: int
+    prefix: str
+    overrides: Dict[str, object]
+    export: Optional[ExportResult] = None
+    error: Optional[str] = None
+    duration_s: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SweepResult:
+    """Summary of a parameter sweep and the manifest describing it."""
+
+    manifest_path: pathlib.Path
+    points: List[SweepPoint]
+
+    @property
+    def failed(self) -> List[SweepPoint]:
+        return [point for point in self.points if not point.succeeded]
+
+
+SweepSpec = Union[Mapping[str, object], Iterable[Mapping[str, object]]]
+
+
+def expand_sweep_points(grid_or_points: SweepSpec) -> List[Dict[str, object]]:
+    """Expand a sweep specification into a list of override dictionaries.
+
+    A mapping is treated as a grid: every value that is a list or tuple is an
+    axis and the cartesian product of all axes is returned (scalars are held
+    constant). Any other iterable is taken as an explicit list of override
+    dictionaries.
+    """
+
+    if isinstance(grid_or_points, Mapping):
+        names = list(grid_or_points.keys())
+        axes: List[Sequence[object]] = []
+        for name in names:
+            values = grid_or_points[name]
+            if isinstance(values, (list, tuple)):
+                if not values:
+                    raise ValueError(f"Sweep axis '{name}' has no values")
+                axes.append(values)
+            else:
+                axes.append((values,))
+        return [dict(zip(names, combination)) for combination in itertools.product(*axes)]
+    return [dict(point) for point in grid_or_points]
+
+
+def run_sweep(
+    grid_or_points: SweepSpec,
+    *,
+    chemistry: str,
+    model: str,
+    parameter_set: str,
+    export_dir: pathlib.Path,
+    prefix: str = "sweep",
+    workers: Optional[int] = None,
+    t_eval: Optional[Iterable[float]] = None,
+    extra_variables: Optional[Iterable[str]] = None,
+    var_pts: Optional[Mapping[str, int]] = None,
+    include_mdf: bool = True,
+    dat_format: str = "text",
+    catalog: Optional[pathlib.Path] = None,
+    result_cache: Optional[ResultCache] = None,
+    on_point_done: Optional[Callable[[SweepPoint], None]] = None,
+) -> SweepResult:
+    """Run :func:`run_pybamm_simulation` for every point of a parameter sweep.
+
+    Points are spread across a process pool of ``workers`` processes (all
+    cores by default) and each worker exports its result straight away through
+    :func:`export_simulation_results` using ``<prefix>_<index>`` as file
+    prefix, so no result data is shipped back to the parent process. Every
+    worker keeps its own model cache, which means each process only builds
+    the model once per structural configuration. With ``workers=1`` the sweep
+    runs in the calling process.
+
+    ``dat_format="parquet"`` keeps large sweeps compact; every file then
+    records its ``run_id``, sweep name and point index in its metadata.
+    With a ``catalog`` path every worker records its point there, failed
+    points included (status ``"failed"``). A ``result_cache`` is shared
+    by all workers, so repeating a sweep only solves the points it has not
+    seen before.
+
+    Failures are recorded per point rather than aborting the sweep. A JSON
+    manifest mapping each point to its overrides and exported files is
+    written to ``<export_dir>/<prefix>_manifest.json``.
     """
 
+    if dat_format not in DAT_FORMATS:
+        raise ValueError(f"Unsupported DAT format '{dat_format}'")
+    points = expand_sweep_points(grid_or_points)
+    export_dir = pathlib.Path(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(points) or 1))
+
+    width = max(4, len(str(max(len(points) - 1, 0))))
+    tasks = [
+        _SweepTask(
+            index=index,
+            prefix=f"{prefix}_{index:0{width}d}",
+            overrides=overrides,
+            chemistry=chemistry,
+            model=model,
+            parameter_set=parameter_set,
+            export_dir=export_dir,
+            t_eval=None if t_eval is None else [float(value) for value in t_eval],
+            extra_variables=None if extra_variables is None else list(extra_variables),
+            var_pts=None if var_pts is None else dict(var_pts),
+            include_mdf=include_mdf,
+            dat_format=dat_format,
+            sweep=prefix,
+            catalog=None if catalog is None else pathlib.Path(catalog),
+            result_cache=result_cache,
+        )
+        for index, overrides in enumerate(points)
+    ]
+
+    completed: List[SweepPoint] = []
+    if workers == 1:
+        for task in tasks:
+            point = _run_sweep_task(task)
+            completed.append(point)
+            if on_point_done is not None:
+                on_point_done(point)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_sweep_task, task) for task in tasks]
+            for future in as_completed(futures):
+                point = future.result()
+                completed.append(point)
+                if on_point_done is not None:
+                    on_point_done(point)
+
+    completed.sort(key=lambda point: point.index)
+    manifest_path = export_dir / f"{prefix}_manifest.json"
+    _write_sweep_manifest(
+        manifest_path,
+        completed,
+        export_dir=export_dir,
+        header={
+            "prefix": prefix,
+            "chemistry": chemistry,
+            "model": model,
+            "parameter_set": parameter_set,
+        },
+    )
+    return SweepResult(manifest_path=manifest_path, points=completed)
+
+
+@dataclass
+class _SweepTask:
+    index: int
+    prefix: str
+    overrides: Dict[str, object]
+    chemistry: str
+    model: str
+    parameter_set: str
+    export_dir: pathlib.Path
+    t_eval: Optional[List[float]]
+    extra_variables: Optional[List[str]]
+    var_pts: Optional[Dict[str, int]]
+    include_mdf: bool
+    dat_format: str = "text"
+    sweep: str = ""
+    catalog: Optional[pathlib.Path] = None
+    result_cache: Optional[ResultCache] = None
+
+
+def _run_sweep_task(task: _SweepTask) -> SweepPoint:
+    started = time.perf_counter()
+    point = SweepPoint(index=task.index, prefix=task.prefix, overrides=dict(task.overrides))
+    try:
+        results = run_pybamm_simulation(
+            chemistry=task.chemistry,
+            model=task.model,
+            parameter_set=task.parameter_set,
+            overrides=task.overrides,
+            t_eval=task.t_eval,
+            extra_variables=task.extra_variables,
+            var_pts=task.var_pts,
+            result_cache=task.result_cache,
+        )
+        point.export = export_simulation_results(
+            task.export_dir,
+            task.prefix,
+            results,
+            include_mdf=task.include_mdf,
+            dat_format=task.dat_format,
+            metadata={"sweep": task.sweep, "sweep_index": task.index},
+            catalog=task.catalog,
+        )
+    except Exception as exc:  # noqa: BLE001 - recorded in the manifest
+        point.error = f"{type(exc).__name__}: {exc}"
+        if task.catalog is not None:
+            metadata = _run_metadata(task.chemistry, task.model, task.parameter_set, task.overrides)
+            metadata.update({"sweep": task.sweep, "sweep_index": task.index, "error": point.error})
+            _record_run(task.catalog, task.prefix, metadata, {}, [], status="failed")
+    point.duration_s = time.perf_counter() - started
+    return point
+
+
+def _write_sweep_manifest(
+    path: pathlib.Path,
+    points: Sequence[SweepPoint],
+    *,
+    export_dir: pathlib.Path,
+    header: Mapping[str, object],
+) -> None:
+    def relative(file_path: Optional[pathlib.Path]) -> Optional[str]:
+        if file_path is None:
+            return None
+        try:
+            return file_path.relative_to(export_dir).as_posix()
+        except ValueError:
+            return str(file_path)
+
+    entries = []
+    for point in points:
+        files: Dict[str, Optional[str]] = {"dat": None, "mdf": None}
+        warnings: List[str] = []
+        if point.export is not None:
+            files = {"dat": relative(point.export.dat_path), "mdf": relative(point.export.mdf_path)}
+            warnings = list(point.export.warnings)
+        entries.append(
+            {
+                "index": point.index,
+                "prefix": point.prefix,
+                "overrides": point.overrides,
+                "files": files,
+                "warnings": warnings,
+                "error": point.error,
+                "duration_s": round(point.duration_s, 6),
+            }
+        )
+    payload = dict(header)
+    payload["points"] = entries
+    temp_path = path.with_name(path.name + ".tmp")
+    with temp_path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, default=str)
+    temp_path.replace(path)
+
+
+def _prepare_simulation(
+    chemistry: str,
+    model: str,
+    parameter_set: str,
+    overrides: Mapping[str, object],
+    t_eval: Optional[Iterable[float]],
+    var_pts: Optional[Mapping[str, int]],
+    use_cache: bool,
+) -> Tuple[_CachedSimulation, Dict[str, float], Any]:
+    """Return the (possibly cached) simulation, its solver inputs and ``t_eval``."""
+
     try:
         import pybamm  # type: ignore
     except ImportError as exc:  # pragma: no cover - optional runtime dependency
@@ -83,108 +945,321 @@ def run_pybamm_simulation(
     except AttributeError as exc:
         raise RuntimeError(f"Unknown PyBaMM parameter set '{parameter_set}'") from exc
 
-    parameter_values = pybamm.ParameterValues(chemistry=parameter_values_source)
-    if overrides:
-        parameter_values.update(dict(overrides))
+    input_overrides, static_overrides = _split_overrides(overrides)
 
     if t_eval is None:
         t_eval = pybamm.linspace(0, 3600, 361)
     else:
         t_eval = [float(value) for value in t_eval]
 
-    model_instance = model_factory()
-    simulation = pybamm.Simulation(model_instance, parameter_values=parameter_values)
-    solution = simulation.solve(t_eval=t_eval)
+    def build_simulation() -> Any:
+        parameter_values = pybamm.ParameterValues(chemistry=parameter_values_source)
+        payload: Dict[str, object] = dict(static_overrides)
+        payload.update({name: "[input]" for name in input_overrides})
+        if payload:
+            parameter_values.update(payload)
+        simulation_kwargs: Dict[str, Any] = {"parameter_values": parameter_values}
+        if var_pts:
+            simulation_kwargs["var_pts"] = dict(var_pts)
+        return pybamm.Simulation(model_factory(), **simulation_kwargs)
+
+    if use_cache:
+        key = _model_cache_key(chemistry, model, parameter_set, var_pts, input_overrides, static_overrides)
+        entry = _MODEL_CACHE.get_or_create(key, build_simulation)
+    else:
+        entry = _CachedSimulation(simulation=build_simulation())
+    return entry, input_overrides, t_eval
 
-    results: Dict[str, List[float]] = {
-        "Time [s]": solution.t.tolist(),
-    }
 
+def _export_variables(extra_variables: Optional[Iterable[str]]) -> List[str]:
     variables = list(DEFAULT_EXPORT_VARIABLES)
     if extra_variables:
         for variable in extra_variables:
             if variable not in variables:
                 variables.append(variable)
+    return variables
+
+
+def _solution_channels(
+    solution: Any,
+    variables: Sequence[str],
+    *,
+    skip: int = 0,
+    strict: bool = False,
+) -> Dict[str, Any]:
+    """Extract the time base and *variables* from *solution*, dropping *skip* leading samples.
+
+    Variables the model does not produce are left out unless *strict* is set.
+    """
 
+    channels: Dict[str, Any] = {TIME_CHANNEL: np.asarray(solution.t)[skip:]}
     for variable in variables:
         try:
             channel = solution[variable]
         except KeyError:  # pragma: no cover - variable not produced by model
+            if strict:
+                raise
             continue
-        results[variable] = channel.entries.tolist()
+        channels[variable] = np.asarray(channel.entries)[skip:]
+    return channels
 
-    return results
 
+def _run_metadata(chemistry: str, model: str, parameter_set: str, overrides: Mapping[str, object]) -> Dict[str, Any]:
+    return {
+        "chemistry": chemistry,
+        "model": model,
+        "parameter_set": parameter_set,
+        "overrides": dict(overrides or {}),
+    }
 
-def export_simulation_results(
-    export_dir: pathlib.Path,
-    prefix: str,
-    results: Mapping[str, Sequence[float]],
-    *,
-    include_mdf: bool = True,
-) -> ExportResult:
-    """Persist simulation results as ``.dat`` (and optionally ``.mdf``) files."""
 
-    export_dir.mkdir(parents=True, exist_ok=True)
+def _record_run(
+    catalog: Union[pathlib.Path, RunCatalog],
+    run_id: str,
+    metadata: Mapping[str, Any],
+    files: Mapping[str, Optional[pathlib.Path]],
+    warnings: List[str],
+    **fields: Any,
+) -> None:
+    """Record a run in *catalog*; a failure (e.g. a locked database) becomes a warning."""
 
-    if "Time [s]" not in results:
-        raise ValueError("Simulation results missing 'Time [s]' channel")
-    time = [float(value) for value in results["Time [s]"]]
-    columns = [key for key in results.keys() if key != "Time [s]"]
-    expected_length = len(time)
+    try:
+        record_export(catalog, run_id, metadata, files, **fields)
+    except (sqlite3.Error, OSError) as exc:
+        warnings.append(f"Run not recorded in the catalog: {exc}")
 
-    column_data: Dict[str, List[float]] = {"Time [s]": time}
-    for column in columns:
-        values = [float(value) for value in results[column]]
-        if len(values) != expected_length:
-            raise ValueError(f"Result channel '{column}' length mismatch")
-        column_data[column] = values
 
-    dat_path = export_dir / f"{prefix}.dat"
-    header = "\t".join(["Time [s]"] + columns)
-    with dat_path.open("w", encoding="utf-8", newline="") as handle:
-        handle.write(f"{header}\n")
-        for row_index in range(expected_length):
-            row_values = [column_data["Time [s]"][row_index]]
-            row_values.extend(column_data[column][row_index] for column in columns)
-            formatted = "\t".join(_format_float(value) for value in row_values)
-            handle.write(f"{formatted}\n")
+def _time_windows(t_eval: np.ndarray, window_s: float) -> List[np.ndarray]:
+    """Split increasing evaluation times into consecutive windows of at most *window_s* seconds.
 
-    mdf_path: Optional[pathlib.Path] = None
-    warnings: List[str] = []
+    A window always advances time, so a gap longer than *window_s* becomes a
+    window of its own.
+    """
 
-    if include_mdf:
-        try:
-            from asammdf import MDF, Signal  # type: ignore
-        except ImportError:  # pragma: no cover - optional dependency
-            warnings.append("asammdf is not installed; MDF export skipped")
+    if t_eval.ndim != 1 or t_eval.shape[0] < 2:
+        raise ValueError("t_eval needs at least two time points")
+    if not np.all(np.diff(t_eval) > 0):
+        raise ValueError("t_eval must be strictly increasing")
+    windows: List[np.ndarray] = []
+    start = 0
+    # The first window is solved from scratch and needs two points of its own.
+    minimum = 2
+    t_start = float(t_eval[0])
+    while start < t_eval.shape[0]:
+        stop = int(np.searchsorted(t_eval, t_start + window_s, side="right"))
+        stop = min(max(stop, start + minimum), t_eval.shape[0])
+        windows.append(t_eval[start:stop])
+        t_start = float(t_eval[stop - 1])
+        start = stop
+        minimum = 1
+    return windows
+
+
+def _solved_windows(
+    simulation: Any,
+    windows: Sequence[np.ndarray],
+    variables: Sequence[str],
+    input_overrides: Mapping[str, float],
+) -> Iterator[Tuple[Dict[str, Any], bool]]:
+    """Solve *windows* one after the other; yield each window's channels and whether it is the last.
+
+    The first window is solved from the initial conditions and every later
+    one continues from the previous state with ``Simulation.step(save=False)``.
+    A solver event such as the voltage cut-off makes the current window the
+    last, as it ends a plain solve.
+    """
+
+    inputs: Dict[str, Any] = {"inputs": dict(input_overrides)} if input_overrides else {}
+    solution = None
+    t_start = 0.0
+    for index, window in enumerate(windows):
+        if solution is None:
+            solution = simulation.solve(t_eval=window.tolist(), **inputs)
+            channels = _solution_channels(solution, variables)
+            # Later windows must produce exactly the channels of the first.
+            variables = [name for name in channels if name != TIME_CHANNEL]
         else:
-            signals = []
-            for column in columns:
-                samples = [float(value) for value in results[column]]
-                signals.append(Signal(samples=samples, timestamps=time, name=column))
+            step_eval = np.concatenate(([0.0], window - t_start))
+            solution = simulation.step(
+                float(step_eval[-1]), t_eval=step_eval, save=False, starting_solution=solution, **inputs
+            )
+            # The first sample repeats the last one of the previous window.
+            channels = _solution_channels(solution, variables, skip=1, strict=True)
+        t_start = float(np.asarray(channels[TIME_CHANNEL])[-1])
+        terminated = str(getattr(solution, "termination", "final time")).startswith("event")
+        yield channels, terminated or index == len(windows) - 1
 
-            mdf = MDF()
-            mdf.append(signals)
-            mdf_path = export_dir / f"{prefix}.mdf"
-            mdf.save(mdf_path, overwrite=True)
 
-    return ExportResult(dat_path=dat_path, mdf_path=mdf_path, warnings=warnings)
+def _cached_windows(
+    results: SimulationResults, windows: Sequence[np.ndarray]
+) -> Iterator[Tuple[Dict[str, Any], bool]]:
+    """Yield *results* in the row ranges of *windows* (split from its own time channel)."""
+
+    start = 0
+    for index, window in enumerate(windows):
+        stop = start + window.shape[0]
+        yield {name: results[name][start:stop] for name in results}, index == len(windows) - 1
+        start = stop
+
+
+class _MdfStream:
+    """Append result windows to a single MDF channel group and save it on close."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        from asammdf import MDF  # type: ignore
+
+        self._mdf = MDF()
+        self._path = path
+        self._started = False
+
+    def append(self, data: SimulationResults) -> None:
+        if not data.sample_count:
+            return
+        if not self._started:
+            from asammdf import Signal  # type: ignore
+
+            self._mdf.append(
+                [
+                    Signal(samples=data[column], timestamps=data.time, name=column, unit=data.unit(column))
+                    for column in data.channel_names
+                ]
+            )
+            self._started = True
+        else:
+            self._mdf.extend(0, [(data.time, None)] + [(data[column], None) for column in data.channel_names])
+
+    def close(self) -> Optional[pathlib.Path]:
+        try:
+            if not self._started:
+                return None
+            # asammdf may adjust the suffix (``.mf4`` for MDF 4.x).
+            return pathlib.Path(self._mdf.save(self._path, overwrite=True))
+        finally:
+            self._mdf.close()
+
+
+class _BinaryDatSpool:
+    """Spool result windows to per-channel temporary files and assemble one cache entry at the end.
+
+    A run that outgrows the cache's ``max_entry_bytes`` or hits an I/O error
+    is dropped rather than failing the run; :attr:`error` holds the error.
+    """
+
+    def __init__(self, cache: ResultCache) -> None:
+        self._cache = cache
+        self._files: Dict[str, IO[bytes]] = {}
+        self._units: Dict[str, str] = {}
+        self._samples = 0
+        self._dropped = False
+        self.error: Optional[OSError] = None
+
+    def append(self, data: SimulationResults) -> None:
+        if self._dropped:
+            return
+        names = [data.time_channel] + data.channel_names
+        self._samples += data.sample_count
+        if self._samples * 8 * len(names) > self._cache.max_entry_bytes:
+            self._drop()
+            return
+        try:
+            if not self._files:
+                self._cache.root.mkdir(parents=True, exist_ok=True)
+                self._units = {name: data.unit(name) for name in names}
+                for name in names:
+                    self._files[name] = tempfile.TemporaryFile(dir=self._cache.root)
+            for name in names:
+                np.asarray(data[name], dtype="<f8").tofile(self._files[name])
+        except OSError as exc:
+            self.error = exc
+            self._drop()
+
+    def commit(self, key: str, metadata: Mapping[str, Any]) -> Optional[pathlib.Path]:
+        """Write the spooled windows as the cache entry for *key*; ``None`` if the run was dropped."""
+
+        if self._dropped or not self._files:
+            return None
+        try:
+            path = self._cache.reserve()
+            try:
+                with path.open("wb") as handle:
+                    handle.write(_binary_dat_prefix(list(self._files), self._units, self._samples, metadata))
+                    for spooled in self._files.values():
+                        spooled.seek(0)
+                        shutil.copyfileobj(spooled, handle, DAT_CHUNK_ROWS * 8)
+                return self._cache.adopt(key, path)
+            finally:
+                path.unlink(missing_ok=True)
+        except OSError as exc:
+            self.error = exc
+            return None
+        finally:
+            self.close()
+
+    def _drop(self) -> None:
+        self._dropped = True
+        self.close()
 
+    def close(self) -> None:
+        for spooled in self._files.values():
+            spooled.close()
+        self._files = {}
 
-def _format_float(value: float) -> str:
-    if value == 0:
-        return "0"
-    magnitude = abs(value)
-    if magnitude != 0 and (magnitude >= 1e4 or magnitude <= 1e-3):
-        return f"{value:.6e}"
-    return f"{value:.12g}"
+
+def _split_overrides(
+    overrides: Mapping[str, object]
+) -> Tuple[Dict[str, float], Dict[str, object]]:
+    """Separate numeric overrides (solver inputs) from structural ones."""
+
+    inputs: Dict[str, float] = {}
+    static: Dict[str, object] = {}
+    for name, value in (overrides or {}).items():
+        if isinstance(value, numbers.Real) and not isinstance(value, bool):
+            inputs[name] = float(value)
+        else:
+            static[name] = value
+    return inputs, static
+
+
+def _model_cache_key(
+    chemistry: str,
+    model: str,
+    parameter_set: str,
+    var_pts: Optional[Mapping[str, int]],
+    input_overrides: Mapping[str, float],
+    static_overrides: Mapping[str, object],
+) -> Hashable:
+    mesh = tuple(sorted((str(name), int(points)) for name, points in (var_pts or {}).items()))
+    # Non-numeric overrides change the model structure, so their values (not
+    # just their names) are part of the key.
+    static = tuple(sorted((name, repr(value)) for name, value in static_overrides.items()))
+    return (chemistry, model, parameter_set, mesh, frozenset(input_overrides), static)
 
 
 __all__ = [
+    "BINARY_DAT_MAGIC",
+    "BINARY_DAT_SUFFIX",
+    "BINARY_DAT_VERSION",
+    "DAT_CHUNK_ROWS",
+    "DAT_FORMATS",
     "DEFAULT_EXPORT_VARIABLES",
     "ExportResult",
+    "MODEL_CACHE_SIZE",
+    "ModelCache",
+    "ResultCache",
+    "STREAM_WINDOW_S",
+    "SimulationResults",
+    "StreamProgress",
+    "SweepPoint",
+    "SweepResult",
+    "clear_model_cache",
+    "expand_sweep_points",
     "export_simulation_results",
+    "get_model_cache",
+    "read_binary_dat",
     "run_pybamm_simulation",
+    "run_sweep",
+    "stream_pybamm_simulation",
+    "write_binary_dat",
+    "write_dat_text",
 ]
 
@@ -42,6 +42,7 @@ ApplicationWindow {
 
             ComboBox {
                 id: presetBox
+                objectName: "presetBox"
                 Layout.preferredWidth: 220
                 property var presetOptions: ParamCatalog.field_options("parameter_set")
                 model: presetOptions
@@ -52,18 +53,17 @@ ApplicationWindow {
                         ParamStore.setValue("parameter_set", presetOptions[index])
                 }
 
-                Connections {
-                    target: ParamStore
-                    function onChanged(key, value) {
-                        if (key === "parameter_set") {
-                            var candidate = value
-                            if (candidate === undefined || candidate === null || candidate === "")
-                                candidate = storedParameterSet()
-                            var idx = presetOptions.indexOf(candidate)
-                            if (idx >= 0)
-                                presetBox.currentIndex = idx
-                        }
-                    }
+                readonly property int presetRevision: {
+                    ParamStore.revision  // re-evaluate once per committed change set
+                    return ParamStore.keyRevision("parameter_set")
+                }
+                onPresetRevisionChanged: {
+                    var candidate = ParamStore.getValue("parameter_set")
+                    if (candidate === undefined || candidate === null || candidate === "")
+                        candidate = storedParameterSet()
+                    var idx = presetOptions.indexOf(candidate)
+                    if (idx >= 0)
+                        presetBox.currentIndex = idx
                 }
             }
 
@@ -94,7 +94,7 @@ ApplicationWindow {
         Sidebar {
             id: sidebar
             objectName: "sidebar"
-            width: 320
+            SplitView.preferredWidth: 320
             onSectionSelected: function(catIndex, sectionIndex) {
                 paramForm.currentSection = { category: catIndex, section: sectionIndex }
             }
@@ -111,6 +111,16 @@ ApplicationWindow {
 
     Toast { id: toast }
 
+    Connections {
+        target: Bridge
+        function onSimulationFinished(path) {
+            toast.show(qsTr("Simulation results saved to: ") + path)
+        }
+        function onSimulationFailed(message) {
+            toast.show(qsTr("Simulation failed: ") + message)
+        }
+    }
+
     FileDialog {
         id: importDialog
         title: qsTr("Import parameters (.json/.dat)")
@@ -8,6 +8,15 @@ Item {
     implicitWidth: 640
     implicitHeight: 60
 
+    // Emitted only for the store updates that touch this field.
+    signal storeValueChanged(var value)
+
+    readonly property int valueRevision: {
+        ParamStore.revision  // re-evaluate once per committed change set
+        return field ? ParamStore.keyRevision(field.key) : 0
+    }
+    onValueRevisionChanged: storeValueChanged(ParamStore.getValue(field.key))
+
     function currentValue() {
         var value = ParamStore.getValue(field.key)
         if (value === undefined || value === null) {
@@ -122,16 +131,14 @@ Item {
             }
 
             Connections {
-                target: ParamStore
-                function onChanged(key, value) {
-                    if (key === root.field.key) {
+                target: root
+                function onStoreValueChanged(value) {
 
-                        var newValue = root.clamp(root.currentValue())
-                        spin.value = newValue
-                        if (slider.visible)
-                            slider.value = newValue
+                    var newValue = root.clamp(root.currentValue())
+                    spin.value = newValue
+                    if (slider.visible)
+                        slider.value = newValue
 
-                    }
                 }
             }
         }
@@ -148,18 +155,16 @@ Item {
             onActivated: ParamStore.setValue(field.key, model[index])
 
             Connections {
-                target: ParamStore
-                function onChanged(key, value) {
-                    if (key === root.field.key) {
-                        var candidate = value
-                        if (candidate === undefined || candidate === null)
-                            candidate = root.field.default
-                        if (candidate === undefined && model.length > 0)
-                            candidate = model[0]
-                        var idx = model.indexOf(candidate)
-                        if (idx >= 0)
-                            enumBox.currentIndex = idx
-                    }
+                target: root
+                function onStoreValueChanged(value) {
+                    var candidate = value
+                    if (candidate === undefined || candidate === null)
+                        candidate = root.field.default
+                    if (candidate === undefined && model.length > 0)
+                        candidate = model[0]
+                    var idx = model.indexOf(candidate)
+                    if (idx >= 0)
+                        enumBox.currentIndex = idx
                 }
             }
         }
@@ -174,14 +179,12 @@ Item {
             onToggled: ParamStore.setValue(field.key, checked)
 
             Connections {
-                target: ParamStore
-                function onChanged(key, value) {
-                    if (key === root.field.key) {
-                        var state = value
-                        if (state === undefined || state === null)
-                            state = root.field.default
-                        toggle.checked = !!state
-                    }
+                target: root
+                function onStoreValueChanged(value) {
+                    var state = value
+                    if (state === undefined || state === null)
+                        state = root.field.default
+                    toggle.checked = !!state
                 }
             }
         }
@@ -197,14 +200,12 @@ Item {
             onEditingFinished: ParamStore.setValue(field.key, text)
 
             Connections {
-                target: ParamStore
-                function onChanged(key, value) {
-                    if (key === root.field.key) {
-                        var textValue = value
-                        if (textValue === undefined || textValue === null)
-                            textValue = root.field.default !== undefined ? root.field.default : ""
-                        textField.text = String(textValue)
-                    }
+                target: root
+                function onStoreValueChanged(value) {
+                    var textValue = value
+                    if (textValue === undefined || textValue === null)
+                        textValue = root.field.default !== undefined ? root.field.default : ""
+                    textField.text = String(textValue)
                 }
             }
         }
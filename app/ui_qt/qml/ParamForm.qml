@@ -5,26 +5,9 @@ import QtQuick.Layouts
 Item {
     id: root
     property var currentSection: ({ category: 0, section: 0 })
-    property var categories: ParamCatalog.categories
     property string query: ""
     property bool showAdvanced: false
-
-    function safeCategory(index) {
-        const cats = root.categories
-        if (!cats || index < 0 || index >= cats.length)
-            return null
-        return cats[index]
-    }
-
-    function safeSection(catIndex, sectionIndex) {
-        const category = safeCategory(catIndex)
-        if (!category)
-            return null
-        const sections = category.sections || []
-        if (sectionIndex < 0 || sectionIndex >= sections.length)
-            return null
-        return sections[sectionIndex]
-    }
+    readonly property var fieldsModel: ParamCatalog.fieldsModel(currentSection.category, currentSection.section)
 
     ColumnLayout {
         anchors.fill: parent
@@ -33,13 +16,8 @@ Item {
 
         Label {
             id: header
-            text: {
-                const category = safeCategory(root.currentSection.category)
-                const section = safeSection(root.currentSection.category, root.currentSection.section)
-                if (!category || !section)
-                    return "Select a section"
-                return category.label + " · " + section.label
-            }
+            text: ParamCatalog.sectionTitle(root.currentSection.category, root.currentSection.section)
+                  || "Select a section"
             font.pixelSize: 18
         }
 
@@ -55,12 +33,9 @@ Item {
                 Repeater {
                     id: fieldRepeater
                     objectName: "fieldRepeater"
-                    model: {
-                        const section = safeSection(root.currentSection.category, root.currentSection.section)
-                        return section ? section.fields || [] : []
-                    }
+                    model: root.fieldsModel
                     delegate: ParamField {
-                        field: modelData
+                        field: model.field
                         visible: {
                             const isAdvanced = !!field.advanced
                             const matchesAdvanced = root.showAdvanced || !isAdvanced
@@ -16,24 +16,6 @@ Item {
         color: "#111111"
     }
 
-    function visibleFields(section) {
-        const q = (search.text || "").toLowerCase()
-        const advanced = showAdvanced.checked
-        const fields = section.fields || []
-        const matches = []
-        for (let i = 0; i < fields.length; ++i) {
-            const field = fields[i]
-            const isAdvanced = !!field.advanced
-            const label = String(field.label || "").toLowerCase()
-            const key = String(field.key || "").toLowerCase()
-            const matchQuery = !q || label.indexOf(q) !== -1 || key.indexOf(q) !== -1
-            const matchAdvanced = advanced || !isAdvanced
-            if (matchQuery && matchAdvanced)
-                matches.push(field)
-        }
-        return matches
-    }
-
     ColumnLayout {
         anchors.fill: parent
         anchors.margins: 12
@@ -54,22 +36,16 @@ Item {
             objectName: "categoryList"
             Layout.fillWidth: true
             Layout.fillHeight: true
-            model: ParamCatalog.categories
+            model: ParamCatalog.categoryModel
             clip: true
             delegate: Frame {
                 width: ListView.view.width
                 property int categoryIndex: index
 
-                readonly property bool hasVisibleSections: {
-                    const sections = modelData.sections || []
-                    if (!search.text)
-                        return true
-                    for (let i = 0; i < sections.length; ++i) {
-                        if (visibleFields(sections[i]).length > 0)
-                            return true
-                    }
-                    return false
-                }
+                property var sectionsModel: model.sections
+
+                readonly property bool hasVisibleSections: !search.text
+                    || sectionsModel.countMatching(search.text, showAdvanced.checked) > 0
 
                 visible: hasVisibleSections
                 height: visible ? implicitHeight : 0
@@ -80,18 +56,19 @@ Item {
                     spacing: 6
 
                     Label {
-                        text: modelData.label
+                        text: model.label
                         font.bold: true
                         color: "#eeeeee"
                         wrapMode: Text.Wrap
                     }
 
                     Repeater {
-                        model: modelData.sections || []
+                        model: sectionsModel
                         delegate: Button {
                             Layout.fillWidth: true
-                            text: modelData.label
-                            visible: visibleFields(modelData).length > 0 || search.text.length === 0
+                            text: model.label
+                            visible: search.text.length === 0
+                                     || model.fields.countMatching(search.text, showAdvanced.checked) > 0
                             onClicked: root.sectionSelected(categoryIndex, index)
                         }
                     }
@@ -0,0 +1,252 @@
+"""Content-addressed on-disk cache of PyBaMM simulation results.
+
+A solve is fully determined by its configuration, so results are stored
+under the SHA-256 of a canonical description of that configuration (see
+:func:`result_cache_key`): chemistry, model, parameter set, the overrides
+with their values normalised, the evaluation times, the requested variables,
+the mesh settings and the installed PyBaMM version. Re-running a
+configuration that was solved before (a preset the user toggled back to, a
+regression run repeated by CI) then costs one file read instead of a solve.
+
+Entries are binary DAT files (see :func:`pybamm_runner.write_binary_dat`)
+named ``<key>.bdat`` below ``<project>/.cache/pybamm_results``, or
+``$EVSIM_RESULT_CACHE`` when set. They are written to a uniquely named
+temporary file and renamed into place, so concurrent jobs and the processes
+of a sweep can share one cache directory.
+The directory is bounded to ``max_bytes``: after every store the least
+recently used entries (by modification time, which a hit refreshes) are
+removed until it fits again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import numbers
+import os
+import pathlib
+import tempfile
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+if __package__:
+    from .schema_cache import pybamm_version
+    from .simulation_results import SimulationResults
+else:  # pragma: no cover - executed when running as a script
+    from schema_cache import pybamm_version
+    from simulation_results import SimulationResults
+
+
+RESULT_CACHE_VERSION = 1
+RESULT_CACHE_DIR = pathlib.Path(".cache") / "pybamm_results"
+RESULT_CACHE_ENV_VAR = "EVSIM_RESULT_CACHE"
+
+# Total size of the cache directory. A single result larger than a quarter of
+# it is not cached, so one long run cannot flush every other entry.
+RESULT_CACHE_MAX_BYTES = 2 * 1024**3
+
+_ENTRY_SUFFIX = ".bdat"
+
+
+def _normalise_override(value: object) -> object:
+    # Numbers compare by value (1 == 1.0 == np.float64(1)), everything else by
+    # its representation, mirroring how the runner splits solver inputs from
+    # structural overrides.
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, numbers.Real):
+        return float(value)
+    return repr(value)
+
+
+def result_cache_key(
+    *,
+    chemistry: str,
+    model: str,
+    parameter_set: str,
+    overrides: Mapping[str, object],
+    t_eval: Optional[Iterable[float]],
+    variables: Iterable[str],
+    var_pts: Optional[Mapping[str, int]] = None,
+    window_s: Optional[float] = None,
+    version: Optional[str] = None,
+) -> str:
+    """Return the hex SHA-256 identifying the results of one configuration.
+
+    ``t_eval=None`` stands for the runner's default time grid. ``window_s``
+    distinguishes windowed (streamed) solves from single solves. ``version``
+    defaults to the installed PyBaMM version.
+    """
+
+    if t_eval is None:
+        times = None
+    else:
+        samples = np.ascontiguousarray(np.asarray(list(t_eval), dtype=np.float64), dtype="<f8")
+        times = [int(samples.shape[0]), hashlib.sha256(samples.tobytes()).hexdigest()]
+    description = {
+        "format": RESULT_CACHE_VERSION,
+        "pybamm": pybamm_version() if version is None else version,
+        "chemistry": chemistry,
+        "model": model,
+        "parameter_set": parameter_set,
+        "overrides": {str(name): _normalise_override(value) for name, value in (overrides or {}).items()},
+        "t_eval": times,
+        "variables": list(variables),
+        "var_pts": {str(name): int(points) for name, points in (var_pts or {}).items()},
+        "window_s": None if window_s is None else float(window_s),
+    }
+    canonical = json.dumps(description, sort_keys=True, separators=(",", ":"), allow_nan=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Size-bounded store of :class:`SimulationResults` keyed by :func:`result_cache_key`."""
+
+    def __init__(
+        self,
+        root: pathlib.Path,
+        max_bytes: int = RESULT_CACHE_MAX_BYTES,
+        *,
+        max_entry_bytes: Optional[int] = None,
+    ) -> None:
+        self.root = pathlib.Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_entry_bytes = self.max_bytes // 4 if max_entry_bytes is None else max(0, int(max_entry_bytes))
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_project(cls, project_root: pathlib.Path, max_bytes: int = RESULT_CACHE_MAX_BYTES) -> "ResultCache":
+        """Return the cache in ``$EVSIM_RESULT_CACHE`` or ``<project>/.cache/pybamm_results``."""
+
+        configured = os.environ.get(RESULT_CACHE_ENV_VAR)
+        root = pathlib.Path(configured).expanduser() if configured else project_root / RESULT_CACHE_DIR
+        return cls(root, max_bytes)
+
+    def path_for(self, key: str) -> pathlib.Path:
+        return self.root / f"{key}{_ENTRY_SUFFIX}"
+
+    def load(self, key: str) -> Optional[SimulationResults]:
+        """Return the cached results for *key*, or ``None`` on a miss.
+
+        The channels are read-only views onto a memory map of the entry. A
+        hit marks the entry as most recently used; an unreadable entry is
+        removed and reported as a miss.
+        """
+
+        if __package__:
+            from .pybamm_runner import read_binary_dat
+        else:  # pragma: no cover - executed when running as a script
+            from pybamm_runner import read_binary_dat
+
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+            results = read_binary_dat(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError):
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return results
+
+    def store(self, key: str, results: SimulationResults) -> Optional[pathlib.Path]:
+        """Store *results* under *key* and evict old entries; return the entry path.
+
+        Results larger than ``max_entry_bytes`` are not stored (``None``).
+        """
+
+        if __package__:
+            from .pybamm_runner import write_binary_dat
+        else:  # pragma: no cover - executed when running as a script
+            from pybamm_runner import write_binary_dat
+
+        if results.nbytes > self.max_entry_bytes:
+            return None
+        temp_path = self.reserve()
+        try:
+            write_binary_dat(temp_path, results)
+            return self.adopt(key, temp_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def reserve(self) -> pathlib.Path:
+        """Create an empty, uniquely named temporary file in the cache directory.
+
+        Entries written elsewhere (e.g. assembled from a streamed run) are
+        built there and handed to :meth:`adopt`.
+        """
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        handle, name = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=self.root)
+        os.close(handle)
+        os.chmod(name, 0o644)  # mkstemp creates the file private
+        return pathlib.Path(name)
+
+    def adopt(self, key: str, path: pathlib.Path) -> pathlib.Path:
+        """Move the finished entry *path* (from :meth:`reserve`) into place as *key* and evict."""
+
+        target = self.path_for(key)
+        os.replace(path, target)
+        self.evict(keep=target)
+        return target
+
+    def entries(self) -> List[Tuple[pathlib.Path, int, float]]:
+        """Return ``(path, size, mtime)`` of every entry, least recently used first."""
+
+        found = []
+        if not self.root.is_dir():
+            return found
+        for path in self.root.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            found.append((path, stat.st_size, stat.st_mtime))
+        found.sort(key=lambda item: item[2])
+        return found
+
+    def evict(self, keep: Optional[pathlib.Path] = None) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``; return the count."""
+
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:  # pragma: no cover - still mapped by a reader on Windows
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def clear(self) -> None:
+        for path, _, _ in self.entries():
+            path.unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+
+__all__ = [
+    "RESULT_CACHE_DIR",
+    "RESULT_CACHE_ENV_VAR",
+    "RESULT_CACHE_MAX_BYTES",
+    "RESULT_CACHE_VERSION",
+    "ResultCache",
+    "result_cache_key",
+]
@@ -0,0 +1,615 @@
+"""SQLite catalog of exported simulation runs.
+
+Every export registers one row in ``runs`` (run id, scenario, preset,
+chemistry, model, parameter set, status, sample count and timings) together
+with its overrides, output files and KPIs in three child tables. Overrides
+and KPIs are normalised into ``(run_id, name, value)`` rows with a covering
+``(name, value, run_id)`` index, so a query such as "all runs with a
+negative electrode thickness above 80 um" is a single index range scan
+instead of a walk over every exported file::
+
+    with RunCatalog("data/simulations/catalog.sqlite") as catalog:
+        runs = catalog.find_runs([parse_condition("Negative electrode thickness [m] > 8e-5")])
+
+A run is always written in one ``BEGIN IMMEDIATE`` transaction (replacing a
+previous entry with the same id), and the database runs in WAL mode, so
+sweep workers in several processes can record runs concurrently while
+readers keep querying. Numeric override values are stored as ``REAL``;
+anything else is stored as text (strings as-is, other values as JSON).
+
+The module doubles as a command line tool::
+
+    python -m app.ui_qt.run_catalog data/simulations/catalog.sqlite query \\
+        --where "Negative electrode thickness [m]>8e-5" --kpi "Terminal voltage [V].min<3.1"
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import json
+import numbers
+import pathlib
+import re
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# File name of the catalog kept next to the exports (``data/simulations``).
+CATALOG_FILENAME = "catalog.sqlite"
+CATALOG_SCHEMA_VERSION = 1
+
+# Seconds a writer waits for another process holding the write lock.
+CATALOG_BUSY_TIMEOUT_S = 30.0
+
+# Bytes read per block while hashing exported files.
+CHECKSUM_BLOCK_BYTES = 1024 * 1024
+
+# Run metadata keys that map onto ``runs`` columns; everything else is kept
+# in the ``metadata`` JSON column.
+_RUN_COLUMNS = ("scenario", "preset", "chemistry", "model", "parameter_set")
+
+# SQLite limits the number of bound parameters per statement.
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    status TEXT NOT NULL,
+    scenario TEXT,
+    preset TEXT,
+    chemistry TEXT,
+    model TEXT,
+    parameter_set TEXT,
+    samples INTEGER NOT NULL DEFAULT 0,
+    solve_s REAL,
+    export_s REAL,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS runs_by_created_at ON runs (created_at);
+CREATE INDEX IF NOT EXISTS runs_by_scenario ON runs (scenario, created_at);
+CREATE INDEX IF NOT EXISTS runs_by_parameter_set ON runs (parameter_set, created_at);
+CREATE TABLE IF NOT EXISTS overrides (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value_num REAL,
+    value_text TEXT,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS overrides_by_number ON overrides (name, value_num, run_id);
+CREATE INDEX IF NOT EXISTS overrides_by_text ON overrides (name, value_text, run_id);
+CREATE TABLE IF NOT EXISTS files (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (run_id, kind)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS kpis (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS kpis_by_value ON kpis (name, value, run_id);
+"""
+
+_OPERATORS = {"=": "=", "==": "=", "!=": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+_CONDITION_PATTERN = re.compile(r"^\s*(?P<name>.+?)\s*(?P<op>>=|<=|!=|==|=|>|<)\s*(?P<value>.*?)\s*$")
+
+
+@dataclass
+class FileRecord:
+    """An exported artefact of a run."""
+
+    path: pathlib.Path
+    size: int
+    sha256: str
+
+
+@dataclass
+class RunRecord:
+    """One catalogued run with its overrides, files and KPIs."""
+
+    run_id: str
+    created_at: float = field(default_factory=time.time)
+    status: str = "completed"
+    scenario: Optional[str] = None
+    preset: Optional[str] = None
+    chemistry: Optional[str] = None
+    model: Optional[str] = None
+    parameter_set: Optional[str] = None
+    samples: int = 0
+    solve_s: Optional[float] = None
+    export_s: Optional[float] = None
+    overrides: Dict[str, Any] = field(default_factory=dict)
+    files: Dict[str, FileRecord] = field(default_factory=dict)
+    kpis: Dict[str, float] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_metadata(cls, run_id: str, metadata: Mapping[str, Any], **fields: Any) -> "RunRecord":
+        """Build a record from run metadata (``chemistry``, ``overrides``, ``solve_s``, ...)."""
+
+        extra = dict(metadata)
+        extra.pop("run_id", None)
+        values: Dict[str, Any] = {name: extra.pop(name) for name in _RUN_COLUMNS if name in extra}
+        values["overrides"] = dict(extra.pop("overrides", None) or {})
+        if "solve_s" in extra:
+            values["solve_s"] = float(extra.pop("solve_s"))
+        values["metadata"] = extra
+        values.update(fields)
+        return cls(run_id=run_id, **values)
+
+
+@dataclass(frozen=True)
+class Condition:
+    """A filter on an override (``kind="override"``) or a KPI (``kind="kpi"``)."""
+
+    name: str
+    op: str
+    value: Union[float, str]
+    kind: str = "override"
+
+
+def parse_condition(text: str, kind: str = "override") -> Condition:
+    """Parse ``"<name> <op> <value>"`` (op is one of ``= == != < <= > >=``)."""
+
+    match = _CONDITION_PATTERN.match(text)
+    if match is None or not match["value"]:
+        raise ValueError(f"Cannot parse condition '{text}' (expected '<name> <op> <value>')")
+    raw = match["value"]
+    value: Union[float, str]
+    try:
+        value = float(raw)
+    except ValueError:
+        value = raw
+    return Condition(name=match["name"], op=match["op"], value=value, kind=kind)
+
+
+def file_checksum(path: Union[str, pathlib.Path]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(CHECKSUM_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe_file(path: Union[str, pathlib.Path]) -> FileRecord:
+    """Return the :class:`FileRecord` (size and SHA-256) of an existing file."""
+
+    path = pathlib.Path(path)
+    return FileRecord(path=path, size=path.stat().st_size, sha256=file_checksum(path))
+
+
+def result_kpis(results: Mapping[str, Any], time_channel: Optional[str] = None) -> Dict[str, float]:
+    """Return ``<channel>.min`` / ``.max`` / ``.final`` for every channel of *results*.
+
+    The time channel (the first one unless *time_channel* is given) only
+    contributes ``.final``, the simulated duration.
+    """
+
+    names = list(results)
+    if not names:
+        return {}
+    time_channel = time_channel or getattr(results, "time_channel", names[0])
+    kpis: Dict[str, float] = {}
+    for name in names:
+        values = np.asarray(results[name], dtype=np.float64)
+        if values.size == 0:
+            continue
+        kpis[f"{name}.final"] = float(values[-1])
+        if name != time_channel and not np.all(np.isnan(values)):
+            kpis[f"{name}.min"] = float(np.nanmin(values))
+            kpis[f"{name}.max"] = float(np.nanmax(values))
+    return kpis
+
+
+def merge_kpis(total: Dict[str, float], later: Mapping[str, float]) -> Dict[str, float]:
+    """Fold the KPIs of a later block of samples into *total* (in place)."""
+
+    for name, value in later.items():
+        previous = total.get(name)
+        if previous is None or name.endswith(".final"):
+            total[name] = value
+        elif name.endswith(".min"):
+            total[name] = min(previous, value)
+        elif name.endswith(".max"):
+            total[name] = max(previous, value)
+        else:
+            total[name] = value
+    return total
+
+
+def _override_values(value: Any) -> Tuple[Optional[float], Optional[str]]:
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return float(value), None
+    if isinstance(value, str):
+        return None, value
+    return None, json.dumps(value, sort_keys=True, default=str)
+
+
+class RunCatalog:
+    """Connection to a run catalog database; use as a context manager."""
+
+    def __init__(self, path: Union[str, pathlib.Path], *, timeout: float = CATALOG_BUSY_TIMEOUT_S) -> None:
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly by _transaction().
+        self._connection = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._ensure_schema()
+
+    def __enter__(self) -> "RunCatalog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return int(self._connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
+
+    def _ensure_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == CATALOG_SCHEMA_VERSION:
+            return
+        if version not in (0, CATALOG_SCHEMA_VERSION):
+            raise RuntimeError(f"Unsupported run catalog version {version} in {self.path}")
+        with self._transaction() as cursor:
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    cursor.execute(statement)
+            cursor.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        else:
+            cursor.execute("COMMIT")
+        finally:
+            cursor.close()
+
+    # -- writing -------------------------------------------------------------
+
+    def _stored_path(self, path: pathlib.Path) -> str:
+        path = pathlib.Path(path).resolve()
+        try:
+            return path.relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def record_run(self, run: RunRecord) -> None:
+        """Insert *run*, replacing any previous entry with the same id, atomically."""
+
+        self.record_runs([run])
+
+    def record_runs(self, runs: Iterable[RunRecord]) -> int:
+        """Insert many runs in a single transaction and return how many were written."""
+
+        count = 0
+        with self._transaction() as cursor:
+            for run in runs:
+                self._write_run(cursor, run)
+                count += 1
+        return count
+
+    def _write_run(self, cursor: sqlite3.Cursor, run: RunRecord) -> None:
+        cursor.execute("DELETE FROM runs WHERE run_id = ?", (run.run_id,))
+        cursor.execute(
+            "INSERT INTO runs (run_id, created_at, status, scenario, preset, chemistry, model, parameter_set,"
+            " samples, solve_s, export_s, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run.run_id,
+                float(run.created_at),
+                run.status,
+                run.scenario,
+                run.preset,
+                run.chemistry,
+                run.model,
+                run.parameter_set,
+                int(run.samples),
+                run.solve_s,
+                run.export_s,
+                json.dumps(run.metadata, sort_keys=True, default=str),
+            ),
+        )
+        cursor.executemany(
+            "INSERT INTO overrides (run_id, name, value_num, value_text) VALUES (?, ?, ?, ?)",
+            [(run.run_id, str(name), *_override_values(value)) for name, value in run.overrides.items()],
+        )
+        cursor.executemany(
+            "INSERT INTO files (run_id, kind, path, size, sha256) VALUES (?, ?, ?, ?, ?)",
+            [
+                (run.run_id, kind, self._stored_path(record.path), int(record.size), record.sha256)
+                for kind, record in run.files.items()
+            ],
+        )
+        cursor.executemany(
+            "INSERT INTO kpis (run_id, name, value) VALUES (?, ?, ?)",
+            [(run.run_id, name, None if value is None else float(value)) for name, value in run.kpis.items()],
+        )
+
+    def delete_run(self, run_id: str) -> bool:
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            return cursor.rowcount > 0
+
+    # -- querying ------------------------------------------------------------
+
+    def _where(
+        self,
+        conditions: Sequence[Condition],
+        filters: Mapping[str, Optional[str]],
+        since: Optional[float],
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        parameters: List[Any] = []
+        for column, value in filters.items():
+            if value is not None:
+                clauses.append(f"runs.{column} = ?")
+                parameters.append(value)
+        if since is not None:
+            clauses.append("runs.created_at >= ?")
+            parameters.append(float(since))
+        for condition in conditions:
+            op = _OPERATORS.get(condition.op)
+            if op is None:
+                raise ValueError(f"Unsupported operator '{condition.op}'")
+            numeric = isinstance(condition.value, (int, float))
+            if condition.kind == "kpi":
+                if not numeric:
+                    raise ValueError(f"KPI condition on '{condition.name}' needs a numeric value")
+                subquery = f"SELECT run_id FROM kpis WHERE name = ? AND value {op} ?"
+            elif condition.kind == "override":
+                column = "value_num" if numeric else "value_text"
+                subquery = f"SELECT run_id FROM overrides WHERE name = ? AND {column} {op} ?"
+            else:
+                raise ValueError(f"Unknown condition kind '{condition.kind}'")
+            clauses.append(f"runs.run_id IN ({subquery})")
+            parameters.extend([condition.name, condition.value])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", parameters
+
+    def find_run_ids(
+        self,
+        conditions: Sequence[Condition] = (),
+        *,
+        scenario: Optional[str] = None,
+        preset: Optional[str] = None,
+        parameter_set: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Return the ids of the matching runs, oldest first.
+
+        All *conditions* and filters must hold. Numeric override conditions
+        compare against numeric values only, text conditions against text.
+        """
+
+        filters = {"scenario": scenario, "preset": preset, "parameter_set": parameter_set, "status": status}
+        where, parameters = self._where(conditions, filters, since)
+        query = f"SELECT run_id FROM runs{where} ORDER BY created_at, run_id"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(int(limit))
+        return [row[0] for row in self._connection.execute(query, parameters)]
+
+    def find_runs(self, conditions: Sequence[Condition] = (), **filters: Any) -> List[RunRecord]:
+        """Like :meth:`find_run_ids` but return full :class:`RunRecord` objects."""
+
+        return self.get_runs(self.find_run_ids(conditions, **filters))
+
+    def get_run(self, run_id: str) -> Optional[RunRecord]:
+        runs = self.get_runs([run_id])
+        return runs[0] if runs else None
+
+    def get_runs(self, run_ids: Sequence[str]) -> List[RunRecord]:
+        """Load the given runs with their overrides, files and KPIs, in the given order."""
+
+        records: Dict[str, RunRecord] = {}
+        base = self.path.parent
+        for start in range(0, len(run_ids), _BATCH_SIZE):
+            batch = list(run_ids[start : start + _BATCH_SIZE])
+            marks = ", ".join("?" * len(batch))
+            for row in self._connection.execute(
+                "SELECT run_id, created_at, status, scenario, preset, chemistry, model, parameter_set, samples,"
+                f" solve_s, export_s, metadata FROM runs WHERE run_id IN ({marks})",
+                batch,
+            ):
+                records[row[0]] = RunRecord(
+                    run_id=row[0],
+                    created_at=row[1],
+                    status=row[2],
+                    scenario=row[3],
+                    preset=row[4],
+                    chemistry=row[5],
+                    model=row[6],
+                    parameter_set=row[7],
+                    samples=row[8],
+                    solve_s=row[9],
+                    export_s=row[10],
+                    metadata=json.loads(row[11]),
+                )
+            for run_id, name, number, text in self._connection.execute(
+                f"SELECT run_id, name, value_num, value_text FROM overrides WHERE run_id IN ({marks})", batch
+            ):
+                records[run_id].overrides[name] = number if number is not None else text
+            for run_id, kind, path, size, sha256 in self._connection.execute(
+                f"SELECT run_id, kind, path, size, sha256 FROM files WHERE run_id IN ({marks})", batch
+            ):
+                records[run_id].files[kind] = FileRecord(path=base / path, size=size, sha256=sha256)
+            for run_id, name, value in self._connection.execute(
+                f"SELECT run_id, name, value FROM kpis WHERE run_id IN ({marks})", batch
+            ):
+                records[run_id].kpis[name] = value
+        return [records[run_id] for run_id in run_ids if run_id in records]
+
+    def verify(self, run_ids: Optional[Sequence[str]] = None) -> List[Tuple[str, str, str]]:
+        """Re-hash catalogued files; return ``(run_id, kind, problem)`` for every mismatch."""
+
+        if run_ids is None:
+            run_ids = [row[0] for row in self._connection.execute("SELECT run_id FROM runs ORDER BY run_id")]
+        problems: List[Tuple[str, str, str]] = []
+        for run in self.get_runs(run_ids):
+            for kind, record in sorted(run.files.items()):
+                if not record.path.exists():
+                    problems.append((run.run_id, kind, "missing"))
+                elif record.path.stat().st_size != record.size:
+                    problems.append((run.run_id, kind, "size changed"))
+                elif file_checksum(record.path) != record.sha256:
+                    problems.append((run.run_id, kind, "checksum mismatch"))
+        return problems
+
+
+def record_export(
+    catalog: Union[str, pathlib.Path, RunCatalog],
+    run_id: str,
+    metadata: Mapping[str, Any],
+    files: Mapping[str, Optional[Union[str, pathlib.Path]]],
+    **fields: Any,
+) -> RunRecord:
+    """Hash *files* and record them as run *run_id* in *catalog* (a path or open catalog).
+
+    *metadata* is the run metadata written with the results; *fields*
+    override :class:`RunRecord` attributes (``samples``, ``kpis``,
+    ``export_s``, ``status``, ...). ``None`` entries in *files* are skipped.
+    """
+
+    described = {kind: describe_file(path) for kind, path in files.items() if path is not None}
+    run = RunRecord.from_metadata(run_id, metadata, files=described, **fields)
+    if isinstance(catalog, RunCatalog):
+        catalog.record_run(run)
+    else:
+        with RunCatalog(catalog) as opened:
+            opened.record_run(run)
+    return run
+
+
+# -- command line --------------------------------------------------------------
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.datetime.fromtimestamp(timestamp).isoformat(sep=" ", timespec="seconds")
+
+
+def _run_to_json(run: RunRecord) -> Dict[str, Any]:
+    payload = asdict(run)
+    payload["files"] = {
+        kind: {"path": str(record.path), "size": record.size, "sha256": record.sha256}
+        for kind, record in run.files.items()
+    }
+    return payload
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query the simulation run catalog.")
+    parser.add_argument("catalog", type=pathlib.Path, help=f"Catalog database (usually .../{CATALOG_FILENAME})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    query = commands.add_parser("query", help="List runs matching all given filters")
+    query.add_argument("--where", action="append", default=[], help="Override condition, e.g. 'Name [m]>8e-5'")
+    query.add_argument("--kpi", action="append", default=[], help="KPI condition, e.g. 'Voltage [V].min<3'")
+    query.add_argument("--scenario")
+    query.add_argument("--preset")
+    query.add_argument("--parameter-set")
+    query.add_argument("--status")
+    query.add_argument("--limit", type=int)
+    output = query.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Print full records as JSON lines")
+    output.add_argument("--paths", metavar="KIND", help="Print the path of the given file kind (dat, mdf, ...)")
+    output.add_argument("--count", action="store_true", help="Only print the number of matching runs")
+
+    show = commands.add_parser("show", help="Print one run as JSON")
+    show.add_argument("run_id")
+
+    verify = commands.add_parser("verify", help="Check sizes and checksums of catalogued files")
+    verify.add_argument("run_ids", nargs="*")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    with RunCatalog(args.catalog) as catalog:
+        if args.command == "show":
+            run = catalog.get_run(args.run_id)
+            if run is None:
+                print(f"Unknown run '{args.run_id}'", file=sys.stderr)
+                return 1
+            print(json.dumps(_run_to_json(run), indent=2, default=str))
+            return 0
+
+        if args.command == "verify":
+            problems = catalog.verify(args.run_ids or None)
+            for run_id, kind, problem in problems:
+                print(f"{run_id}\t{kind}\t{problem}")
+            return 1 if problems else 0
+
+        conditions = [parse_condition(text) for text in args.where]
+        conditions += [parse_condition(text, kind="kpi") for text in args.kpi]
+        started = time.perf_counter()
+        run_ids = catalog.find_run_ids(
+            conditions,
+            scenario=args.scenario,
+            preset=args.preset,
+            parameter_set=args.parameter_set,
+            status=args.status,
+            limit=args.limit,
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1e3
+        if args.count:
+            print(len(run_ids))
+        elif args.json:
+            for run in catalog.get_runs(run_ids):
+                print(json.dumps(_run_to_json(run), default=str))
+        elif args.paths:
+            for run in catalog.get_runs(run_ids):
+                record = run.files.get(args.paths)
+                if record is not None:
+                    print(record.path)
+        else:
+            for run in catalog.get_runs(run_ids):
+                print(
+                    f"{run.run_id}\t{_format_time(run.created_at)}\t{run.status}\t{run.scenario or '-'}\t"
+                    f"{run.parameter_set or '-'}\t{run.samples}"
+                )
+            print(f"{len(run_ids)} run(s) in {elapsed_ms:.1f} ms", file=sys.stderr)
+    return 0
+
+
+__all__ = [
+    "CATALOG_FILENAME",
+    "CATALOG_SCHEMA_VERSION",
+    "Condition",
+    "FileRecord",
+    "RunCatalog",
+    "RunRecord",
+    "describe_file",
+    "file_checksum",
+    "merge_kpis",
+    "parse_condition",
+    "record_export",
+    "result_kpis",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
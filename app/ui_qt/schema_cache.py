@@ -0,0 +1,114 @@
+"""On-disk cache for parameter schemas generated from PyBaMM.
+
+Building the ``parameter_schema: auto`` schema requires importing PyBaMM and
+walking every entry of a parameter set, which dominates the start-up time of
+the parameter editor. The finished schema entries (in the same JSON layout as
+the static schema files) are stored under ``<project>/.cache/pybamm_schema``
+keyed by the PyBaMM version, chemistry, model and parameter set. The version
+is read from the installed distribution metadata so a cache lookup never
+imports PyBaMM.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import re
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from typing import Any, Dict, List, Optional
+
+SCHEMA_CACHE_VERSION = 1
+SCHEMA_CACHE_DIR = pathlib.Path(".cache") / "pybamm_schema"
+
+
+def pybamm_version() -> str:
+    """Return the installed PyBaMM version, or ``""`` when it is not installed."""
+
+    try:
+        return metadata.version("pybamm")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+@dataclass(frozen=True)
+class SchemaCacheKey:
+    pybamm_version: str
+    chemistry: str
+    model: str
+    parameter_set: str
+
+    @classmethod
+    def current(cls, *, chemistry: str, model: str, parameter_set: str) -> "SchemaCacheKey":
+        return cls(pybamm_version(), chemistry, model, parameter_set)
+
+    @property
+    def filename(self) -> str:
+        # One file per schema source; the version lives inside so an upgrade
+        # replaces the entry instead of accumulating files.
+        stem = "_".join(re.sub(r"[^0-9A-Za-z.-]+", "-", part) for part in (self.chemistry, self.model, self.parameter_set))
+        return f"{stem}.json"
+
+
+@dataclass
+class CachedSchema:
+    key: SchemaCacheKey
+    entries: List[Dict[str, Any]]
+    stale: bool = False
+
+
+class SchemaCache:
+    """Stores generated schema entries as JSON files below *root*."""
+
+    def __init__(self, root: pathlib.Path) -> None:
+        self.root = root
+
+    @classmethod
+    def for_project(cls, project_root: pathlib.Path) -> "SchemaCache":
+        return cls(project_root / SCHEMA_CACHE_DIR)
+
+    def path_for(self, key: SchemaCacheKey) -> pathlib.Path:
+        return self.root / key.filename
+
+    def load(self, key: SchemaCacheKey) -> Optional[CachedSchema]:
+        """Return the cached schema for *key*'s source.
+
+        The result is marked ``stale`` when it was produced for a different
+        PyBaMM version; ``None`` is returned when nothing usable is cached.
+        """
+
+        path = self.path_for(key)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("format") != SCHEMA_CACHE_VERSION:
+            return None
+        try:
+            cached_key = SchemaCacheKey(**payload["key"])
+            entries = list(payload["entries"])
+        except (KeyError, TypeError):
+            return None
+        return CachedSchema(key=cached_key, entries=entries, stale=cached_key != key)
+
+    def store(self, key: SchemaCacheKey, entries: List[Dict[str, Any]]) -> pathlib.Path:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"format": SCHEMA_CACHE_VERSION, "key": asdict(key), "entries": entries}
+        temp_path = path.with_name(f".{path.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"), default=str)
+        os.replace(temp_path, path)
+        return path
+
+
+__all__ = [
+    "CachedSchema",
+    "SCHEMA_CACHE_DIR",
+    "SCHEMA_CACHE_VERSION",
+    "SchemaCache",
+    "SchemaCacheKey",
+    "pybamm_version",
+]
@@ -0,0 +1,236 @@
+"""Background execution of simulation jobs for the Qt front-ends.
+
+Simulation and export work is submitted to a :class:`SimulationJobQueue`,
+which runs it on a :class:`QtCore.QThreadPool` so the GUI thread keeps
+processing events. Jobs report progress and observe cooperative cancellation
+through the :class:`JobContext` they receive; all notifications are delivered
+back on the thread that owns the queue (normally the GUI thread).
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from PySide6 import QtCore
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation has been requested."""
+
+
+class CancellationToken:
+    """Thread-safe flag checked by jobs at convenient points."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+@dataclass
+class JobContext:
+    """Handle passed to a job function while it runs on a worker thread."""
+
+    job_id: str
+    name: str
+    token: CancellationToken
+    _report: Callable[[str, float], None]
+
+    def report(self, stage: str, fraction: float) -> None:
+        """Publish progress and honour a pending cancellation request."""
+
+        self.token.raise_if_cancelled()
+        self._report(stage, float(fraction))
+
+    def check_cancelled(self) -> None:
+        self.token.raise_if_cancelled()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+
+@dataclass
+class CompletedJob:
+    job_id: str
+    name: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    duration_s: float = 0.0
+
+
+JobFunction = Callable[[JobContext], Any]
+
+
+class _JobSignals(QtCore.QObject):
+    progress = QtCore.Signal(str, str, float)
+    done = QtCore.Signal(str, str, object, str, float)
+
+
+class _JobRunnable(QtCore.QRunnable):
+    def __init__(self, context: JobContext, function: JobFunction, signals: _JobSignals) -> None:
+        super().__init__()
+        self._context = context
+        self._function = function
+        self._signals = signals
+        self.setAutoDelete(True)
+
+    def run(self) -> None:  # type: ignore[override]
+        context = self._context
+        started = time.perf_counter()
+        result: Any = None
+        error = ""
+        try:
+            context.check_cancelled()
+            result = self._function(context)
+            status = "finished"
+        except JobCancelled:
+            status = "cancelled"
+        except Exception as exc:  # noqa: BLE001 - surfaced through jobFailed
+            status = "failed"
+            error = str(exc) or type(exc).__name__
+        self._signals.done.emit(context.job_id, status, result, error, time.perf_counter() - started)
+
+
+class SimulationJobQueue(QtCore.QObject):
+    """Runs simulation jobs off the GUI thread and keeps their results.
+
+    ``progressUpdated`` mirrors the ``(stage, fraction)`` signal exposed by the
+    bridges so it can be forwarded directly. Finished, failed and cancelled
+    jobs are appended to a bounded completed-job queue that callers can
+    inspect or drain with :meth:`take_completed`.
+    """
+
+    progressUpdated = QtCore.Signal(str, float)
+    jobProgress = QtCore.Signal(str, str, float)
+    jobFinished = QtCore.Signal(str, object)
+    jobFailed = QtCore.Signal(str, str)
+    jobCancelled = QtCore.Signal(str)
+    activeCountChanged = QtCore.Signal()
+
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        *,
+        max_workers: Optional[int] = None,
+        completed_limit: int = 64,
+    ) -> None:
+        super().__init__(parent)
+        self._pool = QtCore.QThreadPool(self)
+        if max_workers is not None:
+            self._pool.setMaxThreadCount(max(1, int(max_workers)))
+        self._ids = itertools.count(1)
+        self._active: Dict[str, JobContext] = {}
+        self._signals: Dict[str, _JobSignals] = {}
+        self._completed: Deque[CompletedJob] = deque(maxlen=max(1, int(completed_limit)))
+
+    def submit(self, function: JobFunction, *, name: str = "") -> str:
+        """Queue ``function(context)`` for execution and return its job id."""
+
+        job_id = f"job-{next(self._ids)}"
+        signals = _JobSignals()
+        signals.progress.connect(self._on_progress)
+        signals.done.connect(self._on_done)
+        context = JobContext(
+            job_id=job_id,
+            name=name or job_id,
+            token=CancellationToken(),
+            _report=lambda stage, fraction: signals.progress.emit(job_id, stage, fraction),
+        )
+        self._active[job_id] = context
+        self._signals[job_id] = signals
+        self.activeCountChanged.emit()
+        self._pool.start(_JobRunnable(context, function, signals))
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        context = self._active.get(job_id)
+        if context is None:
+            return False
+        context.token.cancel()
+        return True
+
+    def cancel_all(self) -> None:
+        for context in list(self._active.values()):
+            context.token.cancel()
+
+    def is_active(self, job_id: str) -> bool:
+        return job_id in self._active
+
+    def active_jobs(self) -> List[str]:
+        return list(self._active)
+
+    def completed_jobs(self) -> List[CompletedJob]:
+        return list(self._completed)
+
+    def take_completed(self) -> List[CompletedJob]:
+        """Return and clear the completed-job queue."""
+
+        jobs = list(self._completed)
+        self._completed.clear()
+        return jobs
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """Block until all jobs have run; results are delivered on the next event loop pass."""
+
+        return self._pool.waitForDone(timeout_ms)
+
+    @QtCore.Property(int, notify=activeCountChanged)
+    def activeCount(self) -> int:  # noqa: N802 - Qt property naming
+        return len(self._active)
+
+    @QtCore.Slot()
+    def cancelAll(self) -> None:  # noqa: N802 - Qt slot naming
+        self.cancel_all()
+
+    def _on_progress(self, job_id: str, stage: str, fraction: float) -> None:
+        if job_id not in self._active:
+            return
+        self.jobProgress.emit(job_id, stage, fraction)
+        self.progressUpdated.emit(stage, fraction)
+
+    def _on_done(self, job_id: str, status: str, result: Any, error: str, duration_s: float) -> None:
+        context = self._active.pop(job_id, None)
+        self._signals.pop(job_id, None)
+        name = context.name if context is not None else job_id
+        self._completed.append(
+            CompletedJob(
+                job_id=job_id,
+                name=name,
+                status=status,
+                result=result if status == "finished" else None,
+                error=error or None,
+                duration_s=duration_s,
+            )
+        )
+        self.activeCountChanged.emit()
+        if status == "finished":
+            self.jobFinished.emit(job_id, result)
+        elif status == "cancelled":
+            self.jobCancelled.emit(job_id)
+        else:
+            self.jobFailed.emit(job_id, error)
+
+
+__all__ = [
+    "CancellationToken",
+    "CompletedJob",
+    "JobCancelled",
+    "JobContext",
+    "SimulationJobQueue",
+]
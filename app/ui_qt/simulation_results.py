@@ -0,0 +1,157 @@
+"""Columnar container for simulation result channels.
+
+Results are stored as one contiguous ``float64`` NumPy array per channel
+together with per-channel units and free-form run metadata. The container is
+a read-only :class:`~collections.abc.Mapping` of channel name to array so it
+can be handed to any code that previously consumed ``Dict[str, List[float]]``
+without converting the samples into Python objects.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+TIME_CHANNEL = "Time [s]"
+
+_UNIT_PATTERN = re.compile(r"\[(.*?)\]$")
+
+
+def unit_from_name(name: str) -> str:
+    """Return the unit embedded in a PyBaMM-style name (``"Voltage [V]"``)."""
+
+    match = _UNIT_PATTERN.search(name)
+    return match.group(1) if match else ""
+
+
+def _as_column(name: str, values: Any) -> np.ndarray:
+    array = np.ascontiguousarray(values, dtype=np.float64)
+    if array.ndim != 1:
+        if array.size == max(array.shape, default=0):
+            array = array.reshape(-1)
+        else:
+            raise ValueError(f"Result channel '{name}' must be one-dimensional")
+    # Expose a read-only view so callers cannot mutate shared buffers through
+    # the container (and the caller's own array stays writeable).
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class SimulationResults(Mapping):
+    """Immutable mapping of channel name to contiguous ``float64`` samples.
+
+    Parameters
+    ----------
+    channels:
+        Mapping of channel name to array-like samples. Arrays that are already
+        contiguous ``float64`` are wrapped without copying.
+    units:
+        Optional per-channel units. Missing entries are derived from a
+        trailing ``[unit]`` in the channel name.
+    metadata:
+        Free-form run metadata (chemistry, parameter set, overrides, ...).
+    time_channel:
+        Name of the channel holding the time base.
+    """
+
+    def __init__(
+        self,
+        channels: Mapping[str, Any],
+        *,
+        units: Optional[Mapping[str, str]] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+        time_channel: str = TIME_CHANNEL,
+    ) -> None:
+        if time_channel not in channels:
+            raise ValueError(f"Simulation results missing '{time_channel}' channel")
+        self._time_channel = time_channel
+        self._columns: Dict[str, np.ndarray] = {time_channel: _as_column(time_channel, channels[time_channel])}
+        expected_length = self._columns[time_channel].shape[0]
+        for name, values in channels.items():
+            if name == time_channel:
+                continue
+            column = _as_column(name, values)
+            if column.shape[0] != expected_length:
+                raise ValueError(f"Result channel '{name}' length mismatch")
+            self._columns[name] = column
+        provided_units = dict(units or {})
+        self._units: Dict[str, str] = {
+            name: provided_units.get(name, unit_from_name(name)) for name in self._columns
+        }
+        self.metadata: Dict[str, Any] = dict(metadata or {})
+
+    @classmethod
+    def from_mapping(cls, results: Mapping[str, Any], **kwargs: Any) -> "SimulationResults":
+        """Return *results* unchanged if already columnar, otherwise wrap it."""
+
+        if isinstance(results, cls) and not kwargs:
+            return results
+        if isinstance(results, cls):
+            kwargs.setdefault("units", results.units)
+            kwargs.setdefault("metadata", results.metadata)
+        return cls(results, **kwargs)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(channels={len(self._columns)}, "
+            f"samples={self.sample_count}, nbytes={self.nbytes})"
+        )
+
+    @property
+    def time_channel(self) -> str:
+        return self._time_channel
+
+    @property
+    def time(self) -> np.ndarray:
+        return self._columns[self._time_channel]
+
+    @property
+    def channel_names(self) -> List[str]:
+        """Names of all data channels, excluding the time base."""
+
+        return [name for name in self._columns if name != self._time_channel]
+
+    @property
+    def sample_count(self) -> int:
+        return int(self.time.shape[0])
+
+    @property
+    def units(self) -> Dict[str, str]:
+        return dict(self._units)
+
+    def unit(self, name: str) -> str:
+        return self._units.get(name, "")
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def as_matrix(self, channels: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Return a ``(samples, channels)`` array; time first when *channels* is omitted."""
+
+        names = list(self._columns) if channels is None else list(channels)
+        if not names:
+            return np.empty((self.sample_count, 0), dtype=np.float64)
+        return np.column_stack([self._columns[name] for name in names])
+
+    def to_lists(self) -> Dict[str, List[float]]:
+        """Materialise the channels as Python lists (for JSON or legacy callers)."""
+
+        return {name: column.tolist() for name, column in self._columns.items()}
+
+
+__all__ = ["SimulationResults", "TIME_CHANNEL", "unit_from_name"]
@@ -0,0 +1,404 @@
+"""Staged start-up and launch-time instrumentation for the Qt entry points.
+
+The entry points show their window first and import heavy modules (the
+parameter bridge, exporters, PyBaMM helpers) afterwards through a
+:class:`DeferredLoader`, one loader per event-loop pass. Passing
+``--startup-profile [PATH]`` records how long every module import took (via a
+``sys.meta_path`` hook), the named start-up phases and the time to the first
+rendered frame, and writes them as JSON when the application quits; adding
+``--startup-profile-exit`` quits as soon as start-up has finished, which is
+what CI uses to track launch time.
+
+This module only depends on the standard library at import time so it can be
+imported, and the import hook installed, before PySide6 itself is loaded.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import json
+import os
+import pathlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+PROFILE_FLAG = "--startup-profile"
+EXIT_FLAG = "--startup-profile-exit"
+DEFAULT_PROFILE_PATH = pathlib.Path("startup_profile.json")
+PROFILE_FORMAT_VERSION = 1
+# Start-up still finishes (and the profile is written) if no frame is ever
+# presented, e.g. on a headless platform plugin.
+FIRST_FRAME_TIMEOUT_MS = 10_000
+
+
+@dataclass
+class StartupOptions:
+    profile_path: Optional[pathlib.Path] = None
+    exit_after_startup: bool = False
+
+
+def parse_startup_arguments(argv: Sequence[str]) -> Tuple[StartupOptions, List[str]]:
+    """Split the start-up flags from *argv*; the rest is passed on to Qt."""
+
+    options = StartupOptions()
+    remaining: List[str] = []
+    arguments = list(argv)
+    index = 0
+    while index < len(arguments):
+        argument = arguments[index]
+        if argument == PROFILE_FLAG:
+            following = arguments[index + 1] if index + 1 < len(arguments) else ""
+            if following and not following.startswith("-"):
+                options.profile_path = pathlib.Path(following)
+                index += 1
+            else:
+                options.profile_path = DEFAULT_PROFILE_PATH
+        elif argument.startswith(PROFILE_FLAG + "="):
+            options.profile_path = pathlib.Path(argument.split("=", 1)[1] or DEFAULT_PROFILE_PATH)
+        elif argument == EXIT_FLAG:
+            options.exit_after_startup = True
+        else:
+            remaining.append(argument)
+        index += 1
+    if options.exit_after_startup and options.profile_path is None:
+        options.profile_path = DEFAULT_PROFILE_PATH
+    return options, remaining
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    cumulative_s: float
+    self_s: float
+    parent: Optional[str]
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Proxy around a real loader that times ``exec_module``."""
+
+    def __init__(self, loader: Any, name: str, profiler: "ImportProfiler") -> None:
+        self._loader = loader
+        self._name = name
+        self._profiler = profiler
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._loader, attribute)
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self._profiler._enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave(self._name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """``sys.meta_path`` hook recording the execution time of each import.
+
+    ``cumulative_s`` includes nested imports, ``self_s`` excludes them (the
+    same split as ``python -X importtime``). Only imports on the thread that
+    installed the profiler are timed.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[ImportRecord] = []
+        self._stack: List[List[Any]] = []
+        self._resolving: set = set()
+        self._thread = threading.get_ident()
+        self._installed = False
+
+    def install(self) -> "ImportProfiler":
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+        return self
+
+    def uninstall(self) -> None:
+        if self._installed:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:  # pragma: no cover - removed by someone else
+                pass
+            self._installed = False
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if threading.get_ident() != self._thread or fullname in self._resolving:
+            return None
+        self._resolving.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._resolving.discard(fullname)
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname, self)
+        return spec
+
+    def _enter(self, name: str) -> None:
+        # [name, start, time spent in nested imports]
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _leave(self, name: str) -> None:
+        entry = self._stack.pop()
+        cumulative = time.perf_counter() - entry[1]
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            parent[2] += cumulative
+        self.records.append(
+            ImportRecord(
+                module=name,
+                cumulative_s=cumulative,
+                self_s=max(cumulative - entry[2], 0.0),
+                parent=parent[0] if parent is not None else None,
+            )
+        )
+
+    def slowest(self, count: int = 20) -> List[ImportRecord]:
+        return sorted(self.records, key=lambda record: record.cumulative_s, reverse=True)[:count]
+
+
+class StartupProfile:
+    """Collects start-up phases, import timings and the time to first frame.
+
+    A disabled profile (no ``--startup-profile`` flag) keeps its API but
+    records nothing and writes nothing, so the entry points can use it
+    unconditionally.
+    """
+
+    def __init__(self, options: Optional[StartupOptions] = None, *, qt_argv: Optional[List[str]] = None) -> None:
+        self.options = options or StartupOptions()
+        self.qt_argv: List[str] = list(qt_argv if qt_argv is not None else sys.argv)
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.marks: Dict[str, float] = {}
+        self.first_frame_s: Optional[float] = None
+        self.imports: Optional[ImportProfiler] = ImportProfiler().install() if self.enabled else None
+        self._written = False
+
+    @classmethod
+    def from_argv(cls, argv: Optional[Sequence[str]] = None) -> "StartupProfile":
+        options, remaining = parse_startup_arguments(sys.argv if argv is None else argv)
+        return cls(options, qt_argv=remaining)
+
+    @property
+    def enabled(self) -> bool:
+        return self.options.profile_path is not None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def mark(self, name: str) -> None:
+        if self.enabled:
+            self.marks[name] = self.elapsed()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def record_first_frame(self) -> None:
+        if self.first_frame_s is None:
+            self.first_frame_s = self.elapsed()
+            self.mark("first_frame")
+
+    def to_dict(self) -> Dict[str, Any]:
+        records = self.imports.records if self.imports is not None else []
+        return {
+            "format": PROFILE_FORMAT_VERSION,
+            "argv0": pathlib.Path(sys.argv[0]).name if sys.argv else "",
+            "python": sys.version.split()[0],
+            "pid": os.getpid(),
+            "time_to_first_frame_ms": None if self.first_frame_s is None else self.first_frame_s * 1e3,
+            "total_ms": self.elapsed() * 1e3,
+            "marks_ms": {name: value * 1e3 for name, value in self.marks.items()},
+            "phases_ms": {name: value * 1e3 for name, value in self.phases.items()},
+            "import_count": len(records),
+            "import_total_ms": sum(record.self_s for record in records) * 1e3,
+            "imports": [
+                {
+                    "module": record.module,
+                    "cumulative_ms": record.cumulative_s * 1e3,
+                    "self_ms": record.self_s * 1e3,
+                    "parent": record.parent,
+                }
+                for record in records
+            ],
+        }
+
+    def write(self) -> Optional[pathlib.Path]:
+        """Write the profile once (further calls are no-ops) and return its path."""
+
+        path = self.options.profile_path
+        if path is None or self._written:
+            return None
+        self._written = True
+        if self.imports is not None:
+            self.imports.uninstall()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, indent=2)
+        return path
+
+
+class DeferredLoader:
+    """Runs start-up work after the window is up, one step per event-loop pass.
+
+    Each loader is a ``(name, callable)`` pair; its return value is passed to
+    the optional ``on_loaded`` callback and its duration is recorded as a
+    ``deferred:<name>`` phase. Failures are reported through ``on_failed``
+    and do not stop the remaining loaders.
+    """
+
+    def __init__(
+        self,
+        profile: Optional[StartupProfile] = None,
+        *,
+        on_loaded: Optional[Callable[[str, Any], None]] = None,
+        on_failed: Optional[Callable[[str, BaseException], None]] = None,
+    ) -> None:
+        self._profile = profile or StartupProfile(StartupOptions())
+        self._pending: List[Tuple[str, Callable[[], Any]]] = []
+        self._finished_callbacks: List[Callable[[], None]] = []
+        self._on_loaded = on_loaded
+        self._on_failed = on_failed
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self._started = False
+        self.finished = False
+
+    def add(self, name: str, function: Callable[[], Any]) -> None:
+        self._pending.append((name, function))
+        if self.finished:
+            self.finished = False
+            self._schedule()
+
+    def when_finished(self, callback: Callable[[], None]) -> None:
+        if self.finished:
+            callback()
+        else:
+            self._finished_callbacks.append(callback)
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        self._profile.mark("deferred_start")
+        self._schedule()
+
+    def run_all(self) -> None:
+        """Run every pending loader synchronously (used without an event loop)."""
+
+        self._started = True
+        while self._pending:
+            self._run_next(reschedule=False)
+        self._finish()
+
+    def _schedule(self) -> None:
+        from PySide6 import QtCore
+
+        QtCore.QTimer.singleShot(0, self._run_next)
+
+    def _run_next(self, reschedule: bool = True) -> None:
+        if not self._pending:
+            self._finish()
+            return
+        name, function = self._pending.pop(0)
+        try:
+            with self._profile.phase(f"deferred:{name}"):
+                result = function()
+        except Exception as exc:  # noqa: BLE001 - reported through on_failed
+            self.errors[name] = exc
+            if self._on_failed is not None:
+                self._on_failed(name, exc)
+        else:
+            self.results[name] = result
+            if self._on_loaded is not None:
+                self._on_loaded(name, result)
+        if reschedule:
+            self._schedule()
+
+    def _finish(self) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        self._profile.mark("deferred_done")
+        callbacks, self._finished_callbacks = self._finished_callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def run_staged(
+    app: Any,
+    engine: Any,
+    profile: StartupProfile,
+    loader: DeferredLoader,
+    *,
+    first_frame_timeout_ms: int = FIRST_FRAME_TIMEOUT_MS,
+) -> None:
+    """Start *loader* once the first frame of *engine*'s window is presented.
+
+    Writes the profile when the application quits (or, with
+    ``--startup-profile-exit``, as soon as the deferred loaders finished).
+    """
+
+    from PySide6 import QtCore
+
+    state = {"started": False}
+
+    def begin(frame_presented: bool) -> None:
+        if state["started"]:
+            return
+        state["started"] = True
+        if frame_presented:
+            profile.record_first_frame()
+        else:
+            profile.mark("first_frame_timeout")
+        loader.start()
+
+    roots = engine.rootObjects()
+    window = roots[0] if roots else None
+    frame_swapped = getattr(window, "frameSwapped", None)
+    if frame_swapped is not None:
+        frame_swapped.connect(lambda: begin(True), QtCore.Qt.SingleShotConnection)
+        QtCore.QTimer.singleShot(first_frame_timeout_ms, lambda: begin(False))
+    else:
+        QtCore.QTimer.singleShot(0, lambda: begin(False))
+
+    app.aboutToQuit.connect(profile.write)
+    if profile.options.exit_after_startup:
+        def finish() -> None:
+            profile.write()
+            app.quit()
+
+        loader.when_finished(finish)
+
+
+__all__ = [
+    "DEFAULT_PROFILE_PATH",
+    "DeferredLoader",
+    "EXIT_FLAG",
+    "ImportProfiler",
+    "ImportRecord",
+    "PROFILE_FLAG",
+    "StartupOptions",
+    "StartupProfile",
+    "parse_startup_arguments",
+    "run_staged",
+]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark text DAT against Parquet / Arrow IPC exports of a sweep.
+
+A synthetic sweep of ``--runs`` results (time plus the default PyBaMM export
+channels, smooth signals with a little noise, sampled at 10 Hz) is written
+once per format. The script reports the write time and on-disk size, then
+the time to load a single channel from every run: through the columnar
+``.dat`` reader for text and through a projected read for the columnar
+formats.
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.model.dat_reader import read_dat  # noqa: E402  (path set-up above)
+from app.ui_qt.columnar_results import HAS_PYARROW, read_columnar_results  # noqa: E402  (path set-up above)
+from app.ui_qt.pybamm_runner import (  # noqa: E402  (path set-up above)
+    DEFAULT_EXPORT_VARIABLES,
+    SimulationResults,
+    export_simulation_results,
+)
+
+CHANNEL = "Terminal voltage [V]"
+
+
+def build_results(samples: int, seed: int) -> SimulationResults:
+    rng = np.random.default_rng(seed)
+    time_s = np.arange(samples, dtype=np.float64) * 0.1
+    trend = np.linspace(0.0, 1.0, samples)
+    channels: Dict[str, np.ndarray] = {"Time [s]": time_s}
+    for index, name in enumerate(DEFAULT_EXPORT_VARIABLES):
+        base = 3.0 + index - (0.5 + index * 0.1) * trend + 0.05 * np.sin(time_s / (30.0 + index))
+        channels[name] = base + rng.normal(0.0, 1e-4, samples)
+    return SimulationResults(channels, metadata={"seed": seed})
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50, help="Number of runs in the sweep")
+    parser.add_argument("--samples", type=float, default=36000, help="Samples per run (10 Hz)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    if not HAS_PYARROW:
+        print("pyarrow is not installed")
+        return 1
+    samples = int(args.samples)
+    runs = [build_results(samples, seed) for seed in range(args.runs)]
+    print(f"{args.runs} runs x {samples} samples x {len(runs[0])} channels")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for dat_format in ("text", "parquet", "arrow"):
+            directory = pathlib.Path(tmpdir) / dat_format
+            paths: List[pathlib.Path] = []
+            started = time.perf_counter()
+            for index, results in enumerate(runs):
+                export = export_simulation_results(
+                    directory, f"run_{index:04d}", results, include_mdf=False, dat_format=dat_format
+                )
+                paths.append(export.dat_path)
+            write_time = time.perf_counter() - started
+            size_mb = sum(path.stat().st_size for path in paths) / 1e6
+
+            started = time.perf_counter()
+            total = 0.0
+            for path in paths:
+                if dat_format == "text":
+                    total += float(read_dat(path, [CHANNEL])[CHANNEL].sum())
+                else:
+                    total += float(read_columnar_results(path, [CHANNEL])[CHANNEL].sum())
+            read_time = time.perf_counter() - started
+            print(
+                f"{dat_format:8s}: write {write_time:7.2f} s, {size_mb:8.1f} MB, "
+                f"one channel from every run {read_time:6.2f} s (checksum {total:.1f})"
+            )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
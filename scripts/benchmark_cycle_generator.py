@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark generating a long WLTP duty cycle.
+
+The legacy path extends the previous generator script to repeated cycles: it
+builds every row as a Python tuple with ``ramp``/``hold``/``tile_pattern``
+lists and hands the full table to ``csv.writer``. The streaming path writes
+the same CSV chunk by chunk with :func:`write_csv`, and :func:`write_binary`
+writes the binary drive-cycle format.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import dataclasses
+import pathlib
+import sys
+import tempfile
+import time
+from typing import List, Sequence, Tuple
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.model.cycle_generator import WLTP_CLASS3, Hold, Ramp, write_binary, write_csv  # noqa: E402  (path set-up above)
+
+
+def legacy_rows(repeat: int) -> List[Tuple[int, str, float, float]]:
+    phases = []
+    for phase in WLTP_CLASS3.phases:
+        pattern: List[float] = []
+        for segment in phase.pattern:
+            steps = int(segment.duration_s)
+            if isinstance(segment, Ramp):
+                if steps == 1:
+                    pattern.append(segment.end_kph)
+                elif steps > 1:
+                    step = (segment.end_kph - segment.start_kph) / float(steps - 1)
+                    pattern.extend(segment.start_kph + step * i for i in range(steps))
+            elif isinstance(segment, Hold):
+                pattern.extend(segment.speed_kph for _ in range(steps))
+        speeds: List[float] = []
+        while len(speeds) < phase.duration_s:
+            speeds.extend(pattern)
+        phases.append((phase.name, speeds[: int(phase.duration_s)]))
+
+    rows = [(0, "low", 0.0, 0.0)]
+    time_s, distance_m, previous_mps = 0, 0.0, 0.0
+    for _ in range(repeat):
+        for name, speeds in phases:
+            for speed_kph in speeds:
+                time_s += 1
+                speed_mps = speed_kph / 3.6
+                distance_m += 0.5 * (speed_mps + previous_mps) * 1.0
+                previous_mps = speed_mps
+                rows.append((time_s, name, speed_kph, distance_m))
+    return rows
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=240, help="Number of consecutive 1800 s WLTP cycles")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    spec = dataclasses.replace(WLTP_CLASS3, repeat=args.repeat)
+    print(f"{args.repeat} WLTP cycles at 1 Hz ({spec.sample_count} samples)")
+    with tempfile.TemporaryDirectory() as scratch:
+        legacy_path = pathlib.Path(scratch) / "legacy.csv"
+        started = time.perf_counter()
+        rows = legacy_rows(args.repeat)
+        with legacy_path.open("w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["time_s", "phase", "speed_kph", "distance_m"])
+            writer.writerows(rows)
+        legacy = time.perf_counter() - started
+        del rows
+
+        streamed_path = pathlib.Path(scratch) / "streamed.csv"
+        started = time.perf_counter()
+        write_csv(spec, streamed_path)
+        streamed = time.perf_counter() - started
+        identical = streamed_path.read_bytes() == legacy_path.read_bytes()
+
+        started = time.perf_counter()
+        write_binary(spec, pathlib.Path(scratch) / "streamed.evdc")
+        binary = time.perf_counter() - started
+
+    print(f"legacy lists + csv.writer : {legacy * 1e3:9.1f} ms")
+    print(f"streamed csv             : {streamed * 1e3:9.1f} ms  speed-up x{legacy / streamed:5.1f}  identical={identical}")
+    print(f"streamed binary          : {binary * 1e3:9.1f} ms  speed-up x{legacy / binary:5.1f}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
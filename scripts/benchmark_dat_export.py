@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark the text and binary DAT writers on a large synthetic result.
+
+The synthetic run mirrors the default PyBaMM export (time plus six channels)
+sampled at 10 Hz. By default 1e7 samples are written, which corresponds to
+roughly 11.5 days of 10 Hz data. The legacy row-by-row writer is only timed
+on a slice of the data and extrapolated, because running it on the full
+result takes several minutes.
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Dict, Sequence
+
+import numpy as np
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.ui_qt.pybamm_runner import (  # noqa: E402  (path set-up above)
+    DEFAULT_EXPORT_VARIABLES,
+    SimulationResults,
+    read_binary_dat,
+    write_binary_dat,
+    write_dat_text,
+)
+
+
+def build_results(samples: int, seed: int) -> SimulationResults:
+    rng = np.random.default_rng(seed)
+    channels: Dict[str, np.ndarray] = {"Time [s]": np.arange(samples, dtype=np.float64) * 0.1}
+    for index, name in enumerate(DEFAULT_EXPORT_VARIABLES):
+        scale = 10.0 ** (index - 2)
+        channels[name] = rng.normal(0.0, scale, samples)
+    return SimulationResults(channels)
+
+
+def legacy_write(handle, results: SimulationResults) -> None:
+    def format_float(value: float) -> str:
+        if value == 0:
+            return "0"
+        magnitude = abs(value)
+        if magnitude != 0 and (magnitude >= 1e4 or magnitude <= 1e-3):
+            return f"{value:.6e}"
+        return f"{value:.12g}"
+
+    names = [results.time_channel] + results.channel_names
+    handle.write("\t".join(names) + "\n")
+    columns = {name: results[name].tolist() for name in names}
+    for row_index in range(results.sample_count):
+        handle.write("\t".join(format_float(columns[name][row_index]) for name in names) + "\n")
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=float, default=1e7, help="Number of samples per channel")
+    parser.add_argument(
+        "--legacy-samples",
+        type=float,
+        default=2e5,
+        help="Samples used to time the legacy writer (0 disables it)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(argv or sys.argv[1:])
+    samples = int(args.samples)
+    results = build_results(samples, args.seed)
+    print(f"{samples} samples x {len(results)} channels ({results.nbytes / 1e6:.1f} MB in memory)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = pathlib.Path(tmpdir)
+
+        legacy_samples = min(int(args.legacy_samples), samples)
+        if legacy_samples > 0:
+            subset = SimulationResults({name: results[name][:legacy_samples] for name in results})
+            started = time.perf_counter()
+            with (directory / "legacy.dat").open("w", encoding="utf-8", newline="") as handle:
+                legacy_write(handle, subset)
+            elapsed = time.perf_counter() - started
+            print(
+                f"legacy text   : {elapsed:8.2f} s for {legacy_samples} samples "
+                f"(~{elapsed * samples / legacy_samples:.1f} s extrapolated)"
+            )
+
+        text_path = directory / "vectorized.dat"
+        started = time.perf_counter()
+        with text_path.open("w", encoding="utf-8", newline="") as handle:
+            write_dat_text(handle, results)
+        elapsed = time.perf_counter() - started
+        print(f"chunked text  : {elapsed:8.2f} s ({text_path.stat().st_size / 1e6:.1f} MB)")
+
+        binary_path = directory / "binary.bdat"
+        started = time.perf_counter()
+        write_binary_dat(binary_path, results)
+        elapsed = time.perf_counter() - started
+        print(f"binary write  : {elapsed:8.2f} s ({binary_path.stat().st_size / 1e6:.1f} MB)")
+
+        started = time.perf_counter()
+        loaded = read_binary_dat(binary_path)
+        checksum = float(np.sum(loaded[DEFAULT_EXPORT_VARIABLES[0]]))
+        elapsed = time.perf_counter() - started
+        print(f"binary read   : {elapsed:8.2f} s (memory-mapped, checksum {checksum:.3f})")
+        del loaded
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark reading long multi-cell WLTP ``.dat`` result files.
+
+A long result file is produced by running the batched single-cell engine
+over a repeated 10 Hz WLTP cycle. The legacy path reads it the only way the
+tree could before: line by line, splitting every row into Python floats and
+building per-channel lists. The mapped path uses :mod:`app.model.dat_reader`
+for a full read, a single-cell projection and a short row window.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Dict, List, Sequence
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.model.cycle_generator import WLTP_CLASS3, generate  # noqa: E402  (path set-up above)
+from app.model.dat_reader import DatFile  # noqa: E402  (path set-up above)
+from app.model.single_cell_engine import default_cells, simulate_batch  # noqa: E402  (path set-up above)
+
+
+def legacy_read(path: pathlib.Path) -> Dict[str, List[float]]:
+    columns: Dict[str, List[float]] = {}
+    names: List[str] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.startswith("#"):
+                continue
+            if not names:
+                names = line.rstrip("\n").split("\t")
+                columns = {name: [] for name in names}
+                continue
+            for name, value in zip(names, line.rstrip("\n").split("\t")):
+                columns[name].append(float(value))
+    return columns
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=4, help="Number of 10 Hz WLTP cycles in the result file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    cycle = generate(dataclasses.replace(WLTP_CLASS3, repeat=args.repeat, sample_rate_hz=10.0))
+    with tempfile.TemporaryDirectory() as scratch:
+        path = pathlib.Path(scratch) / "results.dat"
+        simulate_batch(cycle, default_cells()).write_dat(path)
+        size_mb = path.stat().st_size / 1e6
+
+        started = time.perf_counter()
+        legacy = legacy_read(path)
+        legacy_time = time.perf_counter() - started
+        rows = len(legacy["time_s"])
+        del legacy
+
+        with DatFile(path) as dat:
+            started = time.perf_counter()
+            dat.read()
+            full_time = time.perf_counter() - started
+            started = time.perf_counter()
+            dat.read(prefixes=["LFP"])
+            projected_time = time.perf_counter() - started
+            started = time.perf_counter()
+            dat.read(["NCA.temperature_c"], rows=(rows // 2, rows // 2 + 6000))
+            window_time = time.perf_counter() - started
+
+    print(f"{rows} rows, {size_mb:.1f} MB")
+    print(f"legacy line parse      : {legacy_time * 1e3:9.1f} ms")
+    print(f"mapped full read       : {full_time * 1e3:9.1f} ms  speed-up x{legacy_time / full_time:5.1f}")
+    print(f"mapped LFP projection  : {projected_time * 1e3:9.1f} ms  speed-up x{legacy_time / projected_time:5.1f}")
+    print(f"mapped 10 min window   : {window_time * 1e3:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
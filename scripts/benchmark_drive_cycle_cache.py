@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark loading drive cycles from CSV against the binary cycle cache.
+
+Each worker process loads the cycle as a fresh consumer would: the legacy
+path parses the CSV text, the cached path hashes the CSV and memory-maps the
+compiled cache file. A longer synthetic cycle can be generated by repeating
+the WLTP trace (``--repeat``) to show how both paths scale.
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Sequence
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.model.drive_cycles import compile_cycle, load_cycle, load_wltp_csv  # noqa: E402  (path set-up above)
+
+WLTP_CSV = ROOT / "data" / "wltp" / "wltp_class3_cycle.csv"
+
+
+def write_repeated_cycle(target: pathlib.Path, repeat: int) -> pathlib.Path:
+    lines = WLTP_CSV.read_text(encoding="utf-8").splitlines()
+    header, rows = lines[0], lines[1:]
+    period = len(rows)
+    with target.open("w", encoding="utf-8") as handle:
+        handle.write(header + "\n")
+        for block in range(repeat):
+            for index, row in enumerate(rows):
+                _, phase, speed, distance = row.split(",")
+                handle.write(f"{block * period + index},{phase},{speed},{distance}\n")
+    return target
+
+
+def _load_csv(path: str) -> int:
+    return len(load_wltp_csv(path))
+
+
+def _load_cached(path: str, cache_dir: str) -> int:
+    return len(load_cycle(path, cache_dir=cache_dir))
+
+
+def time_loads(loader: Callable[[], int], loads: int) -> float:
+    started = time.perf_counter()
+    for _ in range(loads):
+        loader()
+    return time.perf_counter() - started
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="Number of WLTP periods in the benchmark cycle")
+    parser.add_argument("--loads", type=int, default=50, help="Loads per path in the calling process")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes that each load the cycle once")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(argv or sys.argv[1:])
+    with tempfile.TemporaryDirectory() as scratch:
+        cache_dir = str(pathlib.Path(scratch) / "cache")
+        source = str(write_repeated_cycle(pathlib.Path(scratch) / "cycle.csv", args.repeat))
+        compile_cycle(source, cache_dir)
+        print(f"cycle with {_load_csv(source)} samples")
+
+        csv_time = time_loads(lambda: _load_csv(source), args.loads)
+        cached_time = time_loads(lambda: _load_cached(source, cache_dir), args.loads)
+        print(f"csv parse     : {csv_time / args.loads * 1e3:8.2f} ms per load")
+        print(f"mapped cache  : {cached_time / args.loads * 1e3:8.2f} ms per load  speed-up x{csv_time / cached_time:5.1f}")
+
+        with ProcessPoolExecutor(args.workers) as pool:
+            list(pool.map(_load_csv, [source] * args.workers))  # warm the worker processes
+            started = time.perf_counter()
+            list(pool.map(_load_csv, [source] * args.workers))
+            pooled_csv = time.perf_counter() - started
+            started = time.perf_counter()
+            list(pool.map(_load_cached, [source] * args.workers, [cache_dir] * args.workers))
+            pooled_cached = time.perf_counter() - started
+        print(f"{args.workers} workers csv   : {pooled_csv * 1e3:8.2f} ms")
+        print(f"{args.workers} workers cache : {pooled_cached * 1e3:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark batch studies on the C++ core through the orchestrator pool.
+
+The same set of default-scenario runs is executed once through a single
+:class:`OrchestratorClient` (the previous behaviour of the Qt controller)
+and then through :class:`OrchestratorPool` instances of increasing size.
+While the batch runs, a Python thread counts loop iterations to show that
+ctypes releases the GIL for the native calls. That thread competes with the
+native runs for CPU time, so on machines with few cores pass
+``--no-heartbeat`` when comparing timings.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import sys
+import threading
+import time
+from typing import List, Optional, Sequence
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.ui_qt.orchestrator_client import (  # noqa: E402  (path set-up above)
+    OrchestratorClient,
+    OrchestratorPool,
+    ScenarioRequest,
+)
+
+
+class _Heartbeat:
+    """Counts Python iterations on a side thread while a batch is running."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.ticks = 0
+        self._enabled = enabled
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.ticks += 1
+
+    def __enter__(self) -> "_Heartbeat":
+        if self._enabled:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._enabled:
+            self._thread.join()
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--library", type=pathlib.Path, default=None, help="Path to the evsim_core library")
+    parser.add_argument("--runs", type=int, default=16, help="Number of scenarios in the batch")
+    parser.add_argument("--steps", type=int, default=200_000, help="Steps per scenario")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--no-heartbeat", action="store_true", help="Do not run the GIL heartbeat thread")
+    return parser.parse_args(argv)
+
+
+def run_sequential(library: Optional[pathlib.Path], requests: List[ScenarioRequest]) -> float:
+    with OrchestratorClient(library) as client:
+        for request in requests[:1]:  # warm up like the pools, outside the timed region
+            client.run_default_scenario(request.time_step, request.steps)
+            client.discard_run()
+        started = time.perf_counter()
+        for request in requests:
+            client.run_default_scenario(request.time_step, request.steps)
+            client.discard_run()  # as the pool does when a handle is released
+        return time.perf_counter() - started
+
+
+def run_pooled(library: Optional[pathlib.Path], requests: List[ScenarioRequest], size: int) -> float:
+    with OrchestratorPool(size, library_path=library) as pool:
+        pool.map(requests[:size])  # create the handles outside the timed region
+        started = time.perf_counter()
+        pool.map(requests)
+        return time.perf_counter() - started
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(argv or sys.argv[1:])
+    requests = [
+        ScenarioRequest(time_step=0.5 + 0.1 * (index % 5), steps=args.steps, collect_results=False)
+        for index in range(args.runs)
+    ]
+    print(f"{args.runs} scenarios x {args.steps} steps, {os.cpu_count()} CPU(s)")
+
+    with _Heartbeat(not args.no_heartbeat) as heartbeat:
+        sequential = run_sequential(args.library, requests)
+    print(f"single client   : {sequential * 1e3:9.1f} ms  (python thread ticks: {heartbeat.ticks})")
+
+    size = 1
+    while size <= max(1, args.max_workers):
+        with _Heartbeat(not args.no_heartbeat) as heartbeat:
+            elapsed = run_pooled(args.library, requests, size)
+        print(
+            f"pool size {size:<5} : {elapsed * 1e3:9.1f} ms  speed-up x{sequential / elapsed:4.2f}"
+            f"  (python thread ticks: {heartbeat.ticks})"
+        )
+        size *= 2
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
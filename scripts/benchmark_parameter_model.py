@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Benchmark preset application, override import and search on the parameter models.
+
+A synthetic schema with PyBaMM-sized parameter counts is loaded into
+:class:`ParameterListModel` and every ``dataChanged`` emission is routed to a
+Python slot, which is roughly what a bound QML view pays per signal. The
+legacy row-by-row update (a linear scan plus one signal per changed row) is
+timed next to the indexed bulk operations. Search typing is replayed one
+keystroke at a time against a main and a diff-only filter model sharing the
+source, and the slowest keystroke is compared with a 60 Hz frame budget.
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from PySide6 import QtCore  # noqa: E402  (path set-up above)
+
+from app.ui_qt.parameter_bridge import (  # noqa: E402
+    ParameterDefinition,
+    ParameterFilterModel,
+    ParameterListModel,
+)
+
+FRAME_BUDGET_MS = 1000.0 / 60.0
+_WORDS = (
+    "negative", "positive", "electrode", "electrolyte", "separator", "particle", "thickness",
+    "conductivity", "diffusivity", "porosity", "temperature", "exchange", "current", "density",
+    "reference", "activation", "energy", "volume", "fraction", "radius", "heat", "capacity",
+)
+
+
+def build_items(count: int) -> List[ParameterDefinition]:
+    return [
+        ParameterDefinition(
+            identifier=f"param_{index:05d}",
+            name=f"Parameter {index} [m]",
+            label=" ".join(
+                _WORDS[(index // len(_WORDS) ** depth) % len(_WORDS)] for depth in range(3)
+            ).capitalize(),
+            type="number",
+            default=float(index),
+            value=float(index),
+            unit="m",
+            category="General",
+            advanced=False,
+        )
+        for index in range(count)
+    ]
+
+
+def legacy_update_defaults(model: ParameterListModel, defaults: Dict[str, Any]) -> None:
+    for row, item in enumerate(model.items()):
+        if item.identifier in defaults:
+            item.default = defaults[item.identifier]
+            if item.override is None and item.value != item.default:
+                item.value = item.default
+                index = model.index(row, 0)
+                model.dataChanged.emit(index, index, [model.DefaultRole, model.ValueRole, model.DirtyRole])
+
+
+def legacy_set_overrides(model: ParameterListModel, overrides: Dict[str, Any]) -> None:
+    for row, item in enumerate(model.items()):
+        if item.identifier in overrides and item.value != overrides[item.identifier]:
+            item.value = overrides[item.identifier]
+            item.override = item.value if item.value != item.default else None
+            index = model.index(row, 0)
+            model.dataChanged.emit(index, index, [model.ValueRole, model.DirtyRole])
+
+
+def measure(label: str, count: int, run: Callable[[ParameterListModel], None]) -> None:
+    model = ParameterListModel()
+    model.set_items(build_items(count))
+    emissions = [0]
+
+    def on_changed(*_args: Any) -> None:
+        emissions[0] += 1
+
+    model.dataChanged.connect(on_changed)
+    started = time.perf_counter()
+    run(model)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28}: {elapsed * 1e3:8.2f} ms, {emissions[0]:6d} dataChanged signals")
+
+
+class LegacyFilterModel(ParameterFilterModel):
+    """The pre-index filter: lowercases and scans every row per keystroke."""
+
+    def set_search(self, text: str) -> None:
+        self._search = text
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # type: ignore[override]
+        source = self.sourceModel()
+        index = source.index(source_row, 0, source_parent)
+        label = source.data(index, ParameterListModel.LabelRole)
+        name = source.data(index, ParameterListModel.IdRole)
+        dirty = source.data(index, ParameterListModel.DirtyRole)
+        if self._diff_only and not dirty:
+            return False
+        if self._search and self._search.lower() not in f"{label} {name}".lower():
+            return False
+        return True
+
+
+def measure_search(label: str, count: int, query: str, factory: Callable[..., ParameterFilterModel]) -> None:
+    model = ParameterListModel()
+    model.set_items(build_items(count))
+    model.set_overrides({f"param_{index:05d}": -1.0 for index in range(0, count, 10)})
+    filters = [factory(), factory(diff_only=True)]
+    for proxy in filters:
+        proxy.setSourceModel(model)
+    timings = []
+    for length in range(1, len(query) + 1):
+        started = time.perf_counter()
+        for proxy in filters:
+            proxy.set_search(query[:length])
+            proxy.rowCount()  # force the (lazy) re-filter, as an attached view would
+        timings.append((time.perf_counter() - started) * 1e3)
+    worst = max(timings)
+    verdict = "within" if worst <= FRAME_BUDGET_MS else "over"
+    print(
+        f"{label:<28}: {worst:8.2f} ms worst keystroke, {sum(timings) / len(timings):6.2f} ms mean "
+        f"({verdict} the {FRAME_BUDGET_MS:.1f} ms frame budget, {filters[0].rowCount()} rows left)"
+    )
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parameters", type=int, default=2000, help="Number of schema parameters")
+    parser.add_argument(
+        "--fraction",
+        type=float,
+        default=0.75,
+        help="Fraction of parameters touched by the preset/import",
+    )
+    parser.add_argument("--query", default="electrode thickness", help="Search text typed one key at a time")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(argv or sys.argv[1:])
+    _app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    count = args.parameters
+    touched = max(1, int(count * args.fraction))
+    defaults = {f"param_{index:05d}": float(index) + 0.5 for index in range(touched)}
+    overrides = {f"param_{index:05d}": float(index) * 2.0 + 1.0 for index in range(0, count, 2)}
+    print(f"{count} parameters, preset touches {len(defaults)}, import sets {len(overrides)}")
+
+    measure("legacy preset apply", count, lambda model: legacy_update_defaults(model, defaults))
+    measure("indexed preset apply", count, lambda model: model.update_defaults(defaults))
+    measure("legacy override import", count, lambda model: legacy_set_overrides(model, overrides))
+    measure("indexed override import", count, lambda model: model.set_overrides(overrides))
+    measure_search("legacy search (2 filters)", count, args.query, LegacyFilterModel)
+    measure_search("indexed search (2 filters)", count, args.query, ParameterFilterModel)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
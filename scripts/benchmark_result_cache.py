@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark result-cache hits against solving a PyBaMM configuration again.
+
+The cache lookup (canonical key plus memory-mapped load) is timed on a
+synthetic result with the default export channels and ``--samples`` rows.
+With PyBaMM installed, the same configuration is also run through
+``run_pybamm_simulation`` twice with a fresh cache: once cold (solve and
+store) and once warm (served from the cache).
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Sequence
+
+import numpy as np
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.ui_qt.pybamm_runner import (  # noqa: E402  (path set-up above)
+    DEFAULT_EXPORT_VARIABLES,
+    SimulationResults,
+    run_pybamm_simulation,
+)
+from app.ui_qt.result_cache import ResultCache, result_cache_key  # noqa: E402  (path set-up above)
+from app.ui_qt.schema_cache import pybamm_version  # noqa: E402  (path set-up above)
+
+OVERRIDES = {"Negative electrode thickness [m]": 8.5e-5, "Ambient temperature [K]": 298.15}
+
+
+def build_results(samples: int) -> SimulationResults:
+    time_s = np.linspace(0.0, 3600.0, samples)
+    channels = {"Time [s]": time_s}
+    for offset, name in enumerate(DEFAULT_EXPORT_VARIABLES):
+        channels[name] = np.cos(time_s / (600.0 + offset)) + offset
+    return SimulationResults(channels, metadata={"overrides": OVERRIDES})
+
+
+def time_lookups(cache: ResultCache, samples: int, repeats: int) -> float:
+    t_eval = np.linspace(0.0, 3600.0, samples)
+    arguments = dict(
+        chemistry="lithium_ion",
+        model="DFN",
+        parameter_set="Chen2020",
+        overrides=OVERRIDES,
+        t_eval=t_eval,
+        variables=list(DEFAULT_EXPORT_VARIABLES),
+    )
+    cache.store(result_cache_key(**arguments), build_results(samples))
+    started = time.perf_counter()
+    for _ in range(repeats):
+        results = cache.load(result_cache_key(**arguments))
+        assert results is not None
+        float(results["Voltage [V]"][-1])
+    return (time.perf_counter() - started) / repeats
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=3601, help="Rows of the cached result")
+    parser.add_argument("--repeats", type=int, default=200, help="Timed cache lookups")
+    parser.add_argument("--parameter-set", default="Chen2020", help="PyBaMM parameter set for the solve timing")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lookup = time_lookups(ResultCache(pathlib.Path(tmpdir) / "lookups"), args.samples, args.repeats)
+        print(f"cache hit ({args.samples} rows) : {lookup * 1e3:9.3f} ms")
+
+        if not pybamm_version():
+            print("PyBaMM is not installed; skipping the solve comparison")
+            return 0
+        cache = ResultCache(pathlib.Path(tmpdir) / "runs")
+        timings = []
+        for _ in range(2):
+            started = time.perf_counter()
+            run_pybamm_simulation(
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set=args.parameter_set,
+                overrides=OVERRIDES,
+                t_eval=np.linspace(0.0, 3600.0, args.samples),
+                result_cache=cache,
+            )
+            timings.append(time.perf_counter() - started)
+    print(f"cold run (build, solve, store): {timings[0] * 1e3:9.1f} ms")
+    print(f"warm run (cache hit)          : {timings[1] * 1e3:9.1f} ms  speed-up x{timings[0] / timings[1]:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
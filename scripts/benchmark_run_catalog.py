@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark override queries on the SQLite run catalog against manifest scans.
+
+``--runs`` synthetic sweep points (three numeric overrides and a handful of
+KPIs each) are stored twice: as ``run_sweep`` style JSON manifests of
+``--points-per-manifest`` points, which is what finding runs took before,
+and in a run catalog. The same query ("negative electrode thickness above a
+threshold and minimum voltage below another") is then answered by parsing
+every manifest and by the catalog.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.ui_qt.run_catalog import RunCatalog, RunRecord, parse_condition  # noqa: E402  (path set-up above)
+
+THICKNESS = "Negative electrode thickness [m]"
+POROSITY = "Negative electrode porosity"
+TEMPERATURE = "Ambient temperature [K]"
+VOLTAGE_MIN = "Terminal voltage [V].min"
+
+
+def build_runs(count: int, seed: int) -> List[RunRecord]:
+    rng = np.random.default_rng(seed)
+    thickness = rng.uniform(50e-6, 120e-6, count)
+    porosity = rng.uniform(0.2, 0.4, count)
+    temperature = rng.uniform(273.15, 318.15, count)
+    voltage = rng.uniform(2.8, 3.6, count)
+    return [
+        RunRecord(
+            run_id=f"sweep_{index:07d}",
+            created_at=1.7e9 + index,
+            scenario="bench",
+            parameter_set="Chen2020",
+            samples=3601,
+            overrides={THICKNESS: thickness[index], POROSITY: porosity[index], TEMPERATURE: temperature[index]},
+            kpis={VOLTAGE_MIN: voltage[index], "Terminal voltage [V].max": 4.2, "Time [s].final": 3600.0},
+        )
+        for index in range(count)
+    ]
+
+
+def write_manifests(directory: pathlib.Path, runs: Sequence[RunRecord], per_manifest: int) -> None:
+    for start in range(0, len(runs), per_manifest):
+        points = [
+            {"prefix": run.run_id, "overrides": run.overrides, "kpis": run.kpis, "files": {"dat": f"{run.run_id}.dat"}}
+            for run in runs[start : start + per_manifest]
+        ]
+        payload = {"parameter_set": "Chen2020", "points": points}
+        (directory / f"sweep_{start:07d}_manifest.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def scan_manifests(directory: pathlib.Path, thickness: float, voltage: float) -> List[str]:
+    matches: List[str] = []
+    for path in sorted(directory.glob("*_manifest.json")):
+        manifest: Dict = json.loads(path.read_text(encoding="utf-8"))
+        for point in manifest["points"]:
+            if point["overrides"][THICKNESS] > thickness and point["kpis"][VOLTAGE_MIN] < voltage:
+                matches.append(point["prefix"])
+    return matches
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=100_000, help="Number of catalogued runs")
+    parser.add_argument("--points-per-manifest", type=int, default=100, help="Sweep points per JSON manifest")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    runs = build_runs(args.runs, args.seed)
+    thickness, voltage = 110e-6, 3.0
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = pathlib.Path(tmpdir)
+        write_manifests(directory, runs, args.points_per_manifest)
+
+        with RunCatalog(directory / "catalog.sqlite") as catalog:
+            started = time.perf_counter()
+            catalog.record_runs(runs)
+            print(f"catalogued {args.runs} runs in {time.perf_counter() - started:.2f} s")
+
+            started = time.perf_counter()
+            legacy = scan_manifests(directory, thickness, voltage)
+            legacy_time = time.perf_counter() - started
+
+            conditions = [
+                parse_condition(f"{THICKNESS} > {thickness}"),
+                parse_condition(f"{VOLTAGE_MIN} < {voltage}", kind="kpi"),
+            ]
+            started = time.perf_counter()
+            indexed = catalog.find_run_ids(conditions)
+            indexed_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            only_thickness = catalog.find_run_ids(conditions[:1])
+            single_time = time.perf_counter() - started
+
+    assert sorted(indexed) == sorted(legacy)
+    print(f"manifest scan          : {legacy_time * 1e3:9.1f} ms ({len(legacy)} runs)")
+    print(f"catalog override + KPI : {indexed_time * 1e3:9.1f} ms  speed-up x{legacy_time / indexed_time:6.1f}")
+    print(f"catalog override only  : {single_time * 1e3:9.1f} ms ({len(only_thickness)} runs)")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
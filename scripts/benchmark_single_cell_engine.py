@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark a capacity/resistance tolerance study over the WLTP cycle.
+
+The legacy path steps one cell at a time with scalar arithmetic, the way the
+C++ CLI runs one orchestrator per cell. The batched path advances every cell
+variant together with :func:`simulate_batch`. The legacy loop is timed on a
+subset of cells and extrapolated to the full study size.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import pathlib
+import sys
+import time
+from typing import Sequence
+
+import numpy as np
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.model.drive_cycles import DriveCycle, load_wltp_csv  # noqa: E402  (path set-up above)
+from app.model.single_cell_engine import (  # noqa: E402  (path set-up above)
+    DEFAULT_CELL_PRESETS,
+    CellBatch,
+    CellParameters,
+    simulate_batch,
+)
+
+WLTP_CSV = ROOT / "data" / "wltp" / "wltp_class3_cycle.csv"
+
+
+def legacy_run_cell(cell: CellParameters, cycle: DriveCycle, ambient_c: float) -> float:
+    """Scalar per-cell loop (thermal model); returns the final temperature."""
+
+    dt = cycle.sample_interval
+    soc, temperature = 1.0, ambient_c
+    previous = cycle.speed_kph[0] / 3.6
+    rth = max(cell.thermal_resistance_k_per_w, 1e-3)
+    thermal_mass = max(cell.mass_kg, 1e-6) * max(cell.heat_capacity_j_per_kg_k, 1e-3)
+    time_s = 0.0
+    for _ in range(len(cycle)):
+        index = min(int(math.floor(time_s / dt)), len(cycle) - 1)
+        speed = float(cycle.speed_kph[index]) / 3.6
+        accel = (speed - previous) / dt
+        previous = speed
+        current = max(cell.base_current_a + cell.speed_current_gain * speed + cell.accel_current_gain * accel, 0.0)
+        heat = current * current * cell.internal_resistance
+        soc = min(max(soc - (current * dt) / (cell.capacity_ah * 3600.0), 0.0), 1.0)
+        delta = ((heat - (temperature - ambient_c) / rth) / thermal_mass) * dt
+        temperature = min(max(temperature + delta, -40.0), 120.0)
+        time_s += dt
+    return temperature
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cells", type=int, default=10_000, help="Number of cell variants in the study")
+    parser.add_argument("--legacy-cells", type=int, default=200, help="Cells timed on the legacy path")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(argv or sys.argv[1:])
+    cycle = load_wltp_csv(WLTP_CSV)
+    base = DEFAULT_CELL_PRESETS["NCA"]
+    rng = np.random.default_rng(args.seed)
+    batch = CellBatch.variants(
+        base,
+        args.cells,
+        capacity_ah=rng.normal(base.capacity_ah, 0.02 * base.capacity_ah, args.cells),
+        internal_resistance=rng.normal(base.internal_resistance, 0.05 * base.internal_resistance, args.cells),
+    )
+    print(f"{args.cells} cell variants x {len(cycle)} WLTP steps")
+
+    legacy_count = min(args.legacy_cells, args.cells)
+    started = time.perf_counter()
+    legacy = [legacy_run_cell(batch.cell(index), cycle, 25.0) for index in range(legacy_count)]
+    legacy_per_cell = (time.perf_counter() - started) / max(legacy_count, 1)
+    legacy_total = legacy_per_cell * args.cells
+
+    started = time.perf_counter()
+    result = simulate_batch(cycle, batch, signals=("soc", "temperature_c"))
+    batched = time.perf_counter() - started
+
+    np.testing.assert_allclose(result.signals["temperature_c"][-1, :legacy_count], legacy, rtol=0, atol=1e-12)
+    print(f"per-cell loop   : {legacy_total * 1e3:10.1f} ms  (extrapolated from {legacy_count} cells)")
+    print(f"batched engine  : {batched * 1e3:10.1f} ms  speed-up x{legacy_total / batched:6.1f}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark preparing PyBaMM sweep inputs from UI parameter vectors.
+
+Every sweep point sets all numeric fields of the bundled parameter schema.
+The legacy path converts one dictionary per point with ``convert_to_si`` and
+``values_to_pybamm_keys``, which re-indexes the schema on every call. The
+compiled path converts the whole ``(points, fields)`` matrix with one
+:class:`ConversionPlan` multiply-add.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.model.units_adapter import (  # noqa: E402  (path set-up above)
+    CELSIUS_KEYS,
+    UNIT_TO_SI,
+    compile_plan,
+    values_to_pybamm_keys,
+)
+
+SCHEMA_PATH = ROOT / "app" / "params" / "params_schema.json"
+
+
+def legacy_convert_to_si(values: Dict[str, Any], categories_schema: List[dict]) -> Dict[str, Any]:
+    unit_idx: Dict[str, Dict[str, Any]] = {}
+    for cat in categories_schema:
+        for sec in cat.get("sections", []):
+            for field in sec.get("fields", []):
+                unit_idx[field["key"]] = {"unit": field.get("unit"), "advanced": field.get("advanced", False)}
+    out: Dict[str, Any] = {}
+    for key, value in values.items():
+        unit = unit_idx.get(key, {}).get("unit")
+        if isinstance(value, (int, float)):
+            if key in CELSIUS_KEYS:
+                out[key] = float(value) + 273.15 if unit in ("°C", "C") else float(value)
+            elif unit in UNIT_TO_SI:
+                out[key] = float(value) * UNIT_TO_SI[unit]
+            else:
+                out[key] = float(value)
+        else:
+            out[key] = value
+    return out
+
+
+def load_categories() -> List[dict]:
+    with SCHEMA_PATH.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return payload["categories"] if isinstance(payload, dict) else payload
+
+
+def parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=10_000, help="Number of sweep points")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_arguments(argv or sys.argv[1:])
+    categories = load_categories()
+    keys = [
+        field["key"]
+        for cat in categories
+        for sec in cat.get("sections", [])
+        for field in sec.get("fields", [])
+        if field.get("type") == "number"
+    ]
+    matrix = np.random.default_rng(args.seed).uniform(0.5, 2.0, size=(args.points, len(keys)))
+    print(f"{args.points} sweep points x {len(keys)} numeric fields")
+
+    started = time.perf_counter()
+    legacy = [values_to_pybamm_keys(legacy_convert_to_si(dict(zip(keys, row)), categories)) for row in matrix.tolist()]
+    legacy_elapsed = time.perf_counter() - started
+    print(f"legacy per-point dicts : {legacy_elapsed * 1e3:9.2f} ms")
+
+    started = time.perf_counter()
+    plan = compile_plan(categories)
+    names, _converted = plan.to_pybamm(matrix, keys)
+    matrix_elapsed = time.perf_counter() - started
+    print(f"compiled plan (matrix) : {matrix_elapsed * 1e3:9.2f} ms")
+
+    started = time.perf_counter()
+    points = plan.pybamm_points(matrix, keys)
+    records_elapsed = time.perf_counter() - started
+    print(f"compiled plan (dicts)  : {records_elapsed * 1e3:9.2f} ms")
+
+    if points != legacy:
+        print("compiled plan disagrees with the legacy conversion", file=sys.stderr)
+        return 1
+    print(f"{len(names)} PyBaMM columns, results identical to the legacy path")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
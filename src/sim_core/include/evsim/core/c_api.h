@@ -1,5 +1,6 @@
 #pragma once
 
+#include <cstddef>
 #include <cstdint>
 
 #ifdef _WIN32
@@ -17,6 +18,32 @@ typedef void* evsim_orchestrator_handle;
 EVSIM_API evsim_orchestrator_handle evsim_create_orchestrator();
 EVSIM_API void evsim_destroy_orchestrator(evsim_orchestrator_handle handle);
 EVSIM_API int evsim_run_default_scenario(evsim_orchestrator_handle handle, double time_step, std::uint32_t steps);
+/*
+ * Frees the samples the orchestrator keeps for a run. Every run stays in
+ * memory until it is discarded or the orchestrator is destroyed, so callers
+ * that reuse a handle discard each run once it has been exported. A NULL
+ * run_id discards the most recent run. Returns 0, or -1 for an invalid handle.
+ */
+EVSIM_API int evsim_discard_run(evsim_orchestrator_handle handle, const char* run_id);
+
+/*
+ * Columnar export of a finished run. The returned handle owns one contiguous
+ * channel-major block of doubles; every pointer obtained from it stays valid
+ * until evsim_destroy_result() is called, independently of the orchestrator.
+ * Returns NULL if the handle is invalid or no run has completed.
+ */
+typedef void* evsim_result_handle;
+
+EVSIM_API evsim_result_handle evsim_export_last_run(evsim_orchestrator_handle handle);
+EVSIM_API void evsim_destroy_result(evsim_result_handle result);
+EVSIM_API const char* evsim_result_run_id(evsim_result_handle result);
+EVSIM_API std::size_t evsim_result_sample_count(evsim_result_handle result);
+EVSIM_API std::size_t evsim_result_channel_count(evsim_result_handle result);
+EVSIM_API const char* evsim_result_channel_name(evsim_result_handle result, std::size_t channel);
+EVSIM_API const double* evsim_result_timestamps(evsim_result_handle result);
+/* Pointer to channel_count * sample_count doubles, channel after channel. */
+EVSIM_API const double* evsim_result_values(evsim_result_handle result);
+EVSIM_API const double* evsim_result_channel_data(evsim_result_handle result, std::size_t channel);
 
 #ifdef __cplusplus
 }
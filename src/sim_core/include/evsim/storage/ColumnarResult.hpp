@@ -0,0 +1,31 @@
+#pragma once
+
+#include <cstddef>
+#include <string>
+#include <vector>
+
+#include "evsim/common/TimeseriesSample.hpp"
+
+namespace evsim::storage {
+
+// Channel-major copy of a finished run. ``values`` holds one contiguous block
+// of ``sample_count`` doubles per channel, in ``channel_names`` order, so the
+// whole run can be handed to other languages without per-sample conversion.
+// Signals missing from a sample are stored as NaN.
+struct ColumnarResult {
+    std::string run_id;
+    std::vector<std::string> channel_names{};
+    std::vector<double> timestamps{};
+    std::vector<double> values{};
+
+    [[nodiscard]] std::size_t sample_count() const noexcept { return timestamps.size(); }
+    [[nodiscard]] std::size_t channel_count() const noexcept { return channel_names.size(); }
+    [[nodiscard]] const double* channel_data(std::size_t channel) const noexcept {
+        return channel < channel_names.size() ? values.data() + channel * timestamps.size() : nullptr;
+    }
+};
+
+// Channels are sorted by name so the layout does not depend on hash order.
+[[nodiscard]] ColumnarResult to_columnar(const std::string& run_id, const common::Timeseries& samples);
+
+}  // namespace evsim::storage
@@ -8,6 +8,7 @@
 #include <vector>
 
 #include "evsim/common/TimeseriesSample.hpp"
+#include "evsim/storage/ColumnarResult.hpp"
 #include "evsim/core/Scenario.hpp"
 
 namespace evsim::storage {
@@ -25,6 +26,9 @@ public:
     virtual void append_sample(const RunRecord& record, common::TimeseriesSample sample) = 0;
     virtual void complete_run(const RunRecord& record) = 0;
     virtual std::vector<common::TimeseriesSample> samples(const std::string& run_id) const = 0;
+    virtual ColumnarResult columnar(const std::string& run_id) const { return to_columnar(run_id, samples(run_id)); }
+    // Releases the samples of a run; unknown ids are ignored.
+    virtual void discard_run(const std::string& run_id) = 0;
 };
 
 class InMemoryResultStore final : public ResultStore {
@@ -33,6 +37,8 @@ public:
     void append_sample(const RunRecord& record, common::TimeseriesSample sample) override;
     void complete_run(const RunRecord& record) override;
     std::vector<common::TimeseriesSample> samples(const std::string& run_id) const override;
+    ColumnarResult columnar(const std::string& run_id) const override;
+    void discard_run(const std::string& run_id) override;
 
 private:
     std::unordered_map<std::string, std::vector<common::TimeseriesSample>> storage_{};
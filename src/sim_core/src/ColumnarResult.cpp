@@ -0,0 +1,40 @@
+#include "evsim/storage/ColumnarResult.hpp"
+
+#include <algorithm>
+#include <limits>
+#include <unordered_map>
+
+namespace evsim::storage {
+
+ColumnarResult to_columnar(const std::string& run_id, const common::Timeseries& samples) {
+    ColumnarResult result{};
+    result.run_id = run_id;
+
+    std::unordered_map<std::string, std::size_t> column_of;
+    for (const auto& sample : samples) {
+        for (const auto& [name, value] : sample.signals) {
+            (void)value;
+            if (column_of.find(name) == column_of.end()) {
+                column_of.emplace(name, 0);
+                result.channel_names.push_back(name);
+            }
+        }
+    }
+    std::sort(result.channel_names.begin(), result.channel_names.end());
+    for (std::size_t column = 0; column < result.channel_names.size(); ++column) {
+        column_of[result.channel_names[column]] = column;
+    }
+
+    const std::size_t rows = samples.size();
+    result.timestamps.resize(rows);
+    result.values.assign(rows * result.channel_names.size(), std::numeric_limits<double>::quiet_NaN());
+    for (std::size_t row = 0; row < rows; ++row) {
+        result.timestamps[row] = samples[row].timestamp;
+        for (const auto& [name, value] : samples[row].signals) {
+            result.values[column_of.at(name) * rows + row] = value;
+        }
+    }
+    return result;
+}
+
+}  // namespace evsim::storage
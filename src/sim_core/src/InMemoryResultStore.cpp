@@ -30,4 +30,14 @@ std::vector<common::TimeseriesSample> InMemoryResultStore::samples(const std::st
     return iter->second;
 }
 
+ColumnarResult InMemoryResultStore::columnar(const std::string& run_id) const {
+    auto iter = storage_.find(run_id);
+    if (iter == storage_.end()) {
+        return to_columnar(run_id, {});
+    }
+    return to_columnar(run_id, iter->second);
+}
+
+void InMemoryResultStore::discard_run(const std::string& run_id) { storage_.erase(run_id); }
+
 }  // namespace evsim::storage
@@ -1,16 +1,19 @@
 #include "evsim/core/c_api.h"
 
 #include <memory>
+#include <string>
 #include "evsim/core/Scenario.hpp"
 
 #include "evsim/core/SimulationOrchestrator.hpp"
 #include "evsim/models/BatteryPackModel.hpp"
 #include "evsim/solvers/EulerSolver.hpp"
+#include "evsim/storage/ColumnarResult.hpp"
 
 namespace {
 
 struct OrchestratorHolder {
     evsim::SimulationOrchestrator orchestrator;
+    std::string last_run_id;
 
     OrchestratorHolder() {
         orchestrator.register_model(std::make_unique<evsim::models::BatteryPackModel>());
@@ -18,6 +21,10 @@ struct OrchestratorHolder {
     }
 };
 
+const evsim::storage::ColumnarResult* as_result(evsim_result_handle result) {
+    return static_cast<const evsim::storage::ColumnarResult*>(result);
+}
+
 }  // namespace
 
 extern "C" {
@@ -48,11 +55,75 @@ int evsim_run_default_scenario(evsim_orchestrator_handle handle, double time_ste
     scenario.step_count = steps;
 
     try {
-        holder->orchestrator.run(scenario);
+        holder->last_run_id = holder->orchestrator.run(scenario).run_id;
     } catch (...) {
         return -2;
     }
     return 0;
 }
 
+int evsim_discard_run(evsim_orchestrator_handle handle, const char* run_id) {
+    if (handle == nullptr) {
+        return -1;
+    }
+    auto* holder = static_cast<OrchestratorHolder*>(handle);
+    const std::string discarded = run_id == nullptr ? holder->last_run_id : std::string(run_id);
+    if (discarded.empty()) {
+        return 0;
+    }
+    holder->orchestrator.result_store().discard_run(discarded);
+    if (discarded == holder->last_run_id) {
+        holder->last_run_id.clear();
+    }
+    return 0;
+}
+
+evsim_result_handle evsim_export_last_run(evsim_orchestrator_handle handle) {
+    if (handle == nullptr) {
+        return nullptr;
+    }
+    auto* holder = static_cast<OrchestratorHolder*>(handle);
+    if (holder->last_run_id.empty()) {
+        return nullptr;
+    }
+    try {
+        return new evsim::storage::ColumnarResult(holder->orchestrator.result_store().columnar(holder->last_run_id));
+    } catch (...) {
+        return nullptr;
+    }
+}
+
+void evsim_destroy_result(evsim_result_handle result) { delete as_result(result); }
+
+const char* evsim_result_run_id(evsim_result_handle result) {
+    return result == nullptr ? nullptr : as_result(result)->run_id.c_str();
+}
+
+std::size_t evsim_result_sample_count(evsim_result_handle result) {
+    return result == nullptr ? 0 : as_result(result)->sample_count();
+}
+
+std::size_t evsim_result_channel_count(evsim_result_handle result) {
+    return result == nullptr ? 0 : as_result(result)->channel_count();
+}
+
+const char* evsim_result_channel_name(evsim_result_handle result, std::size_t channel) {
+    if (result == nullptr || channel >= as_result(result)->channel_count()) {
+        return nullptr;
+    }
+    return as_result(result)->channel_names[channel].c_str();
+}
+
+const double* evsim_result_timestamps(evsim_result_handle result) {
+    return result == nullptr ? nullptr : as_result(result)->timestamps.data();
+}
+
+const double* evsim_result_values(evsim_result_handle result) {
+    return result == nullptr ? nullptr : as_result(result)->values.data();
+}
+
+const double* evsim_result_channel_data(evsim_result_handle result, std::size_t channel) {
+    return result == nullptr ? nullptr : as_result(result)->channel_data(channel);
+}
+
 }  // extern "C"
@@ -0,0 +1,65 @@
+#include <cassert>
+#include <cmath>
+#include <cstring>
+#include <iostream>
+#include <string>
+
+#include "evsim/core/c_api.h"
+#include "evsim/storage/ColumnarResult.hpp"
+
+int main() {
+    // Layout of the conversion itself, including a signal missing in one sample.
+    evsim::common::Timeseries samples(3);
+    for (std::size_t row = 0; row < samples.size(); ++row) {
+        samples[row].timestamp = static_cast<double>(row) * 0.5;
+        samples[row].signals["b"] = static_cast<double>(row);
+        if (row != 1) {
+            samples[row].signals["a"] = 10.0 + static_cast<double>(row);
+        }
+    }
+    const auto columnar = evsim::storage::to_columnar("run", samples);
+    assert(columnar.channel_count() == 2);
+    assert(columnar.channel_names[0] == "a" && columnar.channel_names[1] == "b");
+    assert(columnar.channel_data(0)[2] == 12.0);
+    assert(std::isnan(columnar.channel_data(0)[1]));
+    assert(columnar.channel_data(1) == columnar.values.data() + 3);
+    assert(columnar.channel_data(2) == nullptr);
+
+    // Round trip through the C API.
+    auto orchestrator = evsim_create_orchestrator();
+    assert(orchestrator != nullptr);
+    assert(evsim_export_last_run(orchestrator) == nullptr);
+    assert(evsim_run_default_scenario(orchestrator, 1.0, 25) == 0);
+
+    auto result = evsim_export_last_run(orchestrator);
+    assert(result != nullptr);
+    assert(evsim_discard_run(nullptr, nullptr) == -1);
+    assert(evsim_discard_run(orchestrator, nullptr) == 0);  // the result owns its buffers
+    assert(evsim_export_last_run(orchestrator) == nullptr);
+    assert(evsim_discard_run(orchestrator, "run_unknown") == 0);
+    evsim_destroy_orchestrator(orchestrator);
+
+    const std::size_t count = evsim_result_sample_count(result);
+    const std::size_t channels = evsim_result_channel_count(result);
+    assert(count == 25);
+    assert(channels == 4);
+    assert(std::strcmp(evsim_result_channel_name(result, 0), "pack.current") == 0);
+    assert(evsim_result_channel_name(result, channels) == nullptr);
+    assert(evsim_result_timestamps(result)[count - 1] == 24.0);
+
+    std::size_t soc_channel = channels;
+    for (std::size_t channel = 0; channel < channels; ++channel) {
+        assert(evsim_result_channel_data(result, channel) == evsim_result_values(result) + channel * count);
+        if (std::string(evsim_result_channel_name(result, channel)) == "pack.soc") {
+            soc_channel = channel;
+        }
+    }
+    assert(soc_channel < channels);
+    const double* soc = evsim_result_channel_data(result, soc_channel);
+    assert(soc[0] <= 1.0 && soc[count - 1] < soc[0]);
+
+    std::cout << "Exported " << channels << " channels x " << count << " samples from "
+              << evsim_result_run_id(result) << "\n";
+    evsim_destroy_result(result);
+    return 0;
+}
@@ -1,10 +1,26 @@
 """Pytest configuration for Python unit tests."""
 
+import os
 import pathlib
 import sys
 
+import pytest
+
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Provide a shared QGuiApplication instance for Qt tests."""
+
+    pytest.importorskip("PySide6")
+    from PySide6.QtGui import QGuiApplication
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication.instance()
+    if app is None:
+        app = QGuiApplication([])
+    return app
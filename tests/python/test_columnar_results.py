@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+
+from app.ui_qt.columnar_results import (
+    HAS_PYARROW,
+    read_columnar_header,
+    read_columnar_results,
+    scan_columnar_results,
+    write_columnar_results,
+)
+from app.ui_qt.pybamm_runner import SimulationResults, export_simulation_results
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class ColumnarResultsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.directory = pathlib.Path(self._tmpdir.name)
+        samples = 5000
+        time = np.arange(samples, dtype=np.float64) * 0.5
+        self.results = SimulationResults(
+            {
+                "Time [s]": time,
+                "Voltage [V]": 4.2 - time * 1e-4,
+                "Current [A]": np.sin(time / 60.0),
+                "Cell temperature [K]": 298.15 + time * 1e-3,
+            },
+            metadata={"run_id": "run-7", "preset": "Chen2020", "overrides": {"Ambient temperature [K]": 300.0}},
+        )
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_round_trip_keeps_samples_units_and_metadata(self) -> None:
+        for name, compression in (("run.parquet", "zstd"), ("run.arrow", "lz4"), ("plain.arrow", None)):
+            with self.subTest(name=name):
+                path = write_columnar_results(self.directory / name, self.results, compression=compression)
+                loaded = read_columnar_results(path)
+                self.assertEqual(list(loaded.keys()), list(self.results.keys()))
+                for channel in self.results:
+                    np.testing.assert_array_equal(loaded[channel], self.results[channel])
+                self.assertEqual(loaded.units, self.results.units)
+                self.assertEqual(loaded.metadata, self.results.metadata)
+
+    def test_projection_and_header_do_not_need_other_channels(self) -> None:
+        path = write_columnar_results(
+            self.directory / "run.parquet",
+            self.results,
+            compression={"Voltage [V]": "zstd", "Current [A]": "snappy"},
+            row_group_rows=1024,
+        )
+        header = read_columnar_header(path)
+        self.assertEqual(header.format, "parquet")
+        self.assertEqual(header.time_channel, "Time [s]")
+        self.assertEqual(header.channels, ["Voltage [V]", "Current [A]", "Cell temperature [K]"])
+        self.assertEqual(header.samples, 5000)
+        self.assertEqual(header.run_id, "run-7")
+        self.assertEqual(header.units["Cell temperature [K]"], "K")
+
+        projected = read_columnar_results(path, ["Current [A]"])
+        self.assertEqual(list(projected.keys()), ["Time [s]", "Current [A]"])
+        np.testing.assert_array_equal(projected["Current [A]"], self.results["Current [A]"])
+        with self.assertRaises(KeyError):
+            read_columnar_results(path, ["Missing [V]"])
+        with self.assertRaises(ValueError):
+            write_columnar_results(self.directory / "run.arrow", self.results, compression={"Voltage [V]": "zstd"})
+        with self.assertRaises(ValueError):
+            write_columnar_results(self.directory / "run.csv", self.results)
+
+    def test_compressed_arrow_reads_decode_only_projected_channels(self) -> None:
+        import pyarrow as pa  # type: ignore
+
+        path = write_columnar_results(
+            self.directory / "run.arrow", self.results, compression="zstd", row_group_rows=1024
+        )
+        column_bytes = self.results["Voltage [V]"].nbytes
+
+        def allocated(read: object) -> int:
+            # Decompressed buffers come from the default pool; count them in a proxy.
+            pool = pa.proxy_memory_pool(pa.default_memory_pool())
+            previous = pa.default_memory_pool()
+            pa.set_memory_pool(pool)
+            try:
+                read()  # type: ignore[operator]
+            finally:
+                pa.set_memory_pool(previous)
+            return pool.total_bytes_allocated()
+
+        self.assertLess(allocated(lambda: read_columnar_header(path)), column_bytes)
+        self.assertEqual(read_columnar_header(path).samples, 5000)
+        # Time plus the requested channel, not all four columns.
+        self.assertLess(allocated(lambda: read_columnar_results(path, ["Current [A]"])), 3 * column_bytes)
+        self.assertGreaterEqual(allocated(lambda: read_columnar_results(path)), 4 * column_bytes)
+
+    def test_sweep_exports_can_be_scanned_by_metadata(self) -> None:
+        # Without a run_id of its own every export is identified by its prefix.
+        results = SimulationResults.from_mapping(
+            self.results, metadata={"overrides": {"Ambient temperature [K]": 300.0}}
+        )
+        for index, preset in enumerate(("Chen2020", "Marquis2019", "Chen2020")):
+            export = export_simulation_results(
+                self.directory,
+                f"sweep_{index:04d}",
+                results,
+                include_mdf=False,
+                dat_format="parquet" if index % 2 == 0 else "arrow",
+                metadata={"preset": preset, "scenario": "fast-charge"},
+            )
+            self.assertEqual(export.dat_path.suffix, ".parquet" if index % 2 == 0 else ".arrow")
+
+        scanned = list(
+            scan_columnar_results(
+                self.directory,
+                ["Voltage [V]"],
+                where=lambda header: header.metadata["preset"] == "Chen2020",
+            )
+        )
+        self.assertEqual([path.name for path, _ in scanned], ["sweep_0000.parquet", "sweep_0002.parquet"])
+        for path, results in scanned:
+            self.assertEqual(list(results.keys()), ["Time [s]", "Voltage [V]"])
+            self.assertEqual(results.metadata["run_id"], path.stem)
+            self.assertEqual(results.metadata["scenario"], "fast-charge")
+            self.assertEqual(results.metadata["overrides"], {"Ambient temperature [K]": 300.0})
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()
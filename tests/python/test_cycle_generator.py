@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+
+from app.model.cycle_generator import (
+    WLTP_CLASS3,
+    CycleSpec,
+    Hold,
+    PhaseSpec,
+    Ramp,
+    Variation,
+    generate,
+    iter_chunks,
+    write_binary,
+    write_csv,
+)
+from app.model.drive_cycles import load_wltp_csv, open_cycle
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+WLTP_CSV = ROOT / "data" / "wltp" / "wltp_class3_cycle.csv"
+
+
+class CycleGeneratorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = pathlib.Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_reproduces_the_shipped_wltp_csv(self) -> None:
+        for chunk_samples in (7, 1 << 16):
+            target = self.tmp / f"wltp_{chunk_samples}.csv"
+            self.assertEqual(write_csv(WLTP_CLASS3, target, chunk_samples=chunk_samples), 1801)
+            self.assertEqual(target.read_bytes(), WLTP_CSV.read_bytes())
+
+    def test_binary_output_matches_the_generated_trace(self) -> None:
+        spec = dataclasses.replace(WLTP_CLASS3, repeat=3, sample_rate_hz=10.0)
+        target = self.tmp / "cycle.evdc"
+        self.assertEqual(write_binary(spec, target, chunk_samples=1000), spec.sample_count)
+
+        cycle = open_cycle(target)
+        reference = generate(spec)
+        self.assertEqual(len(cycle), 1 + 3 * 18000)
+        self.assertAlmostEqual(cycle.sample_interval, 0.1)
+        self.assertEqual(cycle.time_s[-1], 5400.0)
+        for name in ("time_s", "speed_kph", "distance_m", "phase_code"):
+            np.testing.assert_array_equal(getattr(cycle, name), getattr(reference, name), err_msg=name)
+        # At 10 Hz the distance of one cycle stays close to the 1 Hz trace.
+        one_hz = load_wltp_csv(WLTP_CSV)
+        self.assertAlmostEqual(cycle.distance_m[18000] / one_hz.distance_m[-1], 1.0, delta=0.01)
+
+    def test_chunks_are_bounded_and_independent_of_their_size(self) -> None:
+        spec = CycleSpec(
+            phases=(PhaseSpec("urban", 30, (Ramp(0.0, 30.0, 10), Hold(30.0, 5), Ramp(30.0, 0.0, 10), Hold(0.0, 5))),),
+            repeat=5,
+            sample_rate_hz=4.0,
+            variation=Variation(seed=3, scale_sigma=0.1, jitter_kph=2.0),
+        )
+        small = list(iter_chunks(spec, chunk_samples=50))
+        self.assertTrue(all(len(chunk) <= 50 for chunk in small))
+        self.assertEqual(sum(len(chunk) for chunk in small), spec.sample_count)
+        whole = generate(spec)
+        np.testing.assert_array_equal(np.concatenate([chunk.speed_kph for chunk in small]), whole.speed_kph)
+        np.testing.assert_array_equal(np.concatenate([chunk.distance_m for chunk in small]), whole.distance_m)
+        self.assertTrue(np.all(np.diff(whole.distance_m) >= 0.0))
+
+    def test_variation_is_seeded_and_keeps_stops(self) -> None:
+        base = dataclasses.replace(WLTP_CLASS3, repeat=2)
+        plain = generate(base)
+        varied = generate(dataclasses.replace(base, variation=Variation(seed=7, scale_sigma=0.05, jitter_kph=1.0)))
+        again = generate(dataclasses.replace(base, variation=Variation(seed=7, scale_sigma=0.05, jitter_kph=1.0)))
+        other = generate(dataclasses.replace(base, variation=Variation(seed=8, scale_sigma=0.05, jitter_kph=1.0)))
+
+        np.testing.assert_array_equal(varied.speed_kph, again.speed_kph)
+        self.assertFalse(np.array_equal(varied.speed_kph, other.speed_kph))
+        self.assertFalse(np.array_equal(varied.speed_kph, plain.speed_kph))
+        np.testing.assert_array_equal(varied.speed_kph[plain.speed_kph == 0.0], 0.0)
+        self.assertTrue(np.all(varied.speed_kph >= 0.0))
+        np.testing.assert_array_equal(varied.phase_code, plain.phase_code)
+
+    def test_jitter_handles_phases_shorter_than_its_window(self) -> None:
+        short = CycleSpec(phases=(PhaseSpec("low", 3, (Ramp(0, 10, 3),)),), variation=Variation(jitter_kph=1.0))
+        cycle = generate(short)
+        self.assertEqual(len(cycle), 4)
+        fast = dataclasses.replace(short, sample_rate_hz=10.0)
+        self.assertEqual(len(generate(fast)), 31)
+
+    def test_rejects_invalid_specs(self) -> None:
+        with self.assertRaises(ValueError):
+            CycleSpec(phases=())
+        with self.assertRaises(ValueError):
+            dataclasses.replace(WLTP_CLASS3, repeat=0)
+        with self.assertRaises(ValueError):
+            dataclasses.replace(WLTP_CLASS3, sample_rate_hz=0.0)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from app.model import dat_reader
+from app.model.dat_reader import DatFile, read_dat, read_dat_groups, read_dat_header
+from app.model.drive_cycles import load_wltp_csv
+from app.model.single_cell_engine import default_cells, simulate_batch
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+RESULTS_DAT = ROOT / "data" / "wltp" / "wltp_single_cell_results.dat"
+WLTP_CSV = ROOT / "data" / "wltp" / "wltp_class3_cycle.csv"
+
+
+def _naive_read(path: pathlib.Path) -> dict:
+    lines = [line for line in path.read_text(encoding="utf-8").splitlines() if not line.startswith("#")]
+    names = lines[0].split("\t")
+    rows = [[float(value) for value in line.split("\t")] for line in lines[1:]]
+    return {name: np.array([row[i] for row in rows]) for i, name in enumerate(names)}
+
+
+class DatReaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = pathlib.Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_parses_the_wltp_metadata_header(self) -> None:
+        header = read_dat_header(RESULTS_DAT)
+        self.assertEqual(header.title, "WLTP single-cell simulation export")
+        self.assertEqual(header.metadata["WLTP source"], "data/wltp/wltp_class3_cycle.csv")
+        self.assertEqual(header.metadata["Ambient temperature [C]"], "25")
+        self.assertEqual([cell.cell_id for cell in header.cells], ["NMC811", "LFP", "NCA"])
+        self.assertEqual(header.cells[1].model_kind, "rc")
+        self.assertEqual(header.cells[2].capacity_ah, 4.5)
+        self.assertEqual(header.columns[0], "time_s")
+        self.assertEqual(header.prefixes, ["drive", "LFP", "NCA", "NMC811"])
+
+    def test_full_read_matches_a_text_parse(self) -> None:
+        expected = _naive_read(RESULTS_DAT)
+        with mock.patch.object(dat_reader, "DAT_BLOCK_BYTES", 4096):
+            table = read_dat(RESULTS_DAT)
+        self.assertEqual(list(table.columns), list(expected))
+        for name, values in expected.items():
+            np.testing.assert_array_equal(table[name], values, err_msg=name)
+
+    def test_projection_row_ranges_and_prefix_groups(self) -> None:
+        expected = _naive_read(RESULTS_DAT)
+        with DatFile(RESULTS_DAT) as dat:
+            self.assertEqual(dat.row_count, 1801)
+            window = dat.read(["drive.speed_kph"], prefixes=["LFP"], rows=(100, 250))
+            tail = dat.read(["NCA.soc"], rows=slice(-5, None))
+
+        self.assertEqual(window.row_offset, 100)
+        self.assertEqual(len(window), 150)
+        self.assertEqual(list(window.columns)[:3], ["time_s", "drive.speed_kph", "LFP.current_a"])
+        np.testing.assert_array_equal(window.time, expected["time_s"][100:250])
+        groups = window.by_prefix()
+        self.assertEqual(set(groups), {"drive", "LFP"})
+        self.assertIn("rc_surface_voltage_v", groups["LFP"])
+        np.testing.assert_array_equal(groups["LFP"]["voltage_v"], expected["LFP.voltage_v"][100:250])
+        self.assertTrue(groups["LFP"]["soc"].flags.c_contiguous)
+        np.testing.assert_array_equal(tail["NCA.soc"], expected["NCA.soc"][-5:])
+
+        time, cells = read_dat_groups(RESULTS_DAT, ["NMC811"])
+        self.assertEqual(len(time), 1801)
+        self.assertEqual(set(cells), {"NMC811"})
+
+    def test_reads_engine_exports_and_plain_dat_files(self) -> None:
+        result = simulate_batch(load_wltp_csv(WLTP_CSV), default_cells())
+        exported = self.tmp / "engine.dat"
+        result.write_dat(exported)
+        table = read_dat(exported, prefixes=["NMC811"])
+        self.assertEqual(list(table.columns)[1:3], ["NMC811.current_a", "NMC811.heat_w"])
+        np.testing.assert_allclose(table["NMC811.soc"], result.channel("NMC811.soc"), rtol=1e-5)
+
+        plain = self.tmp / "pybamm.dat"
+        plain.write_text("Time [s]\tVoltage [V]\n0\t4.2\n1.5\tnan\n\n", encoding="utf-8")
+        table = read_dat(plain)
+        self.assertEqual(read_dat_header(plain).metadata, {})
+        np.testing.assert_array_equal(table.time, [0.0, 1.5])
+        self.assertTrue(np.isnan(table["Voltage [V]"][1]))
+        self.assertEqual(table.by_prefix(), {"": {"Voltage [V]": table["Voltage [V]"]}})
+
+    def test_rejects_unknown_channels_and_strided_rows(self) -> None:
+        with DatFile(RESULTS_DAT) as dat:
+            with self.assertRaises(KeyError):
+                dat.read(["LFP.unknown"])
+            with self.assertRaises(KeyError):
+                dat.read(prefixes=["NMC"])
+            with self.assertRaises(ValueError):
+                dat.read(rows=slice(0, 10, 2))
+        empty = self.tmp / "empty.dat"
+        empty.write_text("", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            read_dat(empty)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pathlib
+import pickle
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+from app.model.drive_cycles import (
+    CACHE_FORMAT_VERSION,
+    compile_cycle,
+    load_cycle,
+    load_wltp_csv,
+    open_cycle,
+)
+from app.model.single_cell_engine import default_cells, simulate_batch
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+WLTP_CSV = ROOT / "data" / "wltp" / "wltp_class3_cycle.csv"
+
+
+class DriveCycleCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = pathlib.Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_cached_cycle_matches_the_csv(self) -> None:
+        parsed = load_wltp_csv(WLTP_CSV)
+        cached = load_cycle(WLTP_CSV, cache_dir=self.cache_dir)
+
+        self.assertIsInstance(cached.time_s, np.memmap)
+        self.assertFalse(cached.speed_kph.flags.writeable)
+        self.assertEqual(cached.phase_code.dtype, np.uint8)
+        for name in ("time_s", "speed_kph", "distance_m", "phase_code"):
+            np.testing.assert_array_equal(getattr(cached, name), getattr(parsed, name), err_msg=name)
+        self.assertEqual(cached.sample_interval, parsed.sample_interval)
+        self.assertEqual((cached.id, cached.source), (parsed.id, str(WLTP_CSV)))
+
+        parsed_run = simulate_batch(parsed, default_cells(), signals=("soc",))
+        cached_run = simulate_batch(cached, default_cells(), signals=("soc",))
+        np.testing.assert_array_equal(cached_run.signals["soc"], parsed_run.signals["soc"])
+        np.testing.assert_array_equal(cached_run.drive["drive.phase_id"], parsed_run.drive["drive.phase_id"])
+
+    def test_cache_is_keyed_by_source_content(self) -> None:
+        source = self.cache_dir / "cycle.csv"
+        source.write_text("time_s,phase,speed_kph,distance_m\n0,low,0.0,0.0\n2,medium,3.6,1.0\n", encoding="utf-8")
+        first = compile_cycle(source, self.cache_dir)
+        stamp = first.stat().st_mtime_ns
+        self.assertEqual(compile_cycle(source, self.cache_dir), first)
+        self.assertEqual(first.stat().st_mtime_ns, stamp)
+
+        source.write_text("time_s,phase,speed_kph\n0,high,0.0\n1,extra_high,7.2\n", encoding="utf-8")
+        second = compile_cycle(source, self.cache_dir)
+        self.assertNotEqual(second, first)
+        cycle = open_cycle(second)
+        np.testing.assert_array_equal(cycle.phase_code, [3, 4])
+        np.testing.assert_array_equal(cycle.distance_m, [0.0, 0.0])
+        self.assertEqual(cycle.sample_interval, 1.0)
+
+    def test_rejects_other_versions_and_rebuilds_them(self) -> None:
+        path = compile_cycle(WLTP_CSV, self.cache_dir)
+        with open(path, "r+b") as handle:
+            handle.seek(8)
+            handle.write(struct.pack("<I", CACHE_FORMAT_VERSION + 1))
+        with self.assertRaises(ValueError):
+            open_cycle(path)
+
+        self.assertEqual(compile_cycle(WLTP_CSV, self.cache_dir), path)
+        self.assertEqual(len(open_cycle(path)), len(load_wltp_csv(WLTP_CSV)))
+
+    def test_cached_cycles_pickle_as_their_path(self) -> None:
+        cycle = load_cycle(WLTP_CSV, cache_dir=self.cache_dir)
+        payload = pickle.dumps(cycle)
+        self.assertLess(len(payload), 1024)
+        restored = pickle.loads(payload)
+        self.assertEqual(restored.cache_path, cycle.cache_path)
+        self.assertEqual(restored.source, cycle.source)
+        np.testing.assert_array_equal(restored.speed_kph, cycle.speed_kph)
+
+        parsed = pickle.loads(pickle.dumps(load_wltp_csv(WLTP_CSV)))
+        self.assertIsNone(parsed.cache_path)
+        np.testing.assert_array_equal(parsed.speed_kph, cycle.speed_kph)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+
+from app.model.exporters import HAS_ASAMMDF, iter_timeseries_mdf4
+
+
+@unittest.skipUnless(HAS_ASAMMDF, "asammdf is not installed")
+class IterTimeseriesMdf4Test(unittest.TestCase):
+    def setUp(self) -> None:
+        from asammdf import MDF, Signal  # type: ignore
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self._tmpdir.name) / "measurement.mf4"
+        fast_time = np.arange(1000) / 10.0
+        slow_time = np.arange(10, dtype=np.float64)
+        mdf = MDF()
+        mdf.append(
+            [
+                Signal(samples=np.sin(fast_time), timestamps=fast_time, name="voltage"),
+                Signal(samples=np.cos(fast_time), timestamps=fast_time, name="current"),
+            ]
+        )
+        mdf.append([Signal(samples=slow_time * 2.0, timestamps=slow_time, name="temperature")])
+        mdf.save(self.path, overwrite=True)
+        self.fast_time = fast_time
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_streams_selected_channel_in_chunks(self) -> None:
+        blocks = list(iter_timeseries_mdf4(self.path, ["voltage"], chunk_size=300))
+
+        self.assertEqual([len(block) for block in blocks], [300, 300, 300, 100])
+        self.assertEqual([block.offset for block in blocks], [0, 300, 600, 900])
+        self.assertEqual(set(blocks[0].channels), {"voltage"})
+        np.testing.assert_allclose(np.concatenate([block.timestamps for block in blocks]), self.fast_time)
+        np.testing.assert_allclose(
+            np.concatenate([block.channels["voltage"] for block in blocks]), np.sin(self.fast_time)
+        )
+
+    def test_memory_cap_limits_block_size(self) -> None:
+        blocks = list(iter_timeseries_mdf4(self.path, ["voltage", "current"], max_memory=24 * 128))
+        self.assertTrue(all(len(block) <= 128 for block in blocks))
+        self.assertEqual(sum(len(block) for block in blocks), 1000)
+
+    def test_all_channels_are_grouped_by_time_base(self) -> None:
+        blocks = list(iter_timeseries_mdf4(self.path))
+        self.assertEqual([block.group for block in blocks], [0, 1])
+        self.assertEqual(set(blocks[0].channels), {"voltage", "current"})
+        np.testing.assert_allclose(blocks[1].channels["temperature"], np.arange(10) * 2.0)
+
+    def test_unknown_channel_is_rejected(self) -> None:
+        with self.assertRaises(KeyError):
+            list(iter_timeseries_mdf4(self.path, ["missing"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Tests for the evsim_core ctypes client and the orchestrator handle pool."""
+
+import gc
+import os
+import pathlib
+import threading
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.ui_qt.orchestrator_client import (  # noqa: E402  (import after skip)
+    OrchestratorClient,
+    OrchestratorPool,
+    ScenarioRequest,
+)
+
+
+@pytest.fixture()
+def client():
+    library = os.environ.get("EVSIM_CORE_LIBRARY")
+    try:
+        client = OrchestratorClient(pathlib.Path(library) if library else None)
+    except FileNotFoundError:
+        pytest.skip("evsim_core shared library has not been built")
+    yield client
+    client.close()
+
+
+def test_export_requires_a_completed_run(client):
+    with pytest.raises(RuntimeError, match="No completed run"):
+        client.export_last_run()
+
+
+def test_last_run_is_exported_as_column_views(client):
+    client.run_default_scenario(0.5, 40)
+    result = client.export_last_run()
+
+    assert len(result) == 40
+    assert result.channel_names == sorted(result.channel_names)
+    assert {"pack.soc", "pack.voltage", "pack.current", "pack.power_kw"} <= set(result)
+    np.testing.assert_allclose(result.timestamps, np.arange(40) * 0.5)
+
+    soc = result["pack.soc"]
+    assert soc.base is not None and not soc.flags.writeable
+    assert np.shares_memory(soc, result.values)
+    assert np.all(np.diff(soc) <= 0.0) and soc[0] <= 1.0
+
+    series = result.series()
+    assert list(series)[0] == "time [s]"
+    assert series["pack.voltage"] is not None and len(series["pack.voltage"]) == 40
+
+
+def test_discarded_runs_are_freed_but_exports_stay_valid(client):
+    client.run_default_scenario(1.0, 10)
+    result = client.export_last_run()
+    client.discard_run()
+    with pytest.raises(RuntimeError, match="No completed run"):
+        client.export_last_run()
+    assert len(result) == 10 and result.run_id == "run_1"
+
+    client.run_default_scenario(1.0, 5)
+    client.discard_run("run_2")
+    client.discard_run("run_2")  # unknown ids are ignored
+    with pytest.raises(RuntimeError, match="No completed run"):
+        client.export_last_run()
+
+
+def test_views_outlive_the_result_and_the_client(client):
+    client.run_default_scenario(1.0, 10)
+    soc = client.export_last_run()["pack.soc"]
+    client.close()
+    gc.collect()
+    assert soc.shape == (10,)
+    assert 0.0 <= float(soc[-1]) <= 1.0
+
+
+class _FakeClient:
+    """Stands in for a native handle and records how it is used."""
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def __init__(self):
+        self.closed = False
+        self.runs = []
+        self.discarded = 0
+
+    def run_default_scenario(self, time_step, steps):
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.peak = max(cls.peak, cls.running)
+        time.sleep(0.01)
+        self.runs.append((time_step, steps))
+        with cls.lock:
+            cls.running -= 1
+
+    def export_last_run(self):
+        return self.runs[-1]
+
+    def discard_run(self, run_id=None):
+        self.discarded += 1
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_bounds_handles_and_keeps_submission_order():
+    clients = []
+
+    def factory():
+        clients.append(_FakeClient())
+        return clients[-1]
+
+    _FakeClient.peak = 0
+    requests = [ScenarioRequest(time_step=0.1 * (index + 1), steps=index + 1) for index in range(8)]
+    with OrchestratorPool(2, client_factory=factory) as pool:
+        outcomes = pool.map(requests)
+        skipped = pool.submit(ScenarioRequest(collect_results=False)).result()
+
+    assert [outcome.result for outcome in outcomes] == [(r.time_step, r.steps) for r in requests]
+    assert skipped.result is None
+    assert len(clients) == pool.handle_count <= 2
+    assert _FakeClient.peak <= 2
+    assert sum(len(client.runs) for client in clients) == 9
+    assert all(client.discarded == len(client.runs) for client in clients)
+    assert all(client.closed for client in clients)
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.run(ScenarioRequest())
+
+
+def test_pool_checkout_waits_for_a_free_handle():
+    pool = OrchestratorPool(1, client_factory=_FakeClient)
+    order = []
+    with pool.client() as first:
+        worker = threading.Thread(target=lambda: order.append(pool.run(ScenarioRequest(steps=3)).result))
+        worker.start()
+        time.sleep(0.05)
+        order.append("released")
+    worker.join(5)
+    pool.close()
+
+    assert order == ["released", (1.0, 3)]
+    assert first.closed
+
+
+def test_pool_runs_native_scenarios_concurrently(client):
+    library = os.environ.get("EVSIM_CORE_LIBRARY")
+    requests = [ScenarioRequest(time_step=dt, steps=steps) for dt, steps in ((1.0, 10), (0.5, 30), (2.0, 5))]
+    with OrchestratorPool(2, library_path=pathlib.Path(library) if library else None) as pool:
+        futures = pool.submit_many(requests)
+        outcomes = [future.result(timeout=30) for future in futures]
+
+    for request, outcome in zip(requests, outcomes):
+        assert len(outcome.result) == request.steps
+        assert outcome.result.timestamps[-1] == pytest.approx((request.steps - 1) * request.time_step)
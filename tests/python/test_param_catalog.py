@@ -0,0 +1,90 @@
+"""Tests for the schema list models exposed by ParamCatalog."""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QModelIndex  # noqa: E402  (import after skip)
+
+from app.model.param_catalog import FieldListModel, ParamCatalog  # noqa: E402
+
+SCHEMA = [
+    {
+        "id": "cell",
+        "label": "Cell",
+        "sections": [
+            {
+                "label": "General",
+                "fields": [
+                    {"key": "chemistry", "label": "Chemistry", "type": "enum", "options": ["A", "B"], "default": "A"},
+                    {"key": "cell.mass", "label": "Mass", "type": "number", "unit": "g", "advanced": True},
+                ],
+            },
+            {"label": "Empty", "fields": []},
+        ],
+    },
+    {"id": "thermal", "label": "Thermal", "sections": [{"label": "Ambient", "fields": [{"key": "t", "label": "T", "type": "number"}]}]},
+]
+
+
+def _roles(model):
+    return {bytes(name).decode(): role for role, name in model.roleNames().items()}
+
+
+def test_category_tree_is_built_lazily_from_one_snapshot(qapp):
+    catalog = ParamCatalog(SCHEMA)
+    categories = catalog.categoryModel
+    assert categories is catalog.categoryModel
+    assert categories.rowCount() == 2
+    assert categories._section_models == {}
+
+    roles = _roles(categories)
+    index = categories.index(0, 0)
+    assert categories.data(index, roles["label"]) == "Cell"
+    assert categories.data(index, roles["sectionCount"]) == 2
+    sections = categories.data(index, roles["sections"])
+    assert sections is categories.sectionsModel(0)
+    assert list(categories._section_models) == [0]
+
+    fields = catalog.fieldsModel(0, 0)
+    assert isinstance(fields, FieldListModel)
+    assert fields is sections.fieldsModel(0)
+    assert catalog.fieldsModel(0, 5) is None
+    assert catalog.fieldsModel(7, 0) is None
+    assert catalog.sectionTitle(1, 0) == "Thermal · Ambient"
+    assert catalog.sectionTitle(1, 3) == ""
+
+
+def test_field_model_roles_and_matching(qapp):
+    catalog = ParamCatalog(SCHEMA)
+    fields = catalog.fieldsModel(0, 0)
+    roles = _roles(fields)
+    first = fields.index(0, 0)
+
+    assert fields.rowCount() == 2
+    assert fields.rowCount(first) == 0
+    assert fields.data(first, roles["key"]) == "chemistry"
+    assert fields.data(fields.index(1, 0), roles["unit"]) == "g"
+    assert fields.data(fields.index(1, 0), roles["advanced"]) is True
+    assert fields.data(QModelIndex(), roles["label"]) is None
+
+    definition = fields.data(first, roles["field"])
+    assert definition == SCHEMA[0]["sections"][0]["fields"][0]
+    definition["options"].append("C")
+    assert catalog.field_options("chemistry") == ["A", "B"]
+
+    assert fields.countMatching("", False) == 1
+    assert fields.countMatching("MASS", True) == 1
+    assert catalog.categoryModel.sectionsModel(0).countMatching("cell.", True) == 1
+
+
+def test_schema_snapshot_is_isolated_from_callers(qapp):
+    source = [dict(SCHEMA[1], sections=[dict(SCHEMA[1]["sections"][0])])]
+    catalog = ParamCatalog(source)
+    source[0]["label"] = "Changed"
+
+    copy = catalog.categories_schema()
+    assert copy[0]["label"] == "Thermal"
+    copy[0]["sections"].clear()
+    assert catalog.categoryModel.sectionsModel(0).rowCount() == 1
+    assert [field.key for field in catalog.iter_fields()] == ["t"]
@@ -0,0 +1,134 @@
+"""Tests for batched updates and change notifications in ParamStore."""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from app.model.param_catalog import ParamCatalog  # noqa: E402  (import after skip)
+from app.model.param_store import ParamStore  # noqa: E402
+
+SCHEMA = [
+    {
+        "label": "Cell",
+        "sections": [
+            {
+                "label": "General",
+                "fields": [
+                    {"key": "chemistry", "label": "Chemistry", "type": "enum", "options": ["A", "B"], "default": "A"},
+                    {"key": "cell.mass", "label": "Mass", "type": "number", "default": 10.0},
+                    {"key": "cell.note", "label": "Note", "type": "text"},
+                ],
+            }
+        ],
+    }
+]
+
+
+@pytest.fixture()
+def store(qapp):
+    store = ParamStore(ParamCatalog(SCHEMA))
+    events = {"changed": [], "values": []}
+    store.changed.connect(lambda key, value: events["changed"].append((key, value)))
+    store.valuesChanged.connect(lambda diff: events["values"].append(diff))
+    store.events = events
+    return store
+
+
+def test_set_values_emits_one_diff(store):
+    store.setValues({"chemistry": "B", "cell.mass": 10.0, "cell.note": "x", "extra": 1})
+
+    assert store.events["changed"] == []
+    assert store.events["values"] == [{"chemistry": "B", "cell.note": "x", "extra": 1}]
+    assert store.getValue("extra") == 1
+
+    store.setValues({"cell.note": None, "chemistry": "B"})
+    assert store.events["values"][-1] == {"cell.note": None}
+    assert "cell.note" not in store.view()
+
+    store.setValues({"chemistry": "B"})
+    assert len(store.events["values"]) == 2
+
+
+def test_single_edits_keep_the_per_key_signal(store):
+    store.setValue("cell.mass", 12.5)
+    store.setValue("cell.mass", 12.5)
+
+    assert store.events["changed"] == [("cell.mass", 12.5), ("cell.mass", 12.5)]
+    assert store.events["values"] == [{"cell.mass": 12.5}]
+
+
+def test_nested_transactions_commit_once_and_roll_back_on_error(store):
+    with store.transaction():
+        store.setValue("chemistry", "B")
+        with store.transaction():
+            store.setValue("cell.mass", 3.0)
+            store.setValue("cell.mass", 10.0)
+        assert store.events["values"] == []
+    assert store.events["values"] == [{"chemistry": "B"}]
+
+    with pytest.raises(KeyError):
+        with store.transaction():
+            store.setValues({"chemistry": "A", "cell.note": "draft"})
+            raise KeyError("boom")
+    assert store.getValue("chemistry") == "B"
+    assert "cell.note" not in store.view()
+    assert len(store.events["values"]) == 1
+
+    with pytest.raises(RuntimeError):
+        store.commitTransaction()
+
+
+def test_view_is_live_and_read_only(store):
+    view = store.view()
+    with pytest.raises(TypeError):
+        view["chemistry"] = "B"
+    store.setValue("chemistry", "B")
+    assert view["chemistry"] == "B"
+    assert store.property("values") == {"chemistry": "B", "cell.mass": 10.0}
+
+
+def test_revisions_track_the_keys_of_each_change_set(store):
+    assert store.revision == 0
+    store.setValues({"chemistry": "B", "cell.note": "x"})
+    store.setValue("cell.mass", 4.0)
+
+    assert store.revision == 2
+    assert store.keyRevision("chemistry") == 1
+    assert store.keyRevision("cell.mass") == 2
+    assert store.keyRevision("unknown") == 0
+
+    store.setValues({"chemistry": "B"})
+    assert store.revision == 2
+
+
+def test_rollback_keeps_revision_history(store):
+    store.setValue("chemistry", "B")
+    with pytest.raises(KeyError):
+        with store.transaction():
+            store.setValue("chemistry", "C")
+            raise KeyError("boom")
+
+    assert store.revision == 1
+    assert store.keyRevision("chemistry") == 1
+
+
+def test_nested_rollback_marks_the_outer_transaction_rollback_only(store):
+    with pytest.raises(RuntimeError, match="nested transaction failed"):
+        with store.transaction():
+            store.setValue("chemistry", "B")
+            with pytest.raises(KeyError):
+                with store.transaction():
+                    store.setValue("cell.mass", 3.0)
+                    raise KeyError("boom")
+            assert store.getValue("cell.mass") == 10.0
+            # Later edits still join the outer transaction instead of emitting.
+            store.setValue("cell.note", "draft")
+            assert store.events["changed"] == []
+
+    assert store.getValue("chemistry") == "A"
+    assert "cell.note" not in store.view()
+    assert store.events["values"] == []
+    assert store.revision == 0
+
+    store.setValues({"chemistry": "B"})
+    assert store.events["values"] == [{"chemistry": "B"}]
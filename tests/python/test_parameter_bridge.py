@@ -0,0 +1,449 @@
+"""Tests for the models, preview engine and scenario persistence behind the parameter bridge."""
+
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication  # noqa: E402  (import after skip)
+
+from app.ui_qt.parameter_bridge import (  # noqa: E402
+    ParameterBridge,
+    ParameterDefinition,
+    ParameterFilterModel,
+    ParameterListModel,
+    ParameterSearchIndex,
+    PreviewEngine,
+    PyBammProcessor,
+    ScenarioStore,
+)
+from app.ui_qt.schema_cache import SchemaCache, SchemaCacheKey  # noqa: E402
+
+
+class _FakeParameterValues(dict):
+    instances = 0
+    updates = []
+
+    def __init__(self, chemistry=None):
+        super().__init__(chemistry)
+        type(self).instances += 1
+
+    def update(self, values):  # noqa: D401 - mirrors pybamm.ParameterValues.update
+        for key in values:
+            if key not in self:
+                raise KeyError(key)
+        type(self).updates.append(dict(values))
+        super().update(values)
+
+    def process_model(self, model):
+        model.processed = True
+
+
+@pytest.fixture
+def fake_pybamm(monkeypatch):
+    _FakeParameterValues.instances = 0
+    _FakeParameterValues.updates = []
+    module = types.ModuleType("pybamm")
+    module.logger = types.SimpleNamespace(verbose=True)
+    module.lithium_ion = types.SimpleNamespace(DFN=lambda: types.SimpleNamespace(processed=False))
+    module.parameter_sets = types.SimpleNamespace(
+        Chen2020={
+            "Nominal cell capacity [A.h]": 5.0,
+            "Negative electrode thickness [m]": 8.52e-05,
+            "Ambient temperature [K]": 298.15,
+        }
+    )
+    module.ParameterValues = _FakeParameterValues
+    monkeypatch.setitem(sys.modules, "pybamm", module)
+    return module
+
+
+def _preview(engine, overrides):
+    return engine.preview(chemistry="lithium_ion", model="DFN", parameter_set="Chen2020", overrides=overrides)
+
+
+def test_engine_processes_once_and_applies_only_changed_overrides(fake_pybamm):
+    engine = PreviewEngine()
+
+    first = _preview(engine, {"Nominal cell capacity [A.h]": 4.0})
+    second = _preview(engine, {"Nominal cell capacity [A.h]": 4.0, "Ambient temperature [K]": 300.0})
+    third = _preview(engine, {"Ambient temperature [K]": 300.0})
+
+    assert _FakeParameterValues.instances == 1
+    assert _FakeParameterValues.updates == [
+        {"Nominal cell capacity [A.h]": 4.0},
+        {"Ambient temperature [K]": 300.0},
+        {"Nominal cell capacity [A.h]": 5.0},
+    ]
+    assert first["Nominal cell capacity [A.h]"] == 4.0
+    assert second["override_count"] == 2
+    assert third["Nominal cell capacity [A.h]"] == 5.0
+
+    defaults = engine.defaults(
+        chemistry="lithium_ion",
+        model="DFN",
+        parameter_set="Chen2020",
+        id_to_name={"ambient": "Ambient temperature [K]", "missing": "Unknown [1]"},
+    )
+    assert defaults == {"ambient": 298.15}
+    assert _FakeParameterValues.instances == 1
+
+
+def test_engine_builds_each_preset_once_under_concurrent_requests(fake_pybamm, monkeypatch):
+    process_model = _FakeParameterValues.process_model
+
+    def slow_process_model(self, model):
+        time.sleep(0.05)
+        process_model(self, model)
+
+    monkeypatch.setattr(_FakeParameterValues, "process_model", slow_process_model)
+    engine = PreviewEngine()
+    barrier = threading.Barrier(4)
+    states = []
+
+    def build():
+        barrier.wait()
+        states.append(engine._state("lithium_ion", "DFN", "Chen2020"))
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _FakeParameterValues.instances == 1
+    assert len(states) == 4 and all(state is states[0] for state in states)
+
+
+class _BlockingEngine:
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.requests = []
+        self.threads = set()
+
+    def preview(self, *, chemistry, model, parameter_set, overrides):
+        self.threads.add(threading.get_ident())
+        self.requests.append(dict(overrides))
+        self.started.set()
+        self.release.wait(5)
+        return {"preset": parameter_set, "override_count": len(overrides)}
+
+
+def test_processor_coalesces_bursts_on_a_worker_thread(qapp):
+    engine = _BlockingEngine()
+    processor = PyBammProcessor(engine=engine)
+    processor.configure(id_to_name={"a": "A [1]"}, chemistry="lithium_ion", model="DFN", preset="Chen2020")
+    previews = []
+    processor.previewReady.connect(previews.append)
+
+    processor._pending_overrides = {"a": 1}
+    processor._process()
+    assert engine.started.wait(5)
+    for value in (2, 3, 4):
+        processor._pending_overrides = {"a": value}
+        processor._process()
+    engine.release.set()
+
+    deadline = time.monotonic() + 5
+    while not previews and time.monotonic() < deadline:
+        processor.wait_for_idle(50)
+        QCoreApplication.processEvents()
+
+    assert engine.requests == [{"A [1]": 1}, {"A [1]": 4}]
+    assert threading.get_ident() not in engine.threads
+    assert previews == [{"preset": "Chen2020", "override_count": 1}]
+
+
+SCENARIO_YAML = """\
+pybamm:
+  chemistry: lithium_ion
+  model: DFN
+  default_preset: Chen2020
+  overrides:
+    a: 1
+"""
+
+
+def _scenario(tmp_path):
+    (tmp_path / "configs").mkdir()
+    path = tmp_path / "configs" / "scenario.yaml"
+    path.write_text(SCENARIO_YAML, encoding="utf-8")
+    return path
+
+
+def test_scenario_edits_are_journaled_and_flushed_atomically(tmp_path):
+    path = _scenario(tmp_path)
+    store = ScenarioStore(path, flush_delay_s=60)
+    store.set_override("b", 2.5)
+    store.set_override("a", None)
+    store.set_current_preset("Ecker2015")
+
+    assert path.read_text(encoding="utf-8") == SCENARIO_YAML
+    assert len(store.journal_path.read_text(encoding="utf-8").splitlines()) == 3
+    assert store.dirty
+
+    store.flush()
+    assert not store.dirty
+    assert not store.journal_path.exists()
+    reloaded = ScenarioStore(path)
+    assert reloaded.overrides == {"b": 2.5}
+    assert reloaded.current_preset == "Ecker2015"
+    store.close()
+    reloaded.close()
+
+
+def test_scenario_journal_is_replayed_after_a_crash(tmp_path):
+    path = _scenario(tmp_path)
+    store = ScenarioStore(path, flush_delay_s=60)
+    store.set_overrides({"x": 1, "y": 2})
+    store.set_override("y", 3)
+    # Simulate a crash: drop the store without flushing and tear the last append.
+    store._cancel_flush_timer()
+    store._journal.write('{"op":"set_override","id":')
+    store._journal.close()
+    store._journal = None
+    store._dirty = False
+
+    recovered = ScenarioStore(path)
+    assert recovered.overrides == {"x": 1, "y": 3}
+    assert not recovered.journal_path.exists()
+    assert "y: 3" in path.read_text(encoding="utf-8")
+    recovered.close()
+
+
+def test_scenario_flush_timer_persists_in_background(tmp_path):
+    path = _scenario(tmp_path)
+    store = ScenarioStore(path, flush_delay_s=0.01)
+    store.set_override("c", 7)
+    deadline = time.monotonic() + 5
+    while store.dirty and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not store.dirty
+    assert "c: 7" in path.read_text(encoding="utf-8")
+    store.close()
+
+
+def _parameter_model(count):
+    model = ParameterListModel()
+    model.set_items(
+        [
+            ParameterDefinition(
+                identifier=f"p{index}",
+                name=f"P{index} [m]",
+                label=f"P{index}",
+                type="number",
+                default=float(index),
+                value=float(index),
+                unit="m",
+                category="General",
+                advanced=False,
+            )
+            for index in range(count)
+        ]
+    )
+    ranges = []
+    model.dataChanged.connect(lambda first, last, roles: ranges.append((first.row(), last.row())))
+    return model, ranges
+
+
+def test_parameter_model_merges_contiguous_change_signals(qapp):
+    model, ranges = _parameter_model(10)
+    assert model.row_for("p7") == 7
+    assert model.row_for("unknown") == -1
+
+    model.update_defaults({"p0": 10.0, "p1": 11.0, "p2": 12.0, "p6": 16.0, "p9": 9.0, "unknown": 1.0})
+    assert ranges == [(0, 2), (6, 6)]
+    assert model.item("p1").value == 11.0
+
+    ranges.clear()
+    model.set_overrides({"p3": 1.5, "p4": 2.5})
+    assert ranges == [(3, 4)]
+    assert model.item("p3").override == 1.5
+
+    ranges.clear()
+    model.set_overrides({"p4": 2.5, "p5": 3.5})
+    assert ranges == [(3, 3), (5, 5)]
+    assert model.item("p3").override is None
+    assert model.item("p3").value == 3.0
+
+
+def test_parameter_model_collapses_fragmented_updates(qapp):
+    model, ranges = _parameter_model(200)
+    model.set_overrides({f"p{index}": -1.0 for index in range(0, 200, 2)})
+    assert ranges == [(0, 198)]
+
+
+def _definition(identifier, label, **kwargs):
+    values = dict(type="number", default=0.0, value=0.0, unit="", category="General", advanced=False)
+    values.update(kwargs)
+    return ParameterDefinition(identifier=identifier, name=label, label=label, **values)
+
+
+SEARCH_ITEMS = [
+    _definition("negative_electrode_thickness", "Negative electrode thickness"),
+    _definition("positive_electrode_thickness", "Positive electrode thickness"),
+    _definition("separator_thickness", "Separator thickness"),
+    _definition("thickness", "Thickness"),
+    _definition("ambient_temperature", "Ambient temperature", category="Thermal"),
+]
+
+
+def test_search_index_matches_substrings_and_ranks_results():
+    index = ParameterSearchIndex(SEARCH_ITEMS)
+    legacy = lambda query: {  # noqa: E731 - reference implementation
+        row
+        for row, item in enumerate(SEARCH_ITEMS)
+        if query.lower() in f"{item.label} {item.identifier}".lower()
+    }
+    for query in ("", "t", "th", "thick", "THICKNESS", "ive_el", "tive elec", "missing", "ambient_t"):
+        assert index.search(query) == legacy(query), query
+
+    assert index.ranked("thickness") == [3, 2, 0, 1]
+    assert index.ranked("electrode")[:2] == [0, 1]
+
+
+def test_search_index_narrows_from_previous_query():
+    index = ParameterSearchIndex(SEARCH_ITEMS)
+    first = index.search("thick")
+    index._trigrams = {}  # a narrowed query must not need the postings again
+    assert index.search("thickn") == first
+    assert index.search("separator thick") == frozenset({2})
+    assert index.search("positive thick") == frozenset()
+
+
+def test_filter_models_share_the_source_index(qapp):
+    model = ParameterListModel()
+    model.set_items(list(SEARCH_ITEMS))
+    main = ParameterFilterModel()
+    main.setSourceModel(model)
+    diff = ParameterFilterModel(diff_only=True)
+    diff.setSourceModel(model)
+    model.set_overrides({"separator_thickness": 1.0})
+
+    main.set_search("thick")
+    diff.set_search("thick")
+    assert main.rowCount() == 4
+    assert diff.rowCount() == 1
+
+    main.set_ranked(True)
+    labels = [main.data(main.index(row, 0), ParameterListModel.LabelRole) for row in range(main.rowCount())]
+    assert labels[0] == "Thickness"
+
+    main.set_category("Thermal")
+    main.set_search("temp")
+    assert main.rowCount() == 1
+
+    model.set_items([_definition("cell_temperature", "Cell temperature", category="Thermal")])
+    assert main.rowCount() == 1
+    assert main.data(main.index(0, 0), ParameterListModel.IdRole) == "cell_temperature"
+
+
+AUTO_SCENARIO_YAML = """\
+pybamm:
+  chemistry: lithium_ion
+  model: DFN
+  parameter_schema: auto
+  default_preset: Chen2020
+  presets:
+    - id: Chen2020
+  overrides:
+    ambient_temperature_k: 300.0
+"""
+
+
+def _auto_scenario(tmp_path):
+    (tmp_path / "CMakeLists.txt").write_text("", encoding="utf-8")
+    path = tmp_path / "configs" / "scenarios" / "auto.yaml"
+    path.parent.mkdir(parents=True)
+    path.write_text(AUTO_SCENARIO_YAML, encoding="utf-8")
+    return path
+
+
+def _bridge_items(bridge):
+    return {item.identifier: item for item in bridge._model.items()}
+
+
+def test_auto_schema_is_cached_and_loaded_without_pybamm(qapp, tmp_path, fake_pybamm, monkeypatch):
+    path = _auto_scenario(tmp_path)
+    bridge = ParameterBridge(path)
+    items = _bridge_items(bridge)
+    assert items["ambient_temperature_k"].value == 300.0
+    assert items["ambient_temperature_k"].default == 298.15
+    key = bridge._schema_cache_key()
+    assert SchemaCache.for_project(tmp_path).path_for(key).exists()
+    bridge.flushScenario()
+
+    monkeypatch.setitem(sys.modules, "pybamm", None)  # any import attempt now fails
+    cached_bridge = ParameterBridge(path)
+    cached_items = _bridge_items(cached_bridge)
+    assert sorted(cached_items) == sorted(items)
+    assert cached_items["ambient_temperature_k"].override == 300.0
+    assert cached_items["nominal_cell_capacity_a_h"].category == "Capacity"
+    cached_bridge.flushScenario()
+
+
+def test_string_parameters_are_shown_as_text_with_and_without_cache(qapp, tmp_path, fake_pybamm, monkeypatch):
+    fake_pybamm.parameter_sets.Chen2020["Electrolyte name"] = "LiPF6"
+    path = _auto_scenario(tmp_path)
+    path.write_text(AUTO_SCENARIO_YAML + "    electrolyte_name: 2\n", encoding="utf-8")
+    bridge = ParameterBridge(path)
+    fresh = _bridge_items(bridge)["electrolyte_name"]
+    assert (fresh.type, fresh.default, fresh.value) == ("string", "LiPF6", "2")
+    bridge.flushScenario()
+
+    monkeypatch.setitem(sys.modules, "pybamm", None)
+    cached_bridge = ParameterBridge(path)
+    assert _bridge_items(cached_bridge)["electrolyte_name"] == fresh
+    cached_bridge.flushScenario()
+
+
+def test_preset_defaults_are_built_off_the_gui_thread(qapp, tmp_path, fake_pybamm, monkeypatch):
+    fake_pybamm.parameter_sets.Marquis2019 = dict(fake_pybamm.parameter_sets.Chen2020)
+    fake_pybamm.parameter_sets.Marquis2019["Nominal cell capacity [A.h]"] = 0.68
+    threads = set()
+    process_model = _FakeParameterValues.process_model
+
+    def recording_process_model(self, model):
+        threads.add(threading.get_ident())
+        process_model(self, model)
+
+    monkeypatch.setattr(_FakeParameterValues, "process_model", recording_process_model)
+    path = _auto_scenario(tmp_path)
+    presets = AUTO_SCENARIO_YAML.replace("    - id: Chen2020\n", "    - id: Chen2020\n    - id: Marquis2019\n")
+    path.write_text(presets, encoding="utf-8")
+    bridge = ParameterBridge(path)
+    bridge.applyPreset("Marquis2019")
+    assert _bridge_items(bridge)["nominal_cell_capacity_a_h"].default == 5.0
+
+    deadline = time.monotonic() + 5
+    while _bridge_items(bridge)["nominal_cell_capacity_a_h"].default != 0.68 and time.monotonic() < deadline:
+        bridge._processor.wait_for_idle(50)
+        QCoreApplication.processEvents()
+
+    assert _bridge_items(bridge)["nominal_cell_capacity_a_h"].default == 0.68
+    assert threads and threading.get_ident() not in threads
+    bridge.flushScenario()
+
+
+def test_stale_schema_cache_is_used_then_rebuilt_in_background(qapp, tmp_path, fake_pybamm):
+    path = _auto_scenario(tmp_path)
+    cache = SchemaCache.for_project(tmp_path)
+    current = SchemaCacheKey.current(chemistry="lithium_ion", model="DFN", parameter_set="Chen2020")
+    old_key = SchemaCacheKey("0.0-old", "lithium_ion", "DFN", "Chen2020")
+    cache.store(old_key, [{"id": "legacy_only", "name": "Legacy only [V]", "label": "Legacy only", "default": 1.0}])
+
+    bridge = ParameterBridge(path)
+    assert list(_bridge_items(bridge)) == ["legacy_only"]
+    assert bridge.wait_for_schema_rebuild(5)
+    QCoreApplication.processEvents()
+
+    assert "legacy_only" not in _bridge_items(bridge)
+    assert "ambient_temperature_k" in _bridge_items(bridge)
+    refreshed = cache.load(current)
+    assert refreshed is not None and not refreshed.stale
+    bridge.flushScenario()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+import json
 import pathlib
 import sys
 import tempfile
@@ -7,7 +9,35 @@ import types
 import unittest
 from typing import Dict, List, Optional, Tuple
 
-from app.ui_qt.pybamm_runner import export_simulation_results, run_pybamm_simulation
+import numpy as np
+
+from app.ui_qt.pybamm_runner import (
+    BINARY_DAT_MAGIC,
+    SimulationResults,
+    clear_model_cache,
+    expand_sweep_points,
+    export_simulation_results,
+    get_model_cache,
+    read_binary_dat,
+    run_pybamm_simulation,
+    run_sweep,
+    stream_pybamm_simulation,
+    write_binary_dat,
+    write_dat_text,
+)
+from app.ui_qt.result_cache import ResultCache
+from app.ui_qt.run_catalog import RunCatalog, parse_condition
+
+
+def _reference_format(value: float) -> str:
+    """Row-by-row formatting rules of the original ``.dat`` writer."""
+
+    if value == 0:
+        return "0"
+    magnitude = abs(value)
+    if magnitude != 0 and (magnitude >= 1e4 or magnitude <= 1e-3):
+        return f"{value:.6e}"
+    return f"{value:.12g}"
 
 
 class ExportSimulationResultsTest(unittest.TestCase):
@@ -33,8 +63,28 @@ class ExportSimulationResultsTest(unittest.TestCase):
             content = export.dat_path.read_text(encoding="utf-8")
             self.assertIn("Time [s]\tTerminal voltage [V]", content.splitlines()[0])
 
+    def test_accepts_columnar_results(self) -> None:
+        results = SimulationResults(
+            {
+                "Time [s]": np.array([0.0, 1.0, 2.0]),
+                "Terminal voltage [V]": np.array([4.2, 4.1, 4.0]),
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export = export_simulation_results(pathlib.Path(tmpdir), "columnar", results, include_mdf=False)
+            lines = export.dat_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines, ["Time [s]\tTerminal voltage [V]", "0\t4.2", "1\t4.1", "2\t4"])
+
+    def test_rejects_mismatched_channel_lengths(self) -> None:
+        results = {"Time [s]": [0.0, 1.0], "Terminal voltage [V]": [4.2]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                export_simulation_results(pathlib.Path(tmpdir), "bad", results, include_mdf=False)
+
     def test_warns_when_asammdf_missing(self) -> None:
         module_backup = sys.modules.pop("asammdf", None)
+        # A ``None`` entry makes the import fail even when asammdf is installed.
+        sys.modules["asammdf"] = None  # type: ignore[assignment]
         try:
             with tempfile.TemporaryDirectory() as tmpdir:
                 export = export_simulation_results(
@@ -56,8 +106,10 @@ class ExportSimulationResultsTest(unittest.TestCase):
 class RunPyBammSimulationTest(unittest.TestCase):
     def setUp(self) -> None:
         self.module_backup = sys.modules.pop("pybamm", None)
+        clear_model_cache()
 
     def tearDown(self) -> None:
+        clear_model_cache()
         if self.module_backup is not None:
             sys.modules["pybamm"] = self.module_backup
         else:
@@ -84,6 +136,9 @@ class RunPyBammSimulationTest(unittest.TestCase):
             def tolist(self) -> List[float]:
                 return list(self._values)
 
+            def __array__(self, dtype: object = None, copy: object = None) -> np.ndarray:
+                return np.asarray(self._values, dtype=dtype)
+
             @property
             def entries(self) -> "FakeArray":
                 return self
@@ -94,6 +149,7 @@ class RunPyBammSimulationTest(unittest.TestCase):
                 self._variables: Dict[str, FakeArray] = {
                     "Terminal voltage [V]": FakeArray([4.2 for _ in t_eval]),
                     "Custom": FakeArray(list(range(len(t_eval)))),
+                    "Elapsed [s]": FakeArray(t_eval),
                 }
 
             def __getitem__(self, name: str) -> FakeArray:
@@ -101,17 +157,34 @@ class RunPyBammSimulationTest(unittest.TestCase):
 
         class FakeSimulation:
             last_t_eval: Optional[List[float]] = None
+            last_inputs: Optional[Dict[str, float]] = None
             last_parameter_values: Optional[FakeParameterValues] = None
             last_model_instance: Optional[object] = None
+            instances = 0
+            steps: List[Tuple[float, bool, Optional[Dict[str, float]]]] = []
 
             def __init__(self, model_instance: object, parameter_values: FakeParameterValues) -> None:
+                type(self).instances += 1
                 type(self).last_model_instance = model_instance
                 type(self).last_parameter_values = parameter_values
 
-            def solve(self, t_eval: List[float]) -> FakeSolution:
+            def solve(self, t_eval: List[float], inputs: Optional[Dict[str, float]] = None) -> FakeSolution:
                 type(self).last_t_eval = [float(value) for value in t_eval]
+                type(self).last_inputs = inputs
                 return FakeSolution(type(self).last_t_eval)
 
+            def step(
+                self,
+                dt: float,
+                t_eval: List[float],
+                save: bool = True,
+                starting_solution: Optional[FakeSolution] = None,
+                inputs: Optional[Dict[str, float]] = None,
+            ) -> FakeSolution:
+                type(self).steps.append((float(dt), save, inputs))
+                t_start = np.asarray(starting_solution.t)[-1] if starting_solution is not None else 0.0
+                return FakeSolution([float(t_start + value) for value in t_eval])
+
         def fake_model_factory() -> dict[str, str]:
             return {"model": "dfn"}
 
@@ -144,13 +217,18 @@ class RunPyBammSimulationTest(unittest.TestCase):
             extra_variables=["Custom"],
         )
 
+        self.assertIsInstance(results, SimulationResults)
         self.assertIn("Time [s]", results)
-        self.assertEqual(results["Time [s]"], [0.0, 10.0, 20.0])
-        self.assertEqual(results["Custom"], [0, 1, 2])
+        self.assertEqual(results["Time [s]"].tolist(), [0.0, 10.0, 20.0])
+        self.assertEqual(results["Custom"].tolist(), [0, 1, 2])
+        self.assertEqual(results.unit("Terminal voltage [V]"), "V")
+        self.assertEqual(results.metadata["parameter_set"], "TestSet")
+        self.assertEqual(results.metadata["overrides"], {"My parameter": 3.14})
         parameter_values = fake_module.ParameterValues.last_instance
         self.assertIsNotNone(parameter_values)
         self.assertEqual(parameter_values.chemistry, "chemistry_source")
-        self.assertEqual(parameter_values.updated_with, {"My parameter": 3.14})
+        self.assertEqual(parameter_values.updated_with, {"My parameter": "[input]"})
+        self.assertEqual(fake_module.Simulation.last_inputs, {"My parameter": 3.14})
         self.assertEqual(fake_module.Simulation.last_t_eval, [0.0, 10.0, 20.0])
         self.assertEqual(fake_module.Simulation.last_model_instance, {"model": "dfn"})
 
@@ -169,5 +247,518 @@ class RunPyBammSimulationTest(unittest.TestCase):
         self.assertEqual(len(results["Time [s]"]), 361)
         self.assertEqual(len(results["Terminal voltage [V]"]), 361)
 
+    def test_reuses_built_simulation_when_only_override_values_change(self) -> None:
+        fake_module = self._install_fake_pybamm()
+
+        for value in (1.0, 2.0, 3.0):
+            run_pybamm_simulation(
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="TestSet",
+                overrides={"My parameter": value},
+                t_eval=[0, 1],
+            )
+
+        self.assertEqual(fake_module.Simulation.instances, 1)
+        self.assertEqual(fake_module.Simulation.last_inputs, {"My parameter": 3.0})
+        self.assertEqual(get_model_cache().hits, 2)
+
+    def test_rebuilds_when_overridden_names_or_static_values_change(self) -> None:
+        fake_module = self._install_fake_pybamm()
+
+        for overrides in (
+            {"My parameter": 1.0},
+            {"Other parameter": 1.0},
+            {"My parameter": 1.0, "Function": "a"},
+            {"My parameter": 2.0, "Function": "b"},
+        ):
+            run_pybamm_simulation(
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="TestSet",
+                overrides=overrides,
+                t_eval=[0, 1],
+            )
+
+        self.assertEqual(fake_module.Simulation.instances, 4)
+        parameter_values = fake_module.ParameterValues.last_instance
+        self.assertEqual(parameter_values.updated_with, {"Function": "b", "My parameter": "[input]"})
+
+    def test_bypasses_cache_when_disabled(self) -> None:
+        fake_module = self._install_fake_pybamm()
+
+        for _ in range(2):
+            run_pybamm_simulation(
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="TestSet",
+                overrides={},
+                t_eval=[0, 1],
+                use_cache=False,
+            )
+
+        self.assertEqual(fake_module.Simulation.instances, 2)
+        self.assertEqual(len(get_model_cache()), 0)
+
+    def test_result_cache_skips_repeated_solves(self) -> None:
+        fake_module = self._install_fake_pybamm()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResultCache(pathlib.Path(tmpdir))
+            runs = []
+            for value in (1.0, 2.0, 1):
+                runs.append(
+                    run_pybamm_simulation(
+                        chemistry="lithium_ion",
+                        model="DFN",
+                        parameter_set="TestSet",
+                        overrides={"My parameter": value},
+                        t_eval=[0, 10, 20],
+                        extra_variables=["Custom"],
+                        use_cache=False,
+                        result_cache=cache,
+                    )
+                )
+
+        # The third run repeats the first (1 == 1.0) and is not solved again.
+        self.assertEqual(fake_module.Simulation.instances, 2)
+        self.assertEqual(fake_module.Simulation.last_inputs, {"My parameter": 2.0})
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        first, _, repeated = runs
+        self.assertNotIn("cache_hit", first.metadata)
+        self.assertTrue(repeated.metadata["cache_hit"])
+        self.assertEqual(repeated.metadata["overrides"], {"My parameter": 1.0})
+        self.assertEqual(list(repeated.keys()), list(first.keys()))
+        for channel in first:
+            np.testing.assert_array_equal(repeated[channel], first[channel])
+
+    def test_stream_replays_cached_results(self) -> None:
+        fake_module = self._install_fake_pybamm()
+        t_eval = np.arange(101, dtype=np.float64)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_dir = pathlib.Path(tmpdir)
+            cache = ResultCache(export_dir / "cache")
+            progress: List[List[int]] = [[], []]
+            exports = []
+            for index in range(2):
+                exports.append(
+                    stream_pybamm_simulation(
+                        export_dir,
+                        f"stream_{index}",
+                        chemistry="lithium_ion",
+                        model="DFN",
+                        parameter_set="TestSet",
+                        overrides={"My parameter": 2.0},
+                        t_eval=t_eval,
+                        extra_variables=["Elapsed [s]"],
+                        include_mdf=False,
+                        window_s=30.0,
+                        on_window=lambda update, index=index: progress[index].append(update.rows),
+                        result_cache=cache,
+                    )
+                )
+            texts = [export.dat_path.read_text(encoding="utf-8") for export in exports]
+
+            entries = sorted(path.name for path in cache.root.iterdir())
+
+        self.assertEqual(texts[0], texts[1])
+        self.assertEqual(progress, [[31, 61, 91, 101], [31, 61, 91, 101]])
+        self.assertEqual(fake_module.Simulation.instances, 1)
+        self.assertEqual(len(fake_module.Simulation.steps), 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # The windows were spooled to disk; only the assembled entry is left.
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(entries[0].endswith(".bdat"))
+
+    def test_stream_does_not_cache_runs_larger_than_an_entry(self) -> None:
+        self._install_fake_pybamm()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_dir = pathlib.Path(tmpdir)
+            # Two windows of 31 rows x 3 channels fit, the whole run does not.
+            cache = ResultCache(export_dir / "cache", max_entry_bytes=2 * 31 * 3 * 8)
+            export = stream_pybamm_simulation(
+                export_dir,
+                "long",
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="TestSet",
+                overrides={},
+                t_eval=np.arange(101, dtype=np.float64),
+                extra_variables=["Elapsed [s]"],
+                include_mdf=False,
+                window_s=30.0,
+                result_cache=cache,
+            )
+            rows = len(export.dat_path.read_text(encoding="utf-8").splitlines()) - 1
+            leftovers = list(cache.root.iterdir())
+
+        self.assertEqual(rows, 101)
+        self.assertEqual(export.warnings, [])
+        self.assertEqual(leftovers, [])
+
+    def test_stream_writes_windows_as_they_finish(self) -> None:
+        fake_module = self._install_fake_pybamm()
+        t_eval = np.arange(101, dtype=np.float64)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_dir = pathlib.Path(tmpdir)
+            visible: List[int] = []
+            progress = []
+
+            def on_window(update: object) -> None:
+                progress.append(update)
+                text = (export_dir / "stream.dat").read_text(encoding="utf-8")
+                visible.append(len(text.splitlines()) - 1)
+
+            export = stream_pybamm_simulation(
+                export_dir,
+                "stream",
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="TestSet",
+                overrides={"My parameter": 2.0},
+                t_eval=t_eval,
+                extra_variables=["Elapsed [s]"],
+                window_s=30.0,
+                on_window=on_window,
+            )
+            reference = export_simulation_results(
+                export_dir,
+                "reference",
+                run_pybamm_simulation(
+                    chemistry="lithium_ion",
+                    model="DFN",
+                    parameter_set="TestSet",
+                    overrides={"My parameter": 2.0},
+                    t_eval=t_eval,
+                    extra_variables=["Elapsed [s]"],
+                ),
+                include_mdf=False,
+            )
+            streamed_text = export.dat_path.read_text(encoding="utf-8")
+            reference_text = reference.dat_path.read_text(encoding="utf-8")
+            mdf_rows = None
+            if export.mdf_path is not None:
+                from asammdf import MDF  # type: ignore
+
+                with MDF(export.mdf_path) as mdf:
+                    signal = mdf.get("Elapsed [s]")
+                    mdf_rows = (signal.timestamps.tolist(), signal.samples.tolist())
+
+        self.assertEqual(streamed_text, reference_text)
+        self.assertEqual(visible, [31, 61, 91, 101])
+        self.assertEqual([update.rows for update in progress], visible)
+        self.assertEqual(progress[-1].t_end, 100.0)
+        self.assertEqual(progress[-1].fraction, 1.0)
+        self.assertEqual(fake_module.Simulation.instances, 1)
+        inputs = {"My parameter": 2.0}
+        self.assertEqual(
+            fake_module.Simulation.steps,
+            [(30.0, False, inputs), (30.0, False, inputs), (10.0, False, inputs)],
+        )
+        if mdf_rows is not None:
+            self.assertEqual(mdf_rows, (t_eval.tolist(), t_eval.tolist()))
+
+    def test_stream_keeps_completed_windows_when_stopped(self) -> None:
+        self._install_fake_pybamm()
+
+        def cancel(update: object) -> None:
+            raise RuntimeError("cancelled")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_dir = pathlib.Path(tmpdir)
+            with self.assertRaisesRegex(RuntimeError, "cancelled"):
+                stream_pybamm_simulation(
+                    export_dir,
+                    "partial",
+                    chemistry="lithium_ion",
+                    model="DFN",
+                    parameter_set="TestSet",
+                    overrides={},
+                    t_eval=[0.0, 1000.0, 1001.0],
+                    window_s=600.0,
+                    include_mdf=False,
+                    on_window=cancel,
+                )
+            lines = (export_dir / "partial.dat").read_text(encoding="utf-8").splitlines()
+            with self.assertRaises(ValueError):
+                stream_pybamm_simulation(
+                    export_dir,
+                    "unsorted",
+                    chemistry="lithium_ion",
+                    model="DFN",
+                    parameter_set="TestSet",
+                    overrides={},
+                    t_eval=[0.0, 2.0, 1.0],
+                    include_mdf=False,
+                )
+
+        self.assertEqual(lines, ["Time [s]\tTerminal voltage [V]", "0\t4.2", "1000\t4.2"])
+
+    def test_run_sweep_exports_each_point_and_writes_manifest(self) -> None:
+        fake_module = self._install_fake_pybamm()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_dir = pathlib.Path(tmpdir)
+            sweep = run_sweep(
+                {"My parameter": [1.0, 2.0], "Other parameter": 5.0},
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="TestSet",
+                export_dir=export_dir,
+                prefix="design",
+                workers=1,
+                t_eval=[0, 1, 2],
+                include_mdf=False,
+            )
+
+            self.assertFalse(sweep.failed)
+            self.assertEqual([point.prefix for point in sweep.points], ["design_0000", "design_0001"])
+            self.assertTrue((export_dir / "design_0000.dat").exists())
+            self.assertTrue((export_dir / "design_0001.dat").exists())
+            manifest = json.loads(sweep.manifest_path.read_text(encoding="utf-8"))
+            self.assertEqual(manifest["parameter_set"], "TestSet")
+            self.assertEqual(
+                [entry["overrides"] for entry in manifest["points"]],
+                [
+                    {"My parameter": 1.0, "Other parameter": 5.0},
+                    {"My parameter": 2.0, "Other parameter": 5.0},
+                ],
+            )
+            self.assertEqual(manifest["points"][1]["files"], {"dat": "design_0001.dat", "mdf": None})
+        self.assertEqual(fake_module.Simulation.instances, 1)
+
+    def test_sweep_and_stream_record_runs_in_catalog(self) -> None:
+        self._install_fake_pybamm()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_dir = pathlib.Path(tmpdir)
+            catalog_path = export_dir / "catalog.sqlite"
+            run_sweep(
+                {"My parameter": [1.0, 2.0, 3.0]},
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="TestSet",
+                export_dir=export_dir,
+                prefix="design",
+                workers=1,
+                t_eval=[0, 1, 2],
+                include_mdf=False,
+                catalog=catalog_path,
+            )
+
+            def cancel(update: object) -> None:
+                raise RuntimeError("cancelled")
+
+            with self.assertRaises(RuntimeError):
+                stream_pybamm_simulation(
+                    export_dir,
+                    "streamed",
+                    chemistry="lithium_ion",
+                    model="DFN",
+                    parameter_set="TestSet",
+                    overrides={"My parameter": 9.0},
+                    t_eval=[0.0, 10.0, 20.0],
+                    window_s=10.0,
+                    include_mdf=False,
+                    on_window=cancel,
+                    metadata={"scenario": "long"},
+                    catalog=catalog_path,
+                )
+
+            with RunCatalog(catalog_path) as catalog:
+                matching = catalog.find_run_ids([parse_condition("My parameter >= 2")])
+                design = catalog.get_run("design_0001")
+                streamed = catalog.get_run("streamed")
+
+        self.assertEqual(matching, ["design_0001", "design_0002", "streamed"])
+        assert design is not None and streamed is not None
+        self.assertEqual(design.metadata["sweep_index"], 1)
+        self.assertEqual(design.files["dat"].path, export_dir / "design_0001.dat")
+        self.assertEqual(design.samples, 3)
+        self.assertIsNotNone(design.solve_s)
+        self.assertEqual((streamed.status, streamed.scenario, streamed.samples), ("incomplete", "long", 2))
+        self.assertEqual(streamed.kpis["Time [s].final"], 10.0)
+
+    def test_unwritable_catalog_does_not_mask_the_run(self) -> None:
+        self._install_fake_pybamm()
+        arguments = dict(
+            chemistry="lithium_ion",
+            model="DFN",
+            parameter_set="TestSet",
+            overrides={"My parameter": 1.0},
+            t_eval=[0.0, 10.0, 20.0],
+            window_s=10.0,
+            include_mdf=False,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export_dir = pathlib.Path(tmpdir)
+            # A directory in place of the database makes every catalog write fail.
+            catalog_path = export_dir / "catalog.sqlite"
+            catalog_path.mkdir()
+
+            export = stream_pybamm_simulation(export_dir, "finished", catalog=catalog_path, **arguments)
+            self.assertTrue(export.dat_path.exists())
+
+            def cancel(update: object) -> None:
+                raise KeyboardInterrupt
+
+            with self.assertRaises(KeyboardInterrupt):
+                stream_pybamm_simulation(export_dir, "cancelled", catalog=catalog_path, on_window=cancel, **arguments)
+
+            exported = export_simulation_results(
+                export_dir,
+                "single",
+                SimulationResults({"Time [s]": [0.0, 1.0]}),
+                include_mdf=False,
+                catalog=catalog_path,
+            )
+
+        for warnings in (export.warnings, exported.warnings):
+            self.assertEqual(len(warnings), 1)
+            self.assertTrue(warnings[0].startswith("Run not recorded in the catalog"))
+
+    def test_run_sweep_records_failed_points(self) -> None:
+        self._install_fake_pybamm()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sweep = run_sweep(
+                [{"My parameter": 1.0}],
+                chemistry="lithium_ion",
+                model="DFN",
+                parameter_set="MissingSet",
+                export_dir=pathlib.Path(tmpdir),
+                workers=1,
+                include_mdf=False,
+            )
+            manifest = json.loads(sweep.manifest_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(len(sweep.failed), 1)
+        self.assertIn("MissingSet", manifest["points"][0]["error"])
+        self.assertIsNone(manifest["points"][0]["files"]["dat"])
+
+
+class DatWriterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(7)
+        samples = 1000
+        voltage = rng.normal(3.7, 0.3, samples)
+        voltage[::50] = 0.0
+        voltage[1] = -0.0
+        tiny = rng.normal(0.0, 1e-4, samples)
+        tiny[2] = np.nan
+        large = rng.normal(0.0, 1e5, samples)
+        large[3] = np.inf
+        large[4] = -np.inf
+        self.results = SimulationResults(
+            {
+                "Time [s]": np.arange(samples, dtype=np.float64) * 0.1,
+                "Voltage [V]": voltage,
+                "Tiny": tiny,
+                "Large": large,
+            },
+            metadata={"preset": "Chen2020"},
+        )
+
+    def test_text_writer_matches_reference_formatting(self) -> None:
+        handle = io.StringIO()
+        rows = write_dat_text(handle, self.results, chunk_rows=97)
+
+        names = ["Time [s]"] + self.results.channel_names
+        expected = ["\t".join(names)]
+        for row in self.results.as_matrix(names).tolist():
+            expected.append("\t".join(_reference_format(value) for value in row))
+        self.assertEqual(rows, self.results.sample_count)
+        self.assertEqual(handle.getvalue(), "\n".join(expected) + "\n")
+
+    def test_binary_round_trip_uses_memory_map(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = write_binary_dat(pathlib.Path(tmpdir) / "run.bdat", self.results)
+            self.assertEqual(path.read_bytes()[:8], BINARY_DAT_MAGIC)
+
+            loaded = read_binary_dat(path)
+            base = loaded["Voltage [V]"]
+            while base is not None and not isinstance(base, np.memmap):
+                base = base.base
+            self.assertIsInstance(base, np.memmap)
+            self.assertEqual(list(loaded.keys()), list(self.results.keys()))
+            for name in self.results:
+                np.testing.assert_array_equal(loaded[name], self.results[name])
+            self.assertEqual(loaded.metadata, {"preset": "Chen2020"})
+            self.assertEqual(loaded.unit("Voltage [V]"), "V")
+
+            projected = read_binary_dat(path, channels=["Large"], mmap=False)
+            self.assertEqual(list(projected.keys()), ["Time [s]", "Large"])
+            del loaded
+
+    def test_export_writes_binary_flavour(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            export = export_simulation_results(
+                pathlib.Path(tmpdir), "binary", self.results, include_mdf=False, dat_format="binary"
+            )
+            self.assertEqual(export.dat_path.suffix, ".bdat")
+            loaded = read_binary_dat(export.dat_path, mmap=False)
+        self.assertEqual(loaded.sample_count, self.results.sample_count)
+
+    def test_rejects_non_binary_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / "plain.dat"
+            path.write_text("Time [s]\n0\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                read_binary_dat(path)
+
+
+class SimulationResultsTest(unittest.TestCase):
+    def test_wraps_contiguous_float64_arrays_without_copying(self) -> None:
+        time = np.arange(5, dtype=np.float64)
+        voltage = np.linspace(4.2, 3.0, 5)
+        results = SimulationResults({"Time [s]": time, "Voltage [V]": voltage})
+
+        self.assertTrue(np.shares_memory(results["Voltage [V]"], voltage))
+        self.assertFalse(results["Voltage [V]"].flags.writeable)
+        self.assertTrue(voltage.flags.writeable)
+        self.assertEqual(results.channel_names, ["Voltage [V]"])
+        self.assertEqual(results.sample_count, 5)
+        self.assertEqual(results.units, {"Time [s]": "s", "Voltage [V]": "V"})
+
+    def test_converts_sequences_and_requires_time_channel(self) -> None:
+        results = SimulationResults({"Time [s]": [0, 1], "Flag": [True, False]}, units={"Flag": "-"})
+        self.assertEqual(results["Flag"].dtype, np.float64)
+        self.assertEqual(results.unit("Flag"), "-")
+        with self.assertRaises(ValueError):
+            SimulationResults({"Voltage [V]": [1.0]})
+
+    def test_from_mapping_returns_existing_instance(self) -> None:
+        results = SimulationResults({"Time [s]": [0.0]})
+        self.assertIs(SimulationResults.from_mapping(results), results)
+
+
+class ExpandSweepPointsTest(unittest.TestCase):
+    def test_grid_is_expanded_to_cartesian_product(self) -> None:
+        points = expand_sweep_points({"a": [1, 2], "b": (3, 4), "c": 0})
+        self.assertEqual(
+            points,
+            [
+                {"a": 1, "b": 3, "c": 0},
+                {"a": 1, "b": 4, "c": 0},
+                {"a": 2, "b": 3, "c": 0},
+                {"a": 2, "b": 4, "c": 0},
+            ],
+        )
+
+    def test_explicit_points_are_copied(self) -> None:
+        source = [{"a": 1}, {"a": 2, "b": 3}]
+        points = expand_sweep_points(source)
+        self.assertEqual(points, source)
+        self.assertIsNot(points[0], source[0])
+
+    def test_empty_axis_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            expand_sweep_points({"a": []})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import tempfile
+import threading
+import unittest
+from typing import List
+
+import numpy as np
+
+from app.ui_qt.result_cache import ResultCache, result_cache_key
+from app.ui_qt.simulation_results import SimulationResults
+
+
+def _key(**changes: object) -> str:
+    arguments = {
+        "chemistry": "lithium_ion",
+        "model": "DFN",
+        "parameter_set": "Chen2020",
+        "overrides": {"Ambient temperature [K]": 298.15, "Negative electrode thickness [m]": 8e-5},
+        "t_eval": [0.0, 10.0, 20.0],
+        "variables": ["Voltage [V]"],
+        "version": "24.1",
+    }
+    arguments.update(changes)
+    return result_cache_key(**arguments)  # type: ignore[arg-type]
+
+
+def _results(samples: int, offset: float = 0.0) -> SimulationResults:
+    time = np.arange(samples, dtype=np.float64)
+    return SimulationResults({"Time [s]": time, "Voltage [V]": 4.2 - time * 1e-3 + offset}, metadata={"solve_s": 1.5})
+
+
+class ResultCacheKeyTest(unittest.TestCase):
+    def test_key_is_canonical(self) -> None:
+        reference = _key()
+        self.assertEqual(len(reference), 64)
+        reordered = {"Negative electrode thickness [m]": np.float64(8e-5), "Ambient temperature [K]": 298.15}
+        self.assertEqual(_key(overrides=reordered), reference)
+        self.assertEqual(_key(t_eval=np.array([0, 10, 20])), reference)
+        self.assertEqual(_key(overrides={"Cells": 2}), _key(overrides={"Cells": 2.0}))
+
+    def test_key_changes_with_every_input(self) -> None:
+        reference = _key()
+        for changes in (
+            {"overrides": {"Ambient temperature [K]": 298.15, "Negative electrode thickness [m]": 8.1e-5}},
+            {"overrides": {"Ambient temperature [K]": "298.15", "Negative electrode thickness [m]": 8e-5}},
+            {"t_eval": [0.0, 10.0, 30.0]},
+            {"t_eval": None},
+            {"variables": ["Voltage [V]", "Current [A]"]},
+            {"var_pts": {"x_n": 20}},
+            {"window_s": 600.0},
+            {"parameter_set": "Marquis2019"},
+            {"version": "24.5"},
+        ):
+            with self.subTest(changes=changes):
+                self.assertNotEqual(_key(**changes), reference)
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self._tmpdir.name) / "results"
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_round_trip_and_miss(self) -> None:
+        cache = ResultCache(self.root)
+        self.assertIsNone(cache.load(_key()))
+        path = cache.store(_key(), _results(100))
+        self.assertEqual(path, cache.path_for(_key()))
+
+        loaded = cache.load(_key())
+        assert loaded is not None
+        np.testing.assert_array_equal(loaded["Voltage [V]"], _results(100)["Voltage [V]"])
+        self.assertFalse(loaded["Voltage [V]"].flags.writeable)
+        self.assertEqual(loaded.metadata, {"solve_s": 1.5})
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+        self.assertEqual(list(self.root.iterdir()), [path])
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        first = ResultCache(self.root).store("a", _results(1000))
+        assert first is not None
+        size = first.stat().st_size
+        cache = ResultCache(self.root, max_bytes=2 * size + size // 2, max_entry_bytes=size)
+        cache.store("b", _results(1000, 1.0))
+        os.utime(cache.path_for("a"), (1000, 1000))
+        os.utime(cache.path_for("b"), (2000, 2000))
+
+        self.assertIsNotNone(cache.load("a"))  # "a" becomes the most recently used entry
+        cache.store("c", _results(1000, 2.0))
+        self.assertIsNone(cache.load("b"))
+        self.assertIsNotNone(cache.load("a"))
+        self.assertIsNotNone(cache.load("c"))
+        self.assertLessEqual(cache.size_bytes(), cache.max_bytes)
+
+    def test_oversized_and_corrupt_entries_are_not_served(self) -> None:
+        cache = ResultCache(self.root, max_bytes=4096)
+        self.assertEqual(cache.max_entry_bytes, 1024)
+        self.assertIsNone(cache.store("large", _results(1000)))
+        self.assertIsNone(cache.load("large"))
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        cache.path_for("broken").write_bytes(b"not a result")
+        self.assertIsNone(cache.load("broken"))
+        self.assertFalse(cache.path_for("broken").exists())
+
+    def test_concurrent_stores_of_one_key_do_not_collide(self) -> None:
+        cache = ResultCache(self.root)
+        barrier = threading.Barrier(8)
+        errors: List[BaseException] = []
+
+        def store() -> None:
+            try:
+                barrier.wait()
+                for _ in range(5):
+                    cache.store("same", _results(200000))
+            except BaseException as exc:  # noqa: BLE001 - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=store) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual([path.name for path in self.root.iterdir()], ["same.bdat"])
+        loaded = cache.load("same")
+        assert loaded is not None
+        self.assertEqual(loaded.sample_count, 200000)
+
+    def test_project_cache_honours_environment(self) -> None:
+        project = pathlib.Path(self._tmpdir.name)
+        previous = os.environ.pop("EVSIM_RESULT_CACHE", None)
+        try:
+            self.assertEqual(ResultCache.for_project(project).root, project / ".cache" / "pybamm_results")
+            os.environ["EVSIM_RESULT_CACHE"] = str(self.root)
+            self.assertEqual(ResultCache.for_project(project).root, self.root)
+        finally:
+            os.environ.pop("EVSIM_RESULT_CACHE", None)
+            if previous is not None:
+                os.environ["EVSIM_RESULT_CACHE"] = previous
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()
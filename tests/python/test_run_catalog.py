@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+
+from app.ui_qt.pybamm_runner import SimulationResults, export_simulation_results
+from app.ui_qt.run_catalog import (
+    Condition,
+    FileRecord,
+    RunCatalog,
+    RunRecord,
+    main,
+    merge_kpis,
+    parse_condition,
+    result_kpis,
+)
+
+THICKNESS = "Negative electrode thickness [m]"
+
+
+class RunCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.directory = pathlib.Path(self._tmpdir.name)
+        self.catalog = RunCatalog(self.directory / "catalog.sqlite")
+
+    def tearDown(self) -> None:
+        self.catalog.close()
+        self._tmpdir.cleanup()
+
+    def _populate(self) -> None:
+        runs = []
+        for index in range(20):
+            runs.append(
+                RunRecord(
+                    run_id=f"run_{index:02d}",
+                    created_at=1000.0 + index,
+                    scenario="baseline" if index % 2 else "fast-charge",
+                    parameter_set="Chen2020",
+                    overrides={
+                        THICKNESS: (70 + 2 * index) / 1e6,
+                        "Cooling": "forced" if index < 5 else "natural",
+                    },
+                    kpis={"Terminal voltage [V].min": 3.5 - index * 0.02},
+                )
+            )
+        self.assertEqual(self.catalog.record_runs(runs), 20)
+
+    def test_queries_use_normalised_overrides_and_kpis(self) -> None:
+        self._populate()
+        self.assertEqual(len(self.catalog), 20)
+
+        thick = self.catalog.find_run_ids([parse_condition(f"{THICKNESS} > 1e-4")])
+        self.assertEqual(thick, ["run_16", "run_17", "run_18", "run_19"])
+        self.assertEqual(
+            self.catalog.find_run_ids(
+                [parse_condition(f"{THICKNESS}>=1e-4"), parse_condition("Terminal voltage [V].min<3.15", kind="kpi")],
+                scenario="baseline",
+            ),
+            ["run_19"],
+        )
+        forced = self.catalog.find_run_ids([Condition("Cooling", "=", "forced")], limit=2)
+        self.assertEqual(forced, ["run_00", "run_01"])
+        self.assertEqual(self.catalog.find_run_ids(parameter_set="Marquis2019"), [])
+
+        run = self.catalog.get_run("run_03")
+        assert run is not None
+        self.assertEqual(run.overrides, {THICKNESS: 76e-6, "Cooling": "forced"})
+        self.assertEqual(run.scenario, "baseline")
+        with self.assertRaises(ValueError):
+            parse_condition("Cooling")
+        with self.assertRaises(ValueError):
+            self.catalog.find_run_ids([parse_condition("Terminal voltage [V].min<low", kind="kpi")])
+
+    def test_recording_a_run_again_replaces_it(self) -> None:
+        self._populate()
+        self.catalog.record_run(RunRecord(run_id="run_00", created_at=5000.0, overrides={THICKNESS: 1.0}))
+        run = self.catalog.get_run("run_00")
+        assert run is not None
+        self.assertEqual(run.overrides, {THICKNESS: 1.0})
+        self.assertEqual(run.kpis, {})
+        forced = self.catalog.find_run_ids([Condition("Cooling", "=", "forced")])
+        self.assertEqual(forced, ["run_01", "run_02", "run_03", "run_04"])
+        self.assertTrue(self.catalog.delete_run("run_00"))
+        self.assertIsNone(self.catalog.get_run("run_00"))
+        self.assertEqual(len(self.catalog), 19)
+
+    def test_export_records_files_checksums_and_kpis(self) -> None:
+        results = SimulationResults(
+            {"Time [s]": np.arange(4.0), "Voltage [V]": np.array([4.2, 4.0, 3.9, 3.95])},
+            metadata={"chemistry": "lithium_ion", "parameter_set": "Chen2020", "overrides": {THICKNESS: 8e-5}},
+        )
+        export = export_simulation_results(
+            self.directory / "runs",
+            "export_01",
+            results,
+            include_mdf=False,
+            metadata={"scenario": "baseline", "preset": "chen"},
+            catalog=self.catalog,
+        )
+
+        run = self.catalog.get_run("export_01")
+        assert run is not None
+        self.assertEqual((run.scenario, run.preset, run.parameter_set), ("baseline", "chen", "Chen2020"))
+        self.assertEqual(run.samples, 4)
+        self.assertEqual(run.files["dat"].path, export.dat_path)
+        self.assertEqual(run.files["dat"].size, export.dat_path.stat().st_size)
+        self.assertEqual(run.kpis["Voltage [V].min"], 3.9)
+        self.assertEqual(run.kpis["Voltage [V].final"], 3.95)
+        self.assertEqual(run.kpis["Time [s].final"], 3.0)
+        self.assertIsNotNone(run.export_s)
+        self.assertEqual(self.catalog.verify(), [])
+
+        export.dat_path.write_text("Time [s]\tVoltage [V]\n0\t0\n", encoding="utf-8")
+        self.assertEqual(self.catalog.verify(), [("export_01", "dat", "size changed")])
+        export.dat_path.unlink()
+        self.assertEqual(self.catalog.verify(["export_01"]), [("export_01", "dat", "missing")])
+
+    def test_kpis_merge_across_windows(self) -> None:
+        first = result_kpis({"Time [s]": [0.0, 1.0], "Voltage [V]": [4.0, 3.8]})
+        second = result_kpis({"Time [s]": [2.0], "Voltage [V]": [3.9]})
+        self.assertEqual(
+            merge_kpis(first, second),
+            {"Time [s].final": 2.0, "Voltage [V].final": 3.9, "Voltage [V].min": 3.8, "Voltage [V].max": 4.0},
+        )
+
+    def test_command_line_query(self) -> None:
+        self._populate()
+        target = self.directory / "run_17.dat"
+        target.write_text("Time [s]\n0\n", encoding="utf-8")
+        self.catalog.record_run(
+            RunRecord(
+                run_id="run_17",
+                created_at=1017.0,
+                overrides={THICKNESS: 104e-6},
+                files={"dat": FileRecord(path=target, size=target.stat().st_size, sha256="0" * 64)},
+            )
+        )
+        path = str(self.directory / "catalog.sqlite")
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = main([path, "query", "--where", f"{THICKNESS}>1e-4", "--count"])
+        self.assertEqual((status, output.getvalue()), (0, "4\n"))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main([path, "query", "--where", f"{THICKNESS}>1e-4", "--paths", "dat"])
+        self.assertEqual(output.getvalue().splitlines(), [str(target)])
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = main([path, "verify", "run_17"])
+        self.assertEqual((status, output.getvalue()), (1, "run_17\tdat\tchecksum mismatch\n"))
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()
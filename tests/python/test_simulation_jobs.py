@@ -0,0 +1,88 @@
+"""Tests for the background simulation job queue."""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication  # noqa: E402  (import after skip)
+
+from app.ui_qt.simulation_jobs import SimulationJobQueue  # noqa: E402
+
+
+def _drain(queue: SimulationJobQueue, timeout: float = 5.0) -> None:
+    """Wait for all jobs and deliver their queued notifications."""
+
+    deadline = time.monotonic() + timeout
+    while queue.active_jobs() and time.monotonic() < deadline:
+        queue.wait_for_done(50)
+        QCoreApplication.processEvents()
+    assert not queue.active_jobs(), "jobs did not finish in time"
+
+
+def test_jobs_run_off_the_calling_thread_and_report_progress(qapp):
+    queue = SimulationJobQueue(max_workers=2)
+    progress = []
+    finished = []
+    queue.progressUpdated.connect(lambda stage, fraction: progress.append((stage, fraction)))
+    queue.jobFinished.connect(lambda job_id, result: finished.append((job_id, result)))
+    caller = threading.get_ident()
+
+    def job(context):
+        context.report("working", 0.5)
+        return threading.get_ident()
+
+    job_id = queue.submit(job, name="probe")
+    assert queue.activeCount == 1
+    _drain(queue)
+
+    assert progress == [("working", 0.5)]
+    assert finished[0][0] == job_id
+    assert finished[0][1] != caller
+    completed = queue.completed_jobs()
+    assert [(job.name, job.status) for job in completed] == [("probe", "finished")]
+    assert queue.activeCount == 0
+
+
+def test_cancellation_is_cooperative(qapp):
+    queue = SimulationJobQueue(max_workers=1)
+    cancelled = []
+    queue.jobCancelled.connect(cancelled.append)
+    started = threading.Event()
+    release = threading.Event()
+
+    def job(context):
+        started.set()
+        release.wait(5)
+        context.report("after wait", 0.9)
+        return "not reached"
+
+    job_id = queue.submit(job)
+    assert started.wait(5)
+    assert queue.cancel(job_id)
+    release.set()
+    _drain(queue)
+
+    assert cancelled == [job_id]
+    assert queue.completed_jobs()[0].status == "cancelled"
+    assert queue.completed_jobs()[0].result is None
+
+
+def test_failures_are_reported_and_completed_queue_is_drained(qapp):
+    queue = SimulationJobQueue(max_workers=2)
+    failures = []
+    queue.jobFailed.connect(lambda job_id, error: failures.append(error))
+
+    def broken(context):
+        raise RuntimeError("solver diverged")
+
+    queue.submit(broken)
+    queue.submit(lambda context: 42)
+    _drain(queue)
+
+    assert failures == ["solver diverged"]
+    statuses = sorted(job.status for job in queue.take_completed())
+    assert statuses == ["failed", "finished"]
+    assert queue.completed_jobs() == []
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import io
+import math
+import pathlib
+import unittest
+
+import numpy as np
+
+from app.model.drive_cycles import DriveCycle, load_wltp_csv
+from app.model.single_cell_engine import (
+    DEFAULT_CELL_PRESETS,
+    CellBatch,
+    CellParameters,
+    default_cells,
+    simulate_batch,
+)
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+WLTP_CSV = ROOT / "data" / "wltp" / "wltp_class3_cycle.csv"
+REFERENCE_DAT = ROOT / "data" / "wltp" / "wltp_single_cell_results.dat"
+
+
+def _reference_run(cell: CellParameters, cycle: DriveCycle, ambient_c: float = 25.0) -> dict:
+    """Scalar transcription of ``SingleCellModels.cpp`` for one cell."""
+
+    dt = cycle.sample_interval
+    soc, rc, temperature = 1.0, 0.0, ambient_c
+    previous = cycle.speed_kph[0] / 3.6
+    rows = {"soc": [], "voltage_v": [], "temperature_c": []}
+    time = 0.0
+    for _ in range(len(cycle)):
+        index = min(int(math.floor(time / dt)), len(cycle) - 1)
+        speed = cycle.speed_kph[index] / 3.6
+        accel = (speed - previous) / dt
+        previous = speed
+        current = max(cell.base_current_a + cell.speed_current_gain * speed + cell.accel_current_gain * accel, 0.0)
+        ocv = cell.ocv_min + max(cell.ocv_max - cell.ocv_min, 0.0) * min(max(soc, 0.0), 1.0)
+        if cell.model_kind == "rc":
+            rc += ((current * max(cell.rc_resistance, 0.0) - rc) / max(cell.rc_time_constant_s, 1e-3)) * dt
+        voltage = max(ocv - current * cell.internal_resistance - rc, 0.0)
+        heat = current * current * cell.internal_resistance
+        soc = min(max(soc - (current * dt) / (cell.capacity_ah * 3600.0), 0.0), 1.0)
+        if cell.model_kind == "thermal":
+            rth = max(cell.thermal_resistance_k_per_w, 1e-3)
+            mass = max(cell.mass_kg, 1e-6) * max(cell.heat_capacity_j_per_kg_k, 1e-3)
+            delta = ((heat - (temperature - ambient_c) / rth) / mass) * dt
+            temperature = min(max(temperature + delta, -40.0), 120.0)
+        rows["soc"].append(soc)
+        rows["voltage_v"].append(voltage)
+        rows["temperature_c"].append(temperature)
+        time += dt
+    return rows
+
+
+class SingleCellEngineTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.cycle = load_wltp_csv(WLTP_CSV)
+        cls.result = simulate_batch(cls.cycle, default_cells())
+
+    def test_batch_matches_the_scalar_models(self) -> None:
+        for index, cell_id in enumerate(self.result.cells.cell_ids):
+            expected = _reference_run(DEFAULT_CELL_PRESETS[cell_id], self.cycle)
+            for signal, values in expected.items():
+                np.testing.assert_array_equal(self.result.signals[signal][:, index], values, err_msg=f"{cell_id}.{signal}")
+
+    def test_matches_the_exported_cli_results(self) -> None:
+        lines = REFERENCE_DAT.read_text(encoding="utf-8").splitlines()
+        reference_header = lines[7].split("\t")
+        buffer = io.StringIO()
+        rows = self.result.write_dat(buffer, row_chunk=500)
+        written = buffer.getvalue().splitlines()
+
+        self.assertEqual(rows, len(lines) - 8)
+        self.assertEqual(written[0], lines[0])
+        self.assertEqual(written[1], f"# WLTP source: {WLTP_CSV}")
+        self.assertEqual(written[2:4], lines[2:4])
+        self.assertEqual(written[7].split("\t"), reference_header)
+        # The ohmic and thermal models and the drive trace are unchanged since
+        # the reference export was written, so their columns match verbatim.
+        compared = [
+            position
+            for position, name in enumerate(reference_header)
+            if name.startswith(("NMC811.", "NCA.", "drive.speed", "drive.accel", "drive.phase")) or name == "time_s"
+        ]
+        for ours, theirs in zip(written[8:], lines[8:]):
+            ours_values, their_values = ours.split("\t"), theirs.split("\t")
+            self.assertEqual([ours_values[i] for i in compared], [their_values[i] for i in compared])
+
+    def test_variants_and_signal_selection(self) -> None:
+        base = DEFAULT_CELL_PRESETS["LFP"]
+        capacities = np.array([4.0, 4.8, 5.6])
+        batch = CellBatch.variants(base, 3, capacity_ah=capacities)
+        result = simulate_batch(self.cycle, batch, signals=("soc", "rc_surface_voltage_v"))
+
+        self.assertEqual(batch.cell_ids, ["LFP_0", "LFP_1", "LFP_2"])
+        self.assertEqual(set(result.signals), {"soc", "rc_surface_voltage_v"})
+        self.assertEqual(result.channel_names()[4:7], ["LFP_0.rc_surface_voltage_v", "LFP_0.soc", "LFP_1.rc_surface_voltage_v"])
+        self.assertTrue(np.all(np.diff(result.signals["soc"][600]) > 0.0))
+        np.testing.assert_array_equal(result.channel("LFP_1.soc"), self.result.channel("LFP.soc"))
+        with self.assertRaises(KeyError):
+            result.channel("LFP_1.voltage_v")
+
+    def test_mixed_kinds_only_expose_their_own_signals(self) -> None:
+        signals = self.result.cell_signals(self.result.cells.cell_ids.index("NMC811"))
+        self.assertNotIn("rc_surface_voltage_v", signals)
+        self.assertNotIn("heat_rejection_w", signals)
+        self.assertTrue(np.isnan(self.result.signals["heat_rejection_w"][:, 0]).all())
+
+    def test_rejects_invalid_input(self) -> None:
+        with self.assertRaises(ValueError):
+            CellBatch.from_cells([CellParameters("A", model_kind="spm")])
+        with self.assertRaises(ValueError):
+            CellBatch.variants(DEFAULT_CELL_PRESETS["LFP"], 2, capacity=5.0)
+        with self.assertRaises(ValueError):
+            simulate_batch(self.cycle, default_cells(), steps=len(self.cycle) + 1)
+        with self.assertRaises(ValueError):
+            simulate_batch(self.cycle, default_cells(), signals=("unknown",))
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()
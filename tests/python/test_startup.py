@@ -0,0 +1,122 @@
+"""Tests for the staged start-up helpers and the import profiler."""
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from app.ui_qt.startup import (
+    DEFAULT_PROFILE_PATH,
+    DeferredLoader,
+    ImportProfiler,
+    StartupOptions,
+    StartupProfile,
+    parse_startup_arguments,
+)
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def test_startup_flags_are_removed_from_the_qt_arguments():
+    options, remaining = parse_startup_arguments(["main.py", "--startup-profile", "out.json", "-style", "Fusion"])
+    assert options.profile_path == pathlib.Path("out.json")
+    assert not options.exit_after_startup
+    assert remaining == ["main.py", "-style", "Fusion"]
+
+    options, remaining = parse_startup_arguments(["main.py", "--startup-profile-exit", "--startup-profile"])
+    assert options.profile_path == DEFAULT_PROFILE_PATH
+    assert options.exit_after_startup
+    assert remaining == ["main.py"]
+
+    options, _ = parse_startup_arguments(["main.py", "--startup-profile=/tmp/p.json"])
+    assert options.profile_path == pathlib.Path("/tmp/p.json")
+
+
+def test_import_profiler_records_nested_module_times(tmp_path, monkeypatch):
+    package = tmp_path / "profiled_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from . import child\n", encoding="utf-8")
+    (package / "child.py").write_text(
+        textwrap.dedent(
+            """
+            import time
+            time.sleep(0.02)
+            VALUE = 42
+            """
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = ImportProfiler().install()
+    try:
+        import profiled_pkg  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("profiled_pkg", None)
+        sys.modules.pop("profiled_pkg.child", None)
+
+    records = {record.module: record for record in profiler.records}
+    assert records["profiled_pkg.child"].parent == "profiled_pkg"
+    assert records["profiled_pkg.child"].self_s >= 0.015
+    assert records["profiled_pkg"].cumulative_s >= records["profiled_pkg.child"].cumulative_s
+    assert records["profiled_pkg"].self_s < records["profiled_pkg.child"].self_s
+    assert profiler not in sys.meta_path
+
+
+def test_profile_and_deferred_loader_write_json(tmp_path):
+    path = tmp_path / "profile.json"
+    profile = StartupProfile(StartupOptions(profile_path=path), qt_argv=["main.py"])
+    order = []
+    loader = DeferredLoader(profile, on_failed=lambda name, exc: order.append(f"failed:{name}"))
+    loader.add("first", lambda: order.append("first") or 1)
+    loader.add("broken", lambda: 1 / 0)
+    loader.add("second", lambda: order.append("second") or 2)
+    loader.when_finished(lambda: order.append("done"))
+    profile.record_first_frame()
+    loader.run_all()
+
+    assert order == ["first", "failed:broken", "second", "done"]
+    assert loader.results == {"first": 1, "second": 2}
+    assert isinstance(loader.errors["broken"], ZeroDivisionError)
+    assert profile.write() == path
+    assert profile.write() is None
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["time_to_first_frame_ms"] is not None
+    assert set(payload["phases_ms"]) == {"deferred:first", "deferred:broken", "deferred:second"}
+    assert "deferred_done" in payload["marks_ms"]
+
+
+def test_disabled_profile_records_nothing(tmp_path):
+    profile = StartupProfile(StartupOptions(), qt_argv=[])
+    with profile.phase("load_qml"):
+        pass
+    profile.mark("main")
+    assert not profile.enabled
+    assert profile.imports is None
+    assert profile.phases == {} and profile.marks == {}
+    assert profile.write() is None
+
+
+def test_parameter_ui_startup_profile_end_to_end(tmp_path):
+    pytest.importorskip("PySide6")
+    path = tmp_path / "startup.json"
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    completed = subprocess.run(
+        [sys.executable, str(ROOT / "app" / "main.py"), "--startup-profile", str(path), "--startup-profile-exit"],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    modules = {record["module"] for record in payload["imports"]}
+    assert "PySide6.QtCore" in modules
+    assert {"model.exporters", "model.runner"} <= modules
+    assert payload["marks_ms"]["deferred_start"] <= payload["marks_ms"]["deferred_done"]
+    assert "deferred:model.exporters" in payload["phases_ms"]
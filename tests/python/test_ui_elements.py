@@ -1,31 +1,18 @@
 """Integration tests for the Qt Quick parameter UI."""
 
-import os
-
 import pytest
 
 pytest.importorskip("PySide6")
 
-from PySide6.QtCore import QCoreApplication, QObject, QUrl  # noqa: E402  (import after skip)
-from PySide6.QtGui import QGuiApplication  # noqa: E402
+from PySide6.QtCore import Q_ARG, Q_RETURN_ARG, QCoreApplication, QMetaObject, QObject, QUrl  # noqa: E402
 from PySide6.QtQml import QQmlApplicationEngine  # noqa: E402
+from PySide6.QtQuick import QQuickItem  # noqa: E402
 
 from app.main import Bridge, resource_path  # noqa: E402
 from app.model.param_catalog import ParamCatalog  # noqa: E402
 from app.model.param_store import ParamStore  # noqa: E402
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Provide a shared QApplication instance for Qt tests."""
-
-    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-    app = QGuiApplication.instance()
-    if app is None:
-        app = QGuiApplication([])
-    return app
-
-
 @pytest.fixture()
 def loaded_main(qapp):
     """Load the main QML scene with the production context objects."""
@@ -83,3 +70,51 @@ def test_param_form_populates_fields(loaded_main):
 
     QCoreApplication.processEvents()
     assert repeater.property("count") > 0
+
+
+def _list_delegate(view, row):
+    item = QMetaObject.invokeMethod(view, "itemAtIndex", Q_RETURN_ARG("QQuickItem*"), Q_ARG(int, row))
+    assert isinstance(item, QQuickItem), f"ListView row {row} has no delegate"
+    return item
+
+
+def test_sidebar_search_hides_categories_without_matches(loaded_main):
+    """Typing a query should hide categories whose fields do not match."""
+
+    root = loaded_main["root"]
+    sidebar = root.findChild(QObject, "sidebar")
+    category_list = sidebar.findChild(QObject, "categoryList")
+    catalog = loaded_main["catalog"]
+    categories = catalog.categoryModel
+
+    sidebar.setProperty("query", "thickness")
+    QCoreApplication.processEvents()
+
+    matching = [
+        row
+        for row in range(categories.rowCount())
+        if categories.sectionsModel(row).countMatching("thickness", False) > 0
+    ]
+    assert 0 < len(matching) < categories.rowCount()
+    assert category_list.property("count") == categories.rowCount()
+    hidden = next(row for row in range(categories.rowCount()) if row not in matching)
+    shown = _list_delegate(category_list, matching[0])
+    assert shown.isVisible() and shown.height() > 0
+    assert not _list_delegate(category_list, hidden).isVisible()
+    assert _list_delegate(category_list, hidden).height() == 0
+
+    sidebar.setProperty("query", "")
+    QCoreApplication.processEvents()
+    assert _list_delegate(category_list, hidden).isVisible()
+
+
+def test_batched_store_update_refreshes_the_preset_box(loaded_main):
+    """A single aggregated store update should reach the toolbar editors."""
+
+    root = loaded_main["root"]
+    preset_box = root.findChild(QObject, "presetBox")
+    assert preset_box is not None
+
+    loaded_main["store"].setValues({"parameter_set": "Ai2020", "unrelated.key": 1.0})
+    QCoreApplication.processEvents()
+    assert preset_box.property("currentText") == "Ai2020"
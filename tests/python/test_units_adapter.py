@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from app.model.units_adapter import (
+    DEFAULT_REGISTRY,
+    UNIT_TO_SI,
+    ConversionPlan,
+    UnitError,
+    compile_plan,
+    convert_to_si,
+    values_to_pybamm_keys,
+)
+
+
+def _schema(*fields):
+    return [{"sections": [{"fields": [{"key": key, "unit": unit} for key, unit in fields]}]}]
+
+
+class UnitRegistryTest(unittest.TestCase):
+    def test_reproduces_the_legacy_multiplier_table(self) -> None:
+        for unit, factor in UNIT_TO_SI.items():
+            target = "A.h" if unit in {"A.h", "Ah"} else None
+            if target is None:
+                self.assertAlmostEqual(DEFAULT_REGISTRY.parse(unit).scale, factor, msg=unit)
+            else:
+                self.assertEqual(DEFAULT_REGISTRY.conversion(unit, target), (1.0, 0.0))
+
+    def test_compound_prefixed_and_offset_units(self) -> None:
+        registry = DEFAULT_REGISTRY
+        self.assertEqual(registry.conversion("W/(m^2·K)", "W.m-2.K-1"), (1.0, 0.0))
+        self.assertAlmostEqual(registry.conversion("mAh", "A.h")[0], 1e-3)
+        self.assertAlmostEqual(registry.convert(36.0, "km/h", "m/s"), 10.0)
+        self.assertAlmostEqual(registry.convert(1.0, "g/cm^3", "kg.m-3"), 1000.0)
+        self.assertAlmostEqual(registry.convert(25.0, "°C", "K"), 298.15)
+        self.assertAlmostEqual(registry.convert(300.0, "K", "degC"), 26.85)
+        self.assertAlmostEqual(registry.convert(212.0, "°F", "°C"), 100.0)
+        # Offsets do not apply inside compound units (temperature differences).
+        self.assertEqual(registry.conversion("W/(m·°C)", "W/(m·K)"), (1.0, 0.0))
+
+    def test_flags_unknown_and_incompatible_units(self) -> None:
+        with self.assertRaises(UnitError):
+            DEFAULT_REGISTRY.parse("furlong")
+        with self.assertRaises(UnitError):
+            DEFAULT_REGISTRY.conversion("V", "A")
+
+
+class ConversionPlanTest(unittest.TestCase):
+    def test_scalar_conversion_matches_convert_to_si(self) -> None:
+        schema = _schema(
+            ("geometry.anode.thickness", "μm"),
+            ("initial.temperature", "°C"),
+            ("thermal.ambient_temp", "C"),
+            ("cell.nominal_capacity", "mAh"),
+            ("initial.soc", "%"),
+            ("model.type", None),
+        )
+        values = {
+            "geometry.anode.thickness": 85,
+            "initial.temperature": 25.0,
+            "thermal.ambient_temp": 20,
+            "cell.nominal_capacity": 5000,
+            "initial.soc": 50,
+            "model.type": "DFN",
+            "not.in.schema": 2,
+        }
+        converted = convert_to_si(values, schema)
+
+        self.assertAlmostEqual(converted["geometry.anode.thickness"], 85e-6)
+        self.assertAlmostEqual(converted["initial.temperature"], 298.15)
+        self.assertAlmostEqual(converted["thermal.ambient_temp"], 293.15)
+        self.assertAlmostEqual(converted["cell.nominal_capacity"], 5.0)
+        self.assertAlmostEqual(converted["initial.soc"], 0.5)
+        self.assertEqual(converted["model.type"], "DFN")
+        self.assertEqual(converted["not.in.schema"], 2.0)
+
+    def test_matrix_conversion_and_pybamm_points(self) -> None:
+        schema = _schema(("geometry.anode.thickness", "μm"), ("initial.temperature", "°C"))
+        plan = compile_plan(schema)
+        self.assertIs(plan, compile_plan(_schema(("geometry.anode.thickness", "μm"), ("initial.temperature", "°C"))))
+
+        matrix = np.array([[25.0, 80.0], [30.0, 90.0]])
+        keys = ["initial.temperature", "geometry.anode.thickness"]
+        names, converted = plan.to_pybamm(matrix, keys)
+        self.assertEqual(names, ["Initial temperature [K]", "Negative electrode thickness [m]"])
+        np.testing.assert_allclose(converted, [[298.15, 80e-6], [303.15, 90e-6]])
+
+        points = plan.pybamm_points(matrix, keys)
+        self.assertEqual(
+            points[1], values_to_pybamm_keys(convert_to_si(dict(zip(keys, matrix[1].tolist())), schema))
+        )
+        with self.assertRaises(ValueError):
+            plan.to_si(np.ones((2, 3)))
+
+    def test_mismatched_units_are_reported_and_left_unconverted(self) -> None:
+        plan = ConversionPlan.compile(_schema(("geometry.anode.thickness", "V"), ("misc.length", "parsec")))
+        self.assertEqual(len(plan.mismatches), 2)
+        self.assertEqual(plan.convert_values({"geometry.anode.thickness": 3, "misc.length": 4}), {
+            "geometry.anode.thickness": 3.0,
+            "misc.length": 4.0,
+        })
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution helper
+    unittest.main()